@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""Benchmark API response serialization and compression.
+
+Compares the previous response path (``to_dict()``/``asdict()`` followed by
+``json.dumps`` and an uncompressed body, as ``web.json_response`` does)
+with the current one (``vpo.server.serialization.dumps`` on the view model,
+compressed by ``vpo.server.compression``) for representative payloads.
+
+Usage::
+
+    python scripts/benchmark_api_responses.py [--rounds N]
+
+Install the ``speedups`` extra (orjson, Brotli) to measure the fast paths;
+without it the stdlib fallbacks are measured.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import time
+from collections.abc import Callable
+from dataclasses import asdict
+from typing import Any
+
+from vpo.db.types import TrendDataPoint
+from vpo.server.compression import compress, supported_encodings
+from vpo.server.serialization import JSON_BACKEND, dumps
+from vpo.server.ui.models import (
+    FileListItem,
+    FileListResponse,
+    PlanListItem,
+    PlanListResponse,
+)
+
+
+def _library_page(size: int) -> FileListResponse:
+    return FileListResponse(
+        files=[
+            FileListItem(
+                id=i,
+                filename=f"Movie Title ({1990 + i % 30}) [{i}].mkv",
+                path=f"/media/movies/Movie Title ({1990 + i % 30})/movie-{i}.mkv",
+                title=f"Movie Title {i}" if i % 3 else None,
+                resolution=("4K", "1080p", "720p")[i % 3],
+                audio_languages="eng, jpn, fre",
+                scanned_at="2025-01-15T10:30:00+00:00",
+                scan_status="ok",
+            )
+            for i in range(size)
+        ],
+        total=25_000,
+        limit=size,
+        offset=0,
+        has_filters=False,
+        max_page_size=size,
+    )
+
+
+def _plan_page(size: int) -> PlanListResponse:
+    return PlanListResponse(
+        plans=[
+            PlanListItem(
+                id=f"5d0c6a52-8a4e-4a51-9b7c-{i:012d}",
+                id_short="5d0c6a52",
+                file_id=i,
+                file_path=f"/media/tv/Show/Season 01/Show - S01E{i:02d}.mkv",
+                filename=f"Show - S01E{i:02d}.mkv",
+                file_deleted=False,
+                policy_name="default",
+                action_count=i % 7,
+                requires_remux=bool(i % 2),
+                status="pending",
+                status_badge={"class": "status-pending", "label": "Pending"},
+                created_at="2025-01-15T10:30:00+00:00",
+                updated_at="2025-01-15T10:30:00+00:00",
+            )
+            for i in range(size)
+        ],
+        total=size,
+        limit=size,
+        offset=0,
+        has_filters=False,
+    )
+
+
+def _trends(days: int) -> list[TrendDataPoint]:
+    return [
+        TrendDataPoint(
+            date=f"2025-{1 + d // 28 % 12:02d}-{1 + d % 28:02d}",
+            files_processed=d * 3,
+            size_saved=d * 1_234_567,
+            success_count=d * 3 - d % 2,
+            fail_count=d % 2,
+        )
+        for d in range(days)
+    ]
+
+
+def _median_ms(func: Callable[[], Any], rounds: int) -> float:
+    timings = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        func()
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    library = _library_page(100)
+    plans = _plan_page(100)
+    trends = _trends(365)
+    cases: list[tuple[str, Callable[[], Any], Callable[[], bytes]]] = [
+        (
+            "library page (100)",
+            lambda: json.dumps(library.to_dict()).encode(),
+            lambda: dumps(library),
+        ),
+        (
+            "plans page (100)",
+            lambda: json.dumps(plans.to_dict()).encode(),
+            lambda: dumps(plans),
+        ),
+        (
+            "stats trends (365)",
+            lambda: json.dumps([asdict(t) for t in trends]).encode(),
+            lambda: dumps(trends),
+        ),
+    ]
+
+    print(f"serializer: {JSON_BACKEND}; encodings: {', '.join(supported_encodings())}")
+    print(
+        f"{'payload':<20} {'before ms':>10} {'after ms':>9} "
+        f"{'before B':>9} {'after B':>8}  compression"
+    )
+    for name, before, after in cases:
+        before_body = before()
+        after_body = after()
+        encoded = []
+        for coding in supported_encodings():
+            ms = _median_ms(lambda c=coding: compress(after_body, c), args.rounds)
+            size = len(compress(after_body, coding))
+            encoded.append(f"{coding} {size} B in {ms:.2f} ms")
+        print(
+            f"{name:<20} "
+            f"{_median_ms(before, args.rounds):>10.3f} "
+            f"{_median_ms(after, args.rounds):>9.3f} "
+            f"{len(before_body):>9} {len(after_body):>8}  " + "; ".join(encoded)
+        )
+
+
+if __name__ == "__main__":
+    main()
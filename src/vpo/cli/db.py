@@ -625,6 +625,13 @@ def _get_db_path(ctx: click.Context) -> Path:
     type=click.Path(dir_okay=False, writable=True),
     help="Output path for backup file (default: ~/.vpo/backups/).",
 )
+@click.option(
+    "--incremental",
+    "-i",
+    is_flag=True,
+    default=False,
+    help="Store only pages changed since the newest incremental backup.",
+)
 @click.option(
     "--dry-run",
     is_flag=True,
@@ -636,6 +643,7 @@ def _get_db_path(ctx: click.Context) -> Path:
 def backup_command(
     ctx: click.Context,
     output: str | None,
+    incremental: bool,
     dry_run: bool,
     output_format: str,
 ) -> None:
@@ -645,6 +653,12 @@ def backup_command(
     metadata JSON. Uses the SQLite online backup API to safely
     copy the database even if it's in use.
 
+    With --incremental, creates a .pages.tar archive holding only the
+    database pages that changed since the newest incremental backup in
+    the output directory (the first one stores every page). The copy
+    yields to writers, so the daemon can keep running. Restoring a
+    delta needs every earlier archive of its chain.
+
     Examples:
 
         # Create backup in default location
@@ -653,6 +667,9 @@ def backup_command(
         # Create backup at custom path
         vpo db backup --output /path/to/backup.tar.gz
 
+        # Nightly incremental backup
+        vpo db backup --incremental
+
         # Preview without creating
         vpo db backup --dry-run
     """
@@ -660,6 +677,7 @@ def backup_command(
     from pathlib import Path
 
     from vpo.db.backup import (
+        BACKUP_EXTENSION,
         ESTIMATED_COMPRESSION_RATIO,
         BackupIOError,
         BackupLockError,
@@ -669,16 +687,23 @@ def backup_command(
         _get_library_stats,
         create_backup,
     )
+    from vpo.db.incremental_backup import PAGE_BACKUP_EXTENSION
     from vpo.db.schema import SCHEMA_VERSION
 
     conn = get_db_conn_from_context(ctx)
     db_path = _get_db_path(ctx)
+    extension = PAGE_BACKUP_EXTENSION if incremental else BACKUP_EXTENSION
 
     # Determine output path
     if output:
         output_path = Path(output).resolve()
+        if incremental and not output_path.name.endswith(PAGE_BACKUP_EXTENSION):
+            raise click.BadParameter(
+                f"incremental backups must end in {PAGE_BACKUP_EXTENSION}",
+                param_hint="--output",
+            )
     else:
-        output_path = _get_default_backup_dir() / _generate_backup_filename()
+        output_path = _get_default_backup_dir() / _generate_backup_filename(extension)
 
     if dry_run:
         # Show what would be backed up
@@ -725,6 +750,7 @@ def backup_command(
             db_path=db_path,
             output_path=output_path if output else None,
             conn=conn,
+            incremental=incremental,
         )
     except BackupLockError as e:
         if json_output:
@@ -764,6 +790,10 @@ def backup_command(
                     "file_count": result.metadata.file_count,
                     "schema_version": result.metadata.schema_version,
                     "created_at": result.metadata.created_at,
+                    "kind": result.metadata.kind,
+                    "parent": result.metadata.parent,
+                    "page_count": result.metadata.page_count,
+                    "pages_stored": result.metadata.pages_stored,
                 },
                 indent=2,
             )
@@ -780,6 +810,16 @@ def backup_command(
             f"  Archive size:  {format_file_size(result.archive_size_bytes)} "
             f"({compression_pct}% compression)"
         )
+        if result.metadata.kind == "delta":
+            click.echo(
+                f"  Pages stored: {result.metadata.pages_stored:,} of "
+                f"{result.metadata.page_count:,} (delta of {result.metadata.parent})"
+            )
+        elif result.metadata.kind == "base":
+            click.echo(
+                f"  Pages stored: {result.metadata.pages_stored:,} of "
+                f"{result.metadata.page_count:,} (new incremental chain)"
+            )
         click.echo(f"  Files in library: {result.metadata.file_count:,}")
 
 
@@ -999,8 +1039,9 @@ def backups_command(
 ) -> None:
     """List available backups in the backup directory.
 
-    Scans for vpo-library-*.tar.gz files and displays metadata
-    including creation date, size, and file count.
+    Scans for vpo-library-*.tar.gz and incremental vpo-library-*.pages.tar
+    files and displays metadata including creation date, kind, size, and
+    file count.
 
     Examples:
 
@@ -1047,6 +1088,8 @@ def backups_command(
                             "schema_version": (
                                 b.metadata.schema_version if b.metadata else None
                             ),
+                            "kind": b.metadata.kind if b.metadata else None,
+                            "parent": b.metadata.parent if b.metadata else None,
                         }
                         for b in backups
                     ],
@@ -1068,11 +1111,13 @@ def backups_command(
     # Table header
     name_width = 44
     date_width = 18
+    kind_width = 5
     size_width = 10
     files_width = 8
     header = (
         f"{'Filename':<{name_width}}  "
         f"{'Created':<{date_width}}  "
+        f"{'Kind':<{kind_width}}  "
         f"{'Size':>{size_width}}  "
         f"{'Files':>{files_width}}"
     )
@@ -1094,12 +1139,15 @@ def backups_command(
         # Format file count
         if b.metadata:
             files = f"{b.metadata.file_count:,}"
+            kind = b.metadata.kind
         else:
             files = "\u2014"
+            kind = "\u2014"
 
         click.echo(
             f"{filename:<{name_width}}  "
             f"{created:<{date_width}}  "
+            f"{kind:<{kind_width}}  "
             f"{size:>{size_width}}  "
             f"{files:>{files_width}}"
         )
@@ -24,9 +24,11 @@ from vpo.db import (
 from vpo.jobs.queue import (
     cancel_job,
     get_queue_stats,
+    get_running_by_class,
     recover_stale_jobs,
     requeue_job,
 )
+from vpo.jobs.resources import resource_slots
 from vpo.jobs.worker import JobWorker
 
 logger = logging.getLogger(__name__)
@@ -299,6 +301,8 @@ def _output_job_human(job: Job) -> None:
     if job.policy_name:
         click.echo(f"  Policy:      {job.policy_name}")
     click.echo(f"  Priority:    {job.priority}")
+    if job.resource_class:
+        click.echo(f"  Class:       {job.resource_class.value}")
     click.echo("")
     click.echo(f"  Created:     {job.created_at}")
     if job.started_at:
@@ -357,6 +361,15 @@ def show_status(ctx: click.Context) -> None:
     click.echo(f"  Cancelled: {stats['cancelled']:>5}")
     click.echo("-" * 30)
     click.echo(f"  Total:     {stats['total']:>5}")
+    click.echo(f"  Coalesced: {stats['coalesced']:>5}")
+
+    slots = resource_slots(get_config().jobs)
+    click.echo("")
+    click.echo("Running by Class (limits per host)")
+    click.echo("-" * 30)
+    for resource_class, running in get_running_by_class(conn).items():
+        limit = slots[resource_class] or "-"
+        click.echo(f"  {resource_class.value + ':':<14} {running:>3} / {limit}")
 
 
 @jobs_group.command("start")
@@ -388,6 +401,14 @@ def show_status(ctx: click.Context) -> None:
     is_flag=True,
     help="Don't purge old completed jobs.",
 )
+@click.option(
+    "--batch-size",
+    "-b",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Jobs to lease from the queue per claim.",
+)
 @click.pass_context
 def start_worker(
     ctx: click.Context,
@@ -396,11 +417,15 @@ def start_worker(
     end_by: str | None,
     cpu_cores: int | None,
     no_purge: bool,
+    batch_size: int,
 ) -> None:
     """Start processing jobs from the queue.
 
     The worker will process jobs until:
-    - Queue is empty
+    - Queue is empty, or only holds jobs whose resource class is at its
+      slot limit ([jobs] *_slots in config.toml)
+    - No queued job is expected to finish before --max-duration or
+      --end-by (estimated from past job durations)
     - --max-files limit reached
     - --max-duration limit reached
     - --end-by time reached
@@ -419,6 +444,9 @@ def start_worker(
 
         # Stop at 6:00 AM
         vpo jobs start --end-by 06:00
+
+        # Reserve 10 jobs per claim (fewer round trips with many workers)
+        vpo jobs start --batch-size 10
     """
     conn = ctx.obj.get("db_conn")
     if conn is None:
@@ -435,12 +463,112 @@ def start_worker(
         cpu_cores=cpu_cores or config.worker.cpu_cores,
         auto_purge=not no_purge and config.jobs.auto_purge,
         retention_days=config.jobs.retention_days,
+        batch_size=batch_size,
+        resource_slots=resource_slots(config.jobs),
     )
 
     processed = worker.run()
     click.echo(f"Processed {processed} job(s).")
 
 
+@jobs_group.command("worker")
+@click.option(
+    "--broker",
+    "broker_url",
+    required=True,
+    help="URL of a VPO server running with --broker (e.g. http://nas:8321).",
+)
+@click.option(
+    "--path-map",
+    "-m",
+    "path_maps",
+    multiple=True,
+    metavar="SERVER=LOCAL",
+    help="Translate a server path prefix to a local one (repeatable).",
+)
+@click.option(
+    "--worker-id",
+    help="Worker name shown as the job's lease owner (default: host:pid).",
+)
+@click.option(
+    "--max-files",
+    "-n",
+    type=int,
+    help="Maximum number of files to process.",
+)
+@click.option(
+    "--max-duration",
+    "-d",
+    type=int,
+    help="Maximum duration in seconds.",
+)
+@click.option(
+    "--end-by",
+    "-e",
+    help="End time (HH:MM format, 24h).",
+)
+@click.option(
+    "--cpu-cores",
+    "-c",
+    type=int,
+    help="Number of CPU cores for transcoding.",
+)
+def remote_worker(
+    broker_url: str,
+    path_maps: tuple[str, ...],
+    worker_id: str | None,
+    max_files: int | None,
+    max_duration: int | None,
+    end_by: str | None,
+    cpu_cores: int | None,
+) -> None:
+    """Process transcode jobs from another host's queue.
+
+    Claims jobs from a server started with 'vpo serve --broker', runs them
+    on this machine and reports progress, logs and results back. The
+    server's auth token is read from VPO_AUTH_TOKEN or server.auth_token.
+
+    Examples:
+
+        # Library at /media on the server, mounted at /mnt/media here
+        vpo jobs worker --broker http://nas:8321 --path-map /media=/mnt/media
+
+        # Stop at 6:00 AM
+        vpo jobs worker --broker http://nas:8321 --end-by 06:00
+    """
+    from vpo.jobs.broker import (
+        BrokerClient,
+        PathMapper,
+        PathMapping,
+        RemoteJobWorker,
+    )
+
+    try:
+        mapper = PathMapper([PathMapping.parse(value) for value in path_maps])
+    except ValueError as e:
+        raise click.BadParameter(str(e), param_hint="--path-map") from e
+
+    config = get_config()
+    client = BrokerClient(
+        broker_url,
+        worker_id=worker_id,
+        auth_token=config.server.auth_token,
+    )
+    try:
+        worker = RemoteJobWorker(
+            client,
+            path_mapper=mapper,
+            max_files=max_files or config.worker.max_files,
+            max_duration=max_duration or config.worker.max_duration,
+            end_by=end_by or config.worker.end_by,
+            cpu_cores=cpu_cores or config.worker.cpu_cores,
+        )
+        processed = worker.run()
+    finally:
+        client.close()
+    click.echo(f"Processed {processed} job(s).")
+
+
 @jobs_group.command("cancel")
 @click.argument("job_id")
 @click.pass_context
@@ -504,7 +632,9 @@ def retry_job_cmd(ctx: click.Context, job_id: str) -> None:
     if requeue_job(conn, job.id):
         click.echo(f"Requeued job {job.id[:8]}")
     else:
-        raise click.ClickException("Failed to requeue job.")
+        raise click.ClickException(
+            "Failed to requeue job (an equivalent job may already be queued)."
+        )
 
 
 @jobs_group.command("clear")
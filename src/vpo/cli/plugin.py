@@ -216,6 +216,14 @@ def list_plugins(ctx: click.Context, verbose: bool, output_format: str) -> None:
                 }
             )
 
+    # Attach call statistics recorded by the event dispatcher
+    from vpo.plugin.dispatcher import load_plugin_stats
+
+    call_stats = load_plugin_stats()
+    for p in plugins_info:
+        if p["name"] in call_stats:
+            p["stats"] = call_stats[p["name"]].summary()
+
     # Display results
     if output_format == "json":
         click.echo(json.dumps(plugins_info, indent=2))
@@ -244,16 +252,22 @@ def list_plugins(ctx: click.Context, verbose: bool, output_format: str) -> None:
                 click.echo(f"    Events: {', '.join(p['events'])}")
             if p.get("errors"):
                 click.echo(f"    Errors: {'; '.join(p['errors'])}")
+            if p.get("stats"):
+                click.echo(f"    Calls: {_format_call_stats(p['stats'])}")
             click.echo()
     else:
         # Table format
         click.echo(
-            f"  {'NAME':<20} {'VERSION':<10} {'TYPE':<10} {'STATUS':<15} {'SOURCE':<12}"
+            f"  {'NAME':<20} {'VERSION':<10} {'TYPE':<10} {'STATUS':<15} "
+            f"{'SOURCE':<12} {'CALLS':>7} {'P95':>8}"
         )
         for p in plugins_info:
+            stats = p.get("stats") or {}
+            p95 = stats.get("p95_seconds")
             click.echo(
                 f"  {p['name']:<20} {p['version']:<10} {p['type']:<10} "
-                f"{p['status']:<15} {p['source']:<12}"
+                f"{p['status']:<15} {p['source']:<12} {stats.get('calls', 0):>7} "
+                f"{_format_seconds(p95):>8}"
             )
 
     click.echo()
@@ -261,6 +275,32 @@ def list_plugins(ctx: click.Context, verbose: bool, output_format: str) -> None:
     click.echo(f"Plugin directories: {dirs_str}")
 
 
+def _format_seconds(seconds: float | None) -> str:
+    """Format a latency for the plugin table."""
+    if seconds is None:
+        return "-"
+    if seconds < 1:
+        return f"{seconds * 1000:.0f}ms"
+    return f"{seconds:.1f}s"
+
+
+def _format_call_stats(stats: dict) -> str:
+    """One-line summary of a plugin's dispatcher call statistics."""
+    parts = [
+        f"{stats['calls']} calls",
+        f"p50 {_format_seconds(stats['p50_seconds'])}",
+        f"p95 {_format_seconds(stats['p95_seconds'])}",
+        f"max {_format_seconds(stats['max_seconds'])}",
+        f"{stats['errors']} errors",
+        f"{stats['timeouts']} timeouts",
+    ]
+    if stats["breaker_trips"]:
+        parts.append(
+            f"disabled {stats['breaker_trips']}x (last {stats['last_tripped_at']})"
+        )
+    return ", ".join(parts)
+
+
 @plugin_group.command("info")
 @click.argument("name")
 @click.pass_context
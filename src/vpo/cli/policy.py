@@ -4,6 +4,7 @@ This module provides commands for managing policy files:
 - policy list: List available policies
 - policy show: Display policy contents
 - policy validate: Validate policy syntax
+- policy simulate: Preview library-wide changes without touching files
 
 The `policy run` command has been promoted to `vpo process` for better
 discoverability as a top-level command.
@@ -551,3 +552,154 @@ def _output_human(result: dict) -> None:
         click.echo(click.style("Invalid", fg="red") + f": {result['file']}")
         if result.get("message"):
             click.echo(f"  {result['message']}")
+
+
+# =============================================================================
+# Simulate Command
+# =============================================================================
+
+
+@policy_group.command("simulate")
+@click.argument("policy_name_or_path")
+@click.option(
+    "--path",
+    "path_prefix",
+    type=click.Path(path_type=Path),
+    default=None,
+    help="Only simulate files under this directory.",
+)
+@click.option(
+    "--phases",
+    "phases_str",
+    default=None,
+    help="Phases to simulate (comma-separated, default: all).",
+)
+@click.option(
+    "--limit",
+    type=click.IntRange(min=0),
+    default=20,
+    show_default=True,
+    help="Maximum number of changed files to list.",
+)
+@click.option(
+    "--batch-size",
+    type=click.IntRange(min=1, max=10000),
+    default=500,
+    show_default=True,
+    help="Files loaded and evaluated per batch.",
+)
+@format_option
+@click.pass_context
+def simulate_policy_cmd(
+    ctx: click.Context,
+    policy_name_or_path: str,
+    path_prefix: Path | None,
+    phases_str: str | None,
+    limit: int,
+    batch_size: int,
+    output_format: str,
+) -> None:
+    """Preview which library files a policy would change.
+
+    Evaluates the policy against the track metadata of every scanned file
+    in the database, without touching any files. Much faster than
+    'vpo process --dry-run' for whole-library questions.
+
+    Transcode, audio synthesis, transcription and file timestamp
+    operations need media analysis and are not simulated.
+
+    Examples:
+
+        # Which files would this policy change?
+        vpo policy simulate normalize
+
+        # Only files under a directory, as JSON
+        vpo policy simulate normalize --path /media/movies --format json
+    """
+    from vpo.cli import get_db_conn_from_context
+    from vpo.policy.compiled import load_compiled_policy
+    from vpo.workflow.simulation import simulate_policy
+
+    json_output = output_format == "json"
+
+    policy_path = _resolve_policy_path(policy_name_or_path)
+    if policy_path is None:
+        raise click.ClickException(
+            f"Policy '{policy_name_or_path}' not found. "
+            "Specify a valid policy name or path."
+        )
+
+    try:
+        policy = load_compiled_policy(policy_path).schema
+    except PolicyValidationError as e:
+        raise click.ClickException(f"Policy validation failed: {e}")
+
+    selected_phases = None
+    if phases_str:
+        selected_phases = [p.strip() for p in phases_str.split(",") if p.strip()]
+        invalid = [name for name in selected_phases if name not in policy.phase_names]
+        if invalid:
+            raise click.ClickException(
+                f"Invalid phase name(s): {', '.join(invalid)}. "
+                f"Valid phases: {', '.join(policy.phase_names)}"
+            )
+
+    conn = get_db_conn_from_context(ctx)
+    result = simulate_policy(
+        conn,
+        policy,
+        policy_name=policy.name or policy_path.stem,
+        selected_phases=selected_phases,
+        path_prefix=str(path_prefix.expanduser().resolve()) if path_prefix else None,
+        batch_size=batch_size,
+        max_files=limit,
+    )
+
+    if json_output:
+        click.echo(json.dumps(result.to_dict(), indent=2))
+        return
+
+    _output_simulation_human(result)
+
+
+def _output_simulation_human(result) -> None:
+    """Output a SimulationResult in human-readable format."""
+    click.echo(f"Policy: {result.policy_name}")
+    click.echo(
+        f"Simulated {result.total_files} file(s) in {result.duration_seconds:.1f}s"
+    )
+    click.echo(f"  Would change: {result.files_changed}")
+    click.echo(f"  Compliant:    {result.files_compliant}")
+    if result.files_errored:
+        click.echo(f"  Would fail:   {result.files_errored}")
+    if result.remux_required:
+        click.echo(f"  Need remux:   {result.remux_required}")
+    if result.tracks_removed:
+        click.echo(f"  Tracks removed: {result.tracks_removed}")
+
+    if result.action_counts:
+        click.echo("")
+        click.echo("Planned actions:")
+        for action, count in result.action_counts.most_common():
+            click.echo(f"  {action}: {count}")
+
+    if result.phase_counts:
+        click.echo("")
+        click.echo("Files changed by phase:")
+        for phase, count in result.phase_counts.most_common():
+            click.echo(f"  {phase}: {count}")
+
+    if result.files:
+        click.echo("")
+        click.echo("Files:")
+        for sim in result.files:
+            if sim.error:
+                click.echo(f"  [FAIL] {sim.path}: {sim.error}")
+            else:
+                click.echo(f"  [{sim.changes:>3}] {sim.path}")
+        if result.truncated:
+            click.echo("  ... (use --limit to list more)")
+
+    if result.unsimulated_operations:
+        click.echo("")
+        click.echo("Not simulated: " + ", ".join(result.unsimulated_operations))
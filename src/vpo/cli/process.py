@@ -7,13 +7,23 @@ the most common workflow command to top level.
 
 import json
 import logging
+import multiprocessing
 import os
+import signal
 import sqlite3
 import sys
 import threading
 import time
 import uuid
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import (
+    Executor,
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+)
+from contextlib import ExitStack, nullcontext
+from logging.handlers import QueueHandler, QueueListener
+from multiprocessing.util import Finalize
 from pathlib import Path
 
 import click
@@ -32,8 +42,9 @@ from vpo.jobs import (
     StderrProgressReporter,
     WorkflowRunnerConfig,
 )
-from vpo.logging import worker_context
-from vpo.policy.loader import PolicyValidationError, load_policy
+from vpo.logging import WorkerContextFilter, worker_context
+from vpo.policy.compiled import load_compiled_policy
+from vpo.policy.loader import PolicyValidationError
 from vpo.policy.types import (
     FileProcessingResult,
     FileSnapshot,
@@ -340,6 +351,7 @@ def _format_result_json(result, file_path: Path) -> dict:
         "phases_failed": result.phases_failed,
         "phases_skipped": result.phases_skipped,
         "total_changes": result.total_changes,
+        "already_compliant": result.already_compliant,
         "failed_phase": result.failed_phase,
         "error_message": result.error_message,
         "duration_seconds": round(result.total_duration_seconds, 2),
@@ -487,10 +499,12 @@ def _process_single_file(
     file_id: str,
     batch_id: str | None,
     save_logs: bool = False,
+    conn: sqlite3.Connection | None = None,
 ) -> tuple[Path, list[tuple[str, FileProcessingResult]] | None, bool]:
     """Process a single file through one or more policies sequentially.
 
-    Each worker creates its own database connection for thread safety.
+    Each worker creates its own database connection for thread safety,
+    unless a per-process connection is supplied.
     When multiple policies are provided, they run in order on the file.
     If a policy fails, the failing policy's on_error setting determines
     whether to continue to the next policy (continue), skip remaining
@@ -508,6 +522,7 @@ def _process_single_file(
         file_id: File identifier for logging (e.g., "F001").
         batch_id: UUID grouping CLI batch operations (None if dry-run).
         save_logs: If True, save detailed logs to ~/.vpo/logs/.
+        conn: Existing connection to use instead of opening one from db_path.
 
     Returns:
         Tuple of (file_path, list of (policy_name, result) pairs, overall_success).
@@ -527,7 +542,7 @@ def _process_single_file(
             logger.info("=== FILE %s: %s", file_id, file_path)
 
             # Each worker gets its own connection for thread safety
-            with get_connection(db_path) as conn:
+            with nullcontext(conn) if conn else get_connection(db_path) as conn:
                 # Get database file_id if file exists in DB
                 db_file_id: int | None = None
                 if not runner_configs[0].dry_run:
@@ -591,6 +606,74 @@ def _process_single_file(
         return file_path, [(current_policy_name, result)], False
 
 
+# Per-process state for --executor=process workers, set by the pool initializer
+_process_worker_state: dict = {}
+
+
+def _init_process_worker(
+    db_path: Path,
+    policy_paths: list[Path],
+    stop_event: threading.Event,
+    log_queue: multiprocessing.Queue,
+    log_level: int,
+) -> None:
+    """Initialize a worker process for --executor=process.
+
+    Loads the policies, opens the process's database connection and routes
+    all logging through log_queue to the parent's handlers. SIGINT is
+    ignored so that Ctrl-C is coordinated by the parent through stop_event
+    instead of interrupting workers mid-file.
+    """
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    handler = QueueHandler(log_queue)
+    handler.addFilter(WorkerContextFilter())
+    root_logger = logging.getLogger()
+    root_logger.handlers = [handler]
+    root_logger.setLevel(log_level)
+
+    resources = ExitStack()
+    Finalize(None, resources.close, exitpriority=10)
+    _process_worker_state.update(
+        db_path=db_path,
+        policies=[(p, load_compiled_policy(p).schema) for p in policy_paths],
+        conn=resources.enter_context(get_connection(db_path)),
+        stop_event=stop_event,
+        resources=resources,
+    )
+
+
+def _process_file_in_worker(
+    file_path: Path,
+    file_index: int,
+    runner_configs: list[WorkflowRunnerConfig],
+    worker_id: str,
+    file_id: str,
+    batch_id: str | None,
+    save_logs: bool = False,
+) -> tuple[Path, list[tuple[str, FileProcessingResult]] | None, bool]:
+    """Process a single file in a worker process (see _init_process_worker).
+
+    Progress is reported by the parent as results arrive, so the worker
+    uses a disabled reporter.
+    """
+    state = _process_worker_state
+    return _process_single_file(
+        file_path,
+        file_index,
+        state["db_path"],
+        state["policies"],
+        runner_configs,
+        StderrProgressReporter(enabled=False),
+        state["stop_event"],
+        worker_id,
+        file_id,
+        batch_id,
+        save_logs,
+        conn=state["conn"],
+    )
+
+
 # =============================================================================
 # Process Command
 # =============================================================================
@@ -651,11 +734,28 @@ def _process_single_file(
         "Each worker needs ~2.5x file size disk space for transcoding."
     ),
 )
+@click.option(
+    "--executor",
+    "executor_kind",
+    type=click.Choice(["thread", "process"]),
+    default="thread",
+    show_default=True,
+    help=(
+        "Run workers as threads or as separate processes. Processes scale "
+        "policy evaluation across CPU cores for metadata-only batches."
+    ),
+)
 @click.option(
     "--save-logs/--no-save-logs",
     default=True,
     help="Save detailed job logs to ~/.vpo/logs/ (default: enabled).",
 )
+@click.option(
+    "--force",
+    is_flag=True,
+    default=False,
+    help="Re-evaluate files previously recorded as compliant with the policy.",
+)
 @click.argument(
     "paths",
     nargs=-1,
@@ -672,7 +772,9 @@ def process_command(
     output_format: str,
     json_short: bool,
     workers: int | None,
+    executor_kind: str,
     save_logs: bool,
+    force: bool,
     paths: tuple[Path, ...],
 ) -> None:
     """Apply a policy to media files.
@@ -696,6 +798,14 @@ def process_command(
         vpo process -p policy.yaml --phases analyze,apply movie.mkv
 
         vpo process -p policy.yaml --dry-run movie.mkv
+
+    Files that needed no changes under a policy are remembered and skipped
+    on later runs until the file or the policy changes. Use --force to
+    re-evaluate them anyway.
+
+    With --executor process, workers run in separate processes so that
+    policy evaluation is not limited by the GIL; each worker process keeps
+    its own database connection.
     """
     if json_short:
         output_format = "json"
@@ -720,10 +830,12 @@ def process_command(
 
     # Load all policies upfront (fail fast on any invalid policy)
     policies: list[tuple[Path, PolicySchema]] = []
+    policy_hashes: list[str] = []
     for p in resolved_paths:
         p = p.expanduser().resolve()
         try:
-            schema = load_policy(p)
+            compiled = load_compiled_policy(p)
+            schema = compiled.schema
         except FileNotFoundError:
             error_exit(
                 f"Policy file not found: {p}",
@@ -733,6 +845,7 @@ def process_command(
         except PolicyValidationError as e:
             error_exit(str(e), ExitCode.POLICY_VALIDATION_ERROR, json_output)
         policies.append((p, schema))
+        policy_hashes.append(compiled.content_hash)
 
     # Discover files
     file_paths = _discover_files(list(paths), recursive)
@@ -767,7 +880,7 @@ def process_command(
                 click.echo(f"  - {policy_path} (v{policy.schema_version})")
         click.echo(f"Files: {len(file_paths)}")
         click.echo(f"Mode: {'dry-run' if dry_run else 'live'}")
-        click.echo(f"Workers: {effective_workers}")
+        click.echo(f"Workers: {effective_workers} ({executor_kind})")
         click.echo("")
 
     # Process files
@@ -775,6 +888,7 @@ def process_command(
     success_count = 0
     fail_count = 0
     not_in_db_count = 0
+    compliant_count = 0
     stopped_early = False
     batch_start_time = time.time()
 
@@ -807,7 +921,6 @@ def process_command(
         enabled=not json_output and not verbose,  # Disable if JSON or verbose
     )
     progress.on_start(len(file_paths))
-    stop_event = threading.Event()
 
     # Generate batch_id for CLI batch operations (skip for dry-run)
     batch_id = str(uuid.uuid4()) if not dry_run else None
@@ -819,15 +932,46 @@ def process_command(
             verbose=verbose,
             selected_phases=selected_phases,
             policy_name=schema.name or path.stem,
+            policy_hash=policy_hash,
+            use_compliance_memo=config.processing.compliance_memo and not force,
         )
-        for path, schema in policies
+        for (path, schema), policy_hash in zip(policies, policy_hashes, strict=True)
     ]
 
+    # In process mode the stop event is shared with the worker processes
+    # and their log records are forwarded to this process's handlers.
+    log_listener: QueueListener | None = None
     try:
         # The strictest on_error mode across all policies governs the batch.
         batch_on_error = strictest_error_mode(schema for _, schema in policies)
 
-        with ThreadPoolExecutor(max_workers=effective_workers) as executor:
+        pool: Executor
+        if executor_kind == "process":
+            mp_context = multiprocessing.get_context("spawn")
+            stop_event = mp_context.Event()
+            log_queue = mp_context.Queue()
+            root_logger = logging.getLogger()
+            log_listener = QueueListener(
+                log_queue, *root_logger.handlers, respect_handler_level=True
+            )
+            log_listener.start()
+            pool = ProcessPoolExecutor(
+                max_workers=effective_workers,
+                mp_context=mp_context,
+                initializer=_init_process_worker,
+                initargs=(
+                    db_path,
+                    [path for path, _ in policies],
+                    stop_event,
+                    log_queue,
+                    root_logger.getEffectiveLevel(),
+                ),
+            )
+        else:
+            stop_event = threading.Event()
+            pool = ThreadPoolExecutor(max_workers=effective_workers)
+
+        with pool as executor:
             # Submit all files as futures
             futures = {}
 
@@ -847,28 +991,44 @@ def process_command(
                 file_id = f"F{file_idx:0{file_id_width}d}"
 
                 # file_index is 0-based for progress tracking
-                future = executor.submit(
-                    _process_single_file,
-                    file_path,
-                    file_idx - 1,  # 0-based index for progress
-                    db_path,
-                    policies,
-                    runner_configs,
-                    progress,
-                    stop_event,
-                    worker_id,
-                    file_id,
-                    batch_id,
-                    save_logs,
-                )
-                futures[future] = file_path
+                if executor_kind == "process":
+                    future = executor.submit(
+                        _process_file_in_worker,
+                        file_path,
+                        file_idx - 1,
+                        runner_configs,
+                        worker_id,
+                        file_id,
+                        batch_id,
+                        save_logs,
+                    )
+                else:
+                    future = executor.submit(
+                        _process_single_file,
+                        file_path,
+                        file_idx - 1,  # 0-based index for progress
+                        db_path,
+                        policies,
+                        runner_configs,
+                        progress,
+                        stop_event,
+                        worker_id,
+                        file_id,
+                        batch_id,
+                        save_logs,
+                    )
+                futures[future] = (file_path, file_idx - 1)
 
             # Process results as they complete
             try:
                 for future in as_completed(futures):
-                    file_path = futures[future]
+                    file_path, file_index = futures[future]
                     try:
                         _, policy_results, success = future.result()
+                        if executor_kind == "process" and policy_results is not None:
+                            # Worker processes cannot update the parent's display
+                            progress.on_item_start(file_index)
+                            progress.on_item_complete(file_index, success=success)
                         if policy_results is not None:
                             results.append((file_path, policy_results))
                             # Check for not-in-db (first policy result will show it)
@@ -880,6 +1040,8 @@ def process_command(
                                 not_in_db_count += 1
                             elif success:
                                 success_count += 1
+                                if all(r.already_compliant for _, r in policy_results):
+                                    compliant_count += 1
                             else:
                                 fail_count += 1
 
@@ -887,6 +1049,12 @@ def process_command(
                             if not json_output and verbose:
                                 if is_not_in_db:
                                     output = f"[SKIP] {file_path.name}: not in database"
+                                elif all(
+                                    r.already_compliant for _, r in policy_results
+                                ):
+                                    output = (
+                                        f"[SKIP] {file_path.name}: already compliant"
+                                    )
                                 else:
                                     output = _format_multi_policy_result_human(
                                         policy_results, file_path, verbose
@@ -969,6 +1137,9 @@ def process_command(
 
     except sqlite3.Error as e:
         error_exit(f"Database error: {e}", ExitCode.GENERAL_ERROR, json_output)
+    finally:
+        if log_listener is not None:
+            log_listener.stop()
 
     # Calculate batch duration
     batch_duration = time.time() - batch_start_time
@@ -1024,11 +1195,13 @@ def process_command(
             "multi_policy": len(policies) > 1,
             "dry_run": dry_run,
             "workers": effective_workers,
+            "executor": executor_kind,
             "summary": {
                 "total": len(results),
                 "success": success_count,
                 "failed": fail_count,
                 "skipped_not_in_db": not_in_db_count,
+                "already_compliant": compliant_count,
                 "duration_seconds": round(batch_duration, 2),
                 "stopped_early": stopped_early,
             },
@@ -1048,6 +1221,11 @@ def process_command(
                 f"Skipped {not_in_db_count} file(s) not in database"
                 " (run 'vpo scan' first)"
             )
+        if compliant_count > 0:
+            click.echo(
+                f"Skipped {compliant_count} file(s) already compliant"
+                " (use --force to re-evaluate)"
+            )
         if stopped_early:
             click.echo("(Batch stopped early due to error)")
 
@@ -12,9 +12,11 @@ The stats module has been merged into this module for a unified reporting interf
 """
 
 import csv
+import itertools
 import json
 import logging
 import sys
+from collections.abc import Iterable
 from dataclasses import asdict
 from pathlib import Path
 
@@ -30,11 +32,11 @@ from vpo.db.views import (
     get_stats_summary,
 )
 from vpo.reports import (
+    REPORT_COLUMNS,
     ReportFormat,
     TimeFilter,
-    render_csv,
-    render_json,
-    render_text_table,
+    buffer_chunks,
+    iter_report,
     write_report_to_file,
 )
 
@@ -107,7 +109,7 @@ def common_report_options(func):
         "--format",
         "-f",
         "output_format",
-        type=click.Choice(["text", "csv", "json"], case_sensitive=False),
+        type=click.Choice(["text", "csv", "json", "ndjson"], case_sensitive=False),
         default="text",
         help="Output format (default: text).",
     )(func)
@@ -157,7 +159,7 @@ def time_filter_options(func):
 
 
 def output_report(
-    rows: list[dict],
+    rows: Iterable[dict],
     columns: list[tuple[str, str, int]],
     output_format: str,
     output_path: Path | None,
@@ -168,41 +170,45 @@ def output_report(
 ) -> None:
     """Output report in requested format.
 
+    Rows are rendered and written as they are produced, so a report
+    generator (see vpo.reports.queries.iter_*_report) is exported in
+    constant memory.
+
     Args:
-        rows: List of row dictionaries.
+        rows: Row dictionaries (a list or a generator).
         columns: List of (header, key, width) tuples for text format.
-        output_format: Output format (text, csv, json).
+        output_format: Output format (text, csv, json, ndjson).
         output_path: Output file path or None for stdout.
         force: Overwrite existing files.
         empty_message: Message when no records exist.
         filtered_message: Message when filters match nothing.
         has_filters: Whether filters were applied.
     """
-    if not rows:
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None:
         msg = filtered_message if has_filters else empty_message
         click.echo(msg)
         return
 
     fmt = ReportFormat(output_format.casefold())
-    column_keys = [col[1] for col in columns]
-
-    if fmt == ReportFormat.TEXT:
-        content = render_text_table(rows, columns)
-    elif fmt == ReportFormat.CSV:
-        content = render_csv(rows, column_keys)
-    else:  # JSON
-        content = render_json(rows)
+    chunks = buffer_chunks(iter_report(itertools.chain([first], rows), fmt, columns))
 
     if output_path:
         try:
-            write_report_to_file(content, output_path, force)
+            write_report_to_file(chunks, output_path, force)
             click.echo(f"Report written to {output_path}")
         except FileExistsError as e:
             raise click.ClickException(str(e))
         except OSError as e:
             raise click.ClickException(f"Failed to write report: {e}")
     else:
-        click.echo(content)
+        tail = ""
+        for chunk in chunks:
+            click.echo(chunk, nl=False)
+            tail = chunk
+        if not tail.endswith("\n"):
+            click.echo()
 
 
 def get_effective_limit(limit: int, no_limit: bool) -> int | None:
@@ -250,6 +256,7 @@ def report_group() -> None:
       scans          Scan operation history
       transcodes     Transcode job history
       history        Processing history for the library
+      io-wait        I/O admission wait time per disk
 
     \b
     Library reports:
@@ -267,6 +274,7 @@ def report_group() -> None:
     \b
     Maintenance:
       purge          Remove old report data
+      rebuild-rollups  Recompute the statistics rollups from history
 
     Examples:
 
@@ -336,7 +344,7 @@ def report_jobs(
     if conn is None:
         raise click.ClickException("Failed to connect to database.")
 
-    from vpo.reports.queries import get_jobs_report
+    from vpo.reports.queries import iter_jobs_report
 
     time_filter = parse_time_filter(since, until)
     effective_limit = get_effective_limit(limit, no_limit)
@@ -344,7 +352,7 @@ def report_jobs(
     # Determine if filters are applied
     has_filters = bool(job_type != "all" or status != "all" or since or until)
 
-    rows = get_jobs_report(
+    rows = iter_jobs_report(
         conn,
         job_type=None if job_type == "all" else job_type,
         status=None if status == "all" else status,
@@ -352,20 +360,9 @@ def report_jobs(
         limit=effective_limit,
     )
 
-    columns = [
-        ("ID", "job_id", 10),
-        ("TYPE", "type", 10),
-        ("STATUS", "status", 12),
-        ("TARGET", "target", 40),
-        ("STARTED", "started_at", 20),
-        ("COMPLETED", "completed_at", 20),
-        ("DURATION", "duration", 12),
-        ("ERROR", "error", 30),
-    ]
-
     output_report(
         rows,
-        columns,
+        REPORT_COLUMNS["jobs"],
         output_format,
         output_path,
         force,
@@ -441,7 +438,7 @@ def report_library(
     if conn is None:
         raise click.ClickException("Failed to connect to database.")
 
-    from vpo.reports.queries import get_library_report
+    from vpo.reports.queries import iter_library_report
 
     effective_limit = get_effective_limit(limit, no_limit)
 
@@ -455,7 +452,7 @@ def report_library(
     # Determine if filters are applied
     has_filters = bool(resolution or language or has_subtitles or no_subtitles)
 
-    rows = get_library_report(
+    rows = iter_library_report(
         conn,
         resolution=resolution.upper() if resolution else None,
         language=language,
@@ -463,19 +460,9 @@ def report_library(
         limit=effective_limit,
     )
 
-    columns = [
-        ("PATH", "path", 50),
-        ("TITLE", "title", 30),
-        ("CONTAINER", "container", 10),
-        ("RESOLUTION", "resolution", 10),
-        ("AUDIO", "audio_languages", 15),
-        ("SUBTITLES", "has_subtitles", 10),
-        ("SCANNED", "scanned_at", 20),
-    ]
-
     output_report(
         rows,
-        columns,
+        REPORT_COLUMNS["library"],
         output_format,
         output_path,
         force,
@@ -517,33 +504,22 @@ def report_scans(
     if conn is None:
         raise click.ClickException("Failed to connect to database.")
 
-    from vpo.reports.queries import get_scans_report
+    from vpo.reports.queries import iter_scans_report
 
     time_filter = parse_time_filter(since, until)
     effective_limit = get_effective_limit(limit, no_limit)
 
     has_filters = bool(since or until)
 
-    rows = get_scans_report(
+    rows = iter_scans_report(
         conn,
         time_filter=time_filter,
         limit=effective_limit,
     )
 
-    columns = [
-        ("SCAN_ID", "scan_id", 10),
-        ("STARTED", "started_at", 20),
-        ("COMPLETED", "completed_at", 20),
-        ("DURATION", "duration", 12),
-        ("TOTAL", "files_scanned", 8),
-        ("NEW", "files_new", 8),
-        ("CHANGED", "files_changed", 8),
-        ("STATUS", "status", 12),
-    ]
-
     output_report(
         rows,
-        columns,
+        REPORT_COLUMNS["scans"],
         output_format,
         output_path,
         force,
@@ -592,30 +568,80 @@ def report_transcodes(
     if conn is None:
         raise click.ClickException("Failed to connect to database.")
 
-    from vpo.reports.queries import get_transcodes_report
+    from vpo.reports.queries import iter_transcodes_report
 
     time_filter = parse_time_filter(since, until)
     effective_limit = get_effective_limit(limit, no_limit)
 
     has_filters = bool(codec or since or until)
 
-    rows = get_transcodes_report(
+    rows = iter_transcodes_report(
         conn,
         codec=codec,
         time_filter=time_filter,
         limit=effective_limit,
     )
 
+    output_report(
+        rows,
+        REPORT_COLUMNS["transcodes"],
+        output_format,
+        output_path,
+        force,
+        has_filters=has_filters,
+    )
+
+
+@report_group.command("io-wait")
+@time_filter_options
+@common_report_options
+@click.pass_context
+def report_io_wait(
+    ctx: click.Context,
+    since: str | None,
+    until: str | None,
+    output_format: str,
+    output_path: Path | None,
+    force: bool,
+    limit: int,
+    no_limit: bool,
+) -> None:
+    """Show I/O admission wait time per block device.
+
+    When per-device limits are configured ([processing]
+    io_device_concurrency, io_device_bandwidth_mb_per_sec or
+    io_device_limits), each processed phase records how long it queued for
+    its disks. Devices are shown as major:minor numbers (see lsblk).
+
+    Examples:
+
+        # Which disks are the bottleneck?
+        vpo report io-wait
+
+        # Last day only
+        vpo report io-wait --since 1d
+    """
+    conn = ctx.obj.get("db_conn")
+    if conn is None:
+        raise click.ClickException("Failed to connect to database.")
+
+    from vpo.reports.queries import get_io_wait_report
+
+    time_filter = parse_time_filter(since, until)
+    effective_limit = get_effective_limit(limit, no_limit)
+
+    rows = get_io_wait_report(
+        conn,
+        time_filter=time_filter,
+        limit=effective_limit,
+    )
+
     columns = [
-        ("JOB_ID", "job_id", 10),
-        ("FILE", "file_path", 40),
-        ("FROM", "source_codec", 10),
-        ("TO", "target_codec", 10),
-        ("STARTED", "started_at", 20),
-        ("COMPLETED", "completed_at", 20),
-        ("DURATION", "duration", 12),
-        ("STATUS", "status", 12),
-        ("SAVINGS", "size_change", 10),
+        ("DEVICE", "device", 10),
+        ("PHASES", "phases", 8),
+        ("TOTAL_WAIT", "total_wait", 12),
+        ("AVG_WAIT", "avg_wait", 10),
+        ("MAX_WAIT", "max_wait", 10),
     ]
 
     output_report(
@@ -624,7 +650,8 @@ def report_transcodes(
         output_format,
         output_path,
         force,
-        has_filters=has_filters,
+        empty_message="No I/O admission waits recorded.",
+        has_filters=bool(since or until),
     )
 
 
@@ -1695,3 +1722,27 @@ def report_purge(
         deleted = delete_processing_stats_by_policy(conn, policy_name)  # type: ignore
 
     click.echo(f"Deleted {deleted} processing stats records.")
+
+
+@report_group.command("rebuild-rollups")
+@click.pass_context
+def report_rebuild_rollups(ctx: click.Context) -> None:
+    """Recompute the hourly and daily statistics rollups.
+
+    Summary, policy and trend statistics read pre-aggregated rollups that
+    are updated as files are processed. Rebuild them from the full
+    processing history after restoring an old backup or editing
+    processing_stats outside VPO.
+
+    Examples:
+
+        vpo report rebuild-rollups
+    """
+    from vpo.db.queries import rebuild_stats_rollups
+
+    conn = ctx.obj.get("db_conn")
+    if conn is None:
+        raise click.ClickException("Failed to connect to database.")
+
+    rows = rebuild_stats_rollups(conn)
+    click.echo(f"Rebuilt {rows} statistics rollup rows.")
@@ -589,6 +589,8 @@ def scan(
                 )
 
                 try:
+                    from vpo.scanner.enrichment import EnrichmentStage
+
                     files, result = scanner.scan_and_persist(
                         directories,
                         conn,
@@ -598,6 +600,9 @@ def scan(
                         verify_hash=verify_hash,
                         scan_progress=progress,
                         job_id=job.id,
+                        enrichment=EnrichmentStage.from_registry(
+                            get_default_registry()
+                        ),
                     )
 
                     if analyze_languages and not result.interrupted:
@@ -623,6 +628,7 @@ def scan(
                         "skipped": result.files_skipped,
                         "added": result.files_new,
                         "removed": result.files_removed,
+                        "enriched": result.files_enriched,
                         "errors": result.files_errored,
                     }
                     if analyze_languages:
@@ -711,6 +717,7 @@ def output_json(
         data["files_updated"] = result.files_updated
         data["files_skipped"] = result.files_skipped
         data["files_removed"] = getattr(result, "files_removed", 0)
+        data["files_enriched"] = getattr(result, "files_enriched", 0)
         data["incremental"] = getattr(result, "incremental", True)
         if hasattr(result, "job_id") and result.job_id:
             data["job_id"] = result.job_id
@@ -768,6 +775,9 @@ def output_human(
         files_removed = getattr(result, "files_removed", 0)
         if files_removed > 0:
             click.echo(f"  Removed (missing): {files_removed:,}")
+        files_enriched = getattr(result, "files_enriched", 0)
+        if files_enriched > 0:
+            click.echo(f"  Enriched (plugins): {files_enriched:,}")
     else:
         click.echo("  (dry run - no database changes)")
 
@@ -63,6 +63,7 @@ async def run_server(
     auth_token: str | None = None,
     config_path: Path | None = None,
     config: VPOConfig | None = None,
+    job_broker: bool = False,
 ) -> int:
     """Run the daemon server.
 
@@ -75,6 +76,7 @@ async def run_server(
         auth_token: Optional auth token for HTTP Basic Auth.
         config_path: Optional path to config file for reload support.
         config: Current configuration for reload comparison.
+        job_broker: Expose the job broker API for remote workers.
 
     Returns:
         Exit code (0 for clean shutdown, non-zero for errors).
@@ -116,7 +118,7 @@ async def run_server(
     setup_signal_handlers(loop, lifecycle, shutdown_event, reload_callback)
 
     # Create the application with database path for connection pooling
-    app = create_app(db_path=db_path, auth_token=auth_token)
+    app = create_app(db_path=db_path, auth_token=auth_token, job_broker=job_broker)
     app["lifecycle"] = lifecycle
     lifecycle.set_rate_limiter(app["rate_limiter"])
 
@@ -243,6 +245,12 @@ async def run_server(
     default=None,
     help="Named configuration profile to use.",
 )
+@click.option(
+    "--broker/--no-broker",
+    default=None,
+    help="Let remote workers (vpo jobs worker --broker) claim queued "
+    "transcode jobs from this server (default: server.broker).",
+)
 @click.pass_context
 def serve_command(
     ctx: click.Context,
@@ -252,6 +260,7 @@ def serve_command(
     log_level: str | None,
     log_format: str | None,
     profile: str | None,
+    broker: bool | None,
 ) -> None:
     """Run VPO as a background daemon.
 
@@ -279,6 +288,7 @@ def serve_command(
         vpo serve --bind 0.0.0.0            # Listen on all interfaces
         vpo serve --config /etc/vpo/config.toml  # Custom config
         vpo serve --log-format json         # JSON logging for systemd
+        vpo serve --bind 0.0.0.0 --broker   # Accept remote workers
     """
     # Configure logging for daemon mode
     _configure_daemon_logging(log_level, log_format, config_path)
@@ -298,6 +308,7 @@ def serve_command(
     server_port = port if port is not None else config.server.port
     shutdown_timeout = config.server.shutdown_timeout
     auth_token = config.server.auth_token
+    job_broker = broker if broker is not None else config.server.broker
 
     # Get database path
     db_path = config.database_path or get_default_db_path()
@@ -355,6 +366,7 @@ def serve_command(
                 auth_token,
                 config_path,
                 config,
+                job_broker=job_broker,
             )
         )
         sys.exit(exit_code)
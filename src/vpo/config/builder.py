@@ -66,6 +66,10 @@ class ConfigSource:
     entry_point_group: str | None = None
     plugin_auto_load: bool | None = None
     plugin_warn_unacknowledged: bool | None = None
+    plugin_event_workers: int | None = None
+    plugin_event_timeout_seconds: float | None = None
+    plugin_circuit_breaker_threshold: int | None = None
+    plugin_circuit_breaker_reset_seconds: float | None = None
 
     # Jobs config
     jobs_retention_days: int | None = None
@@ -77,6 +81,10 @@ class ConfigSource:
     jobs_min_free_disk_percent: float | None = None
     jobs_auto_prune_enabled: bool | None = None
     jobs_auto_prune_interval_hours: int | None = None
+    jobs_metadata_slots: int | None = None
+    jobs_io_slots: int | None = None
+    jobs_cpu_slots: int | None = None
+    jobs_transcription_slots: int | None = None
 
     # Worker config
     worker_max_files: int | None = None
@@ -89,6 +97,7 @@ class ConfigSource:
     server_port: int | None = None
     server_shutdown_timeout: float | None = None
     server_auth_token: str | None = None
+    server_broker: bool | None = None
 
     # Rate limit config
     server_rate_limit_enabled: bool | None = None
@@ -131,6 +140,10 @@ class ConfigSource:
 
     # Processing config
     processing_workers: int | None = None
+    processing_compliance_memo: bool | None = None
+    processing_io_device_concurrency: int | None = None
+    processing_io_device_bandwidth_mb_per_sec: float | None = None
+    processing_io_device_limits: dict[str, int] | None = None
 
 
 class ConfigBuilder:
@@ -284,6 +297,12 @@ class ConfigBuilder:
             entry_point_group=self._get("entry_point_group", "vpo.plugins"),
             auto_load=self._get("plugin_auto_load", True),
             warn_unacknowledged=self._get("plugin_warn_unacknowledged", True),
+            event_workers=self._get("plugin_event_workers", 8),
+            event_timeout_seconds=self._get("plugin_event_timeout_seconds", 30.0),
+            circuit_breaker_threshold=self._get("plugin_circuit_breaker_threshold", 3),
+            circuit_breaker_reset_seconds=self._get(
+                "plugin_circuit_breaker_reset_seconds", 300.0
+            ),
             metadata=metadata,
         )
 
@@ -298,6 +317,10 @@ class ConfigBuilder:
             min_free_disk_percent=self._get("jobs_min_free_disk_percent", 5.0),
             auto_prune_enabled=self._get("jobs_auto_prune_enabled", False),
             auto_prune_interval_hours=self._get("jobs_auto_prune_interval_hours", 168),
+            metadata_slots=self._get("jobs_metadata_slots", 0),
+            io_slots=self._get("jobs_io_slots", 2),
+            cpu_slots=self._get("jobs_cpu_slots", 1),
+            transcription_slots=self._get("jobs_transcription_slots", 1),
         )
 
         # Build worker config
@@ -327,6 +350,7 @@ class ConfigBuilder:
             port=self._get("server_port", 8321),
             shutdown_timeout=self._get("server_shutdown_timeout", 30.0),
             auth_token=self._get("server_auth_token", None),
+            broker=self._get("server_broker", False),
             rate_limit=rate_limit,
         )
 
@@ -360,6 +384,12 @@ class ConfigBuilder:
         # Build processing config
         processing = ProcessingConfig(
             workers=self._get("processing_workers", 2),
+            compliance_memo=self._get("processing_compliance_memo", True),
+            io_device_concurrency=self._get("processing_io_device_concurrency", 0),
+            io_device_bandwidth_mb_per_sec=self._get(
+                "processing_io_device_bandwidth_mb_per_sec", 0.0
+            ),
+            io_device_limits=self._get("processing_io_device_limits", {}),
         )
 
         return VPOConfig(
@@ -439,6 +469,10 @@ _KNOWN_SECTION_KEYS: dict[str, set[str]] = {
         "entry_point_group",
         "auto_load",
         "warn_unacknowledged",
+        "event_workers",
+        "event_timeout_seconds",
+        "circuit_breaker_threshold",
+        "circuit_breaker_reset_seconds",
         "metadata",
     },
     "jobs": {
@@ -454,6 +488,10 @@ _KNOWN_SECTION_KEYS: dict[str, set[str]] = {
         "min_free_disk_percent",
         "auto_prune_enabled",
         "auto_prune_interval_hours",
+        "metadata_slots",
+        "io_slots",
+        "cpu_slots",
+        "transcription_slots",
     },
     "worker": {"max_files", "max_duration", "end_by", "cpu_cores"},
     "server": {
@@ -461,6 +499,7 @@ _KNOWN_SECTION_KEYS: dict[str, set[str]] = {
         "port",
         "shutdown_timeout",
         "auth_token",
+        "broker",
         "rate_limit",
     },
     "server.rate_limit": {
@@ -487,7 +526,13 @@ _KNOWN_SECTION_KEYS: dict[str, set[str]] = {
         "confidence_threshold",
         "incumbent_bonus",
     },
-    "processing": {"workers"},
+    "processing": {
+        "workers",
+        "compliance_memo",
+        "io_device_concurrency",
+        "io_device_bandwidth_mb_per_sec",
+        "io_device_limits",
+    },
     "plugins.metadata.radarr": {"url", "api_key", "enabled", "timeout_seconds"},
     "plugins.metadata.sonarr": {"url", "api_key", "enabled", "timeout_seconds"},
 }
@@ -573,6 +618,12 @@ def source_from_file(file_config: dict[str, Any]) -> ConfigSource:
         entry_point_group=plugins.get("entry_point_group"),
         plugin_auto_load=plugins.get("auto_load"),
         plugin_warn_unacknowledged=plugins.get("warn_unacknowledged"),
+        plugin_event_workers=plugins.get("event_workers"),
+        plugin_event_timeout_seconds=plugins.get("event_timeout_seconds"),
+        plugin_circuit_breaker_threshold=plugins.get("circuit_breaker_threshold"),
+        plugin_circuit_breaker_reset_seconds=plugins.get(
+            "circuit_breaker_reset_seconds"
+        ),
         # Jobs
         jobs_retention_days=jobs.get("retention_days"),
         jobs_auto_purge=jobs.get("auto_purge"),
@@ -581,6 +632,10 @@ def source_from_file(file_config: dict[str, Any]) -> ConfigSource:
         jobs_log_compression_days=jobs.get("log_compression_days"),
         jobs_log_deletion_days=jobs.get("log_deletion_days"),
         jobs_min_free_disk_percent=jobs.get("min_free_disk_percent"),
+        jobs_metadata_slots=jobs.get("metadata_slots"),
+        jobs_io_slots=jobs.get("io_slots"),
+        jobs_cpu_slots=jobs.get("cpu_slots"),
+        jobs_transcription_slots=jobs.get("transcription_slots"),
         # Worker
         worker_max_files=worker.get("max_files"),
         worker_max_duration=worker.get("max_duration"),
@@ -591,6 +646,7 @@ def source_from_file(file_config: dict[str, Any]) -> ConfigSource:
         server_port=server.get("port"),
         server_shutdown_timeout=server.get("shutdown_timeout"),
         server_auth_token=server.get("auth_token"),
+        server_broker=server.get("broker"),
         # Rate limit
         server_rate_limit_enabled=rate_limit.get("enabled"),
         server_rate_limit_get_max_requests=rate_limit.get("get_max_requests"),
@@ -626,6 +682,12 @@ def source_from_file(file_config: dict[str, Any]) -> ConfigSource:
         plugin_metadata_sonarr_timeout=sonarr.get("timeout_seconds"),
         # Processing
         processing_workers=processing.get("workers"),
+        processing_compliance_memo=processing.get("compliance_memo"),
+        processing_io_device_concurrency=processing.get("io_device_concurrency"),
+        processing_io_device_bandwidth_mb_per_sec=processing.get(
+            "io_device_bandwidth_mb_per_sec"
+        ),
+        processing_io_device_limits=processing.get("io_device_limits"),
     )
 
 
@@ -657,6 +719,14 @@ def source_from_env(reader: EnvReader) -> ConfigSource:
         entry_point_group=None,  # No env var
         plugin_auto_load=reader.get_bool("VPO_PLUGIN_AUTO_LOAD"),
         plugin_warn_unacknowledged=reader.get_bool("VPO_PLUGIN_WARN_UNACKNOWLEDGED"),
+        plugin_event_workers=reader.get_int("VPO_PLUGIN_EVENT_WORKERS"),
+        plugin_event_timeout_seconds=reader.get_float("VPO_PLUGIN_EVENT_TIMEOUT"),
+        plugin_circuit_breaker_threshold=reader.get_int(
+            "VPO_PLUGIN_CIRCUIT_BREAKER_THRESHOLD"
+        ),
+        plugin_circuit_breaker_reset_seconds=reader.get_float(
+            "VPO_PLUGIN_CIRCUIT_BREAKER_RESET"
+        ),
         # Jobs
         jobs_retention_days=reader.get_int("VPO_JOBS_RETENTION_DAYS"),
         jobs_auto_purge=reader.get_bool("VPO_JOBS_AUTO_PURGE"),
@@ -667,6 +737,10 @@ def source_from_env(reader: EnvReader) -> ConfigSource:
         jobs_min_free_disk_percent=reader.get_float("VPO_MIN_FREE_DISK_PERCENT"),
         jobs_auto_prune_enabled=reader.get_bool("VPO_AUTO_PRUNE_ENABLED"),
         jobs_auto_prune_interval_hours=reader.get_int("VPO_AUTO_PRUNE_INTERVAL_HOURS"),
+        jobs_metadata_slots=reader.get_int("VPO_JOBS_METADATA_SLOTS"),
+        jobs_io_slots=reader.get_int("VPO_JOBS_IO_SLOTS"),
+        jobs_cpu_slots=reader.get_int("VPO_JOBS_CPU_SLOTS"),
+        jobs_transcription_slots=reader.get_int("VPO_JOBS_TRANSCRIPTION_SLOTS"),
         # Worker
         worker_max_files=reader.get_int("VPO_WORKER_MAX_FILES"),
         worker_max_duration=reader.get_int("VPO_WORKER_MAX_DURATION"),
@@ -677,6 +751,7 @@ def source_from_env(reader: EnvReader) -> ConfigSource:
         server_port=reader.get_int("VPO_SERVER_PORT"),
         server_shutdown_timeout=reader.get_float("VPO_SERVER_SHUTDOWN_TIMEOUT"),
         server_auth_token=reader.get_str("VPO_AUTH_TOKEN"),
+        server_broker=reader.get_bool("VPO_SERVER_BROKER"),
         # Rate limit
         server_rate_limit_enabled=reader.get_bool("VPO_RATE_LIMIT_ENABLED"),
         server_rate_limit_get_max_requests=reader.get_int(
@@ -724,4 +799,12 @@ def source_from_env(reader: EnvReader) -> ConfigSource:
         plugin_metadata_sonarr_timeout=reader.get_int("VPO_SONARR_TIMEOUT"),
         # Processing
         processing_workers=reader.get_int("VPO_PROCESSING_WORKERS"),
+        processing_compliance_memo=reader.get_bool("VPO_PROCESSING_COMPLIANCE_MEMO"),
+        processing_io_device_concurrency=reader.get_int(
+            "VPO_PROCESSING_IO_DEVICE_CONCURRENCY"
+        ),
+        processing_io_device_bandwidth_mb_per_sec=reader.get_float(
+            "VPO_PROCESSING_IO_DEVICE_BANDWIDTH_MB_PER_SEC"
+        ),
+        processing_io_device_limits=None,  # No env var for per-device limits
     )
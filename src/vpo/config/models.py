@@ -135,9 +135,37 @@ class PluginConfig:
     # Whether to warn about unacknowledged directory plugins
     warn_unacknowledged: bool = True
 
+    # Threads in the shared pool that runs plugin event handlers
+    event_workers: int = 8
+
+    # Time budget per plugin event call in seconds (0 = unlimited)
+    event_timeout_seconds: float = 30.0
+
+    # Consecutive overruns that temporarily disable a plugin (0 = never)
+    circuit_breaker_threshold: int = 3
+
+    # Seconds a plugin stays disabled after tripping its circuit breaker
+    circuit_breaker_reset_seconds: float = 300.0
+
     # Metadata plugin connections (Radarr, Sonarr)
     metadata: MetadataPluginSettings = field(default_factory=MetadataPluginSettings)
 
+    def __post_init__(self) -> None:
+        """Validate configuration."""
+        if self.event_workers < 1:
+            raise ValueError(
+                f"event_workers must be at least 1, got {self.event_workers}"
+            )
+        for name in (
+            "event_timeout_seconds",
+            "circuit_breaker_threshold",
+            "circuit_breaker_reset_seconds",
+        ):
+            if getattr(self, name) < 0:
+                raise ValueError(
+                    f"{name} must be at least 0, got {getattr(self, name)}"
+                )
+
 
 @dataclass
 class JobsConfig:
@@ -181,6 +209,12 @@ class JobsConfig:
     # Hours between auto-prune runs (default: 7 days)
     auto_prune_interval_hours: int = 168
 
+    # Running jobs allowed per resource class on each host (0 = unlimited)
+    metadata_slots: int = 0
+    io_slots: int = 2
+    cpu_slots: int = 1
+    transcription_slots: int = 1
+
     def __post_init__(self) -> None:
         """Validate configuration."""
         if not 0 <= self.min_free_disk_percent <= 100:
@@ -193,6 +227,9 @@ class JobsConfig:
                 f"auto_prune_interval_hours must be >= 1, "
                 f"got {self.auto_prune_interval_hours}"
             )
+        for name in ("metadata_slots", "io_slots", "cpu_slots", "transcription_slots"):
+            if getattr(self, name) < 0:
+                raise ValueError(f"{name} must be >= 0, got {getattr(self, name)}")
 
 
 @dataclass
@@ -222,10 +259,37 @@ class ProcessingConfig:
     workers: int = 2
     """Number of parallel workers for batch processing (1 = sequential)."""
 
+    compliance_memo: bool = True
+    """Skip files recorded as compliant with the policy when unchanged."""
+
+    io_device_concurrency: int = 0
+    """Maximum concurrent file-modifying phases per block device (0 = no limit)."""
+
+    io_device_bandwidth_mb_per_sec: float = 0.0
+    """Admission bandwidth cap per block device in MB/s (0 = no cap)."""
+
+    io_device_limits: dict[str, int] = field(default_factory=dict)
+    """Per-device concurrency overrides, keyed by a path on the device."""
+
     def __post_init__(self) -> None:
         """Validate configuration."""
         if self.workers < 1:
             raise ValueError(f"workers must be at least 1, got {self.workers}")
+        if self.io_device_concurrency < 0:
+            raise ValueError(
+                "io_device_concurrency must be at least 0, "
+                f"got {self.io_device_concurrency}"
+            )
+        if self.io_device_bandwidth_mb_per_sec < 0:
+            raise ValueError(
+                "io_device_bandwidth_mb_per_sec must be at least 0, "
+                f"got {self.io_device_bandwidth_mb_per_sec}"
+            )
+        for path, limit in self.io_device_limits.items():
+            if limit < 1:
+                raise ValueError(
+                    f"io_device_limits[{path!r}] must be at least 1, got {limit}"
+                )
 
 
 @dataclass
@@ -385,6 +449,9 @@ class ServerConfig:
     auth_token: str | None = None
     """Shared secret for HTTP Basic Auth. None or empty disables authentication."""
 
+    broker: bool = False
+    """Expose the job broker API for remote workers (`vpo jobs worker --broker`)."""
+
     rate_limit: RateLimitConfig = field(default_factory=RateLimitConfig)
     """Rate limiting configuration for API endpoints."""
 
@@ -149,6 +149,10 @@ def get_config_template(data_dir: Path) -> str:
 # entry_point_group = "vpo.plugins"  # Entry point group for plugin discovery
 # auto_load = true               # Automatically load plugins on startup
 # warn_unacknowledged = true     # Warn about unacknowledged directory plugins
+# event_workers = 8              # Shared threads running plugin event handlers
+# event_timeout_seconds = 30     # Time budget per plugin event call (0 = none)
+# circuit_breaker_threshold = 3  # Overruns in a row that pause a plugin (0 = off)
+# circuit_breaker_reset_seconds = 300  # How long a tripped plugin stays paused
 
 # -----------------------------------------------------------------------------
 # Metadata Plugins
@@ -209,15 +213,28 @@ def get_config_template(data_dir: Path) -> str:
 # min_free_disk_percent = 5.0
 # auto_prune_enabled = false      # Periodically prune files with scan_status='missing'
 # auto_prune_interval_hours = 168 # Hours between auto-prune runs (default: 7 days)
+# Running jobs per resource class on each host (0 = unlimited)
+# metadata_slots = 0             # In-place metadata edits
+# io_slots = 2                   # Remux, copy and move jobs
+# cpu_slots = 1                  # Video encodes
+# transcription_slots = 1        # Transcription
 
 # =============================================================================
 # Processing
 # =============================================================================
 # Batch processing behavior for `vpo policy run`.
-# Environment variable: VPO_PROCESSING_WORKERS
+# Environment variables: VPO_PROCESSING_WORKERS, VPO_PROCESSING_COMPLIANCE_MEMO,
+# VPO_PROCESSING_IO_DEVICE_CONCURRENCY,
+# VPO_PROCESSING_IO_DEVICE_BANDWIDTH_MB_PER_SEC
 
 [processing]
 # workers = 2                     # Parallel workers (1 = sequential)
+# compliance_memo = true          # Skip unchanged files already compliant
+# io_device_concurrency = 0       # Concurrent modifying phases per disk (0 = off)
+# io_device_bandwidth_mb_per_sec = 0  # Bandwidth cap per disk in MB/s (0 = off)
+#
+# [processing.io_device_limits]   # Per-disk overrides, keyed by a path on the disk
+# "/mnt/array1" = 1
 
 # =============================================================================
 # Worker
@@ -268,6 +285,7 @@ file = "{log_file_path}"         # Log file path (empty = stderr only)
 # port = 8321                    # HTTP port (default: 8321)
 # shutdown_timeout = 30.0        # Seconds to wait for graceful shutdown
 # auth_token = ""                # Shared secret for HTTP Basic Auth (empty = no auth)
+# broker = false                 # Let remote workers claim jobs (vpo jobs worker)
 
 [server.rate_limit]
 # enabled = true                  # Enable API rate limiting
@@ -312,6 +330,9 @@ def get_minimal_config_template() -> str:
 
 [processing]
 # workers = 2  # Parallel workers for batch processing (1 = sequential)
+# compliance_memo = true  # Skip unchanged files already compliant
+# io_device_concurrency = 0  # Concurrent modifying phases per disk (0 = off)
+# io_device_bandwidth_mb_per_sec = 0  # Bandwidth cap per disk in MB/s (0 = off)
 """
 
 
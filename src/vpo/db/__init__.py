@@ -5,6 +5,7 @@ functions are re-exported here for convenient access.
 
 Module organization:
 - types.py: Enums, dataclasses, and type definitions
+- tables.py: Columnar file and track tables for bulk reads
 - queries.py: CRUD operations for database tables
 - views.py: Aggregated view query functions for UI
 - operations.py: Plan CRUD and operation audit logging
@@ -76,11 +77,14 @@ from .queries import (
     get_all_jobs,
     get_classifications_for_file,
     get_classifications_for_tracks,
+    get_file_batch,
     get_file_by_id,
     get_file_by_path,
     get_file_ids_by_path_prefix,
+    get_file_table,
     get_files_by_paths,
     get_job,
+    get_job_checkpoint,
     get_jobs_by_id_prefix,
     get_jobs_by_status,
     get_jobs_filtered,
@@ -93,7 +97,9 @@ from .queries import (
     get_processing_stats_for_file,
     get_queued_jobs,
     get_track_classification,
+    get_track_table,
     get_tracks_for_file,
+    get_tracks_for_file_range,
     get_transcription_result,
     get_transcriptions_for_tracks,
     insert_action_result,
@@ -106,6 +112,8 @@ from .queries import (
     is_plugin_acknowledged,
     update_file_attributes,
     update_file_path,
+    update_job_checkpoint,
+    update_job_log_path,
     update_job_output,
     update_job_progress,
     update_job_status,
@@ -123,6 +131,7 @@ from .queries import (
 # Types: View models
 # Types: Helper functions
 # Types: Type aliases
+from .tables import FileTable, TrackTable
 from .types import (
     ActionResultRecord,
     ActionSummary,
@@ -157,6 +166,7 @@ from .types import (
     PluginMetadataDict,
     PolicyStats,
     ProcessingStatsRecord,
+    ResourceClass,
     ScanErrorView,
     StatsDetailView,
     StatsSummary,
@@ -216,6 +226,7 @@ __all__ = [
     "OperationStatus",
     "OriginalDubbedStatus",
     "PlanStatus",
+    "ResourceClass",
     "TrackClassification",
     # Domain models
     "FileInfo",
@@ -236,6 +247,9 @@ __all__ = [
     "TrackClassificationRecord",
     "TrackRecord",
     "TranscriptionResultRecord",
+    # Columnar tables
+    "FileTable",
+    "TrackTable",
     # View models
     "ActionSummary",
     "AnalysisStatusSummary",
@@ -261,8 +275,10 @@ __all__ = [
     "tracks_to_track_info",
     # File operations
     "delete_file",
+    "get_file_batch",
     "get_file_by_id",
     "get_file_by_path",
+    "get_file_table",
     "get_files_by_paths",
     "insert_file",
     "update_file_attributes",
@@ -271,6 +287,7 @@ __all__ = [
     # Track operations
     "delete_tracks_for_file",
     "get_tracks_for_file",
+    "get_tracks_for_file_range",
     "insert_track",
     "upsert_tracks_for_file",
     # Plugin acknowledgment operations
@@ -284,11 +301,14 @@ __all__ = [
     "delete_old_jobs",
     "get_all_jobs",
     "get_job",
+    "get_job_checkpoint",
     "get_jobs_by_id_prefix",
     "get_jobs_by_status",
     "get_jobs_filtered",
     "get_queued_jobs",
     "insert_job",
+    "update_job_checkpoint",
+    "update_job_log_path",
     "update_job_output",
     "update_job_progress",
     "update_job_status",
@@ -324,6 +344,7 @@ __all__ = [
     "get_classifications_for_file",
     "get_classifications_for_tracks",
     "get_track_classification",
+    "get_track_table",
     "upsert_track_classification",
     # Operation audit logging
     "create_operation",
@@ -1,8 +1,9 @@
 """Backup and restore functionality for the VPO library database.
 
 This module provides functions for creating, validating, and restoring
-backups of the VPO SQLite database. Backups are stored as compressed
-tar.gz archives containing the database and metadata JSON.
+backups of the VPO SQLite database. Full backups are stored as compressed
+tar.gz archives containing the database and metadata JSON. Incremental
+backups store only changed database pages (see vpo.db.incremental_backup).
 
 Archive format:
     vpo-library-{ISO8601_timestamp}.tar.gz
@@ -15,6 +16,9 @@ Usage:
     # Create a backup
     result = create_backup(db_path, output_path, conn)
 
+    # Create an incremental (page-level) backup
+    result = create_backup(db_path, conn=conn, incremental=True)
+
     # Restore from backup
     result = restore_backup(backup_path, db_path, force=True)
 
@@ -106,7 +110,26 @@ class BackupMetadata:
     """Sum of all media file sizes in the library."""
 
     compression: str = "gzip"
-    """Compression algorithm used (always "gzip" for now)."""
+    """Compression algorithm used ("gzip" for full backups, "zlib" or "zstd"
+    for page backups)."""
+
+    kind: str = "full"
+    """Archive kind: "full" (tar.gz copy), "base" or "delta" (page backups)."""
+
+    parent: str | None = None
+    """Filename of the previous page backup in the chain (deltas only)."""
+
+    chain_length: int = 0
+    """Number of deltas between this archive and its base."""
+
+    page_size: int = 0
+    """Database page size in bytes (page backups only)."""
+
+    page_count: int = 0
+    """Number of pages in the database (page backups only)."""
+
+    pages_stored: int = 0
+    """Number of pages stored in this archive (page backups only)."""
 
 
 @dataclass(frozen=True)
@@ -224,17 +247,21 @@ def _get_default_backup_dir() -> Path:
     return Path.home() / ".vpo" / DEFAULT_BACKUP_DIRNAME
 
 
-def _generate_backup_filename() -> str:
+def _generate_backup_filename(extension: str = BACKUP_EXTENSION) -> str:
     """Generate a unique backup filename using UTC timestamp.
 
-    Format: vpo-library-{ISO8601_timestamp}.tar.gz
+    Format: vpo-library-{ISO8601_timestamp}{extension}
     Uses hyphens instead of colons for filesystem compatibility.
 
+    Args:
+        extension: Archive extension (BACKUP_EXTENSION, or
+            PAGE_BACKUP_EXTENSION for incremental backups).
+
     Returns:
         Filename string like "vpo-library-2026-02-05T14-30-22Z.tar.gz"
     """
     timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H-%M-%SZ")
-    return f"{BACKUP_FILENAME_PREFIX}{timestamp}{BACKUP_EXTENSION}"
+    return f"{BACKUP_FILENAME_PREFIX}{timestamp}{extension}"
 
 
 def _check_disk_space(
@@ -333,7 +360,8 @@ def _read_backup_metadata(archive_path: Path) -> BackupMetadata:
         BackupValidationError: If archive is invalid or metadata is missing/corrupt
     """
     try:
-        with tarfile.open(archive_path, "r:gz") as tf:
+        # Full backups are gzip-compressed, page backups are plain tar
+        with tarfile.open(archive_path, "r:*") as tf:
             # Check for metadata file
             try:
                 member = tf.getmember(ARCHIVE_METADATA_NAME)
@@ -375,6 +403,24 @@ def _read_backup_metadata(archive_path: Path) -> BackupMetadata:
                     type_name = expected_type.__name__
                     raise BackupValidationError(f"{field} must be {type_name}")
 
+            # Page backup fields are optional (absent from full backups)
+            page_field_types = {
+                "kind": str,
+                "chain_length": int,
+                "page_size": int,
+                "page_count": int,
+                "pages_stored": int,
+            }
+            for field, expected_type in page_field_types.items():
+                if field in data and not isinstance(data[field], expected_type):
+                    type_name = expected_type.__name__
+                    raise BackupValidationError(f"{field} must be {type_name}")
+            parent = data.get("parent")
+            if parent is not None and (
+                not isinstance(parent, str) or Path(parent).name != parent
+            ):
+                raise BackupValidationError("parent must be a backup filename")
+
             return BackupMetadata(
                 vpo_version=data["vpo_version"],
                 schema_version=data["schema_version"],
@@ -383,6 +429,12 @@ def _read_backup_metadata(archive_path: Path) -> BackupMetadata:
                 file_count=data["file_count"],
                 total_library_size_bytes=data["total_library_size_bytes"],
                 compression=data.get("compression", "gzip"),
+                kind=data.get("kind", "full"),
+                parent=parent,
+                chain_length=data.get("chain_length", 0),
+                page_size=data.get("page_size", 0),
+                page_count=data.get("page_count", 0),
+                pages_stored=data.get("pages_stored", 0),
             )
     except tarfile.TarError as e:
         raise BackupValidationError(f"Invalid tar archive: {e}") from e
@@ -411,6 +463,7 @@ def create_backup(
     db_path: Path,
     output_path: Path | None = None,
     conn: sqlite3.Connection | None = None,
+    incremental: bool = False,
 ) -> BackupResult:
     """Create a backup archive of the database.
 
@@ -418,6 +471,12 @@ def create_backup(
     then creates a compressed tar.gz archive with the database and
     metadata JSON.
 
+    With incremental=True, writes a page backup instead: the snapshot is
+    taken in steps that let writers proceed, and only pages not already
+    in the newest page backup of the output directory are stored (see
+    vpo.db.incremental_backup). An active daemon does not have to be
+    stopped for an incremental backup.
+
     Args:
         db_path: Path to the source database file
         output_path: Optional output path for the backup archive.
@@ -425,6 +484,7 @@ def create_backup(
             auto-generated timestamp filename.
         conn: Optional existing connection to use for stats query.
             If not provided, opens a new connection.
+        incremental: Create a page backup chained to earlier ones.
 
     Returns:
         BackupResult with details about the created backup
@@ -438,16 +498,18 @@ def create_backup(
     import time
 
     from vpo import __version__ as vpo_version
+    from vpo.db.incremental_backup import PAGE_BACKUP_EXTENSION, create_page_backup
     from vpo.db.schema import SCHEMA_VERSION
 
     start_time = time.monotonic()
 
     # Resolve paths
     db_path = Path(db_path).resolve()
+    extension = PAGE_BACKUP_EXTENSION if incremental else BACKUP_EXTENSION
     if output_path is None:
         backup_dir = _get_default_backup_dir()
         backup_dir.mkdir(parents=True, exist_ok=True)
-        output_path = backup_dir / _generate_backup_filename()
+        output_path = backup_dir / _generate_backup_filename(extension)
     else:
         output_path = Path(output_path).resolve()
         output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -457,8 +519,13 @@ def create_backup(
         extra={"db_path": str(db_path), "output": str(output_path)},
     )
 
-    # Check database accessibility and lock status
-    _check_database_lock(db_path)
+    # Check database accessibility and lock status. Incremental backups
+    # copy in steps that yield to writers, so they run next to the daemon.
+    if incremental:
+        if not db_path.exists():
+            raise BackupIOError(f"Database not found: {db_path}")
+    else:
+        _check_database_lock(db_path)
 
     # Get database size for space check
     try:
@@ -485,6 +552,24 @@ def create_backup(
             temp_path = Path(temp_dir)
             temp_db = temp_path / ARCHIVE_DB_NAME
 
+            if incremental:
+                now = datetime.now(timezone.utc)
+                metadata = create_page_backup(
+                    conn,
+                    output_path,
+                    BackupMetadata(
+                        vpo_version=vpo_version,
+                        schema_version=SCHEMA_VERSION,
+                        created_at=now.strftime("%Y-%m-%dT%H:%M:%SZ"),
+                        database_size_bytes=db_size,
+                        file_count=file_count,
+                        total_library_size_bytes=total_library_size,
+                    ),
+                    temp_path,
+                )
+                archive_size = output_path.stat().st_size
+                return _backup_complete(output_path, archive_size, metadata, start_time)
+
             # Use SQLite online backup API
             backup_conn = sqlite3.connect(temp_db)
             try:
@@ -532,6 +617,18 @@ def create_backup(
         if close_conn:
             conn.close()
 
+    return _backup_complete(output_path, archive_size, metadata, start_time)
+
+
+def _backup_complete(
+    output_path: Path,
+    archive_size: int,
+    metadata: BackupMetadata,
+    start_time: float,
+) -> BackupResult:
+    """Log a finished backup and build its BackupResult."""
+    import time
+
     duration = time.monotonic() - start_time
 
     logger.info(
@@ -541,6 +638,8 @@ def create_backup(
             "archive_size": archive_size,
             "db_size": metadata.database_size_bytes,
             "file_count": metadata.file_count,
+            "kind": metadata.kind,
+            "pages_stored": metadata.pages_stored,
             "duration_seconds": round(duration, 2),
         },
     )
@@ -563,6 +662,9 @@ def validate_backup(backup_path: Path) -> BackupMetadata:
     - Metadata JSON is valid and complete
     - Database passes SQLite integrity check (quick_check)
 
+    Page backups are checked by rebuilding the database from their chain,
+    which also verifies every page digest.
+
     Args:
         backup_path: Path to the backup archive
 
@@ -584,6 +686,15 @@ def validate_backup(backup_path: Path) -> BackupMetadata:
     if not backup_path.is_file():
         raise BackupValidationError(f"Not a file: {backup_path}")
 
+    from vpo.db.incremental_backup import is_page_backup, materialize_page_backup
+
+    if is_page_backup(backup_path):
+        with tempfile.TemporaryDirectory(prefix="vpo-validate-") as temp_dir:
+            temp_db = Path(temp_dir) / ARCHIVE_DB_NAME
+            metadata = materialize_page_backup(backup_path, temp_db)
+            _quick_check(temp_db, "Database integrity check failed")
+        return metadata
+
     # Check it's a tar.gz file
     if not backup_path.name.endswith(".tar.gz"):
         raise BackupValidationError(
@@ -640,25 +751,36 @@ def validate_backup(backup_path: Path) -> BackupMetadata:
             ) from e
 
         # Run SQLite integrity check
-        conn = None
-        try:
-            conn = sqlite3.connect(temp_db)
-            cursor = conn.execute("PRAGMA quick_check")
-            result = cursor.fetchone()
-
-            if result[0] != "ok":
-                raise BackupValidationError(
-                    f"Database integrity check failed: {result[0]}"
-                )
-        except sqlite3.Error as e:
-            raise BackupValidationError(f"Database integrity check failed: {e}") from e
-        finally:
-            if conn is not None:
-                conn.close()
+        _quick_check(temp_db, "Database integrity check failed")
 
     return metadata
 
 
+def _quick_check(db_path: Path, message: str) -> None:
+    """Run PRAGMA quick_check on a database file.
+
+    Args:
+        db_path: Database file to check
+        message: Error message prefix
+
+    Raises:
+        BackupValidationError: If the check fails
+    """
+    conn = None
+    try:
+        conn = sqlite3.connect(db_path)
+        cursor = conn.execute("PRAGMA quick_check")
+        result = cursor.fetchone()
+
+        if result[0] != "ok":
+            raise BackupValidationError(f"{message}: {result[0]}")
+    except sqlite3.Error as e:
+        raise BackupValidationError(f"{message}: {e}") from e
+    finally:
+        if conn is not None:
+            conn.close()
+
+
 def restore_backup(
     backup_path: Path,
     db_path: Path,
@@ -667,7 +789,8 @@ def restore_backup(
     """Restore database from a backup archive.
 
     Extracts the database from the backup archive and replaces the
-    current database atomically (extract to temp, then rename).
+    current database atomically (extract to temp, then rename). Page
+    backups are rebuilt by replaying their chain from the base.
 
     Args:
         backup_path: Path to the backup archive
@@ -686,6 +809,7 @@ def restore_backup(
     """
     import time
 
+    from vpo.db.incremental_backup import is_page_backup, materialize_page_backup
     from vpo.db.schema import SCHEMA_VERSION
 
     start_time = time.monotonic()
@@ -723,40 +847,13 @@ def restore_backup(
     # Extract to temp file in same directory (for atomic rename)
     temp_db = db_path.with_suffix(".db.restore-tmp")
     try:
-        with tarfile.open(backup_path, "r:gz") as tf:
-            # Extract database to temp file
-            member = tf.getmember(ARCHIVE_DB_NAME)
-            # Validate member name to prevent path traversal
-            if member.name != ARCHIVE_DB_NAME or ".." in member.name:
-                raise BackupValidationError(
-                    f"Invalid archive member name: {member.name}"
-                )
-            f = tf.extractfile(member)
-            if f is None:
-                raise BackupValidationError("Failed to extract database from archive")
-
-            # Write to temp file, properly closing the extracted file handle
-            with f, open(temp_db, "wb") as out:
-                shutil.copyfileobj(f, out)
+        if is_page_backup(backup_path):
+            materialize_page_backup(backup_path, temp_db)
+        else:
+            _extract_database(backup_path, temp_db)
 
         # Verify extracted database
-        conn = None
-        try:
-            conn = sqlite3.connect(temp_db)
-            cursor = conn.execute("PRAGMA quick_check")
-            result = cursor.fetchone()
-
-            if result[0] != "ok":
-                raise BackupValidationError(
-                    f"Restored database integrity check failed: {result[0]}"
-                )
-        except sqlite3.Error as e:
-            raise BackupValidationError(
-                f"Restored database integrity check failed: {e}"
-            ) from e
-        finally:
-            if conn is not None:
-                conn.close()
+        _quick_check(temp_db, "Restored database integrity check failed")
 
         # Atomic rename to final destination
         # Remove WAL and SHM files if they exist
@@ -797,11 +894,32 @@ def restore_backup(
     )
 
 
+def _extract_database(backup_path: Path, temp_db: Path) -> None:
+    """Extract the database of a full backup archive to temp_db.
+
+    Raises:
+        BackupValidationError: If the archive member is missing or invalid
+    """
+    with tarfile.open(backup_path, "r:gz") as tf:
+        # Extract database to temp file
+        member = tf.getmember(ARCHIVE_DB_NAME)
+        # Validate member name to prevent path traversal
+        if member.name != ARCHIVE_DB_NAME or ".." in member.name:
+            raise BackupValidationError(f"Invalid archive member name: {member.name}")
+        f = tf.extractfile(member)
+        if f is None:
+            raise BackupValidationError("Failed to extract database from archive")
+
+        # Write to temp file, properly closing the extracted file handle
+        with f, open(temp_db, "wb") as out:
+            shutil.copyfileobj(f, out)
+
+
 def list_backups(backup_dir: Path | None = None) -> list[BackupInfo]:
     """List available backups in a directory.
 
-    Scans for vpo-library-*.tar.gz files and extracts metadata from
-    each valid archive. Returns results sorted by creation date
+    Scans for vpo-library-*.tar.gz and vpo-library-*.pages.tar files and
+    extracts metadata from each valid archive. Returns results sorted by creation date
     (newest first).
 
     Args:
@@ -829,9 +947,14 @@ def list_backups(backup_dir: Path | None = None) -> list[BackupInfo]:
     if not backup_dir.is_dir():
         raise BackupIOError(f"Not a directory: {backup_dir}")
 
+    from vpo.db.incremental_backup import PAGE_BACKUP_EXTENSION
+
     # Find backup files
-    pattern = f"{BACKUP_FILENAME_PREFIX}*{BACKUP_EXTENSION}"
-    backup_files = list(backup_dir.glob(pattern))
+    backup_files = [
+        path
+        for extension in (BACKUP_EXTENSION, PAGE_BACKUP_EXTENSION)
+        for path in backup_dir.glob(f"{BACKUP_FILENAME_PREFIX}*{extension}")
+    ]
 
     # Collect backup info
     backups: list[BackupInfo] = []
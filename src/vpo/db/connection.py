@@ -9,6 +9,7 @@ import threading
 import time
 from collections.abc import Callable, Iterator
 from contextlib import contextmanager
+from dataclasses import dataclass
 from pathlib import Path
 from typing import TypeVar
 
@@ -18,6 +19,12 @@ T = TypeVar("T")
 
 DEFAULT_DB_PATH = Path.home() / ".vpo" / "library.db"
 
+# Long-lived read-only connections kept by DaemonConnectionPool
+DEFAULT_READ_POOL_SIZE = 8
+
+# Prepared statements cached per pooled read connection
+READ_STATEMENT_CACHE_SIZE = 256
+
 
 def _apply_standard_pragmas(conn: sqlite3.Connection) -> None:
     """Apply standard SQLite PRAGMA settings to a connection.
@@ -48,6 +55,22 @@ def _apply_standard_pragmas(conn: sqlite3.Connection) -> None:
     conn.row_factory = sqlite3.Row
 
 
+def _apply_read_pragmas(conn: sqlite3.Connection) -> None:
+    """Apply PRAGMA settings to a pooled read-only connection.
+
+    The journal mode is a property of the database file (set by the write
+    connection), so only per-connection settings are applied. query_only
+    guards against accidental writes even if the file was opened read-write.
+
+    Args:
+        conn: SQLite connection to configure.
+    """
+    conn.execute("PRAGMA query_only = ON")
+    conn.execute("PRAGMA busy_timeout = 10000")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    conn.row_factory = sqlite3.Row
+
+
 def get_default_db_path() -> Path:
     """Return the default database path (~/.vpo/library.db)."""
     return DEFAULT_DB_PATH
@@ -230,34 +253,91 @@ def check_database_connectivity(db_path: Path | None = None) -> bool:
         return False
 
 
+@dataclass(frozen=True)
+class PoolStats:
+    """Point-in-time metrics for a DaemonConnectionPool."""
+
+    read_pool_size: int
+    """Maximum number of pooled read connections."""
+
+    read_connections: int
+    """Read connections currently open (idle or in use)."""
+
+    read_in_use: int
+    """Read connections currently checked out."""
+
+    read_checkouts: int
+    """Total read() checkouts since the pool was created."""
+
+    read_waits: int
+    """Checkouts that had to wait for a connection to be returned."""
+
+    read_wait_seconds: float
+    """Total time spent waiting for a read connection."""
+
+    write_transactions: int
+    """Total transaction() calls since the pool was created."""
+
+    write_wait_seconds: float
+    """Total time spent waiting for the write lock."""
+
+    write_max_wait_seconds: float
+    """Longest single wait for the write lock."""
+
+
 class DaemonConnectionPool:
     """Thread-safe connection pool for daemon mode.
 
     Uses separate connection strategies for reads and writes to maximize
     concurrency with SQLite WAL mode:
 
-    - Read operations: Create a new connection per operation (no locking),
-      allowing concurrent reads without blocking.
+    - Read operations: Borrow one of up to ``read_pool_size`` long-lived
+      read-only connections (``mode=ro`` and ``query_only``). They never
+      take the write lock, so reads run concurrently with each other and
+      with a writer, and each connection keeps its prepared statements
+      cached between requests.
     - Write operations: Use a shared connection with locking to ensure
       only one write at a time.
 
-    The pool applies standard PRAGMAs (WAL, foreign keys, busy_timeout)
-    to all connections.
+    The write connection gets the standard PRAGMAs (WAL, foreign keys,
+    busy_timeout); read connections get the per-connection subset.
     """
 
-    def __init__(self, db_path: Path, timeout: float = 30.0) -> None:
+    def __init__(
+        self,
+        db_path: Path,
+        timeout: float = 30.0,
+        read_pool_size: int = DEFAULT_READ_POOL_SIZE,
+    ) -> None:
         """Initialize the connection pool.
 
         Args:
             db_path: Path to SQLite database file.
-            timeout: Connection timeout in seconds.
+            timeout: Connection timeout in seconds. Also the longest a
+                read() call waits for a free connection.
+            read_pool_size: Maximum number of read connections.
         """
         self.db_path = db_path
         self.timeout = timeout
+        self.read_pool_size = max(1, read_pool_size)
         self._write_conn: sqlite3.Connection | None = None
         self._write_lock = threading.Lock()
         self._closed = False
         self._closed_lock = threading.Lock()
+        self._version_conn: sqlite3.Connection | None = None
+        self._version_lock = threading.Lock()
+
+        # Idle read connections (LIFO keeps the warmest ones in use)
+        self._read_idle: list[sqlite3.Connection] = []
+        self._read_available = threading.Condition()
+        self._read_open = 0
+        self._read_in_use = 0
+        self._read_checkouts = 0
+        self._read_waits = 0
+        self._read_wait_seconds = 0.0
+        self._write_transactions = 0
+        self._write_wait_seconds = 0.0
+        self._write_max_wait_seconds = 0.0
 
     def _create_connection(self) -> sqlite3.Connection:
         """Create a new connection with standard PRAGMAs.
@@ -274,6 +354,26 @@ class DaemonConnectionPool:
 
         return conn
 
+    def _create_read_connection(self) -> sqlite3.Connection:
+        """Create a new read-only connection for the read pool.
+
+        Returns:
+            A configured read-only SQLite connection.
+        """
+        conn = sqlite3.connect(
+            f"{self.db_path.resolve().as_uri()}?mode=ro",
+            uri=True,
+            timeout=self.timeout,
+            check_same_thread=False,
+            cached_statements=READ_STATEMENT_CACHE_SIZE,
+        )
+        try:
+            _apply_read_pragmas(conn)
+        except Exception:
+            conn.close()
+            raise
+        return conn
+
     def _get_or_create_write_connection(self) -> sqlite3.Connection:
         """Get the shared write connection, creating if needed.
 
@@ -318,34 +418,131 @@ class DaemonConnectionPool:
         with self._write_lock:
             return self._get_or_create_write_connection()
 
+    def _checkout_read(self) -> sqlite3.Connection:
+        """Take an idle read connection, open a new one, or wait for one.
+
+        Raises:
+            RuntimeError: If the pool has been closed.
+            sqlite3.OperationalError: If no connection became available
+                within the pool timeout.
+        """
+        start_time = time.monotonic()
+        deadline = start_time + self.timeout
+        waited = False
+        conn: sqlite3.Connection | None = None
+
+        with self._read_available:
+            while True:
+                if self.is_closed:
+                    raise RuntimeError("Connection pool is closed")
+                if self._read_idle:
+                    conn = self._read_idle.pop()
+                    break
+                if self._read_open < self.read_pool_size:
+                    # Reserve the slot; the connection is opened below
+                    # without holding the condition.
+                    self._read_open += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise sqlite3.OperationalError(
+                        f"Timed out after {self.timeout:.1f}s waiting for a "
+                        f"read connection ({self.read_pool_size} in use)"
+                    )
+                waited = True
+                self._read_available.wait(remaining)
+
+            self._read_in_use += 1
+            self._read_checkouts += 1
+            if waited:
+                self._read_waits += 1
+                self._read_wait_seconds += time.monotonic() - start_time
+
+        if conn is None:
+            try:
+                conn = self._create_read_connection()
+            except Exception:
+                with self._read_available:
+                    self._read_open -= 1
+                    self._read_in_use -= 1
+                    self._read_available.notify()
+                raise
+        return conn
+
+    def _checkin_read(self, conn: sqlite3.Connection) -> None:
+        """Return a read connection to the pool, or close it if unusable."""
+        reusable = True
+        try:
+            # End any read transaction so the connection does not pin an
+            # old WAL snapshot while idle.
+            if conn.in_transaction:
+                conn.rollback()
+        except sqlite3.Error as e:
+            logger.warning("Discarding read connection (%s)", e)
+            reusable = False
+
+        with self._read_available:
+            self._read_in_use -= 1
+            if reusable and not self.is_closed:
+                self._read_idle.append(conn)
+                conn = None
+            else:
+                self._read_open -= 1
+            self._read_available.notify()
+
+        if conn is not None:
+            try:
+                conn.close()
+            except Exception:  # nosec B110 - best-effort cleanup
+                pass
+
     @contextmanager
-    def read_connection(self) -> Iterator[sqlite3.Connection]:
-        """Get a read-only connection (new connection per call).
+    def read(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a pooled read-only connection.
 
-        Creates a new connection for each read operation, allowing concurrent
-        reads without lock contention. The connection is closed when the
-        context manager exits.
+        Never takes the write lock, so concurrent reads do not queue behind
+        each other or behind a write transaction. Waits up to the pool
+        timeout when all read connections are in use. Any statement that
+        writes fails with "attempt to write a readonly database".
+
+        Example:
+            with pool.read() as conn:
+                rows = conn.execute("SELECT ...").fetchall()
 
         Yields:
-            A fresh SQLite connection for reading.
+            A read-only SQLite connection.
 
         Raises:
             RuntimeError: If the pool has been closed.
+            sqlite3.OperationalError: If no read connection became
+                available within the pool timeout.
         """
-        with self._closed_lock:
-            if self._closed:
-                raise RuntimeError("Connection pool is closed")
-        conn = self._create_connection()
+        conn = self._checkout_read()
         try:
             yield conn
         finally:
-            conn.close()
+            self._checkin_read(conn)
+
+    @contextmanager
+    def read_connection(self) -> Iterator[sqlite3.Connection]:
+        """Get a read-only connection.
+
+        Equivalent to read(); kept for existing callers.
+
+        Yields:
+            A pooled read-only SQLite connection.
+
+        Raises:
+            RuntimeError: If the pool has been closed.
+        """
+        with self.read() as conn:
+            yield conn
 
     def execute_read(self, query: str, params: tuple = ()) -> list[sqlite3.Row]:
-        """Execute a read-only query with its own connection.
+        """Execute a read-only query on a pooled read connection.
 
-        Uses a fresh connection per read to avoid blocking on the write lock.
-        This allows concurrent reads in WAL mode without serialization.
+        Does not take the write lock, so it never waits behind a write
+        transaction in WAL mode.
 
         Args:
             query: SQL query to execute.
@@ -354,10 +551,44 @@ class DaemonConnectionPool:
         Returns:
             List of result rows.
         """
-        with self.read_connection() as conn:
+        with self.read() as conn:
             cursor = conn.execute(query, params)
             return cursor.fetchall()
 
+    def data_version(self) -> int:
+        """Return a counter that changes whenever the database is modified.
+
+        Reads ``PRAGMA data_version`` on a dedicated read-only connection.
+        Because that connection never writes, the value changes after every
+        commit made by any other connection, including other processes
+        such as a CLI scan. Only equality is meaningful: the value is local
+        to this pool and restarts with it.
+
+        Raises:
+            RuntimeError: If the pool has been closed.
+        """
+        with self._version_lock:
+            if self.is_closed:
+                raise RuntimeError("Connection pool is closed")
+            if self._version_conn is None:
+                self._version_conn = self._create_read_connection()
+            return self._version_conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def stats(self) -> PoolStats:
+        """Return current pool metrics."""
+        with self._read_available:
+            return PoolStats(
+                read_pool_size=self.read_pool_size,
+                read_connections=self._read_open,
+                read_in_use=self._read_in_use,
+                read_checkouts=self._read_checkouts,
+                read_waits=self._read_waits,
+                read_wait_seconds=round(self._read_wait_seconds, 3),
+                write_transactions=self._write_transactions,
+                write_wait_seconds=round(self._write_wait_seconds, 3),
+                write_max_wait_seconds=round(self._write_max_wait_seconds, 3),
+            )
+
     def execute_write(self, query: str, params: tuple = ()) -> int:
         """Execute a write query safely (INSERT/UPDATE/DELETE).
 
@@ -377,6 +608,31 @@ class DaemonConnectionPool:
             conn.commit()
             return cursor.rowcount
 
+    @contextmanager
+    def write(self) -> Iterator[sqlite3.Connection]:
+        """Borrow the shared write connection without opening a transaction.
+
+        For helpers that manage their own transactions (BEGIN IMMEDIATE or
+        commit), such as the job queue functions, which cannot run inside
+        transaction(). Holds the write lock for the duration; an
+        uncommitted transaction left open is rolled back.
+
+        Yields:
+            The shared write connection.
+        """
+        start_time = time.monotonic()
+        with self._write_lock:
+            lock_wait = time.monotonic() - start_time
+            self._write_transactions += 1
+            self._write_wait_seconds += lock_wait
+            self._write_max_wait_seconds = max(self._write_max_wait_seconds, lock_wait)
+            conn = self._get_or_create_write_connection()
+            try:
+                yield conn
+            finally:
+                if conn.in_transaction:
+                    conn.rollback()
+
     @contextmanager
     def transaction(self, timeout: float | None = None) -> Iterator[sqlite3.Connection]:
         """Context manager for atomic database transactions.
@@ -411,6 +667,10 @@ class DaemonConnectionPool:
         start_time = time.monotonic()
 
         with self._write_lock:
+            lock_wait = time.monotonic() - start_time
+            self._write_transactions += 1
+            self._write_wait_seconds += lock_wait
+            self._write_max_wait_seconds = max(self._write_max_wait_seconds, lock_wait)
             conn = self._get_or_create_write_connection()
             conn.execute("BEGIN IMMEDIATE")
             try:
@@ -433,12 +693,30 @@ class DaemonConnectionPool:
         """Close the connection pool.
 
         After closing, the pool cannot be reused. Any attempts to
-        get a connection will raise RuntimeError.
+        get a connection will raise RuntimeError. Idle read connections
+        are closed immediately; read connections still in use are closed
+        when they are returned.
 
         Raises:
             Exception: Re-raises any exception from closing the connection
                 (after logging and marking the pool as closed).
         """
+        with self._read_available:
+            with self._closed_lock:
+                self._closed = True
+            idle, self._read_idle = self._read_idle, []
+            self._read_open -= len(idle)
+            self._read_available.notify_all()
+        with self._version_lock:
+            if self._version_conn is not None:
+                idle.append(self._version_conn)
+                self._version_conn = None
+        for conn in idle:
+            try:
+                conn.close()
+            except Exception as e:
+                logger.warning("Error closing read connection: %s", e)
+
         with self._write_lock:
             if self._write_conn is not None:
                 try:
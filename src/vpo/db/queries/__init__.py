@@ -12,6 +12,7 @@ Module organization:
 - analysis.py: Language analysis operations
 - stats.py: Processing statistics operations
 - classifications.py: Track classification operations
+- compliance.py: Compliance memo operations
 
 Usage:
     from vpo.db.queries import get_file_by_path, insert_job
@@ -44,14 +45,30 @@ from .classifications import (
     upsert_track_classification,
 )
 
+# Compliance memo operations
+from .compliance import (
+    ALL_PHASES_KEY,
+    ComplianceMemoEntry,
+    delete_all_compliance_memo,
+    delete_compliance_memo_for_file,
+    get_compliance_memo,
+    hash_plugin_metadata,
+    phases_key_for,
+    record_compliance,
+)
+
 # File and track operations
 from .files import (
     delete_file,
     delete_tracks_for_file,
+    get_file_batch,
     get_file_by_id,
     get_file_by_path,
+    get_file_table,
     get_files_by_paths,
+    get_track_table,
     get_tracks_for_file,
+    get_tracks_for_file_range,
     insert_file,
     insert_track,
     update_file_attributes,
@@ -66,17 +83,29 @@ from .jobs import (
     delete_old_jobs,
     get_all_jobs,
     get_job,
+    get_job_checkpoint,
     get_jobs_by_id_prefix,
     get_jobs_by_status,
     get_jobs_filtered,
     get_queued_jobs,
     insert_job,
+    update_job_checkpoint,
+    update_job_log_path,
     update_job_output,
     update_job_progress,
     update_job_status,
     update_job_worker,
 )
 
+# Plugin metadata value operations
+from .plugin_metadata import (
+    PLUGIN_VALUE_OPERATORS,
+    get_plugin_metadata_values,
+    merge_plugin_metadata,
+    plugin_value_filter,
+    replace_plugin_metadata_values,
+)
+
 # Plugin acknowledgment operations
 from .plugins import (
     delete_plugin_acknowledgment,
@@ -91,6 +120,7 @@ from .stats import (
     delete_all_processing_stats,
     delete_processing_stats_before,
     delete_processing_stats_by_policy,
+    delete_processing_stats_for_file,
     get_action_results_for_stats,
     get_performance_metrics_for_stats,
     get_processing_stats_by_id,
@@ -98,6 +128,7 @@ from .stats import (
     insert_action_result,
     insert_performance_metric,
     insert_processing_stats,
+    rebuild_stats_rollups,
 )
 
 # Transcription result operations
@@ -111,8 +142,10 @@ from .transcriptions import (
 __all__ = [
     # File operations
     "delete_file",
+    "get_file_batch",
     "get_file_by_id",
     "get_file_by_path",
+    "get_file_table",
     "get_files_by_paths",
     "insert_file",
     "update_file_attributes",
@@ -120,7 +153,9 @@ __all__ = [
     "upsert_file",
     # Track operations
     "delete_tracks_for_file",
+    "get_track_table",
     "get_tracks_for_file",
+    "get_tracks_for_file_range",
     "insert_track",
     "upsert_tracks_for_file",
     # Plugin acknowledgment operations
@@ -134,11 +169,14 @@ __all__ = [
     "delete_old_jobs",
     "get_all_jobs",
     "get_job",
+    "get_job_checkpoint",
     "get_jobs_by_id_prefix",
     "get_jobs_by_status",
     "get_jobs_filtered",
     "get_queued_jobs",
     "insert_job",
+    "update_job_checkpoint",
+    "update_job_log_path",
     "update_job_output",
     "update_job_progress",
     "update_job_status",
@@ -166,6 +204,7 @@ __all__ = [
     "delete_all_processing_stats",
     "delete_processing_stats_before",
     "delete_processing_stats_by_policy",
+    "delete_processing_stats_for_file",
     "get_action_results_for_stats",
     "get_performance_metrics_for_stats",
     "get_processing_stats_by_id",
@@ -173,6 +212,7 @@ __all__ = [
     "insert_action_result",
     "insert_performance_metric",
     "insert_processing_stats",
+    "rebuild_stats_rollups",
     # Track classification operations
     "delete_classifications_for_file",
     "delete_track_classification",
@@ -180,4 +220,19 @@ __all__ = [
     "get_classifications_for_tracks",
     "get_track_classification",
     "upsert_track_classification",
+    # Compliance memo operations
+    "ALL_PHASES_KEY",
+    "ComplianceMemoEntry",
+    "delete_all_compliance_memo",
+    "delete_compliance_memo_for_file",
+    "get_compliance_memo",
+    "hash_plugin_metadata",
+    "phases_key_for",
+    "record_compliance",
+    # Plugin metadata value operations
+    "PLUGIN_VALUE_OPERATORS",
+    "get_plugin_metadata_values",
+    "merge_plugin_metadata",
+    "plugin_value_filter",
+    "replace_plugin_metadata_values",
 ]
@@ -0,0 +1,180 @@
+"""Compliance memo operations for Video Policy Orchestrator database.
+
+The compliance memo records that a file needed no changes under a given
+policy. A memo entry stays valid only while the file's content hash, size,
+mtime and plugin metadata match the values recorded with it, so changes to
+either the file or the policy (a different policy hash) invalidate it
+without any explicit bookkeeping.
+
+This module contains database query functions for the compliance memo:
+- Memo lookup by file path, record, and delete operations
+"""
+
+import hashlib
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+#: phases_key value used when all policy phases are executed.
+ALL_PHASES_KEY = "*"
+
+
+@dataclass(frozen=True)
+class ComplianceMemoEntry:
+    """A compliance memo row joined with the current file record."""
+
+    file_id: int
+    content_hash: str
+    size_bytes: int
+    mtime_ns: int
+    plugin_metadata_hash: str | None
+    current_content_hash: str | None
+    current_plugin_metadata: str | None
+
+
+def phases_key_for(selected_phases: list[str] | None) -> str:
+    """Build the memo phases key for a phase selection.
+
+    Args:
+        selected_phases: Phase names to execute, or None for all phases.
+
+    Returns:
+        ALL_PHASES_KEY for all phases, otherwise the comma-joined names.
+    """
+    if not selected_phases:
+        return ALL_PHASES_KEY
+    return ",".join(selected_phases)
+
+
+def hash_plugin_metadata(plugin_metadata: str | None) -> str | None:
+    """Hash the serialized plugin metadata of a file record.
+
+    Args:
+        plugin_metadata: JSON text from files.plugin_metadata.
+
+    Returns:
+        Short hex digest, or None if the file has no plugin metadata.
+    """
+    if not plugin_metadata:
+        return None
+    return hashlib.sha256(plugin_metadata.encode("utf-8")).hexdigest()[:16]
+
+
+def get_compliance_memo(
+    conn: sqlite3.Connection, path: str, policy_hash: str, phases_key: str
+) -> ComplianceMemoEntry | None:
+    """Get the compliance memo entry for a file and policy.
+
+    Reads the memo row and the current file record in one query.
+
+    Args:
+        conn: Database connection.
+        path: File path to look up.
+        policy_hash: Content hash of the policy.
+        phases_key: Phase selection key (see phases_key_for).
+
+    Returns:
+        ComplianceMemoEntry if a memo row exists, None otherwise.
+        The caller decides whether the entry is still valid.
+    """
+    cursor = conn.execute(
+        """
+        SELECT m.file_id, m.content_hash, m.size_bytes, m.mtime_ns,
+               m.plugin_metadata_hash, f.content_hash, f.plugin_metadata
+        FROM files f
+        JOIN compliance_memo m ON m.file_id = f.id
+        WHERE f.path = ? AND m.policy_hash = ? AND m.phases_key = ?
+        """,
+        (path, policy_hash, phases_key),
+    )
+    row = cursor.fetchone()
+    if row is None:
+        return None
+
+    return ComplianceMemoEntry(
+        file_id=row[0],
+        content_hash=row[1],
+        size_bytes=row[2],
+        mtime_ns=row[3],
+        plugin_metadata_hash=row[4],
+        current_content_hash=row[5],
+        current_plugin_metadata=row[6],
+    )
+
+
+def record_compliance(
+    conn: sqlite3.Connection,
+    file_id: int,
+    policy_hash: str,
+    phases_key: str,
+    content_hash: str,
+    size_bytes: int,
+    mtime_ns: int,
+    plugin_metadata_hash: str | None,
+) -> None:
+    """Record (or refresh) a compliant outcome for a file and policy.
+
+    Args:
+        conn: Database connection.
+        file_id: ID of the file record.
+        policy_hash: Content hash of the policy.
+        phases_key: Phase selection key (see phases_key_for).
+        content_hash: Current content hash of the file.
+        size_bytes: Current file size from stat().
+        mtime_ns: Current modification time (ns) from stat().
+        plugin_metadata_hash: Hash of the file's plugin metadata.
+
+    Note:
+        This function does NOT commit. Caller must manage transactions.
+    """
+    conn.execute(
+        """
+        INSERT OR REPLACE INTO compliance_memo (
+            file_id, policy_hash, phases_key, content_hash, size_bytes,
+            mtime_ns, plugin_metadata_hash, recorded_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """,
+        (
+            file_id,
+            policy_hash,
+            phases_key,
+            content_hash,
+            size_bytes,
+            mtime_ns,
+            plugin_metadata_hash,
+            datetime.now(timezone.utc).isoformat(),
+        ),
+    )
+
+
+def delete_compliance_memo_for_file(conn: sqlite3.Connection, file_id: int) -> int:
+    """Delete all compliance memo entries for a file.
+
+    Args:
+        conn: Database connection.
+        file_id: ID of the file record.
+
+    Returns:
+        Number of rows deleted.
+
+    Note:
+        This function does NOT commit. Caller must manage transactions.
+    """
+    cursor = conn.execute("DELETE FROM compliance_memo WHERE file_id = ?", (file_id,))
+    return cursor.rowcount
+
+
+def delete_all_compliance_memo(conn: sqlite3.Connection) -> int:
+    """Delete all compliance memo entries.
+
+    Args:
+        conn: Database connection.
+
+    Returns:
+        Number of rows deleted.
+
+    Note:
+        This function does NOT commit. Caller must manage transactions.
+    """
+    cursor = conn.execute("DELETE FROM compliance_memo")
+    return cursor.rowcount
@@ -8,13 +8,16 @@ This module contains database query functions for files and tracks:
 import sqlite3
 from pathlib import Path
 
+from vpo.db.tables import FileTable, TrackTable
 from vpo.db.types import (
     FileRecord,
     TrackInfo,
     TrackRecord,
 )
 
-from .helpers import _row_to_file_record, _row_to_track_record
+from .helpers import _escape_like_pattern, _row_to_file_record, _row_to_track_record
+from .plugin_metadata import replace_plugin_metadata_values
+from .stats import delete_processing_stats_for_file
 
 # ==========================================================================
 # File Operations
@@ -60,6 +63,8 @@ def insert_file(conn: sqlite3.Connection, record: FileRecord) -> int:
             record.container_tags,
         ),
     )
+    if record.plugin_metadata:
+        replace_plugin_metadata_values(conn, cursor.lastrowid, record.plugin_metadata)
     return cursor.lastrowid
 
 
@@ -122,6 +127,7 @@ def upsert_file(conn: sqlite3.Connection, record: FileRecord) -> int:
         raise sqlite3.IntegrityError(
             f"RETURNING clause failed to return file ID for path: {record.path}"
         )
+    replace_plugin_metadata_values(conn, result[0], record.plugin_metadata)
     return result[0]
 
 
@@ -197,6 +203,198 @@ def get_files_by_paths(
     return result
 
 
+def _path_prefix_pattern(path_prefix: str) -> str:
+    """Return the LIKE pattern matching paths under a directory prefix."""
+    return _escape_like_pattern(path_prefix.rstrip("/") + "/") + "%"
+
+
+def _under_prefix_filter(
+    path_prefix: str, first_id: int | None, last_id: int | None
+) -> tuple[str, list]:
+    """Build a tracks condition keeping only files under a path prefix.
+
+    The file ID bounds are repeated in the subquery so it reads only the
+    batch's range of the files table.
+    """
+    conditions = ["path LIKE ? ESCAPE '\\'"]
+    params: list = [_path_prefix_pattern(path_prefix)]
+    if first_id is not None:
+        conditions.append("id >= ?")
+        params.append(first_id)
+    if last_id is not None:
+        conditions.append("id <= ?")
+        params.append(last_id)
+    subquery = "SELECT id FROM files WHERE " + " AND ".join(conditions)
+    return f"file_id IN ({subquery})", params
+
+
+def get_file_batch(
+    conn: sqlite3.Connection,
+    after_id: int = 0,
+    limit: int = 500,
+    path_prefix: str | None = None,
+) -> list[FileRecord]:
+    """Get the next batch of successfully scanned files in ID order.
+
+    Uses keyset pagination (id > after_id) so iterating a large library
+    costs one indexed range scan per batch regardless of position.
+
+    Args:
+        conn: Database connection.
+        after_id: Return files with an ID greater than this.
+        limit: Maximum number of files to return.
+        path_prefix: Optional directory prefix to restrict the batch to.
+
+    Returns:
+        List of FileRecord objects ordered by ID (empty when exhausted).
+    """
+    query = """
+        SELECT id, path, filename, directory, extension, size_bytes,
+               modified_at, content_hash, container_format,
+               scanned_at, scan_status, scan_error, job_id, plugin_metadata,
+               container_tags
+        FROM files
+        WHERE id > ? AND scan_status = 'ok'
+    """
+    params: list = [after_id]
+    if path_prefix:
+        query += " AND path LIKE ? ESCAPE '\\'"
+        params.append(_path_prefix_pattern(path_prefix))
+    query += " ORDER BY id LIMIT ?"
+    params.append(limit)
+
+    cursor = conn.execute(query, tuple(params))
+    return [_row_to_file_record(row) for row in cursor.fetchall()]
+
+
+def get_tracks_for_file_range(
+    conn: sqlite3.Connection,
+    first_id: int,
+    last_id: int,
+    path_prefix: str | None = None,
+) -> dict[int, list[TrackRecord]]:
+    """Get tracks for all files with IDs in an inclusive range.
+
+    Companion to get_file_batch(): a single range query fetches the
+    tracks for a whole batch without hitting SQLite's parameter limit.
+
+    Args:
+        conn: Database connection.
+        first_id: Lowest file ID in the range.
+        last_id: Highest file ID in the range.
+        path_prefix: Optional directory prefix; pass the one given to
+            get_file_batch() so files outside it are not read.
+
+    Returns:
+        Dictionary mapping file_id to its tracks ordered by track_index.
+        Files without tracks are not included.
+    """
+    query = """
+        SELECT id, file_id, track_index, track_type, codec,
+               language, title, is_default, is_forced,
+               channels, channel_layout, width, height, frame_rate,
+               color_transfer, color_primaries, color_space, color_range,
+               duration_seconds
+        FROM tracks WHERE file_id BETWEEN ? AND ?
+    """
+    params: list = [first_id, last_id]
+    if path_prefix:
+        condition, prefix_params = _under_prefix_filter(path_prefix, first_id, last_id)
+        query += f" AND {condition}"
+        params.extend(prefix_params)
+    query += " ORDER BY file_id, track_index"
+
+    cursor = conn.execute(query, tuple(params))
+    result: dict[int, list[TrackRecord]] = {}
+    for row in cursor.fetchall():
+        record = _row_to_track_record(row)
+        result.setdefault(record.file_id, []).append(record)
+    return result
+
+
+def get_file_table(
+    conn: sqlite3.Connection,
+    paths: list[str] | None = None,
+    chunk_size: int = 900,
+) -> FileTable:
+    """Get file records as a columnar FileTable.
+
+    Bulk counterpart of get_files_by_paths(): rows are copied straight into
+    the table's columns instead of one FileRecord per file.
+
+    Args:
+        conn: Database connection.
+        paths: File paths to look up, or None for all files.
+        chunk_size: Maximum paths per query (default 900, max 999 for SQLite).
+
+    Returns:
+        FileTable of the found files. Missing paths are not included.
+    """
+    table = FileTable()
+    columns = ", ".join(FileTable.FILE_COLUMNS)
+    cursor = conn.cursor()
+    cursor.row_factory = None  # plain tuples; rows are unpacked into columns
+    if paths is None:
+        for row in cursor.execute(f"SELECT {columns} FROM files ORDER BY id"):
+            table.append(row)
+        return table
+
+    for i in range(0, len(paths), chunk_size):
+        chunk = paths[i : i + chunk_size]
+        placeholders = ",".join("?" * len(chunk))
+        for row in cursor.execute(
+            f"SELECT {columns} FROM files WHERE path IN ({placeholders})",
+            tuple(chunk),
+        ):
+            table.append(row)
+    return table
+
+
+def get_track_table(
+    conn: sqlite3.Connection,
+    first_id: int | None = None,
+    last_id: int | None = None,
+    path_prefix: str | None = None,
+) -> TrackTable:
+    """Get tracks as a columnar TrackTable, ordered by file and track index.
+
+    Bulk counterpart of get_tracks_for_file_range(): loading every track of
+    a large library this way avoids one TrackRecord per track.
+
+    Args:
+        conn: Database connection.
+        first_id: Lowest file ID to include (None = no lower bound).
+        last_id: Highest file ID to include (None = no upper bound).
+        path_prefix: Optional directory prefix to restrict the tracks to.
+
+    Returns:
+        TrackTable of the matching tracks.
+    """
+    query = f"SELECT {', '.join(TrackTable.TRACK_COLUMNS)} FROM tracks"
+    conditions: list[str] = []
+    params: list = []
+    if first_id is not None:
+        conditions.append("file_id >= ?")
+        params.append(first_id)
+    if last_id is not None:
+        conditions.append("file_id <= ?")
+        params.append(last_id)
+    if path_prefix:
+        condition, prefix_params = _under_prefix_filter(path_prefix, first_id, last_id)
+        conditions.append(condition)
+        params.extend(prefix_params)
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    query += " ORDER BY file_id, track_index"
+
+    table = TrackTable()
+    cursor = conn.cursor()
+    cursor.row_factory = None  # plain tuples; rows are unpacked into columns
+    for row in cursor.execute(query, tuple(params)):
+        table.append(row)
+    return table
+
+
 def get_file_by_id(conn: sqlite3.Connection, file_id: int) -> FileRecord | None:
     """Get a file record by ID.
 
@@ -227,6 +425,9 @@ def get_file_by_id(conn: sqlite3.Connection, file_id: int) -> FileRecord | None:
 def delete_file(conn: sqlite3.Connection, file_id: int) -> None:
     """Delete a file record and its associated tracks.
 
+    The file's processing stats are deleted first so the stats rollups
+    stay in step with the cascade.
+
     Args:
         conn: Database connection.
         file_id: ID of the file to delete.
@@ -234,6 +435,7 @@ def delete_file(conn: sqlite3.Connection, file_id: int) -> None:
     Note:
         This function does NOT commit. Caller must manage transactions.
     """
+    delete_processing_stats_for_file(conn, file_id)
     conn.execute("DELETE FROM files WHERE id = ?", (file_id,))
 
 
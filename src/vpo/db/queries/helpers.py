@@ -15,6 +15,7 @@ from vpo.db.types import (
     Job,
     JobStatus,
     JobType,
+    ResourceClass,
     TrackRecord,
 )
 
@@ -142,6 +143,9 @@ def _row_to_job(row: sqlite3.Row) -> Job:
         log_path=row["log_path"],
         origin=origin,
         batch_id=batch_id,
+        resource_class=(
+            ResourceClass(row["resource_class"]) if row["resource_class"] else None
+        ),
     )
 
 
@@ -43,8 +43,11 @@ def insert_job(conn: sqlite3.Connection, job: Job) -> str:
             worker_pid, worker_heartbeat,
             output_path, backup_path, error_message,
             files_affected_json, summary_json, log_path,
-            origin, batch_id
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            origin, batch_id, resource_class
+        ) VALUES (
+            ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?,
+            ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?
+        )
         """,
         (
             job.id,
@@ -70,6 +73,7 @@ def insert_job(conn: sqlite3.Connection, job: Job) -> str:
             job.log_path,
             job.origin,
             job.batch_id,
+            job.resource_class.value if job.resource_class else None,
         ),
     )
     return job.id
@@ -93,7 +97,7 @@ def get_job(conn: sqlite3.Connection, job_id: str) -> Job | None:
                worker_pid, worker_heartbeat,
                output_path, backup_path, error_message,
                files_affected_json, summary_json, log_path,
-               origin, batch_id
+               origin, batch_id, resource_class
         FROM jobs WHERE id = ?
         """,
         (job_id,),
@@ -166,6 +170,72 @@ def update_job_progress(
     return cursor.rowcount > 0
 
 
+def update_job_log_path(
+    conn: sqlite3.Connection,
+    job_id: str,
+    log_path: str,
+) -> bool:
+    """Set the relative path of a job's log file.
+
+    Args:
+        conn: Database connection.
+        job_id: Job UUID.
+        log_path: Log path relative to the VPO data directory.
+
+    Returns:
+        True if job was updated, False if job not found.
+
+    Note:
+        This function does NOT commit. Caller must manage transactions.
+    """
+    cursor = conn.execute(
+        "UPDATE jobs SET log_path = ? WHERE id = ?",
+        (log_path, job_id),
+    )
+    return cursor.rowcount > 0
+
+
+def get_job_checkpoint(conn: sqlite3.Connection, job_id: str) -> str | None:
+    """Get a job's workflow checkpoint.
+
+    Args:
+        conn: Database connection.
+        job_id: Job UUID.
+
+    Returns:
+        JSON-encoded checkpoint, or None if the job has none.
+    """
+    row = conn.execute(
+        "SELECT checkpoint_json FROM jobs WHERE id = ?", (job_id,)
+    ).fetchone()
+    return row[0] if row else None
+
+
+def update_job_checkpoint(
+    conn: sqlite3.Connection,
+    job_id: str,
+    checkpoint_json: str | None,
+) -> bool:
+    """Set or clear a job's workflow checkpoint.
+
+    Args:
+        conn: Database connection.
+        job_id: Job UUID.
+        checkpoint_json: JSON-encoded checkpoint (None to clear).
+
+    Returns:
+        True if job was updated, False if job not found.
+
+    Note:
+        This function does NOT commit. Caller must manage transactions.
+    """
+    cursor = conn.execute(
+        "UPDATE jobs SET checkpoint_json = ? WHERE id = ?",
+        (checkpoint_json, job_id),
+    )
+    return cursor.rowcount > 0
+
+
 def update_job_worker(
     conn: sqlite3.Connection,
     job_id: str,
@@ -254,7 +324,7 @@ def get_queued_jobs(conn: sqlite3.Connection, limit: int | None = None) -> list[
                worker_pid, worker_heartbeat,
                output_path, backup_path, error_message,
                files_affected_json, summary_json, log_path,
-               origin, batch_id
+               origin, batch_id, resource_class
         FROM jobs
         WHERE status = 'queued'
         ORDER BY priority ASC, created_at ASC
@@ -288,7 +358,7 @@ def get_jobs_by_status(
                worker_pid, worker_heartbeat,
                output_path, backup_path, error_message,
                files_affected_json, summary_json, log_path,
-               origin, batch_id
+               origin, batch_id, resource_class
         FROM jobs
         WHERE status = ?
         ORDER BY created_at DESC
@@ -319,7 +389,7 @@ def get_all_jobs(conn: sqlite3.Connection, limit: int | None = None) -> list[Job
                worker_pid, worker_heartbeat,
                output_path, backup_path, error_message,
                files_affected_json, summary_json, log_path,
-               origin, batch_id
+               origin, batch_id, resource_class
         FROM jobs
         ORDER BY created_at DESC
     """
@@ -351,7 +421,7 @@ def get_jobs_by_id_prefix(conn: sqlite3.Connection, prefix: str) -> list[Job]:
                worker_pid, worker_heartbeat,
                output_path, backup_path, error_message,
                files_affected_json, summary_json, log_path,
-               origin, batch_id
+               origin, batch_id, resource_class
         FROM jobs
         WHERE id LIKE ?
         ORDER BY created_at DESC
@@ -434,7 +504,7 @@ def get_jobs_filtered(
                worker_pid, worker_heartbeat,
                output_path, backup_path, error_message,
                files_affected_json, summary_json, log_path,
-               origin, batch_id
+               origin, batch_id, resource_class
         FROM jobs
     """
     base_query += where_clause
@@ -0,0 +1,243 @@
+"""Plugin metadata value operations for Video Policy Orchestrator database.
+
+files.plugin_metadata holds plugin enrichment as a JSON object keyed by
+plugin name. The plugin_metadata_values table stores the same data as one
+row per (file, plugin, field) with typed, indexed values, so library-wide
+questions ("all files where radarr.original_language is jpn") are answered
+from an index instead of parsing every file's JSON.
+
+This module contains database query functions for plugin metadata values:
+- Sync from the JSON column, per-file lookup and value filter construction
+- Bulk merge of plugin enrichments into files.plugin_metadata
+"""
+
+import json
+import logging
+import sqlite3
+from collections.abc import Mapping
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Maximum IDs per IN (...) lookup, well under SQLITE_MAX_VARIABLE_NUMBER
+_LOOKUP_CHUNK_SIZE = 500
+
+#: Operators supported by plugin_value_filter, mirroring
+#: MetadataComparisonOperator in policy conditions.
+PLUGIN_VALUE_OPERATORS = frozenset(
+    {"eq", "neq", "contains", "lt", "lte", "gt", "gte", "exists"}
+)
+
+_NUMERIC_OPERATORS = {"lt": "<", "lte": "<=", "gt": ">", "gte": ">="}
+
+# Flatten a plugin_metadata JSON object into plugin_metadata_values rows.
+# Malformed or non-object metadata produces no rows.
+_INSERT_VALUES_SQL = """
+    INSERT INTO plugin_metadata_values (
+        file_id, plugin, key, value_type, value_text, value_num
+    )
+    SELECT
+        :file_id,
+        p.key,
+        k.key,
+        k.type,
+        CASE WHEN k.type IN ('text', 'object', 'array') THEN k.value END,
+        CASE WHEN k.type IN ('integer', 'real', 'true', 'false') THEN k.value END
+    FROM json_each(
+        CASE
+            WHEN json_valid(:metadata) THEN
+                CASE WHEN json_type(:metadata) = 'object' THEN :metadata END
+        END
+    ) AS p,
+    json_each(p.value) AS k
+    WHERE p.type = 'object'
+"""
+
+
+def replace_plugin_metadata_values(
+    conn: sqlite3.Connection, file_id: int, plugin_metadata: str | None
+) -> None:
+    """Replace a file's plugin metadata values from its JSON column value.
+
+    Args:
+        conn: Database connection.
+        file_id: ID of the file.
+        plugin_metadata: JSON text as stored in files.plugin_metadata.
+
+    Note:
+        This function does NOT commit. Caller must manage transactions.
+    """
+    conn.execute("DELETE FROM plugin_metadata_values WHERE file_id = ?", (file_id,))
+    if plugin_metadata:
+        conn.execute(
+            _INSERT_VALUES_SQL, {"file_id": file_id, "metadata": plugin_metadata}
+        )
+
+
+def merge_plugin_metadata(
+    conn: sqlite3.Connection,
+    enrichments: Mapping[int, Mapping[str, dict[str, Any]]],
+) -> int:
+    """Merge plugin enrichments into many files' plugin metadata at once.
+
+    Each plugin's entry replaces that plugin's existing entry for the file;
+    entries from other plugins are kept. The JSON column and the indexed
+    values table are updated with one executemany per statement.
+
+    Args:
+        conn: Database connection.
+        enrichments: Plugin data keyed by file ID, then by plugin name.
+
+    Returns:
+        Number of files updated (files that no longer exist are skipped).
+
+    Note:
+        This function does NOT commit. Caller must manage transactions.
+    """
+    file_ids = [file_id for file_id, data in enrichments.items() if data]
+    existing: dict[int, str | None] = {}
+    for start in range(0, len(file_ids), _LOOKUP_CHUNK_SIZE):
+        chunk = file_ids[start : start + _LOOKUP_CHUNK_SIZE]
+        placeholders = ",".join("?" * len(chunk))
+        cursor = conn.execute(
+            f"SELECT id, plugin_metadata FROM files WHERE id IN ({placeholders})",
+            chunk,
+        )
+        existing.update((row[0], row[1]) for row in cursor)
+
+    rows: list[tuple[str, int]] = []
+    for file_id, current in existing.items():
+        merged: dict[str, Any] = {}
+        if current:
+            try:
+                parsed = json.loads(current)
+            except json.JSONDecodeError:
+                logger.warning(
+                    "Replacing malformed plugin_metadata for file %d", file_id
+                )
+            else:
+                if isinstance(parsed, dict):
+                    merged = parsed
+        merged.update(enrichments[file_id])
+        rows.append((json.dumps(merged), file_id))
+
+    if not rows:
+        return 0
+    conn.executemany("UPDATE files SET plugin_metadata = ? WHERE id = ?", rows)
+    conn.executemany(
+        "DELETE FROM plugin_metadata_values WHERE file_id = ?",
+        [(file_id,) for _, file_id in rows],
+    )
+    conn.executemany(
+        _INSERT_VALUES_SQL,
+        [{"file_id": file_id, "metadata": metadata} for metadata, file_id in rows],
+    )
+    return len(rows)
+
+
+def _decode_value(value_type: str, value_text: str | None, value_num: Any) -> Any:
+    """Convert a stored value back to its JSON-equivalent Python value."""
+    if value_type == "text":
+        return value_text
+    if value_type in ("integer", "real"):
+        return value_num
+    if value_type in ("true", "false"):
+        return value_type == "true"
+    if value_type in ("object", "array") and value_text is not None:
+        return json.loads(value_text)
+    return None
+
+
+def get_plugin_metadata_values(
+    conn: sqlite3.Connection, file_id: int
+) -> dict[str, dict[str, Any]]:
+    """Get a file's plugin metadata from the indexed values table.
+
+    Args:
+        conn: Database connection.
+        file_id: ID of the file.
+
+    Returns:
+        Dict keyed by plugin name with each plugin's fields, in the same
+        shape as the parsed files.plugin_metadata JSON. Empty if the file
+        has no plugin metadata.
+    """
+    cursor = conn.execute(
+        """
+        SELECT plugin, key, value_type, value_text, value_num
+        FROM plugin_metadata_values
+        WHERE file_id = ?
+        ORDER BY plugin, key
+        """,
+        (file_id,),
+    )
+    result: dict[str, dict[str, Any]] = {}
+    for plugin, key, value_type, value_text, value_num in cursor:
+        result.setdefault(plugin, {})[key] = _decode_value(
+            value_type, value_text, value_num
+        )
+    return result
+
+
+def plugin_value_filter(
+    operator: str, value: str | int | float | bool | None = None, alias: str = "v"
+) -> tuple[str, list[Any]]:
+    """Build a SQL condition on a plugin_metadata_values row.
+
+    Semantics follow plugin_metadata policy conditions: string equality and
+    contains are case-insensitive, ordering operators apply only to numeric
+    values, and neq requires the field to exist with a non-null, different
+    value. contains matches text values only.
+
+    Args:
+        operator: One of PLUGIN_VALUE_OPERATORS.
+        value: Value to compare against (unused for "exists").
+        alias: Table alias of the plugin_metadata_values row.
+
+    Returns:
+        Tuple of (SQL condition, parameters). The condition is "1" for
+        "exists".
+
+    Raises:
+        ValueError: If the operator is unknown or value does not suit it.
+    """
+    if operator not in PLUGIN_VALUE_OPERATORS:
+        raise ValueError(f"Unknown plugin metadata operator: {operator}")
+    if operator == "exists":
+        return "1", []
+    if value is None:
+        raise ValueError(f"Operator '{operator}' requires a value")
+
+    if operator in _NUMERIC_OPERATORS:
+        if isinstance(value, bool) or not isinstance(value, int | float):
+            raise ValueError(f"Operator '{operator}' requires a numeric value")
+        return (
+            f"{alias}.value_type IN ('integer', 'real') "
+            f"AND {alias}.value_num {_NUMERIC_OPERATORS[operator]} ?",
+            [value],
+        )
+
+    if operator == "contains":
+        if not isinstance(value, str):
+            raise ValueError("Operator 'contains' requires a string value")
+        return (
+            f"{alias}.value_type = 'text' "
+            f"AND instr(lower({alias}.value_text), lower(?)) > 0",
+            [value],
+        )
+
+    if isinstance(value, bool):
+        condition = f"{alias}.value_type = ?"
+        params: list[Any] = ["true" if value else "false"]
+    elif isinstance(value, int | float):
+        condition = (
+            f"{alias}.value_type IN ('integer', 'real') AND {alias}.value_num = ?"
+        )
+        params = [value]
+    else:
+        condition = f"{alias}.value_type = 'text' AND {alias}.value_text = ?"
+        params = [value]
+
+    if operator == "neq":
+        return f"{alias}.value_type != 'null' AND NOT ({condition})", params
+    return condition, params
@@ -2,10 +2,12 @@
 
 This module contains database query functions for processing statistics:
 - Processing stats insert, get, delete operations
+- Hourly/daily rollup maintenance (processing_stats_rollups)
 - Action result and performance metric operations
 """
 
 import sqlite3
+from datetime import datetime, timedelta
 
 from vpo.db.types import (
     ActionResultRecord,
@@ -13,6 +15,74 @@ from vpo.db.types import (
     ProcessingStatsRecord,
 )
 
+#: strftime format of the bucket start for each rollup granularity
+ROLLUP_BUCKET_FORMATS = {
+    "hour": "%Y-%m-%dT%H:00:00+00:00",
+    "day": "%Y-%m-%dT00:00:00+00:00",
+}
+
+_ROLLUP_BUCKET_LENGTHS = {"hour": timedelta(hours=1), "day": timedelta(days=1)}
+
+# Aggregate processing_stats rows matching {where} into rollup buckets,
+# adding to buckets that already exist. Rows whose processed_at cannot be
+# parsed are not rolled up.
+_ADD_TO_ROLLUPS_SQL = """
+    INSERT INTO processing_stats_rollups (
+        granularity, bucket_start, policy_name,
+        files_processed, successful, failed,
+        size_before, size_after, size_change,
+        audio_tracks_removed, subtitle_tracks_removed, attachments_removed,
+        videos_transcoded, videos_skipped, audio_tracks_transcoded,
+        duration_seconds_total, hardware_encodes, software_encodes,
+        first_processed_at, last_processed_at
+    )
+    SELECT
+        :granularity,
+        strftime(:bucket_format, processed_at) AS bucket,
+        policy_name,
+        COUNT(*),
+        SUM(success = 1),
+        SUM(success = 0),
+        SUM(size_before),
+        SUM(size_after),
+        SUM(size_change),
+        SUM(audio_tracks_removed),
+        SUM(subtitle_tracks_removed),
+        SUM(attachments_removed),
+        SUM(video_target_codec IS NOT NULL AND video_transcode_skipped = 0),
+        SUM(video_transcode_skipped),
+        SUM(audio_tracks_transcoded),
+        SUM(duration_seconds),
+        SUM(CASE WHEN encoder_type = 'hardware' THEN 1 ELSE 0 END),
+        SUM(CASE WHEN encoder_type = 'software' THEN 1 ELSE 0 END),
+        MIN(processed_at),
+        MAX(processed_at)
+    FROM processing_stats
+    WHERE ({where}) AND bucket IS NOT NULL
+    GROUP BY bucket, policy_name
+    ON CONFLICT (granularity, bucket_start, policy_name) DO UPDATE SET
+        files_processed = files_processed + excluded.files_processed,
+        successful = successful + excluded.successful,
+        failed = failed + excluded.failed,
+        size_before = size_before + excluded.size_before,
+        size_after = size_after + excluded.size_after,
+        size_change = size_change + excluded.size_change,
+        audio_tracks_removed = audio_tracks_removed + excluded.audio_tracks_removed,
+        subtitle_tracks_removed =
+            subtitle_tracks_removed + excluded.subtitle_tracks_removed,
+        attachments_removed = attachments_removed + excluded.attachments_removed,
+        videos_transcoded = videos_transcoded + excluded.videos_transcoded,
+        videos_skipped = videos_skipped + excluded.videos_skipped,
+        audio_tracks_transcoded =
+            audio_tracks_transcoded + excluded.audio_tracks_transcoded,
+        duration_seconds_total =
+            duration_seconds_total + excluded.duration_seconds_total,
+        hardware_encodes = hardware_encodes + excluded.hardware_encodes,
+        software_encodes = software_encodes + excluded.software_encodes,
+        first_processed_at = min(first_processed_at, excluded.first_processed_at),
+        last_processed_at = max(last_processed_at, excluded.last_processed_at)
+"""
+
 
 def _row_to_processing_stats(row: sqlite3.Row) -> ProcessingStatsRecord:
     """Convert a database row to ProcessingStatsRecord.
@@ -129,9 +199,111 @@ def insert_processing_stats(
             record.job_id,
         ),
     )
+    _add_to_stats_rollups(conn, "id = :id", {"id": record.id})
     return record.id
 
 
+def _add_to_stats_rollups(
+    conn: sqlite3.Connection, where: str, params: dict[str, object]
+) -> None:
+    """Add the processing_stats rows matching where to every rollup level."""
+    for granularity, bucket_format in ROLLUP_BUCKET_FORMATS.items():
+        conn.execute(
+            _ADD_TO_ROLLUPS_SQL.format(where=where),
+            {**params, "granularity": granularity, "bucket_format": bucket_format},
+        )
+
+
+def _delete_stats_and_refresh_rollups(
+    conn: sqlite3.Connection, where: str, params: dict[str, object]
+) -> int:
+    """Delete processing_stats rows and re-aggregate the buckets they were in.
+
+    Only the (bucket, policy) rollups that contained a deleted row are
+    recomputed, each from an index range scan of processing_stats.
+
+    Returns:
+        Number of processing_stats rows deleted.
+    """
+    affected: set[tuple[str, str, str]] = set()
+    for granularity, bucket_format in ROLLUP_BUCKET_FORMATS.items():
+        cursor = conn.execute(
+            f"""
+            SELECT DISTINCT strftime(:bucket_format, processed_at) AS bucket,
+                policy_name
+            FROM processing_stats
+            WHERE ({where}) AND bucket IS NOT NULL
+            """,
+            {**params, "bucket_format": bucket_format},
+        )
+        affected.update((granularity, row[0], row[1]) for row in cursor)
+
+    cursor = conn.execute(f"DELETE FROM processing_stats WHERE {where}", params)
+    deleted = cursor.rowcount
+
+    for granularity, bucket_start, policy_name in affected:
+        conn.execute(
+            """
+            DELETE FROM processing_stats_rollups
+            WHERE granularity = ? AND bucket_start = ? AND policy_name = ?
+            """,
+            (granularity, bucket_start, policy_name),
+        )
+        bucket_end = (
+            datetime.fromisoformat(bucket_start) + _ROLLUP_BUCKET_LENGTHS[granularity]
+        ).isoformat()
+        conn.execute(
+            _ADD_TO_ROLLUPS_SQL.format(
+                where="processed_at >= :start AND processed_at < :end "
+                "AND policy_name = :policy "
+                "AND strftime(:bucket_format, processed_at) = :start"
+            ),
+            {
+                "granularity": granularity,
+                "bucket_format": ROLLUP_BUCKET_FORMATS[granularity],
+                "start": bucket_start,
+                "end": bucket_end,
+                "policy": policy_name,
+            },
+        )
+    return deleted
+
+
+def delete_processing_stats_for_file(conn: sqlite3.Connection, file_id: int) -> int:
+    """Delete a file's processing stats and update the rollups.
+
+    Note: Does not commit. Caller is responsible for transaction management.
+
+    Args:
+        conn: Database connection.
+        file_id: ID of the file.
+
+    Returns:
+        Number of stats records deleted.
+    """
+    return _delete_stats_and_refresh_rollups(
+        conn, "file_id = :file_id", {"file_id": file_id}
+    )
+
+
+def rebuild_stats_rollups(conn: sqlite3.Connection) -> int:
+    """Rebuild processing_stats_rollups from processing_stats.
+
+    Backfills the rollups for history recorded before they existed, or
+    repairs them after processing_stats was modified outside VPO.
+
+    Args:
+        conn: Database connection.
+
+    Returns:
+        Number of rollup rows written.
+    """
+    conn.execute("DELETE FROM processing_stats_rollups")
+    _add_to_stats_rollups(conn, "1", {})
+    conn.commit()
+    return conn.execute("SELECT COUNT(*) FROM processing_stats_rollups").fetchone()[0]
+
+
 def insert_action_result(conn: sqlite3.Connection, record: ActionResultRecord) -> int:
     """Insert a new action result record.
 
@@ -186,8 +358,9 @@ def insert_performance_metric(
         """
         INSERT INTO performance_metrics (
             stats_id, phase_name, wall_time_seconds,
-            bytes_read, bytes_written, encoding_fps, encoding_bitrate
-        ) VALUES (?, ?, ?, ?, ?, ?, ?)
+            bytes_read, bytes_written, encoding_fps, encoding_bitrate,
+            io_wait_seconds, io_wait_devices
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
         """,
         (
             record.stats_id,
@@ -197,6 +370,8 @@ def insert_performance_metric(
             record.bytes_written,
             record.encoding_fps,
             record.encoding_bitrate,
+            record.io_wait_seconds,
+            record.io_wait_devices,
         ),
     )
     return cursor.lastrowid
@@ -332,7 +507,8 @@ def get_performance_metrics_for_stats(
     cursor = conn.execute(
         """
         SELECT id, stats_id, phase_name, wall_time_seconds,
-               bytes_read, bytes_written, encoding_fps, encoding_bitrate
+               bytes_read, bytes_written, encoding_fps, encoding_bitrate,
+               io_wait_seconds, io_wait_devices
         FROM performance_metrics
         WHERE stats_id = ?
         ORDER BY id
@@ -349,6 +525,8 @@ def get_performance_metrics_for_stats(
             bytes_written=row["bytes_written"],
             encoding_fps=row["encoding_fps"],
             encoding_bitrate=row["encoding_bitrate"],
+            io_wait_seconds=row["io_wait_seconds"],
+            io_wait_devices=row["io_wait_devices"],
         )
         for row in cursor.fetchall()
     ]
@@ -359,7 +537,8 @@ def delete_processing_stats_before(
 ) -> int:
     """Delete processing stats older than the specified date.
 
-    Related action_results and performance_metrics are deleted via CASCADE.
+    Related action_results and performance_metrics are deleted via CASCADE,
+    and the rollup buckets that contained deleted records are recomputed.
 
     Args:
         conn: Database connection.
@@ -377,12 +556,11 @@ def delete_processing_stats_before(
         )
         return cursor.fetchone()[0]
 
-    cursor = conn.execute(
-        "DELETE FROM processing_stats WHERE processed_at < ?",
-        (before_date,),
+    deleted = _delete_stats_and_refresh_rollups(
+        conn, "processed_at < :before", {"before": before_date}
     )
     conn.commit()
-    return cursor.rowcount
+    return deleted
 
 
 def delete_processing_stats_by_policy(
@@ -411,6 +589,10 @@ def delete_processing_stats_by_policy(
         "DELETE FROM processing_stats WHERE policy_name = ?",
         (policy_name,),
     )
+    conn.execute(
+        "DELETE FROM processing_stats_rollups WHERE policy_name = ?",
+        (policy_name,),
+    )
     conn.commit()
     return cursor.rowcount
 
@@ -432,5 +614,6 @@ def delete_all_processing_stats(conn: sqlite3.Connection, dry_run: bool = False)
         return cursor.fetchone()[0]
 
     cursor = conn.execute("DELETE FROM processing_stats")
+    conn.execute("DELETE FROM processing_stats_rollups")
     conn.commit()
     return cursor.rowcount
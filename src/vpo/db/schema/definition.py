@@ -7,7 +7,7 @@ used by the VPO database.
 
 import sqlite3
 
-SCHEMA_VERSION = 27
+SCHEMA_VERSION = 35
 
 SCHEMA_SQL = """
 -- Schema version tracking
@@ -151,6 +151,8 @@ CREATE TABLE IF NOT EXISTS jobs (
     -- Worker
     worker_pid INTEGER,
     worker_heartbeat TEXT,
+    lease_owner TEXT,       -- Worker holding the job ("host:pid")
+    lease_expires_at TEXT,  -- ISO-8601 UTC; renewed by the heartbeat
 
     -- Results
     output_path TEXT,
@@ -168,6 +170,19 @@ CREATE TABLE IF NOT EXISTS jobs (
     origin TEXT,      -- 'cli' or 'daemon' (NULL = legacy)
     batch_id TEXT,    -- UUID grouping CLI batch operations
 
+    -- Submissions merged into this job by enqueue_job
+    coalesced_count INTEGER NOT NULL DEFAULT 0,
+
+    -- Scheduling slot class (see vpo.jobs.resources; NULL = unscheduled)
+    resource_class TEXT CHECK (
+        resource_class IS NULL
+        OR resource_class IN ('metadata', 'io', 'cpu', 'transcription')
+    ),
+
+    -- Completed workflow phases, for resuming a recovered job
+    -- (see vpo.workflow.checkpoint)
+    checkpoint_json TEXT,
+
     FOREIGN KEY (file_id) REFERENCES files(id) ON DELETE CASCADE,
     CONSTRAINT valid_status CHECK (
         status IN ('queued', 'running', 'completed', 'failed', 'cancelled')
@@ -190,6 +205,13 @@ CREATE INDEX IF NOT EXISTS idx_jobs_priority_created ON jobs(priority, created_a
 CREATE INDEX IF NOT EXISTS idx_jobs_job_type ON jobs(job_type);
 CREATE INDEX IF NOT EXISTS idx_jobs_origin ON jobs(origin);
 CREATE INDEX IF NOT EXISTS idx_jobs_batch_id ON jobs(batch_id);
+CREATE INDEX IF NOT EXISTS idx_jobs_queue
+    ON jobs(priority, created_at) WHERE status = 'queued';
+CREATE UNIQUE INDEX IF NOT EXISTS idx_jobs_queued_unique
+    ON jobs(file_id, job_type, IFNULL(policy_name, ''))
+    WHERE status = 'queued' AND file_id IS NOT NULL;
+CREATE INDEX IF NOT EXISTS idx_jobs_running_class
+    ON jobs(resource_class) WHERE status = 'running';
 
 -- Transcription results table (007-audio-transcription)
 CREATE TABLE IF NOT EXISTS transcription_results (
@@ -403,6 +425,10 @@ CREATE TABLE IF NOT EXISTS performance_metrics (
     encoding_fps REAL,                      -- Average encoding FPS
     encoding_bitrate INTEGER,               -- Average output bitrate (bits/sec)
 
+    -- I/O admission (v29)
+    io_wait_seconds REAL,                   -- Time waited for per-device admission
+    io_wait_devices TEXT,                   -- JSON: {device: wait_seconds}
+
     FOREIGN KEY (stats_id) REFERENCES processing_stats(id) ON DELETE CASCADE
 );
 
@@ -455,6 +481,71 @@ CREATE TABLE IF NOT EXISTS library_snapshots (
 
 CREATE INDEX IF NOT EXISTS idx_library_snapshots_time
     ON library_snapshots(snapshot_at);
+
+-- Compliance memo: files known to need no changes under a policy.
+-- A row is only valid while the file's content hash, size, mtime and
+-- plugin metadata still match the recorded values.
+CREATE TABLE IF NOT EXISTS compliance_memo (
+    file_id INTEGER NOT NULL,
+    policy_hash TEXT NOT NULL,              -- SHA-256 of policy file content
+    phases_key TEXT NOT NULL,               -- '*' or comma-joined phase names
+    content_hash TEXT NOT NULL,             -- files.content_hash when recorded
+    size_bytes INTEGER NOT NULL,            -- st_size when recorded
+    mtime_ns INTEGER NOT NULL,              -- st_mtime_ns when recorded
+    plugin_metadata_hash TEXT,              -- Hash of files.plugin_metadata
+    recorded_at TEXT NOT NULL,              -- ISO-8601 UTC timestamp
+    PRIMARY KEY (file_id, policy_hash, phases_key),
+    FOREIGN KEY (file_id) REFERENCES files(id) ON DELETE CASCADE
+);
+
+-- Plugin metadata values: files.plugin_metadata flattened to one row per
+-- (plugin, field), kept in sync whenever a file record is written.
+-- Names and text values compare case-insensitively, like policy conditions.
+CREATE TABLE IF NOT EXISTS plugin_metadata_values (
+    file_id INTEGER NOT NULL,
+    plugin TEXT NOT NULL COLLATE NOCASE,    -- Plugin name (e.g. 'radarr')
+    key TEXT NOT NULL COLLATE NOCASE,       -- Field name (e.g. 'original_language')
+    value_type TEXT NOT NULL,               -- JSON type: text, integer, real,
+                                            -- true, false, null, object, array
+    value_text TEXT COLLATE NOCASE,         -- text value, or JSON for object/array
+    value_num NUMERIC,                      -- numeric value (booleans as 0/1)
+    PRIMARY KEY (file_id, plugin, key),
+    FOREIGN KEY (file_id) REFERENCES files(id) ON DELETE CASCADE
+);
+
+CREATE INDEX IF NOT EXISTS idx_plugin_meta_text
+    ON plugin_metadata_values(plugin, key, value_text);
+CREATE INDEX IF NOT EXISTS idx_plugin_meta_num
+    ON plugin_metadata_values(plugin, key, value_num);
+
+-- Processing stats rollups: processing_stats aggregated per hour and per day
+-- bucket and per policy, updated with every stats insert. Dashboard queries
+-- read whole buckets from here and only scan processing_stats for the
+-- partial hours at the edges of a time range.
+CREATE TABLE IF NOT EXISTS processing_stats_rollups (
+    granularity TEXT NOT NULL,              -- 'hour' or 'day'
+    bucket_start TEXT NOT NULL,             -- ISO-8601 UTC start of bucket
+    policy_name TEXT NOT NULL,
+    files_processed INTEGER NOT NULL DEFAULT 0,
+    successful INTEGER NOT NULL DEFAULT 0,
+    failed INTEGER NOT NULL DEFAULT 0,
+    size_before INTEGER NOT NULL DEFAULT 0,
+    size_after INTEGER NOT NULL DEFAULT 0,
+    size_change INTEGER NOT NULL DEFAULT 0,
+    audio_tracks_removed INTEGER NOT NULL DEFAULT 0,
+    subtitle_tracks_removed INTEGER NOT NULL DEFAULT 0,
+    attachments_removed INTEGER NOT NULL DEFAULT 0,
+    videos_transcoded INTEGER NOT NULL DEFAULT 0,
+    videos_skipped INTEGER NOT NULL DEFAULT 0,
+    audio_tracks_transcoded INTEGER NOT NULL DEFAULT 0,
+    duration_seconds_total REAL NOT NULL DEFAULT 0,
+    hardware_encodes INTEGER NOT NULL DEFAULT 0,
+    software_encodes INTEGER NOT NULL DEFAULT 0,
+    first_processed_at TEXT,
+    last_processed_at TEXT,
+    PRIMARY KEY (granularity, bucket_start, policy_name),
+    CONSTRAINT valid_granularity CHECK (granularity IN ('hour', 'day'))
+);
 """
 
 
@@ -34,6 +34,14 @@ from .migrations import (
     migrate_v24_to_v25,
     migrate_v25_to_v26,
     migrate_v26_to_v27,
+    migrate_v27_to_v28,
+    migrate_v28_to_v29,
+    migrate_v29_to_v30,
+    migrate_v30_to_v31,
+    migrate_v31_to_v32,
+    migrate_v32_to_v33,
+    migrate_v33_to_v34,
+    migrate_v34_to_v35,
 )
 from .version import get_schema_version
 
@@ -128,3 +136,27 @@ def initialize_database(conn: sqlite3.Connection) -> None:
         if current_version == 26:
             migrate_v26_to_v27(conn)
             current_version = 27
+        if current_version == 27:
+            migrate_v27_to_v28(conn)
+            current_version = 28
+        if current_version == 28:
+            migrate_v28_to_v29(conn)
+            current_version = 29
+        if current_version == 29:
+            migrate_v29_to_v30(conn)
+            current_version = 30
+        if current_version == 30:
+            migrate_v30_to_v31(conn)
+            current_version = 31
+        if current_version == 31:
+            migrate_v31_to_v32(conn)
+            current_version = 32
+        if current_version == 32:
+            migrate_v32_to_v33(conn)
+            current_version = 33
+        if current_version == 33:
+            migrate_v33_to_v34(conn)
+            current_version = 34
+        if current_version == 34:
+            migrate_v34_to_v35(conn)
+            current_version = 35
@@ -9,6 +9,8 @@ Modules:
 - v11_to_v15: Language analysis migrations (v11→v15)
 - v16_to_v20: Stats and classification migrations (v16→v20)
 - v21_to_v25: Enhanced statistics migrations (v21→v25)
+- v26_to_v30: Library management and metadata migrations (v25→v30)
+- v31_to_v35: Dashboard and scheduling migrations (v30→v35)
 """
 
 from .v01_to_v05 import (
@@ -48,6 +50,16 @@ from .v21_to_v25 import (
 from .v26_to_v30 import (
     migrate_v25_to_v26,
     migrate_v26_to_v27,
+    migrate_v27_to_v28,
+    migrate_v28_to_v29,
+    migrate_v29_to_v30,
+)
+from .v31_to_v35 import (
+    migrate_v30_to_v31,
+    migrate_v31_to_v32,
+    migrate_v32_to_v33,
+    migrate_v33_to_v34,
+    migrate_v34_to_v35,
 )
 
 __all__ = [
@@ -83,4 +95,13 @@ __all__ = [
     # v25 to v30
     "migrate_v25_to_v26",
     "migrate_v26_to_v27",
+    "migrate_v27_to_v28",
+    "migrate_v28_to_v29",
+    "migrate_v29_to_v30",
+    # v30 to v35
+    "migrate_v30_to_v31",
+    "migrate_v31_to_v32",
+    "migrate_v32_to_v33",
+    "migrate_v33_to_v34",
+    "migrate_v34_to_v35",
 ]
@@ -3,6 +3,9 @@
 This module contains migrations for missing file management features:
 - v25→v26: Add 'prune' job type, create library_snapshots table
 - v26→v27: Add container_tags column to files table
+- v27→v28: Add compliance_memo table
+- v28→v29: Add I/O admission wait columns to performance_metrics
+- v29→v30: Add plugin_metadata_values table
 """
 
 import sqlite3
@@ -172,3 +175,152 @@ def migrate_v26_to_v27(conn: sqlite3.Connection) -> None:
     except Exception:
         conn.execute("ROLLBACK")
         raise
+
+
+def migrate_v27_to_v28(conn: sqlite3.Connection) -> None:
+    """Migrate database from schema version 27 to version 28.
+
+    Adds:
+    - compliance_memo table recording files known to be compliant with a
+      policy, so unchanged files can skip re-evaluation
+
+    This migration is idempotent - safe to run multiple times.
+
+    Args:
+        conn: An open database connection.
+    """
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS compliance_memo (
+                file_id INTEGER NOT NULL,
+                policy_hash TEXT NOT NULL,
+                phases_key TEXT NOT NULL,
+                content_hash TEXT NOT NULL,
+                size_bytes INTEGER NOT NULL,
+                mtime_ns INTEGER NOT NULL,
+                plugin_metadata_hash TEXT,
+                recorded_at TEXT NOT NULL,
+                PRIMARY KEY (file_id, policy_hash, phases_key),
+                FOREIGN KEY (file_id) REFERENCES files(id) ON DELETE CASCADE
+            )
+        """)
+
+        # Update schema version
+        conn.execute("UPDATE _meta SET value = '28' WHERE key = 'schema_version'")
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+
+def migrate_v28_to_v29(conn: sqlite3.Connection) -> None:
+    """Migrate database from schema version 28 to version 29.
+
+    Adds to performance_metrics:
+    - io_wait_seconds REAL: total time the phase waited for I/O admission
+    - io_wait_devices TEXT: JSON object of wait seconds per block device
+
+    This migration is idempotent - safe to run multiple times.
+
+    Args:
+        conn: An open database connection.
+    """
+    # Check existing columns (PRAGMA must run outside transaction)
+    cursor = conn.execute("PRAGMA table_info(performance_metrics)")
+    columns = {row[1] for row in cursor.fetchall()}
+
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+
+        # An empty column set means the table does not exist yet; it is
+        # created with both columns by the current schema definition.
+        if columns and "io_wait_seconds" not in columns:
+            conn.execute(
+                "ALTER TABLE performance_metrics ADD COLUMN io_wait_seconds REAL"
+            )
+        if columns and "io_wait_devices" not in columns:
+            conn.execute(
+                "ALTER TABLE performance_metrics ADD COLUMN io_wait_devices TEXT"
+            )
+
+        # Update schema version
+        conn.execute("UPDATE _meta SET value = '29' WHERE key = 'schema_version'")
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+
+def migrate_v29_to_v30(conn: sqlite3.Connection) -> None:
+    """Migrate database from schema version 29 to version 30.
+
+    Adds the plugin_metadata_values table, which stores files.plugin_metadata
+    as one indexed row per (file, plugin, field), and backfills it from the
+    existing JSON column.
+
+    This migration is idempotent - safe to run multiple times.
+
+    Args:
+        conn: An open database connection.
+    """
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS plugin_metadata_values (
+                file_id INTEGER NOT NULL,
+                plugin TEXT NOT NULL COLLATE NOCASE,
+                key TEXT NOT NULL COLLATE NOCASE,
+                value_type TEXT NOT NULL,
+                value_text TEXT COLLATE NOCASE,
+                value_num NUMERIC,
+                PRIMARY KEY (file_id, plugin, key),
+                FOREIGN KEY (file_id) REFERENCES files(id) ON DELETE CASCADE
+            )
+        """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_plugin_meta_text
+                ON plugin_metadata_values(plugin, key, value_text)
+        """)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_plugin_meta_num
+                ON plugin_metadata_values(plugin, key, value_num)
+        """)
+
+        # Backfill from the JSON column, skipping malformed or non-object
+        # metadata
+        conn.execute("""
+            INSERT OR REPLACE INTO plugin_metadata_values (
+                file_id, plugin, key, value_type, value_text, value_num
+            )
+            SELECT
+                f.id,
+                p.key,
+                k.key,
+                k.type,
+                CASE WHEN k.type IN ('text', 'object', 'array') THEN k.value END,
+                CASE
+                    WHEN k.type IN ('integer', 'real', 'true', 'false')
+                    THEN k.value
+                END
+            FROM files AS f,
+            json_each(
+                CASE
+                    WHEN json_valid(f.plugin_metadata) THEN
+                        CASE
+                            WHEN json_type(f.plugin_metadata) = 'object'
+                            THEN f.plugin_metadata
+                        END
+                END
+            ) AS p,
+            json_each(p.value) AS k
+            WHERE p.type = 'object'
+        """)
+
+        # Update schema version
+        conn.execute("UPDATE _meta SET value = '30' WHERE key = 'schema_version'")
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
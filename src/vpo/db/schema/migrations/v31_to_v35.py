@@ -0,0 +1,307 @@
+"""Database migrations from schema version 31 to 35.
+
+This module contains migrations for dashboard and scheduling features:
+- v30→v31: Add processing_stats_rollups table
+- v31→v32: Add job lease columns and partial queue index
+- v32→v33: Coalesce duplicate queued jobs behind a unique partial index
+- v33→v34: Add job resource classes for slot scheduling
+- v34→v35: Add job workflow checkpoints
+"""
+
+import sqlite3
+from datetime import datetime, timezone
+
+
+def migrate_v30_to_v31(conn: sqlite3.Connection) -> None:
+    """Migrate database from schema version 30 to version 31.
+
+    Adds the processing_stats_rollups table (processing_stats aggregated per
+    hour/day bucket and policy) and backfills it from existing history.
+
+    This migration is idempotent - safe to run multiple times.
+
+    Args:
+        conn: An open database connection.
+    """
+    bucket_formats = {
+        "hour": "%Y-%m-%dT%H:00:00+00:00",
+        "day": "%Y-%m-%dT00:00:00+00:00",
+    }
+
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS processing_stats_rollups (
+                granularity TEXT NOT NULL,
+                bucket_start TEXT NOT NULL,
+                policy_name TEXT NOT NULL,
+                files_processed INTEGER NOT NULL DEFAULT 0,
+                successful INTEGER NOT NULL DEFAULT 0,
+                failed INTEGER NOT NULL DEFAULT 0,
+                size_before INTEGER NOT NULL DEFAULT 0,
+                size_after INTEGER NOT NULL DEFAULT 0,
+                size_change INTEGER NOT NULL DEFAULT 0,
+                audio_tracks_removed INTEGER NOT NULL DEFAULT 0,
+                subtitle_tracks_removed INTEGER NOT NULL DEFAULT 0,
+                attachments_removed INTEGER NOT NULL DEFAULT 0,
+                videos_transcoded INTEGER NOT NULL DEFAULT 0,
+                videos_skipped INTEGER NOT NULL DEFAULT 0,
+                audio_tracks_transcoded INTEGER NOT NULL DEFAULT 0,
+                duration_seconds_total REAL NOT NULL DEFAULT 0,
+                hardware_encodes INTEGER NOT NULL DEFAULT 0,
+                software_encodes INTEGER NOT NULL DEFAULT 0,
+                first_processed_at TEXT,
+                last_processed_at TEXT,
+                PRIMARY KEY (granularity, bucket_start, policy_name),
+                CONSTRAINT valid_granularity CHECK (granularity IN ('hour', 'day'))
+            )
+        """)
+
+        # Backfill from existing history (rebuilt from scratch, so re-running
+        # does not double count)
+        has_stats = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='processing_stats'"
+        ).fetchone()
+        conn.execute("DELETE FROM processing_stats_rollups")
+        if has_stats:
+            for granularity, bucket_format in bucket_formats.items():
+                conn.execute(
+                    """
+                    INSERT INTO processing_stats_rollups (
+                        granularity, bucket_start, policy_name,
+                        files_processed, successful, failed,
+                        size_before, size_after, size_change,
+                        audio_tracks_removed, subtitle_tracks_removed,
+                        attachments_removed, videos_transcoded, videos_skipped,
+                        audio_tracks_transcoded, duration_seconds_total,
+                        hardware_encodes, software_encodes,
+                        first_processed_at, last_processed_at
+                    )
+                    SELECT
+                        ?,
+                        strftime(?, processed_at) AS bucket,
+                        policy_name,
+                        COUNT(*),
+                        SUM(success = 1),
+                        SUM(success = 0),
+                        SUM(size_before),
+                        SUM(size_after),
+                        SUM(size_change),
+                        SUM(audio_tracks_removed),
+                        SUM(subtitle_tracks_removed),
+                        SUM(attachments_removed),
+                        SUM(video_target_codec IS NOT NULL
+                            AND video_transcode_skipped = 0),
+                        SUM(video_transcode_skipped),
+                        SUM(audio_tracks_transcoded),
+                        SUM(duration_seconds),
+                        SUM(CASE WHEN encoder_type = 'hardware' THEN 1 ELSE 0 END),
+                        SUM(CASE WHEN encoder_type = 'software' THEN 1 ELSE 0 END),
+                        MIN(processed_at),
+                        MAX(processed_at)
+                    FROM processing_stats
+                    WHERE bucket IS NOT NULL
+                    GROUP BY bucket, policy_name
+                    """,
+                    (granularity, bucket_format),
+                )
+
+        # Update schema version
+        conn.execute("UPDATE _meta SET value = '31' WHERE key = 'schema_version'")
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+
+def migrate_v31_to_v32(conn: sqlite3.Connection) -> None:
+    """Migrate database from schema version 31 to version 32.
+
+    Adds job leases for batch claiming:
+    - lease_owner and lease_expires_at columns on the jobs table
+    - idx_jobs_queue, a partial index over queued jobs in claim order
+
+    This migration is idempotent - safe to run multiple times.
+
+    Args:
+        conn: An open database connection.
+    """
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+
+        cursor = conn.execute("PRAGMA table_info(jobs)")
+        job_columns = {row[1] for row in cursor.fetchall()}
+
+        if "lease_owner" not in job_columns:
+            conn.execute("ALTER TABLE jobs ADD COLUMN lease_owner TEXT")
+
+        if "lease_expires_at" not in job_columns:
+            conn.execute("ALTER TABLE jobs ADD COLUMN lease_expires_at TEXT")
+
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_jobs_queue
+                ON jobs(priority, created_at) WHERE status = 'queued'
+        """)
+
+        # Update schema version
+        conn.execute("UPDATE _meta SET value = '32' WHERE key = 'schema_version'")
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+
+def migrate_v32_to_v33(conn: sqlite3.Connection) -> None:
+    """Migrate database from schema version 32 to version 33.
+
+    Adds job coalescing:
+    - coalesced_count column on the jobs table
+    - idx_jobs_queued_unique, allowing one queued job per
+      (file_id, job_type, policy_name)
+
+    Existing duplicate queued jobs are merged first: the job that would be
+    claimed first is kept, takes the best priority of its group and counts
+    the others, which are cancelled.
+
+    This migration is idempotent - safe to run multiple times.
+
+    Args:
+        conn: An open database connection.
+    """
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+
+        cursor = conn.execute("PRAGMA table_info(jobs)")
+        job_columns = {row[1] for row in cursor.fetchall()}
+
+        if "coalesced_count" not in job_columns:
+            conn.execute(
+                "ALTER TABLE jobs ADD COLUMN coalesced_count INTEGER NOT NULL DEFAULT 0"
+            )
+
+        rows = conn.execute("""
+            SELECT id, file_id, job_type, IFNULL(policy_name, '')
+            FROM jobs
+            WHERE status = 'queued' AND file_id IS NOT NULL
+            ORDER BY priority ASC, created_at ASC
+        """).fetchall()
+        keepers: dict[tuple, str] = {}
+        duplicates: dict[str, list[str]] = {}
+        for job_id, file_id, job_type, policy_key in rows:
+            keeper = keepers.setdefault((file_id, job_type, policy_key), job_id)
+            if keeper != job_id:
+                duplicates.setdefault(keeper, []).append(job_id)
+
+        now = datetime.now(timezone.utc).isoformat()
+        for keeper, job_ids in duplicates.items():
+            conn.executemany(
+                """
+                UPDATE jobs
+                SET status = 'cancelled', completed_at = ?, error_message = ?,
+                    lease_owner = NULL, lease_expires_at = NULL
+                WHERE id = ?
+                """,
+                [(now, f"Coalesced into job {keeper}", job_id) for job_id in job_ids],
+            )
+            conn.execute(
+                "UPDATE jobs SET coalesced_count = coalesced_count + ? WHERE id = ?",
+                (len(job_ids), keeper),
+            )
+
+        conn.execute("""
+            CREATE UNIQUE INDEX IF NOT EXISTS idx_jobs_queued_unique
+                ON jobs(file_id, job_type, IFNULL(policy_name, ''))
+                WHERE status = 'queued' AND file_id IS NOT NULL
+        """)
+
+        # Update schema version
+        conn.execute("UPDATE _meta SET value = '33' WHERE key = 'schema_version'")
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+
+def migrate_v33_to_v34(conn: sqlite3.Connection) -> None:
+    """Migrate database from schema version 33 to version 34.
+
+    Adds resource-class scheduling:
+    - resource_class column on the jobs table
+    - idx_jobs_running_class, counting running jobs per class
+
+    Pending jobs are classified by job type. Apply jobs are counted as IO
+    and process jobs as CPU, the heaviest work they may do; jobs enqueued
+    after the migration are classified from their options.
+
+    This migration is idempotent - safe to run multiple times.
+
+    Args:
+        conn: An open database connection.
+    """
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+
+        cursor = conn.execute("PRAGMA table_info(jobs)")
+        job_columns = {row[1] for row in cursor.fetchall()}
+
+        if "resource_class" not in job_columns:
+            conn.execute("""
+                ALTER TABLE jobs ADD COLUMN resource_class TEXT
+                CHECK (
+                    resource_class IS NULL
+                    OR resource_class IN ('metadata', 'io', 'cpu', 'transcription')
+                )
+            """)
+
+        conn.execute("""
+            UPDATE jobs
+            SET resource_class = CASE job_type
+                WHEN 'transcode' THEN 'cpu'
+                WHEN 'process' THEN 'cpu'
+                WHEN 'prune' THEN 'metadata'
+                ELSE 'io'
+            END
+            WHERE status IN ('queued', 'running') AND resource_class IS NULL
+        """)
+
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_jobs_running_class
+                ON jobs(resource_class) WHERE status = 'running'
+        """)
+
+        # Update schema version
+        conn.execute("UPDATE _meta SET value = '34' WHERE key = 'schema_version'")
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
+
+
+def migrate_v34_to_v35(conn: sqlite3.Connection) -> None:
+    """Migrate database from schema version 34 to version 35.
+
+    Adds the checkpoint_json column to the jobs table, recording the
+    workflow phases a process job has completed so that a recovered job
+    resumes after them.
+
+    This migration is idempotent - safe to run multiple times.
+
+    Args:
+        conn: An open database connection.
+    """
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+
+        cursor = conn.execute("PRAGMA table_info(jobs)")
+        job_columns = {row[1] for row in cursor.fetchall()}
+
+        if "checkpoint_json" not in job_columns:
+            conn.execute("ALTER TABLE jobs ADD COLUMN checkpoint_json TEXT")
+
+        # Update schema version
+        conn.execute("UPDATE _meta SET value = '35' WHERE key = 'schema_version'")
+        conn.execute("COMMIT")
+    except Exception:
+        conn.execute("ROLLBACK")
+        raise
@@ -0,0 +1,331 @@
+"""Columnar containers for bulk file and track reads.
+
+Loading every row of a large library as FileRecord/TrackRecord objects
+costs an object and its field values per row. FileTable and TrackTable
+hold the same columns as parallel arrays instead: integers and flags in
+array.array, and repeated strings (codecs, languages, directories, scan
+timestamps) interned so each distinct value is stored once. Rows are turned
+into records only when needed, with record(i), iteration or a lookup.
+
+Tables are filled by get_file_table() and get_track_table() in
+vpo.db.queries.
+"""
+
+from __future__ import annotations
+
+import math
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterator, Sequence
+from sys import intern
+
+from vpo.db.types import FileRecord, TrackInfo, TrackRecord
+
+# Stand-ins for NULL in typed arrays (the columns are never negative or NaN)
+_NULL_INT = -1
+_NULL_FLOAT = math.nan
+
+
+def _intern(value: str | None) -> str | None:
+    return intern(value) if value is not None else None
+
+
+def _int_or_null(value: int | None) -> int:
+    return _NULL_INT if value is None else value
+
+
+def _int_or_none(value: int) -> int | None:
+    return None if value == _NULL_INT else value
+
+
+class TrackTable:
+    """Tracks stored column by column, ordered by file ID and track index.
+
+    Rows are appended in the order of TRACK_COLUMNS.
+    """
+
+    TRACK_COLUMNS = (
+        "id",
+        "file_id",
+        "track_index",
+        "track_type",
+        "codec",
+        "language",
+        "title",
+        "is_default",
+        "is_forced",
+        "channels",
+        "channel_layout",
+        "width",
+        "height",
+        "frame_rate",
+        "color_transfer",
+        "color_primaries",
+        "color_space",
+        "color_range",
+        "duration_seconds",
+    )
+
+    __slots__ = (
+        "ids",
+        "file_ids",
+        "track_indexes",
+        "track_types",
+        "codecs",
+        "languages",
+        "titles",
+        "is_default",
+        "is_forced",
+        "channels",
+        "channel_layouts",
+        "widths",
+        "heights",
+        "frame_rates",
+        "color_transfers",
+        "color_primaries",
+        "color_spaces",
+        "color_ranges",
+        "durations",
+    )
+
+    def __init__(self) -> None:
+        self.ids = array("q")
+        self.file_ids = array("q")
+        self.track_indexes = array("l")
+        self.track_types: list[str] = []
+        self.codecs: list[str | None] = []
+        self.languages: list[str | None] = []
+        self.titles: list[str | None] = []
+        self.is_default = array("b")
+        self.is_forced = array("b")
+        self.channels = array("l")
+        self.channel_layouts: list[str | None] = []
+        self.widths = array("l")
+        self.heights = array("l")
+        self.frame_rates: list[str | None] = []
+        self.color_transfers: list[str | None] = []
+        self.color_primaries: list[str | None] = []
+        self.color_spaces: list[str | None] = []
+        self.color_ranges: list[str | None] = []
+        self.durations = array("d")
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def append(self, row: Sequence) -> None:
+        """Append a row of TRACK_COLUMNS values."""
+        self.ids.append(row[0])
+        self.file_ids.append(row[1])
+        self.track_indexes.append(row[2])
+        self.track_types.append(intern(row[3]))
+        self.codecs.append(_intern(row[4]))
+        self.languages.append(_intern(row[5]))
+        self.titles.append(row[6])
+        self.is_default.append(row[7] == 1)
+        self.is_forced.append(row[8] == 1)
+        self.channels.append(_int_or_null(row[9]))
+        self.channel_layouts.append(_intern(row[10]))
+        self.widths.append(_int_or_null(row[11]))
+        self.heights.append(_int_or_null(row[12]))
+        self.frame_rates.append(_intern(row[13]))
+        self.color_transfers.append(_intern(row[14]))
+        self.color_primaries.append(_intern(row[15]))
+        self.color_spaces.append(_intern(row[16]))
+        self.color_ranges.append(_intern(row[17]))
+        self.durations.append(_NULL_FLOAT if row[18] is None else row[18])
+
+    def _duration(self, i: int) -> float | None:
+        duration = self.durations[i]
+        return None if math.isnan(duration) else duration
+
+    def record(self, i: int) -> TrackRecord:
+        """Return row i as a TrackRecord."""
+        return TrackRecord(
+            id=self.ids[i],
+            file_id=self.file_ids[i],
+            track_index=self.track_indexes[i],
+            track_type=self.track_types[i],
+            codec=self.codecs[i],
+            language=self.languages[i],
+            title=self.titles[i],
+            is_default=bool(self.is_default[i]),
+            is_forced=bool(self.is_forced[i]),
+            channels=_int_or_none(self.channels[i]),
+            channel_layout=self.channel_layouts[i],
+            width=_int_or_none(self.widths[i]),
+            height=_int_or_none(self.heights[i]),
+            frame_rate=self.frame_rates[i],
+            color_transfer=self.color_transfers[i],
+            color_primaries=self.color_primaries[i],
+            color_space=self.color_spaces[i],
+            color_range=self.color_ranges[i],
+            duration_seconds=self._duration(i),
+        )
+
+    def track_info(self, i: int) -> TrackInfo:
+        """Return row i as a TrackInfo domain object."""
+        return TrackInfo(
+            index=self.track_indexes[i],
+            track_type=self.track_types[i],
+            codec=self.codecs[i],
+            language=self.languages[i],
+            title=self.titles[i],
+            is_default=bool(self.is_default[i]),
+            is_forced=bool(self.is_forced[i]),
+            channels=_int_or_none(self.channels[i]),
+            channel_layout=self.channel_layouts[i],
+            width=_int_or_none(self.widths[i]),
+            height=_int_or_none(self.heights[i]),
+            frame_rate=self.frame_rates[i],
+            color_transfer=self.color_transfers[i],
+            color_primaries=self.color_primaries[i],
+            color_space=self.color_spaces[i],
+            color_range=self.color_ranges[i],
+            duration_seconds=self._duration(i),
+            id=self.ids[i],
+        )
+
+    def __iter__(self) -> Iterator[TrackRecord]:
+        for i in range(len(self)):
+            yield self.record(i)
+
+    def rows_for_file(self, file_id: int) -> range:
+        """Return the row numbers of a file's tracks (binary search)."""
+        return range(
+            bisect_left(self.file_ids, file_id), bisect_right(self.file_ids, file_id)
+        )
+
+    def records_for_file(self, file_id: int) -> list[TrackRecord]:
+        """Return a file's tracks as TrackRecords, ordered by track index."""
+        return [self.record(i) for i in self.rows_for_file(file_id)]
+
+    def file_rows(self) -> dict[int, range]:
+        """Return the row numbers of each file's tracks, keyed by file ID."""
+        result: dict[int, range] = {}
+        start = 0
+        file_ids = self.file_ids
+        for i in range(1, len(file_ids) + 1):
+            if i == len(file_ids) or file_ids[i] != file_ids[start]:
+                result[file_ids[start]] = range(start, i)
+                start = i
+        return result
+
+
+class FileTable:
+    """Files stored column by column, in the order they were read.
+
+    Rows are appended in the order of FILE_COLUMNS.
+    """
+
+    FILE_COLUMNS = (
+        "id",
+        "path",
+        "filename",
+        "directory",
+        "extension",
+        "size_bytes",
+        "modified_at",
+        "content_hash",
+        "container_format",
+        "scanned_at",
+        "scan_status",
+        "scan_error",
+        "job_id",
+        "plugin_metadata",
+        "container_tags",
+    )
+
+    __slots__ = (
+        "ids",
+        "paths",
+        "filenames",
+        "directories",
+        "extensions",
+        "sizes",
+        "modified_at",
+        "content_hashes",
+        "container_formats",
+        "scanned_at",
+        "scan_statuses",
+        "scan_errors",
+        "job_ids",
+        "plugin_metadata",
+        "container_tags",
+        "_path_index",
+    )
+
+    def __init__(self) -> None:
+        self.ids = array("q")
+        self.paths: list[str] = []
+        self.filenames: list[str] = []
+        self.directories: list[str] = []
+        self.extensions: list[str] = []
+        self.sizes = array("q")
+        self.modified_at: list[str] = []
+        self.content_hashes: list[str | None] = []
+        self.container_formats: list[str | None] = []
+        self.scanned_at: list[str] = []
+        self.scan_statuses: list[str] = []
+        self.scan_errors: list[str | None] = []
+        self.job_ids: list[str | None] = []
+        self.plugin_metadata: list[str | None] = []
+        self.container_tags: list[str | None] = []
+        self._path_index: dict[str, int] | None = None
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def append(self, row: Sequence) -> None:
+        """Append a row of FILE_COLUMNS values."""
+        self.ids.append(row[0])
+        self.paths.append(row[1])
+        self.filenames.append(row[2])
+        self.directories.append(intern(row[3]))
+        self.extensions.append(intern(row[4]))
+        self.sizes.append(row[5])
+        self.modified_at.append(row[6])
+        self.content_hashes.append(row[7])
+        self.container_formats.append(_intern(row[8]))
+        # Files scanned together share a timestamp and job
+        self.scanned_at.append(intern(row[9]))
+        self.scan_statuses.append(intern(row[10]))
+        self.scan_errors.append(row[11])
+        self.job_ids.append(_intern(row[12]))
+        self.plugin_metadata.append(row[13])
+        self.container_tags.append(row[14])
+        self._path_index = None
+
+    def record(self, i: int) -> FileRecord:
+        """Return row i as a FileRecord."""
+        return FileRecord(
+            id=self.ids[i],
+            path=self.paths[i],
+            filename=self.filenames[i],
+            directory=self.directories[i],
+            extension=self.extensions[i],
+            size_bytes=self.sizes[i],
+            modified_at=self.modified_at[i],
+            content_hash=self.content_hashes[i],
+            container_format=self.container_formats[i],
+            scanned_at=self.scanned_at[i],
+            scan_status=self.scan_statuses[i],
+            scan_error=self.scan_errors[i],
+            job_id=self.job_ids[i],
+            plugin_metadata=self.plugin_metadata[i],
+            container_tags=self.container_tags[i],
+        )
+
+    def __iter__(self) -> Iterator[FileRecord]:
+        for i in range(len(self)):
+            yield self.record(i)
+
+    def row_for_path(self, path: str) -> int | None:
+        """Return the row number of a file, or None if it is not loaded."""
+        if self._path_index is None:
+            self._path_index = {p: i for i, p in enumerate(self.paths)}
+        return self._path_index.get(path)
+
+    def get(self, path: str) -> FileRecord | None:
+        """Return the FileRecord for a path, or None if it is not loaded."""
+        i = self.row_for_path(path)
+        return None if i is None else self.record(i)
@@ -4,6 +4,9 @@ This module contains all enums and dataclasses for the database layer:
 - Database records (FileRecord, TrackRecord, Job, etc.)
 - View models for typed query results (FileListViewItem, etc.)
 
+Types returned one per row by bulk queries are slotted to keep their
+per-instance memory down. For whole-library reads see vpo.db.tables.
+
 Domain models (TrackInfo, FileInfo, IntrospectionResult) and domain enums
 (OriginalDubbedStatus, CommentaryStatus, etc.) are defined in vpo.domain
 and re-exported here for backward compatibility.
@@ -82,6 +85,19 @@ class JobStatus(Enum):
     CANCELLED = "cancelled"
 
 
+class ResourceClass(Enum):
+    """Resource a job mainly consumes, used to schedule it into a slot.
+
+    Note: This enum may be extended in future versions.
+    Clients should handle unknown values gracefully.
+    """
+
+    METADATA = "metadata"  # In-place metadata edits and database work
+    IO = "io"  # Remux, copy or move; bound by disk throughput
+    CPU = "cpu"  # Video encode
+    TRANSCRIPTION = "transcription"  # Speech-to-text analysis
+
+
 class PlanStatus(Enum):
     """Status of a plan in the approval workflow.
 
@@ -105,7 +121,7 @@ class PlanStatus(Enum):
     CANCELED = "canceled"  # Withdrawn by operator or system (terminal)
 
 
-@dataclass
+@dataclass(slots=True)
 class FileRecord:
     """Database record for files table."""
 
@@ -160,7 +176,7 @@ class FileRecord:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TrackRecord:
     """Database record for tracks table."""
 
@@ -391,6 +407,9 @@ class Job:
     origin: str | None = None  # 'cli' or 'daemon' (None = legacy)
     batch_id: str | None = None  # UUID grouping CLI batch operations
 
+    # Scheduling (set by enqueue_job; None for CLI tracking records)
+    resource_class: ResourceClass | None = None
+
 
 @dataclass
 class TranscriptionResultRecord:
@@ -638,6 +657,8 @@ class PerformanceMetricsRecord:
         bytes_written: Bytes written to disk.
         encoding_fps: Average encoding FPS (transcode phases).
         encoding_bitrate: Average output bitrate in bits/sec.
+        io_wait_seconds: Time waited for per-device I/O admission.
+        io_wait_devices: JSON object of wait seconds per block device.
     """
 
     id: int | None
@@ -655,6 +676,10 @@ class PerformanceMetricsRecord:
     encoding_fps: float | None
     encoding_bitrate: int | None
 
+    # I/O admission
+    io_wait_seconds: float | None = None
+    io_wait_devices: str | None = None
+
 
 # ==========================================================================
 # View Model Dataclasses
@@ -663,7 +688,7 @@ class PerformanceMetricsRecord:
 # that previously returned raw dicts. They provide type safety and IDE support.
 
 
-@dataclass
+@dataclass(slots=True)
 class FileListViewItem:
     """Typed result for library list view query.
 
@@ -710,7 +735,7 @@ class LanguageOption:
     label: str
 
 
-@dataclass
+@dataclass(slots=True)
 class TranscriptionListViewItem:
     """Typed result for transcriptions overview query.
 
@@ -787,7 +812,7 @@ class TranscriptionDetailView:
     path: str
 
 
-@dataclass
+@dataclass(slots=True)
 class ScanErrorView:
     """Typed result for scan job error listing.
 
@@ -896,7 +921,7 @@ class PolicyStats:
     last_used: str  # ISO-8601
 
 
-@dataclass
+@dataclass(slots=True)
 class MissingFileViewItem:
     """Typed result for missing files view query.
 
@@ -917,7 +942,7 @@ class MissingFileViewItem:
     scanned_at: str | None
 
 
-@dataclass
+@dataclass(slots=True)
 class DistributionItem:
     """A single category in a distribution count."""
 
@@ -1110,7 +1135,7 @@ class AnalysisStatusSummary:
     single_language_count: int
 
 
-@dataclass
+@dataclass(slots=True)
 class FileAnalysisStatus:
     """Analysis status for a single file.
 
@@ -1127,7 +1152,7 @@ class FileAnalysisStatus:
     analyzed_count: int
 
 
-@dataclass
+@dataclass(slots=True)
 class TrackAnalysisDetail:
     """Detailed analysis result for a single track.
 
@@ -1157,7 +1182,7 @@ class TrackAnalysisDetail:
 # ==========================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class TrendDataPoint:
     """Data point for processing trend charts.
 
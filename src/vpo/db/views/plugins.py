@@ -5,6 +5,7 @@ import sqlite3
 
 from vpo.core.json_utils import parse_json_safe
 
+from ..queries.plugin_metadata import plugin_value_filter
 from .helpers import _clamp_limit
 
 
@@ -12,18 +13,25 @@ def get_files_with_plugin_data(
     conn: sqlite3.Connection,
     plugin_name: str,
     *,
+    field: str | None = None,
+    operator: str = "exists",
+    value: str | int | float | bool | None = None,
     limit: int | None = None,
     offset: int | None = None,
     return_total: bool = False,
 ) -> list[dict] | tuple[list[dict], int]:
     """Get files that have data from a specific plugin.
 
-    Queries files where plugin_metadata JSON contains data for the
-    specified plugin name.
+    Uses the indexed plugin_metadata_values table, optionally filtered on
+    one of the plugin's fields (e.g. radarr original_language eq "jpn").
+    Plugin and field names match case-insensitively.
 
     Args:
         conn: Database connection.
         plugin_name: Plugin identifier to filter by (e.g., "whisper-transcriber").
+        field: Optional plugin field to filter on.
+        operator: Comparison operator for field (see PLUGIN_VALUE_OPERATORS).
+        value: Value to compare the field against.
         limit: Maximum files to return.
         offset: Pagination offset.
         return_total: If True, return tuple of (files, total_count).
@@ -39,7 +47,8 @@ def get_files_with_plugin_data(
         }
 
     Raises:
-        ValueError: If plugin_name contains invalid characters.
+        ValueError: If plugin_name contains invalid characters, or the
+            field filter is invalid.
     """
     # Validate plugin name for defense in depth (routes also validate)
     if not re.match(r"^[a-zA-Z0-9_-]+$", plugin_name):
@@ -48,30 +57,28 @@ def get_files_with_plugin_data(
     # Enforce pagination limits to prevent memory exhaustion
     limit = _clamp_limit(limit)
 
+    params: list[str | int | float | bool] = [plugin_name]
+    value_clause = ""
+    if field is not None:
+        condition, condition_params = plugin_value_filter(operator, value)
+        value_clause = f"AND v.key = ? AND {condition}"
+        params.extend([field, *condition_params])
+
     # Build query - use window function for total count when needed
     # This avoids a separate COUNT query (single query optimization)
-    if return_total:
-        query = """
-            SELECT
-                id, filename, path, scan_status, plugin_metadata,
-                COUNT(*) OVER() as total_count
-            FROM files
-            WHERE plugin_metadata IS NOT NULL
-            AND json_extract(plugin_metadata, ?) IS NOT NULL
-            ORDER BY filename
-        """
-    else:
-        query = """
-            SELECT
-                id, filename, path, scan_status, plugin_metadata
-            FROM files
-            WHERE plugin_metadata IS NOT NULL
-            AND json_extract(plugin_metadata, ?) IS NOT NULL
-            ORDER BY filename
-        """
+    total_column = ", COUNT(*) OVER() as total_count" if return_total else ""
+    query = f"""
+        SELECT
+            id, filename, path, scan_status, plugin_metadata{total_column}
+        FROM files
+        WHERE id IN (
+            SELECT v.file_id FROM plugin_metadata_values v
+            WHERE v.plugin = ? {value_clause}
+        )
+        ORDER BY filename
+    """
 
     # Add pagination
-    params: list[str | int] = [f"$.{plugin_name}"]
     if limit is not None:
         query += " LIMIT ?"
         params.append(limit)
@@ -85,17 +92,22 @@ def get_files_with_plugin_data(
     # Extract total from first row if using window function (or 0 if empty)
     total = rows[0][5] if return_total and rows else 0
 
+    plugin_key = plugin_name.casefold()
     files = []
     for row in rows:
         result = parse_json_safe(row[4], default={}, context="plugin_metadata")
         plugin_metadata = result.value or {}
+        plugin_data = next(
+            (v for k, v in plugin_metadata.items() if k.casefold() == plugin_key),
+            {},
+        )
         files.append(
             {
                 "id": row[0],
                 "filename": row[1],
                 "path": row[2],
                 "scan_status": row[3],
-                "plugin_data": plugin_metadata.get(plugin_name, {}),
+                "plugin_data": plugin_data,
             }
         )
 
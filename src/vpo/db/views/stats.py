@@ -1,7 +1,16 @@
-"""Processing statistics view query functions."""
+"""Processing statistics view query functions.
+
+Aggregate views (summary, per-policy, trends) read whole hour and day
+buckets from processing_stats_rollups and scan processing_stats only for
+the partial hours at the edges of the requested range, so their cost
+depends on the length of the range rather than the number of processed
+files.
+"""
 
 import sqlite3
+from datetime import datetime, timedelta, timezone
 
+from ..queries.stats import ROLLUP_BUCKET_FORMATS
 from ..types import (
     ActionSummary,
     FileProcessingHistory,
@@ -12,6 +21,167 @@ from ..types import (
 )
 from .helpers import _clamp_limit
 
+# Row sources unioned by _stats_source_sql: single records and rollup
+# buckets, projected onto the same columns
+_RAW_SOURCE_SQL = """
+    SELECT
+        policy_name,
+        processed_at AS ts,
+        1 AS files_processed,
+        success = 1 AS successful,
+        success = 0 AS failed,
+        size_before,
+        size_after,
+        size_change,
+        audio_tracks_removed,
+        subtitle_tracks_removed,
+        attachments_removed,
+        (video_target_codec IS NOT NULL AND video_transcode_skipped = 0)
+            AS videos_transcoded,
+        video_transcode_skipped AS videos_skipped,
+        audio_tracks_transcoded,
+        duration_seconds AS duration_seconds_total,
+        CASE WHEN encoder_type = 'hardware' THEN 1 ELSE 0 END AS hardware_encodes,
+        CASE WHEN encoder_type = 'software' THEN 1 ELSE 0 END AS software_encodes,
+        processed_at AS first_processed_at,
+        processed_at AS last_processed_at
+    FROM processing_stats
+"""
+
+_ROLLUP_SOURCE_SQL = """
+    SELECT
+        policy_name,
+        bucket_start AS ts,
+        files_processed,
+        successful,
+        failed,
+        size_before,
+        size_after,
+        size_change,
+        audio_tracks_removed,
+        subtitle_tracks_removed,
+        attachments_removed,
+        videos_transcoded,
+        videos_skipped,
+        audio_tracks_transcoded,
+        duration_seconds_total,
+        hardware_encodes,
+        software_encodes,
+        first_processed_at,
+        last_processed_at
+    FROM processing_stats_rollups
+"""
+
+
+def _parse_bound(value: str) -> datetime | None:
+    """Parse a range bound as a UTC datetime (naive values are UTC)."""
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        return parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def _floor(moment: datetime, granularity: str) -> datetime:
+    if granularity == "day":
+        return moment.replace(hour=0, minute=0, second=0, microsecond=0)
+    return moment.replace(minute=0, second=0, microsecond=0)
+
+
+def _ceil(moment: datetime, granularity: str) -> datetime:
+    floored = _floor(moment, granularity)
+    if floored == moment:
+        return moment
+    return floored + (timedelta(days=1) if granularity == "day" else timedelta(hours=1))
+
+
+def _stats_source_sql(
+    since: str | None, until: str | None, policy_name: str | None
+) -> tuple[str, list[str]]:
+    """Build a row source covering processing_stats in [since, until].
+
+    The range is split into whole day buckets, whole hour buckets around
+    them, and raw rows for the partial hours at either end. Each part
+    yields rows with the same columns, so callers aggregate the union with
+    plain SUM/MIN/MAX.
+
+    Args:
+        since: ISO-8601 start of the range (inclusive), or None.
+        until: ISO-8601 end of the range (inclusive), or None.
+        policy_name: Restrict to one policy, or None.
+
+    Returns:
+        Tuple of (SQL subquery, parameters).
+    """
+    start = _parse_bound(since) if since is not None else None
+    end = _parse_bound(until) if until is not None else None
+
+    parts: list[str] = []
+    params: list[str] = []
+
+    def add(source: str, conditions: list[str], values: list[str]) -> None:
+        if policy_name is not None:
+            conditions = [*conditions, "policy_name = ?"]
+            values = [*values, policy_name]
+        where = f" WHERE {' AND '.join(conditions)}" if conditions else ""
+        parts.append(source + where)
+        params.extend(values)
+
+    def add_raw(lower: str | None, upper: str | None, inclusive: bool) -> None:
+        conditions, values = [], []
+        if lower is not None:
+            conditions.append("processed_at >= ?")
+            values.append(lower)
+        if upper is not None:
+            conditions.append("processed_at <= ?" if inclusive else "processed_at < ?")
+            values.append(upper)
+        add(_RAW_SOURCE_SQL, conditions, values)
+
+    def add_rollup(
+        granularity: str, lower: datetime | None, upper: datetime | None
+    ) -> None:
+        conditions, values = ["granularity = ?"], [granularity]
+        if lower is not None:
+            conditions.append("bucket_start >= ?")
+            values.append(lower.strftime(ROLLUP_BUCKET_FORMATS["hour"]))
+        if upper is not None:
+            conditions.append("bucket_start < ?")
+            values.append(upper.strftime(ROLLUP_BUCKET_FORMATS["hour"]))
+        add(_ROLLUP_SOURCE_SQL, conditions, values)
+
+    if (since is not None and start is None) or (until is not None and end is None):
+        # Unparseable bound: compare timestamps as strings, as stored
+        add_raw(since, until, inclusive=True)
+        return " UNION ALL ".join(parts), params
+
+    # Whole hours in the range: [hours_from, hours_to)
+    hours_from = _ceil(start, "hour") if start is not None else None
+    hours_to = _floor(end, "hour") if end is not None else None
+    if hours_from is not None and hours_to is not None and hours_from >= hours_to:
+        add_raw(since, until, inclusive=True)
+        return " UNION ALL ".join(parts), params
+
+    if start is not None and start < hours_from:
+        add_raw(since, hours_from.strftime(ROLLUP_BUCKET_FORMATS["hour"]), False)
+
+    days_from = _ceil(hours_from, "day") if hours_from is not None else None
+    days_to = _floor(hours_to, "day") if hours_to is not None else None
+    if days_from is None or days_to is None or days_from < days_to:
+        if days_from is not None and hours_from < days_from:
+            add_rollup("hour", hours_from, days_from)
+        add_rollup("day", days_from, days_to)
+        if days_to is not None and days_to < hours_to:
+            add_rollup("hour", days_to, hours_to)
+    else:
+        add_rollup("hour", hours_from, hours_to)
+
+    if end is not None:
+        add_raw(hours_to.strftime(ROLLUP_BUCKET_FORMATS["hour"]), until, True)
+
+    return " UNION ALL ".join(parts), params
+
 
 def get_stats_summary(
     conn: sqlite3.Connection,
@@ -34,50 +204,29 @@ def get_stats_summary(
     Returns:
         StatsSummary with aggregate metrics.
     """
-    conditions: list[str] = []
-    params: list[str] = []
-
-    if since is not None:
-        conditions.append("processed_at >= ?")
-        params.append(since)
-    if until is not None:
-        conditions.append("processed_at <= ?")
-        params.append(until)
-    if policy_name is not None:
-        conditions.append("policy_name = ?")
-        params.append(policy_name)
-
-    where_clause = ""
-    if conditions:
-        where_clause = " WHERE " + " AND ".join(conditions)
+    source, params = _stats_source_sql(since, until, policy_name)
 
     query = f"""
         SELECT
-            COUNT(*) as total_files_processed,
-            COALESCE(SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END), 0)
-                as total_successful,
-            COALESCE(SUM(CASE WHEN success = 0 THEN 1 ELSE 0 END), 0)
-                as total_failed,
+            COALESCE(SUM(files_processed), 0) as total_files_processed,
+            COALESCE(SUM(successful), 0) as total_successful,
+            COALESCE(SUM(failed), 0) as total_failed,
             COALESCE(SUM(size_before), 0) as total_size_before,
             COALESCE(SUM(size_after), 0) as total_size_after,
             COALESCE(SUM(size_change), 0) as total_size_saved,
             COALESCE(SUM(audio_tracks_removed), 0) as total_audio_removed,
             COALESCE(SUM(subtitle_tracks_removed), 0) as total_subtitles_removed,
             COALESCE(SUM(attachments_removed), 0) as total_attachments_removed,
-            COALESCE(SUM(CASE WHEN video_target_codec IS NOT NULL
-                AND video_transcode_skipped = 0 THEN 1 ELSE 0 END), 0)
-                as total_videos_transcoded,
-            COALESCE(SUM(video_transcode_skipped), 0) as total_videos_skipped,
+            COALESCE(SUM(videos_transcoded), 0) as total_videos_transcoded,
+            COALESCE(SUM(videos_skipped), 0) as total_videos_skipped,
             COALESCE(SUM(audio_tracks_transcoded), 0) as total_audio_transcoded,
-            COALESCE(AVG(duration_seconds), 0.0) as avg_processing_time,
-            MIN(processed_at) as earliest_processing,
-            MAX(processed_at) as latest_processing,
-            COALESCE(SUM(CASE WHEN encoder_type = 'hardware' THEN 1 ELSE 0 END), 0)
-                as hardware_encodes,
-            COALESCE(SUM(CASE WHEN encoder_type = 'software' THEN 1 ELSE 0 END), 0)
-                as software_encodes
-        FROM processing_stats
-        {where_clause}
+            COALESCE(SUM(duration_seconds_total) / SUM(files_processed), 0.0)
+                as avg_processing_time,
+            MIN(first_processed_at) as earliest_processing,
+            MAX(last_processed_at) as latest_processing,
+            COALESCE(SUM(hardware_encodes), 0) as hardware_encodes,
+            COALESCE(SUM(software_encodes), 0) as software_encodes
+        FROM ({source})
     """
 
     cursor = conn.execute(query, params)
@@ -200,38 +349,24 @@ def get_policy_stats(
     # Enforce pagination limits to prevent memory exhaustion
     limit = _clamp_limit(limit)
 
-    conditions: list[str] = []
-    params: list[str] = []
-
-    if since is not None:
-        conditions.append("processed_at >= ?")
-        params.append(since)
-    if until is not None:
-        conditions.append("processed_at <= ?")
-        params.append(until)
-
-    where_clause = ""
-    if conditions:
-        where_clause = " WHERE " + " AND ".join(conditions)
+    source, params = _stats_source_sql(since, until, None)
 
     query = f"""
         SELECT
             policy_name,
-            COUNT(*) as files_processed,
-            SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) as successful,
+            SUM(files_processed) as files_processed,
+            SUM(successful) as successful,
             SUM(size_change) as total_size_saved,
             SUM(size_before) as total_size_before,
             SUM(audio_tracks_removed) as audio_tracks_removed,
             SUM(subtitle_tracks_removed) as subtitle_tracks_removed,
             SUM(attachments_removed) as attachments_removed,
-            SUM(CASE WHEN video_target_codec IS NOT NULL
-                AND video_transcode_skipped = 0 THEN 1 ELSE 0 END)
-                as videos_transcoded,
+            SUM(videos_transcoded) as videos_transcoded,
             SUM(audio_tracks_transcoded) as audio_transcoded,
-            AVG(duration_seconds) as avg_processing_time,
-            MAX(processed_at) as last_used
-        FROM processing_stats
-        {where_clause}
+            SUM(duration_seconds_total) / SUM(files_processed)
+                as avg_processing_time,
+            MAX(last_processed_at) as last_used
+        FROM ({source})
         GROUP BY policy_name
         ORDER BY files_processed DESC
         LIMIT ?
@@ -285,36 +420,24 @@ def get_policy_stats_by_name(
     Returns:
         PolicyStats for the policy, or None if no stats found for policy.
     """
-    conditions: list[str] = ["policy_name = ?"]
-    params: list[str] = [policy_name]
-
-    if since is not None:
-        conditions.append("processed_at >= ?")
-        params.append(since)
-    if until is not None:
-        conditions.append("processed_at <= ?")
-        params.append(until)
-
-    where_clause = " WHERE " + " AND ".join(conditions)
+    source, params = _stats_source_sql(since, until, policy_name)
 
     query = f"""
         SELECT
             policy_name,
-            COUNT(*) as files_processed,
-            SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) as successful,
+            SUM(files_processed) as files_processed,
+            SUM(successful) as successful,
             SUM(size_change) as total_size_saved,
             SUM(size_before) as total_size_before,
             SUM(audio_tracks_removed) as audio_tracks_removed,
             SUM(subtitle_tracks_removed) as subtitle_tracks_removed,
             SUM(attachments_removed) as attachments_removed,
-            SUM(CASE WHEN video_target_codec IS NOT NULL
-                AND video_transcode_skipped = 0 THEN 1 ELSE 0 END)
-                as videos_transcoded,
+            SUM(videos_transcoded) as videos_transcoded,
             SUM(audio_tracks_transcoded) as audio_transcoded,
-            AVG(duration_seconds) as avg_processing_time,
-            MAX(processed_at) as last_used
-        FROM processing_stats
-        {where_clause}
+            SUM(duration_seconds_total) / SUM(files_processed)
+                as avg_processing_time,
+            MAX(last_processed_at) as last_used
+        FROM ({source})
         GROUP BY policy_name
     """
 
@@ -572,26 +695,16 @@ def get_stats_trends(
         # Default to day
         date_format = "%Y-%m-%d"
 
-    conditions: list[str] = []
-    params: list[str] = []
-
-    if since is not None:
-        conditions.append("processed_at >= ?")
-        params.append(since)
-
-    where_clause = ""
-    if conditions:
-        where_clause = " WHERE " + " AND ".join(conditions)
+    source, params = _stats_source_sql(since, None, None)
 
     query = f"""
         SELECT
-            strftime('{date_format}', processed_at) as period,
-            COUNT(*) as files_processed,
+            strftime('{date_format}', ts) as period,
+            SUM(files_processed) as files_processed,
             COALESCE(SUM(size_change), 0) as size_saved,
-            SUM(CASE WHEN success = 1 THEN 1 ELSE 0 END) as success_count,
-            SUM(CASE WHEN success = 0 THEN 1 ELSE 0 END) as fail_count
-        FROM processing_stats
-        {where_clause}
+            SUM(successful) as success_count,
+            SUM(failed) as fail_count
+        FROM ({source})
         GROUP BY period
         ORDER BY period ASC
     """
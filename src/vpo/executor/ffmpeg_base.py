@@ -5,21 +5,55 @@ to ffmpeg_utils for common operations.
 """
 
 import logging
-import queue
+import os
+import selectors
 import subprocess  # nosec B404 - subprocess is required for FFmpeg invocation
-import threading
 import time
 from abc import ABC
+from collections import deque
 from collections.abc import Callable
 from pathlib import Path
 
 from vpo.executor import ffmpeg_utils
 from vpo.executor.interface import require_tool
 from vpo.tools.ffmpeg_metrics import FFmpegMetricsAggregator, FFmpegMetricsSummary
-from vpo.tools.ffmpeg_progress import FFmpegProgress, parse_stderr_progress
+from vpo.tools.ffmpeg_progress import FFmpegProgress, FFmpegProgressParser
 
 logger = logging.getLogger(__name__)
 
+# Bytes read per ready pipe in the FFmpeg output loop
+_PIPE_READ_BYTES = 65536
+
+# Longest stderr/progress line kept; longer output is split at this length
+_MAX_LINE_BYTES = 4096
+
+
+class _LineSplitter:
+    """Splits a byte stream into decoded lines, bounding the partial line."""
+
+    def __init__(self) -> None:
+        self._partial = b""
+
+    def feed(self, data: bytes) -> list[str]:
+        """Add data, returning the lines it completes (with newlines)."""
+        # FFmpeg terminates some status output with carriage returns
+        chunks = (self._partial + data.replace(b"\r", b"\n")).split(b"\n")
+        self._partial = chunks.pop()
+        lines = [_decode(chunk) + "\n" for chunk in chunks if chunk]
+        while len(self._partial) >= _MAX_LINE_BYTES:
+            lines.append(_decode(self._partial[:_MAX_LINE_BYTES]) + "\n")
+            self._partial = self._partial[_MAX_LINE_BYTES:]
+        return lines
+
+    def flush(self) -> list[str]:
+        """Return the unterminated last line, if any."""
+        partial, self._partial = self._partial, b""
+        return [_decode(partial)] if partial else []
+
+
+def _decode(line: bytes) -> str:
+    return line[:_MAX_LINE_BYTES].decode("utf-8", errors="replace")
+
 
 class FFmpegExecutorBase(ABC):
     """Base class for executors that use FFmpeg.
@@ -37,6 +71,7 @@ class FFmpegExecutorBase(ABC):
 
     DEFAULT_TIMEOUT: int = 1800  # 30 minutes
     STDERR_DRAIN_TIMEOUT: float = 5.0  # Timeout for draining stderr after process ends
+    STDERR_TAIL_LINES: int = 500  # Stderr lines kept for error reporting
 
     def __init__(self, timeout: int | None = None) -> None:
         """Initialize the executor.
@@ -146,11 +181,13 @@ class FFmpegExecutorBase(ABC):
         timeout: float | None = None,
         progress_callback: Callable[[FFmpegProgress], None] | None = None,
     ) -> tuple[bool, int, list[str], FFmpegMetricsSummary | None]:
-        """Run FFmpeg command with timeout and threaded stderr reading.
+        """Run FFmpeg command with timeout and progress reporting.
 
-        This method runs an FFmpeg command with proper timeout handling and
-        optional progress reporting via callback. It uses a separate thread
-        to read stderr to avoid blocking while still supporting timeouts.
+        Progress is read from ``-progress pipe:<fd>`` on a dedicated pipe
+        (with ``-nostats`` so stderr carries only log messages), and both
+        pipes are multiplexed with a selector on the calling thread. Only
+        the last STDERR_TAIL_LINES stderr lines are kept, so memory use does
+        not grow with encode length.
 
         Args:
             cmd: FFmpeg command arguments.
@@ -162,122 +199,102 @@ class FFmpegExecutorBase(ABC):
             Tuple of (success, return_code, stderr_lines, metrics_summary).
             success is False if timeout expired or process failed.
             return_code is -1 on timeout, otherwise the process return code.
+            stderr_lines holds the last STDERR_TAIL_LINES lines of stderr.
             metrics_summary contains aggregated encoding metrics if available.
         """
-        process = subprocess.Popen(  # nosec B603
-            cmd,
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.PIPE,
-            text=True,
-        )
-
-        # Read stderr in a separate thread to support timeout
-        stderr_output: list[str] = []
-        stderr_queue: queue.Queue[str | None] = queue.Queue()
-        stop_event = threading.Event()
-
-        # Metrics aggregator for collecting encoding stats
+        progress_read, progress_write = os.pipe()
+        try:
+            process = subprocess.Popen(  # nosec B603
+                [cmd[0], "-progress", f"pipe:{progress_write}", "-nostats", *cmd[1:]],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                pass_fds=(progress_write,),
+            )
+        except BaseException:
+            os.close(progress_read)
+            raise
+        finally:
+            os.close(progress_write)
+
+        stderr_tail: deque[str] = deque(maxlen=self.STDERR_TAIL_LINES)
         metrics_aggregator = FFmpegMetricsAggregator()
+        parser = FFmpegProgressParser()
 
-        def read_stderr() -> None:
-            """Read stderr lines and put them in the queue."""
+        def handle_progress_line(line: str) -> None:
             try:
-                assert process.stderr is not None
-                for line in process.stderr:
-                    if stop_event.is_set():
-                        break
-                    stderr_queue.put(line)
-            except (ValueError, OSError) as e:
-                # Pipe closed or process terminated
-                logger.debug("Stderr reader stopped: %s", e)
+                progress = parser.feed_line(line)
             except Exception as e:
-                # Unexpected error - log for debugging
-                logger.debug("Stderr reader encountered unexpected error: %s", e)
-            finally:
-                stderr_queue.put(None)  # Signal end of output
+                logger.debug("Failed to parse progress line: %s", e)
+                return
+            if progress is None:
+                return
+            metrics_aggregator.add_sample(progress)
+            if progress_callback:
+                try:
+                    progress_callback(progress)
+                except Exception as e:
+                    logger.warning("Progress callback error: %s", e)
 
-        reader_thread = threading.Thread(target=read_stderr, daemon=True)
-        reader_thread.start()
+        assert process.stderr is not None
+        stderr_fd = process.stderr.fileno()
+        streams: dict[int, tuple[_LineSplitter, Callable[[str], None]]] = {
+            stderr_fd: (_LineSplitter(), stderr_tail.append),
+            progress_read: (_LineSplitter(), handle_progress_line),
+        }
 
-        # Process stderr output while waiting for completion
         timeout_expired = False
         start_time = time.monotonic()
-
-        while True:
-            # Check timeout
-            if timeout is not None:
-                elapsed = time.monotonic() - start_time
-                if elapsed >= timeout:
+        drain_deadline: float | None = None
+
+        selector = selectors.DefaultSelector()
+        try:
+            for fd in streams:
+                os.set_blocking(fd, False)
+                selector.register(fd, selectors.EVENT_READ)
+
+            # Loop until both pipes reach EOF (FFmpeg exited and closed them)
+            while selector.get_map():
+                now = time.monotonic()
+                if timeout is not None and now - start_time >= timeout:
                     timeout_expired = True
                     break
+                if drain_deadline is None and process.poll() is not None:
+                    # Pipes inherited by a lingering child could stay open
+                    drain_deadline = now + self.STDERR_DRAIN_TIMEOUT
+                if drain_deadline is not None and now >= drain_deadline:
+                    break
 
-            # Check if process finished
-            if process.poll() is not None:
-                break
-
-            # Read from queue with timeout to allow checking process status
-            try:
-                line = stderr_queue.get(timeout=1.0)
-                if line is None:
-                    break  # End of stderr
-                stderr_output.append(line)
-                # Parse progress with exception protection to avoid killing the loop
-                try:
-                    progress = parse_stderr_progress(line)
-                    if progress:
-                        # Collect metrics
-                        metrics_aggregator.add_sample(progress)
-                        if progress_callback:
-                            try:
-                                progress_callback(progress)
-                            except Exception as e:
-                                logger.warning("Progress callback error: %s", e)
-                except Exception as e:
-                    logger.debug("Failed to parse progress line: %s", e)
-            except queue.Empty:
-                continue
+                wait = 1.0
+                if timeout is not None:
+                    wait = min(wait, max(0.0, start_time + timeout - now))
+                for key, _ in selector.select(wait):
+                    try:
+                        data = os.read(key.fd, _PIPE_READ_BYTES)
+                    except BlockingIOError:
+                        continue
+                    splitter, handle = streams[key.fd]
+                    if data:
+                        lines = splitter.feed(data)
+                    else:
+                        selector.unregister(key.fd)
+                        lines = splitter.flush()
+                    for line in lines:
+                        handle(line)
+        finally:
+            selector.close()
+            os.close(progress_read)
 
-        # Handle timeout
         if timeout_expired:
             logger.warning("%s timed out after %s seconds", description, timeout)
-            stop_event.set()  # Signal thread to stop
             process.kill()
-            # Close stderr to unblock reader thread
-            if process.stderr:
-                try:
-                    process.stderr.close()
-                except Exception:  # nosec B110 - Intentionally ignoring close errors
-                    pass
-            process.wait()  # Clean up zombie process
-            # Wait for reader thread to finish with shorter timeout
-            reader_thread.join(timeout=2.0)
-            if reader_thread.is_alive():
-                logger.error(
-                    "Stderr reader thread failed to terminate after timeout. "
-                    "Thread will be abandoned (potential leak)."
-                )
-            return (False, -1, stderr_output, metrics_aggregator.summarize())
-
-        # Signal thread to stop (process completed normally)
-        stop_event.set()
-
-        # Drain any remaining stderr output
-        reader_thread.join(timeout=self.STDERR_DRAIN_TIMEOUT)
-        while True:
-            try:
-                line = stderr_queue.get_nowait()
-                if line is None:
-                    break
-                stderr_output.append(line)
-            except queue.Empty:
-                break
-
-        # Wait for process to finish (should already be done)
         process.wait()
+        process.stderr.close()
 
+        if timeout_expired:
+            return (False, -1, list(stderr_tail), metrics_aggregator.summarize())
         return (
             process.returncode == 0,
             process.returncode,
-            stderr_output,
+            list(stderr_tail),
             metrics_aggregator.summarize(),
         )
@@ -7,9 +7,10 @@ to check external tool availability.
 import threading
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Protocol
+from typing import TYPE_CHECKING, Protocol
 
-from vpo.policy.types import Plan
+if TYPE_CHECKING:
+    from vpo.policy.types import Plan
 
 
 @dataclass(frozen=True)
@@ -41,7 +42,7 @@ class Executor(Protocol):
     track reordering) for specific container formats.
     """
 
-    def can_handle(self, plan: Plan) -> bool:
+    def can_handle(self, plan: "Plan") -> bool:
         """Check if this executor can handle the given plan.
 
         Args:
@@ -54,7 +55,7 @@ class Executor(Protocol):
 
     def execute(
         self,
-        plan: Plan,
+        plan: "Plan",
         keep_backup: bool = True,
         keep_original: bool = False,
     ) -> ExecutorResult:
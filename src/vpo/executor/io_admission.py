@@ -0,0 +1,237 @@
+"""Per-device I/O admission control for concurrent file modifications.
+
+File-modifying phases (backup copy, remux, transcode) are heavy sequential
+I/O. Running several of them against the same spinning-disk array thrashes
+the heads, so admission is granted per block device: each device (``st_dev``
+of the source and temp locations) has a limited number of slots, and an
+optional bandwidth cap paces how quickly new work is admitted.
+
+Slots are advisory ``flock`` locks on files under ``<data_dir>/locks/io``,
+so the limits hold across threads, ``--executor process`` workers, the
+daemon and concurrent CLI invocations alike.
+"""
+
+import fcntl
+import logging
+import os
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import ExitStack, contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO
+
+from vpo.config.loader import get_config, get_data_dir
+from vpo.config.models import ProcessingConfig
+
+logger = logging.getLogger(__name__)
+
+# Interval between attempts to claim a busy device slot
+POLL_INTERVAL_SECONDS = 0.25
+
+_BYTES_PER_MB = 1024 * 1024
+
+
+def device_id(path: Path) -> str:
+    """Return the block device identifier ("major:minor") for a path.
+
+    Paths that do not exist yet (e.g. output files) resolve to the device
+    of their nearest existing parent directory.
+
+    Args:
+        path: File or directory path.
+
+    Returns:
+        Device identifier such as "8:17".
+
+    Raises:
+        OSError: If no ancestor of the path can be stat'ed.
+    """
+    current = path
+    while True:
+        try:
+            st_dev = os.stat(current).st_dev
+            break
+        except FileNotFoundError:
+            if current.parent == current:
+                raise
+            current = current.parent
+    return f"{os.major(st_dev)}:{os.minor(st_dev)}"
+
+
+@dataclass(frozen=True)
+class IOAdmission:
+    """Result of an admission: how long the caller waited on each device."""
+
+    wait_seconds: dict[str, float] = field(default_factory=dict)
+    """Queue wait per device identifier (empty if admission is disabled)."""
+
+    @property
+    def total_wait_seconds(self) -> float:
+        """Total time spent waiting for admission."""
+        return sum(self.wait_seconds.values())
+
+
+class IOAdmissionController:
+    """Grants per-device admission to file-modifying work.
+
+    Devices are always acquired in sorted order, so work that touches two
+    devices (source and temp directory) cannot deadlock against work that
+    touches the same two devices.
+    """
+
+    def __init__(
+        self,
+        lock_dir: Path,
+        concurrency: int = 0,
+        bandwidth_mb_per_sec: float = 0.0,
+        device_limits: dict[str, int] | None = None,
+    ) -> None:
+        """Initialize the controller.
+
+        Args:
+            lock_dir: Directory for slot and pacing lock files.
+            concurrency: Default slots per device (0 = unlimited).
+            bandwidth_mb_per_sec: Admission bandwidth per device (0 = no cap).
+            device_limits: Slot overrides keyed by a path on the device.
+        """
+        self.lock_dir = lock_dir
+        self.concurrency = concurrency
+        self.bandwidth_bytes_per_sec = bandwidth_mb_per_sec * _BYTES_PER_MB
+        self._device_limits: dict[str, int] = {}
+        for path, limit in (device_limits or {}).items():
+            try:
+                self._device_limits[device_id(Path(path).expanduser())] = limit
+            except OSError as e:
+                logger.warning("Ignoring io_device_limits entry %s: %s", path, e)
+
+    @classmethod
+    def from_config(
+        cls, config: ProcessingConfig, lock_dir: Path
+    ) -> "IOAdmissionController":
+        """Create a controller from the [processing] configuration."""
+        return cls(
+            lock_dir,
+            concurrency=config.io_device_concurrency,
+            bandwidth_mb_per_sec=config.io_device_bandwidth_mb_per_sec,
+            device_limits=config.io_device_limits,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """True if any limit is configured."""
+        return bool(
+            self.concurrency > 0
+            or self.bandwidth_bytes_per_sec > 0
+            or self._device_limits
+        )
+
+    def limit_for(self, device: str) -> int:
+        """Return the slot count for a device (0 = unlimited)."""
+        return self._device_limits.get(device, self.concurrency)
+
+    @contextmanager
+    def admit(
+        self, paths: Iterable[Path], size_bytes: int = 0
+    ) -> Iterator[IOAdmission]:
+        """Wait for admission on every device touched by paths.
+
+        Blocks until a slot is free on each device and, if a bandwidth cap
+        is configured, until the device's pacing allows size_bytes more.
+        Slots are held until the context exits.
+
+        Args:
+            paths: Source, temp and output locations of the work.
+            size_bytes: Expected bytes to move (used for bandwidth pacing).
+
+        Yields:
+            IOAdmission with the time waited per device.
+        """
+        if not self.enabled:
+            yield IOAdmission()
+            return
+
+        devices: set[str] = set()
+        for path in paths:
+            try:
+                devices.add(device_id(path))
+            except OSError as e:
+                logger.debug("Cannot resolve device for %s: %s", path, e)
+
+        self.lock_dir.mkdir(parents=True, exist_ok=True)
+        wait_seconds: dict[str, float] = {}
+        with ExitStack() as slots:
+            for device in sorted(devices):
+                start = time.monotonic()
+                limit = self.limit_for(device)
+                if limit > 0:
+                    slots.enter_context(self._claim_slot(device, limit))
+                if self.bandwidth_bytes_per_sec > 0 and size_bytes > 0:
+                    self._pace(device, size_bytes)
+                wait_seconds[device] = time.monotonic() - start
+                if wait_seconds[device] >= 1.0:
+                    logger.info(
+                        "Waited %.1fs for I/O admission on device %s",
+                        wait_seconds[device],
+                        device,
+                    )
+            yield IOAdmission(wait_seconds=wait_seconds)
+
+    def _lock_path(self, device: str, suffix: str) -> Path:
+        return self.lock_dir / f"dev-{device.replace(':', '_')}{suffix}"
+
+    @contextmanager
+    def _claim_slot(self, device: str, limit: int) -> Iterator[None]:
+        """Hold one of a device's slot locks for the duration of the context."""
+        handle: IO[str] | None = None
+        while handle is None:
+            for slot in range(limit):
+                candidate = open(  # noqa: SIM115 - held until slot release
+                    self._lock_path(device, f"-{slot}.lock"), "a", encoding="utf-8"
+                )
+                try:
+                    fcntl.flock(candidate.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+                except OSError:
+                    candidate.close()
+                    continue
+                handle = candidate
+                break
+            else:
+                time.sleep(POLL_INTERVAL_SECONDS)
+        try:
+            yield
+        finally:
+            fcntl.flock(handle.fileno(), fcntl.LOCK_UN)
+            handle.close()
+
+    def _pace(self, device: str, size_bytes: int) -> None:
+        """Reserve size_bytes of the device's bandwidth, sleeping until due.
+
+        The pacing file holds the wall-clock time at which the device's
+        budget is next free; each admission pushes it forward by
+        size_bytes / bandwidth.
+        """
+        with open(self._lock_path(device, ".rate"), "a+", encoding="utf-8") as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                try:
+                    next_free = float(f.read().strip() or 0.0)
+                except ValueError:
+                    next_free = 0.0
+                now = time.time()
+                start_at = max(now, next_free)
+                f.truncate(0)
+                f.write(f"{start_at + size_bytes / self.bandwidth_bytes_per_sec:.3f}")
+                f.flush()
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+        if start_at > now:
+            time.sleep(start_at - now)
+
+
+def get_io_admission() -> IOAdmissionController:
+    """Get an admission controller for the current configuration."""
+    return IOAdmissionController.from_config(
+        get_config().processing, get_data_dir() / "locks" / "io"
+    )
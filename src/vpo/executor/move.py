@@ -11,17 +11,46 @@ Design Note:
     The different interfaces reflect distinct responsibilities:
     - Executor: operates on Plan, returns ExecutorResult
     - MoveExecutor: operates on MovePlan, returns MoveResult
+
+Cross-device moves:
+    A move within one filesystem is a rename. When the destination is on
+    another filesystem the file is copied in large chunks with
+    ``copy_file_range`` (falling back to ``sendfile``, then a plain
+    read/write loop) into a hidden ``.<name>.vpo-partial`` file next to
+    the destination. A ``.vpo-move`` marker beside it records which source
+    the partial copy belongs to, so a copy interrupted by a crash or
+    daemon restart resumes from the partial file's size instead of
+    starting over. The copy is verified against the source with the
+    vpo-core content hash, renamed into place, and only then is the source
+    unlinked.
 """
 
 import errno
+import json
 import logging
+import os
 import shutil
+from collections.abc import Callable
 from dataclasses import dataclass
 from enum import Enum
 from pathlib import Path
 
+from vpo._core import hash_files
+
 logger = logging.getLogger(__name__)
 
+# Bytes copied per copy_file_range/sendfile call in cross-device moves
+COPY_CHUNK_BYTES = 64 * 1024 * 1024
+
+_PARTIAL_SUFFIX = ".vpo-partial"
+_MARKER_SUFFIX = ".vpo-move"
+
+# errno values meaning a kernel copy primitive is unusable for this pair
+# of files, so the next strategy should be tried
+_UNSUPPORTED_COPY_ERRNOS = frozenset(
+    {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSUP}
+)
+
 
 class MoveErrorType(Enum):
     """Categorization of move operation errors.
@@ -34,9 +63,41 @@ class MoveErrorType(Enum):
     NOT_FOUND = "not_found"
     CROSS_DEVICE = "cross_device"
     IO_ERROR = "io_error"
+    VERIFICATION = "verification"
     UNKNOWN = "unknown"
 
 
+# Categorize OSErrors by errno for future retry logic
+_ERRNO_TO_TYPE = {
+    errno.ENOSPC: MoveErrorType.DISK_SPACE,
+    errno.EACCES: MoveErrorType.PERMISSION,
+    errno.EPERM: MoveErrorType.PERMISSION,
+    errno.ENOENT: MoveErrorType.NOT_FOUND,
+    errno.EXDEV: MoveErrorType.CROSS_DEVICE,
+    errno.EIO: MoveErrorType.IO_ERROR,
+    errno.EROFS: MoveErrorType.IO_ERROR,
+}
+
+
+class MoveVerificationError(OSError):
+    """Raised when a copied file does not match its source."""
+
+
+@dataclass(frozen=True)
+class MoveProgress:
+    """Progress of a cross-device copy."""
+
+    bytes_copied: int
+    total_bytes: int
+
+    @property
+    def percent(self) -> float:
+        """Percentage of bytes copied (100.0 for empty files)."""
+        if self.total_bytes <= 0:
+            return 100.0
+        return self.bytes_copied * 100.0 / self.total_bytes
+
+
 @dataclass
 class MoveResult:
     """Result of a move operation."""
@@ -65,15 +126,22 @@ class MoveExecutor:
         self,
         create_directories: bool = True,
         overwrite: bool = False,
+        progress_callback: Callable[[MoveProgress], None] | None = None,
+        chunk_size: int = COPY_CHUNK_BYTES,
     ) -> None:
         """Initialize the move executor.
 
         Args:
             create_directories: Create destination directories if needed.
             overwrite: Overwrite existing files at destination.
+            progress_callback: Called with copy progress during cross-device
+                moves, at most once per chunk_size bytes.
+            chunk_size: Bytes per kernel copy call in cross-device moves.
         """
         self.create_directories = create_directories
         self.overwrite = overwrite
+        self.progress_callback = progress_callback
+        self.chunk_size = chunk_size
 
     def create_plan(
         self,
@@ -154,12 +222,26 @@ class MoveExecutor:
     def execute(self, plan: MovePlan) -> MoveResult:
         """Execute a move plan.
 
+        Renames the file when source and destination share a filesystem,
+        otherwise performs a verified, resumable copy and then unlinks the
+        source (see the module docstring).
+
         Args:
             plan: The move plan to execute.
 
         Returns:
             MoveResult with success status and details.
         """
+        try:
+            if self._finish_interrupted_move(plan):
+                return MoveResult(
+                    success=True,
+                    source_path=plan.source_path,
+                    destination_path=plan.destination_path,
+                )
+        except OSError as e:
+            return self._error_result(plan, e)
+
         # Validate first
         errors = self.validate(plan)
         if errors:
@@ -178,7 +260,12 @@ class MoveExecutor:
             logger.info(
                 "Moving file: %s -> %s", plan.source_path, plan.destination_path
             )
-            shutil.move(str(plan.source_path), str(plan.destination_path))
+            try:
+                os.replace(plan.source_path, plan.destination_path)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                self._move_across_devices(plan)
 
             logger.info("Move completed: %s", plan.destination_path)
             return MoveResult(
@@ -188,25 +275,151 @@ class MoveExecutor:
             )
 
         except OSError as e:
-            # Categorize error by errno for future retry logic
-            errno_to_type = {
-                errno.ENOSPC: MoveErrorType.DISK_SPACE,
-                errno.EACCES: MoveErrorType.PERMISSION,
-                errno.EPERM: MoveErrorType.PERMISSION,
-                errno.ENOENT: MoveErrorType.NOT_FOUND,
-                errno.EXDEV: MoveErrorType.CROSS_DEVICE,
-                errno.EIO: MoveErrorType.IO_ERROR,
-                errno.EROFS: MoveErrorType.IO_ERROR,
-            }
-            error_type = errno_to_type.get(e.errno, MoveErrorType.UNKNOWN)
-
-            logger.error("Move failed (%s): %s", error_type.value, e)
-            return MoveResult(
-                success=False,
-                source_path=plan.source_path,
-                error_message=str(e),
-                error_type=error_type,
+            return self._error_result(plan, e)
+
+    def _error_result(self, plan: MovePlan, error: OSError) -> MoveResult:
+        """Build a failed MoveResult, categorizing the error."""
+        if isinstance(error, MoveVerificationError):
+            error_type = MoveErrorType.VERIFICATION
+        else:
+            error_type = _ERRNO_TO_TYPE.get(error.errno, MoveErrorType.UNKNOWN)
+
+        logger.error("Move failed (%s): %s", error_type.value, error)
+        return MoveResult(
+            success=False,
+            source_path=plan.source_path,
+            error_message=str(error),
+            error_type=error_type,
+        )
+
+    def _move_across_devices(self, plan: MovePlan) -> None:
+        """Copy, verify and rename into place, then unlink the source.
+
+        Raises:
+            OSError: If copying, verification or the final rename fails.
+                The source is left untouched in every failure case.
+        """
+        source = plan.source_path
+        destination = plan.destination_path
+        partial = _partial_path(destination)
+        marker = _marker_path(destination)
+        identity = _source_identity(source)
+
+        offset = 0
+        if partial.exists() and _read_marker(marker) == identity:
+            offset = min(partial.stat().st_size, identity["size"])
+            logger.info(
+                "Resuming cross-device copy of %s at byte %d of %d",
+                source,
+                offset,
+                identity["size"],
+            )
+        else:
+            logger.info("Copying across filesystems: %s -> %s", source, destination)
+            # The partial file must exist before the marker does: a marker
+            # without a partial file means the copy was renamed into place
+            partial.open("wb").close()
+            _fsync_directory(partial.parent)
+            _write_marker(marker, identity)
+
+        try:
+            self._copy(source, partial, offset, identity["size"])
+            try:
+                _verify_copy(source, partial)
+            except MoveVerificationError:
+                if offset == 0:
+                    raise
+                # The resumed prefix was not intact; retry once from scratch
+                logger.warning(
+                    "Resumed copy of %s failed verification, copying again", source
+                )
+                self._copy(source, partial, 0, identity["size"])
+                _verify_copy(source, partial)
+        except MoveVerificationError:
+            marker.unlink(missing_ok=True)
+            partial.unlink(missing_ok=True)
+            raise
+
+        shutil.copystat(source, partial)
+        os.replace(partial, destination)
+        _fsync_directory(destination.parent)
+
+        # The marker outlives the rename so an interrupted unlink is
+        # completed by the next attempt (see _finish_interrupted_move)
+        source.unlink()
+        marker.unlink(missing_ok=True)
+
+    def _copy(self, source: Path, partial: Path, offset: int, total: int) -> None:
+        """Copy source[offset:total] into partial at the same offset."""
+        with (
+            open(source, "rb") as src,
+            open(partial, "r+b" if offset else "wb") as dst,
+        ):
+            dst.truncate(offset)
+            src_fd, dst_fd = src.fileno(), dst.fileno()
+            # Strategies this copy has not found unsupported yet; kept per
+            # copy, since support depends on the pair of filesystems
+            methods = list(_COPY_METHODS)
+            copied = offset
+            reported = -1
+            while copied < total:
+                count = min(self.chunk_size, total - copied)
+                written = _copy_chunk(methods, src_fd, dst_fd, copied, count)
+                if written == 0:
+                    raise OSError(
+                        errno.EIO, f"Source ended early during copy: {source}"
+                    )
+                copied += written
+                if self.progress_callback and (
+                    copied - reported >= self.chunk_size or copied == total
+                ):
+                    self.progress_callback(MoveProgress(copied, total))
+                    reported = copied
+            os.fsync(dst_fd)
+
+    def _finish_interrupted_move(self, plan: MovePlan) -> bool:
+        """Complete a cross-device move interrupted after its final rename.
+
+        The partial copy is only renamed into place after verification, so
+        a destination without a partial file but with a marker naming the
+        unchanged source means only the source unlink is outstanding. The
+        destination is still verified against the source before the source
+        is removed, since a stale marker could sit next to an unrelated file.
+
+        Returns:
+            True if the move was completed here.
+
+        Raises:
+            OSError: If either file cannot be hashed.
+        """
+        marker = _marker_path(plan.destination_path)
+        if not marker.exists() or _partial_path(plan.destination_path).exists():
+            return False
+        if not plan.source_path.is_file() or not plan.destination_path.is_file():
+            return False
+        identity = _source_identity(plan.source_path)
+        if _read_marker(marker) != identity:
+            return False
+        if plan.destination_path.stat().st_size != identity["size"]:
+            return False
+        try:
+            _verify_copy(plan.source_path, plan.destination_path)
+        except MoveVerificationError:
+            logger.warning(
+                "Ignoring stale move marker: %s does not match %s",
+                plan.destination_path,
+                plan.source_path,
             )
+            return False
+
+        logger.info(
+            "Completing interrupted move: %s -> %s",
+            plan.source_path,
+            plan.destination_path,
+        )
+        plan.source_path.unlink()
+        marker.unlink(missing_ok=True)
+        return True
 
     def dry_run(self, plan: MovePlan) -> dict:
         """Generate dry-run output showing what would be done.
@@ -230,6 +443,136 @@ class MoveExecutor:
         }
 
 
+def _partial_path(destination: Path) -> Path:
+    """Hidden in-progress copy next to the destination."""
+    return destination.with_name(f".{destination.name}{_PARTIAL_SUFFIX}")
+
+
+def _marker_path(destination: Path) -> Path:
+    """Resume marker identifying the source of a partial copy."""
+    return destination.with_name(f".{destination.name}{_MARKER_SUFFIX}")
+
+
+def _source_identity(source: Path) -> dict:
+    """Identify a source file so stale partial copies are not resumed."""
+    stat = source.stat()
+    return {
+        "source": str(source),
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+    }
+
+
+def _read_marker(marker: Path) -> dict | None:
+    """Read a resume marker, returning None if missing or unreadable."""
+    try:
+        return json.loads(marker.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def _write_marker(marker: Path, identity: dict) -> None:
+    """Durably write a resume marker before copying starts."""
+    with open(marker, "w", encoding="utf-8") as f:
+        json.dump(identity, f)
+        f.flush()
+        os.fsync(f.fileno())
+
+
+def _fsync_directory(directory: Path) -> None:
+    """Persist a rename in directory, where the platform supports it."""
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _copy_file_range(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+    return os.copy_file_range(src_fd, dst_fd, count, offset, offset)
+
+
+def _sendfile(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+    os.lseek(dst_fd, offset, os.SEEK_SET)
+    return os.sendfile(dst_fd, src_fd, offset, count)
+
+
+def _read_write(src_fd: int, dst_fd: int, offset: int, count: int) -> int:
+    data = os.pread(src_fd, min(count, _READ_WRITE_BYTES), offset)
+    if not data:
+        return 0
+    return os.pwrite(dst_fd, data, offset)
+
+
+# Bytes per userspace read/write when no kernel copy primitive works
+_READ_WRITE_BYTES = 1024 * 1024
+
+# Copy strategies available on this platform, in order of preference
+_COPY_METHODS: tuple[Callable[[int, int, int, int], int], ...] = tuple(
+    method
+    for method, available in (
+        (_copy_file_range, hasattr(os, "copy_file_range")),
+        (_sendfile, hasattr(os, "sendfile")),
+        (_read_write, True),
+    )
+    if available
+)
+
+
+def _copy_chunk(
+    methods: list[Callable[[int, int, int, int], int]],
+    src_fd: int,
+    dst_fd: int,
+    offset: int,
+    count: int,
+) -> int:
+    """Copy up to count bytes at offset using the best working strategy.
+
+    Args:
+        methods: The copy's remaining strategies, best first; those the
+            kernel rejects for these files are removed.
+
+    Returns:
+        Number of bytes copied (0 at end of source).
+    """
+    while True:
+        method = methods[0]
+        try:
+            return method(src_fd, dst_fd, offset, count)
+        except OSError as e:
+            if e.errno not in _UNSUPPORTED_COPY_ERRNOS or method is _read_write:
+                raise
+            logger.debug("%s unsupported (%s), falling back", method.__name__, e)
+            methods.pop(0)
+
+
+def _verify_copy(source: Path, copy: Path) -> None:
+    """Compare source and copy with the vpo-core content hash.
+
+    Raises:
+        MoveVerificationError: If the hashes differ.
+        OSError: If either file cannot be hashed.
+    """
+    try:
+        results = hash_files([str(source), str(copy)])
+    except RuntimeError as e:
+        # Rust panics are converted to RuntimeError
+        raise OSError(errno.EIO, f"Hash computation failed: {e}") from e
+
+    errors = [r["error"] for r in results if r.get("error")]
+    if errors:
+        raise OSError(errno.EIO, f"Hash computation failed: {'; '.join(errors)}")
+    if results[0].get("hash") != results[1].get("hash"):
+        raise MoveVerificationError(
+            errno.EIO, f"Copied file does not match source: {copy}"
+        )
+
+
 # Maximum number of suffix attempts before giving up
 MAX_UNIQUE_PATH_ATTEMPTS = 10000
 
@@ -4,6 +4,8 @@ This module provides the job queue system for long-running operations:
 - exceptions: Custom exception types for job tracking errors
 - tracking: Functions for creating and updating job records
 - queue: Job queue operations (enqueue, claim, release)
+- resources: Resource classes and slot limits for job scheduling
+- estimates: Job duration estimates for time-window planning
 - worker: Job worker for processing queued jobs
 - maintenance: Job maintenance operations (purge, cleanup)
 - services: Job processing services
@@ -0,0 +1,404 @@
+"""Remote job workers that claim jobs through a VPO server's job broker.
+
+``vpo serve --broker`` exposes the queue over HTTP (see
+vpo.server.api.broker); ``vpo jobs worker --broker URL`` on another host
+runs RemoteJobWorker against it:
+
+- jobs are claimed, heartbeated and completed over HTTP under a lease
+  owned by the worker ID, so the server's stale-job recovery requeues the
+  job if the worker host disappears,
+- file paths in the job are translated with PathMapper, since the library
+  is usually mounted at a different path on each host,
+- the job log is written locally and uploaded when the job finishes.
+
+Only transcode jobs run remotely (REMOTE_JOB_TYPES).
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, fields, replace
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+from vpo.db import Job, JobStatus, JobType, ResourceClass
+from vpo.jobs.logs import get_log_path
+from vpo.jobs.queue import default_lease_owner
+from vpo.jobs.worker import JobWorker
+
+logger = logging.getLogger(__name__)
+
+#: Header carrying the worker ID (the lease owner) on every broker request
+WORKER_HEADER = "X-VPO-Worker"
+
+#: Job types a remote worker may run. Transcodes only need the file and the
+#: policy snapshot stored on the job; the other types read and write the
+#: library database, which a remote host does not have.
+REMOTE_JOB_TYPES = frozenset({JobType.TRANSCODE})
+
+# Seconds between progress reports sent to the broker
+PROGRESS_REPORT_INTERVAL = 5.0
+
+# Default HTTP timeout for broker requests (log uploads use LOG_UPLOAD_TIMEOUT)
+BROKER_TIMEOUT = 30.0
+LOG_UPLOAD_TIMEOUT = 300.0
+
+_JOB_FIELDS = frozenset(f.name for f in fields(Job))
+
+
+class BrokerError(Exception):
+    """Raised when a job broker request fails."""
+
+
+class BrokerLeaseLostError(BrokerError):
+    """Raised when the broker no longer runs the job under this worker's lease."""
+
+
+@dataclass(frozen=True)
+class PathMapping:
+    """Maps a path prefix on the server to the same directory on this host."""
+
+    server_prefix: str
+    local_prefix: str
+
+    @classmethod
+    def parse(cls, value: str) -> PathMapping:
+        """Parse a ``SERVER_PREFIX=LOCAL_PREFIX`` mapping.
+
+        Raises:
+            ValueError: If value is not of that form.
+        """
+        server, sep, local = value.partition("=")
+        if not sep or not server.strip() or not local.strip():
+            raise ValueError(
+                f"Invalid path mapping '{value}' (expected SERVER_PREFIX=LOCAL_PREFIX)"
+            )
+        return cls(server.strip(), local.strip())
+
+
+def _remap(path: str, pairs: list[tuple[str, str]]) -> str:
+    """Replace the longest matching directory prefix of path."""
+    for source, target in pairs:
+        if path == source or path.startswith(source + "/"):
+            return target + path[len(source) :]
+    return path
+
+
+class PathMapper:
+    """Translates paths between the server and this host.
+
+    Prefixes match whole path components, so ``/media`` maps
+    ``/media/a.mkv`` but not ``/media2/a.mkv``; the longest matching prefix
+    wins. Paths outside every mapping are returned unchanged.
+    """
+
+    def __init__(self, mappings: list[PathMapping] | None = None) -> None:
+        pairs = [
+            (m.server_prefix.rstrip("/") or "/", m.local_prefix.rstrip("/") or "/")
+            for m in mappings or []
+        ]
+        self._to_local = sorted(pairs, key=lambda p: len(p[0]), reverse=True)
+        self._to_server = sorted(
+            ((local, server) for server, local in pairs),
+            key=lambda p: len(p[0]),
+            reverse=True,
+        )
+
+    def to_local(self, path: str) -> str:
+        """Translate a server path to the path on this host."""
+        return _remap(path, self._to_local)
+
+    def to_server(self, path: str) -> str:
+        """Translate a path on this host to the server path."""
+        return _remap(path, self._to_server)
+
+
+class BrokerClient:
+    """HTTP client for the job broker API of a VPO server."""
+
+    def __init__(
+        self,
+        url: str,
+        worker_id: str | None = None,
+        auth_token: str | None = None,
+        timeout: float = BROKER_TIMEOUT,
+        transport: httpx.BaseTransport | None = None,
+    ) -> None:
+        """Initialize the client.
+
+        Args:
+            url: Server base URL (e.g. ``http://nas:8321``).
+            worker_id: Lease owner for claimed jobs (default: host:pid).
+            auth_token: The server's auth token, sent as Basic auth.
+            timeout: Request timeout in seconds.
+            transport: Optional httpx transport (for tests).
+        """
+        self.worker_id = worker_id or default_lease_owner()
+        self._client = httpx.Client(
+            base_url=url.rstrip("/") + "/api/v1/broker",
+            timeout=timeout,
+            headers={WORKER_HEADER: self.worker_id},
+            auth=("vpo", auth_token) if auth_token else None,
+            transport=transport,
+        )
+
+    def close(self) -> None:
+        """Close the HTTP client."""
+        self._client.close()
+
+    def _request(self, method: str, url: str, **kwargs: Any) -> dict[str, Any]:
+        """Send a request and return the decoded JSON body.
+
+        Raises:
+            BrokerLeaseLostError: If the server answers 409.
+            BrokerError: On connection errors and other error responses.
+        """
+        try:
+            response = self._client.request(method, url, **kwargs)
+        except httpx.HTTPError as e:
+            raise BrokerError(f"Cannot reach job broker: {e}") from e
+
+        if response.status_code == 409:
+            raise BrokerLeaseLostError(_error_message(response))
+        if response.status_code == 401:
+            raise BrokerError("Job broker rejected credentials (check VPO_AUTH_TOKEN)")
+        if response.status_code == 404:
+            raise BrokerError("Job broker not enabled on server (vpo serve --broker)")
+        if response.is_error:
+            raise BrokerError(
+                f"Job broker error {response.status_code}: {_error_message(response)}"
+            )
+        try:
+            return response.json()
+        except ValueError as e:
+            raise BrokerError(f"Invalid job broker response: {e}") from e
+
+    def claim(
+        self, job_types: list[JobType] | None = None
+    ) -> tuple[Job | None, float | None]:
+        """Claim the next queued job.
+
+        Args:
+            job_types: Job types to accept (default: all of REMOTE_JOB_TYPES).
+
+        Returns:
+            Tuple of (job, primary video duration in seconds); job is None
+            when the queue has no job this worker can run.
+        """
+        body: dict[str, Any] = {"worker_pid": os.getpid()}
+        if job_types is not None:
+            body["job_types"] = [t.value for t in job_types]
+        data = self._request("POST", "/claim", json=body)
+        if data.get("job") is None:
+            return None, None
+        return _job_from_dict(data["job"]), data.get("duration_seconds")
+
+    def heartbeat(self, job_id: str) -> None:
+        """Renew the lease on a running job."""
+        self._request(
+            "POST", f"/jobs/{job_id}/heartbeat", json={"worker_pid": os.getpid()}
+        )
+
+    def progress(
+        self, job_id: str, percent: float, progress_json: str | None = None
+    ) -> None:
+        """Report progress of a running job."""
+        self._request(
+            "POST",
+            f"/jobs/{job_id}/progress",
+            json={"percent": percent, "progress_json": progress_json},
+        )
+
+    def upload_log(self, job_id: str, log_path: Path) -> None:
+        """Upload a job log file, replacing any log the server has."""
+        with open(log_path, "rb") as fh:
+            self._request(
+                "PUT",
+                f"/jobs/{job_id}/log",
+                content=fh,
+                headers={"Content-Type": "text/plain; charset=utf-8"},
+                timeout=LOG_UPLOAD_TIMEOUT,
+            )
+
+    def complete(
+        self,
+        job_id: str,
+        status: JobStatus,
+        error_message: str | None = None,
+        output_path: str | None = None,
+        summary_json: str | None = None,
+    ) -> None:
+        """Record the final status of a job (COMPLETED or FAILED)."""
+        self._request(
+            "POST",
+            f"/jobs/{job_id}/complete",
+            json={
+                "status": status.value,
+                "error_message": error_message,
+                "output_path": output_path,
+                "summary_json": summary_json,
+            },
+        )
+
+
+def _error_message(response: httpx.Response) -> str:
+    try:
+        return response.json().get("error", response.text)
+    except ValueError:
+        return response.text
+
+
+def _job_from_dict(data: dict[str, Any]) -> Job:
+    """Build a Job from its JSON representation, ignoring unknown fields."""
+    values = {k: v for k, v in data.items() if k in _JOB_FIELDS}
+    values["job_type"] = JobType(values["job_type"])
+    values["status"] = JobStatus(values["status"])
+    if values.get("resource_class"):
+        values["resource_class"] = ResourceClass(values["resource_class"])
+    return Job(**values)
+
+
+class RemoteJobWorker(JobWorker):
+    """Job worker that runs jobs claimed from a remote job broker.
+
+    Reuses JobWorker's limits, signal handling, heartbeat thread and job
+    processing; queue access goes through a BrokerClient instead of a
+    database connection.
+    """
+
+    def __init__(
+        self,
+        client: BrokerClient,
+        path_mapper: PathMapper | None = None,
+        max_files: int | None = None,
+        max_duration: int | None = None,
+        end_by: str | None = None,
+        cpu_cores: int | None = None,
+    ) -> None:
+        """Initialize the remote worker.
+
+        Args:
+            client: Broker client for the server's queue.
+            path_mapper: Translates job paths between server and this host.
+            max_files: Maximum files to process (None = unlimited).
+            max_duration: Maximum duration in seconds (None = unlimited).
+            end_by: End time in HH:MM format (None = run until complete).
+            cpu_cores: CPU cores to use for transcoding.
+        """
+        super().__init__(
+            conn=None,
+            max_files=max_files,
+            max_duration=max_duration,
+            end_by=end_by,
+            cpu_cores=cpu_cores,
+            auto_purge=False,
+        )
+        self.client = client
+        self.path_mapper = path_mapper or PathMapper()
+        self._lease_owner = client.worker_id
+        self._duration: float | None = None
+        self._result: tuple[JobStatus, dict[str, Any]] | None = None
+        self._last_progress = 0.0
+
+    def _claim_job(self) -> Job | None:
+        try:
+            job, self._duration = self.client.claim()
+        except BrokerError as e:
+            logger.error("Cannot claim job: %s", e)
+            return None
+        return job
+
+    def _release_leases(self) -> None:
+        """Nothing to release: jobs are claimed one at a time."""
+
+    def _purge_old_jobs(self) -> None:
+        """Job retention is handled by the server."""
+
+    def _recover_stale_jobs(self) -> None:
+        """Stale-job recovery is handled by the server."""
+
+    def _can_send_heartbeat(self) -> bool:
+        return True
+
+    def _send_heartbeat(self, job_id: str) -> None:
+        self.client.heartbeat(job_id)
+
+    def _get_file_duration(self, file_id: int | None) -> float | None:
+        return self._duration
+
+    def _report_progress(
+        self, job_id: str, percent: float, progress_json: str | None
+    ) -> None:
+        now = time.monotonic()
+        if now - self._last_progress < PROGRESS_REPORT_INTERVAL:
+            return
+        self._last_progress = now
+        self.client.progress(job_id, percent, progress_json)
+
+    def _update_job_log_path(self, job_id: str, log_path: str | None) -> None:
+        """The server links the log when it is uploaded."""
+
+    def _release_job(self, job_id: str, status: JobStatus, **kwargs) -> None:
+        # Reported to the broker by process_job once the log is closed
+        self._result = (status, kwargs)
+
+    def _localize(self, job: Job) -> Job:
+        """Return job with its paths translated to this host."""
+        policy_json = job.policy_json
+        if policy_json:
+            try:
+                policy = json.loads(policy_json)
+            except json.JSONDecodeError:
+                policy = None
+            if isinstance(policy, dict) and isinstance(policy.get("output_dir"), str):
+                policy["output_dir"] = self.path_mapper.to_local(policy["output_dir"])
+                policy_json = json.dumps(policy)
+        return replace(
+            job,
+            file_path=self.path_mapper.to_local(job.file_path),
+            policy_json=policy_json,
+        )
+
+    def process_job(self, job: Job) -> None:
+        """Process a claimed job locally and report the result to the broker.
+
+        Args:
+            job: The job as claimed (with server paths).
+        """
+        self._result = None
+        self._last_progress = 0.0
+        super().process_job(self._localize(job))
+
+        try:
+            log_path = get_log_path(job.id)
+            if log_path.exists():
+                self.client.upload_log(job.id, log_path)
+        except (BrokerError, OSError, ValueError) as e:
+            logger.warning("Failed to upload log for job %s: %s", job.id[:8], e)
+
+        if self._result is None:
+            return
+        status, result = self._result
+        output_path = result.get("output_path")
+        try:
+            self.client.complete(
+                job.id,
+                status,
+                error_message=result.get("error_message"),
+                output_path=(
+                    self.path_mapper.to_server(output_path) if output_path else None
+                ),
+                summary_json=result.get("summary_json"),
+            )
+        except BrokerLeaseLostError:
+            logger.error(
+                "Job %s was reassigned by the server; result discarded", job.id[:8]
+            )
+        except BrokerError as e:
+            # The lease expires and the server requeues the job
+            logger.error("Failed to report result of job %s: %s", job.id[:8], e)
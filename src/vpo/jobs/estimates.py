@@ -0,0 +1,278 @@
+"""Job duration estimates from processing history.
+
+DurationEstimator learns how long jobs take from completed jobs (jobs
+table) and workflow runs (processing_stats). Samples are grouped by job
+type, source video codec, resolution and target codec, and a job's
+estimate is its file size times the seconds-per-byte rate of the most
+specific group with enough samples. Jobs without a file (scan, prune) are
+estimated from their absolute durations.
+
+The worker uses estimates to plan within a time window (--end-by,
+--max-duration): it only claims jobs expected to finish before the window
+closes, so a long encode is not started minutes before the deadline.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+from collections import defaultdict
+from collections.abc import Iterable, Sequence
+from dataclasses import dataclass
+from datetime import datetime
+
+from vpo.db import Job, JobType
+from vpo.workflow.skip_conditions import get_video_resolution_label
+
+logger = logging.getLogger(__name__)
+
+# Most recent history rows read from each source
+HISTORY_LIMIT = 2000
+
+# Samples a group needs before its rate is trusted over a coarser group
+MIN_SAMPLES = 3
+
+# Estimates use this quantile of a group's rates: a little pessimistic, so
+# planned jobs rarely overrun the window
+ESTIMATE_QUANTILE = 0.75
+
+_GroupKey = tuple[str | None, ...]
+
+
+@dataclass(frozen=True)
+class JobFeatures:
+    """Properties of a job that determine how long it takes."""
+
+    job_type: JobType
+    size_bytes: int | None = None
+    source_codec: str | None = None
+    resolution: str | None = None
+    target_codec: str | None = None
+
+    def group_keys(self) -> list[_GroupKey]:
+        """Return the job's groups, most specific first."""
+        job_type = self.job_type.value
+        return [
+            (job_type, self.source_codec, self.resolution, self.target_codec),
+            (job_type, self.source_codec, self.resolution),
+            (job_type, self.resolution),
+            (job_type,),
+        ]
+
+
+def _quantile(values: Sequence[float], q: float = ESTIMATE_QUANTILE) -> float:
+    ordered = sorted(values)
+    return ordered[round(q * (len(ordered) - 1))]
+
+
+def _resolution(height: int | None) -> str | None:
+    return get_video_resolution_label(height) if height else None
+
+
+def _codec(value: str | None) -> str | None:
+    return value.casefold() if value else None
+
+
+def _elapsed_seconds(started_at: str, completed_at: str) -> float | None:
+    try:
+        elapsed = (
+            datetime.fromisoformat(completed_at) - datetime.fromisoformat(started_at)
+        ).total_seconds()
+    except ValueError:
+        return None
+    return elapsed if elapsed > 0 else None
+
+
+def _target_codec(job_type: JobType, policy_json: str | None) -> str | None:
+    """Target video codec of a transcode job (None for other jobs)."""
+    if job_type != JobType.TRANSCODE or not policy_json:
+        return None
+    try:
+        data = json.loads(policy_json)
+    except ValueError:
+        return None
+    if not isinstance(data, dict):
+        return None
+    return _codec(data.get("target_video_codec"))
+
+
+def _video_track(column: str, file_id: str) -> str:
+    """SQL selecting a column of a file's first video track."""
+    return f"""(
+        SELECT {column} FROM tracks
+        WHERE tracks.file_id = {file_id} AND tracks.track_type = 'video'
+        ORDER BY tracks.track_index LIMIT 1
+    )"""
+
+
+class DurationEstimator:
+    """Estimates job run times from historical durations."""
+
+    def __init__(self) -> None:
+        self._rates: dict[_GroupKey, list[float]] = defaultdict(list)
+        self._durations: dict[_GroupKey, list[float]] = defaultdict(list)
+
+    @property
+    def sample_count(self) -> int:
+        """Number of samples recorded (counted once, in their job-type group)."""
+        return sum(
+            len(durations)
+            for key, durations in self._durations.items()
+            if len(key) == 1
+        )
+
+    def add_sample(self, features: JobFeatures, seconds: float) -> None:
+        """Record how long a job with these features took."""
+        for key in features.group_keys():
+            self._durations[key].append(seconds)
+            if features.size_bytes:
+                self._rates[key].append(seconds / features.size_bytes)
+
+    def estimate(self, features: JobFeatures) -> float | None:
+        """Estimate the run time of a job in seconds.
+
+        Returns:
+            Estimated seconds, or None if there is no history for the job
+            type.
+        """
+        for key in features.group_keys():
+            if features.size_bytes:
+                rates = self._rates.get(key, ())
+                if len(rates) >= MIN_SAMPLES:
+                    return _quantile(rates) * features.size_bytes
+            else:
+                durations = self._durations.get(key, ())
+                if len(durations) >= MIN_SAMPLES:
+                    return _quantile(durations)
+        return None
+
+    def estimate_jobs(
+        self, conn: sqlite3.Connection, jobs: Iterable[Job]
+    ) -> dict[str, float | None]:
+        """Estimate the run time of queued jobs.
+
+        Args:
+            conn: Database connection (to look up the jobs' files).
+            jobs: Jobs to estimate.
+
+        Returns:
+            Dictionary of job ID to estimated seconds (None = unknown).
+        """
+        jobs = list(jobs)
+        files = _file_features(conn, {j.file_id for j in jobs if j.file_id})
+        estimates: dict[str, float | None] = {}
+        for job in jobs:
+            size, codec, height = files.get(job.file_id, (None, None, None))
+            features = JobFeatures(
+                job_type=job.job_type,
+                size_bytes=size,
+                source_codec=_codec(codec),
+                resolution=_resolution(height),
+                target_codec=_target_codec(job.job_type, job.policy_json),
+            )
+            estimates[job.id] = self.estimate(features)
+        return estimates
+
+    @classmethod
+    def from_history(
+        cls, conn: sqlite3.Connection, limit: int = HISTORY_LIMIT
+    ) -> DurationEstimator:
+        """Build an estimator from completed jobs and processing stats.
+
+        Process jobs are learned from processing_stats, which records their
+        source and target codecs; other job types from the jobs table.
+
+        Args:
+            conn: Database connection.
+            limit: Most recent rows read from each source.
+
+        Returns:
+            A trained estimator (possibly without samples).
+        """
+        estimator = cls()
+
+        jobs = conn.execute(
+            f"""
+            SELECT j.job_type, j.policy_json, j.started_at, j.completed_at,
+                   f.size_bytes, {_video_track("codec", "j.file_id")},
+                   {_video_track("height", "j.file_id")}
+            FROM jobs AS j
+            LEFT JOIN files AS f ON f.id = j.file_id
+            WHERE j.status = 'completed' AND j.job_type != 'process'
+                AND j.started_at IS NOT NULL AND j.completed_at IS NOT NULL
+            ORDER BY j.completed_at DESC
+            LIMIT ?
+            """,
+            (limit,),
+        ).fetchall()
+        for job_type, policy_json, started, completed, size, codec, height in jobs:
+            seconds = _elapsed_seconds(started, completed)
+            if seconds is None:
+                continue
+            try:
+                job_type = JobType(job_type)
+            except ValueError:
+                continue
+            estimator.add_sample(
+                JobFeatures(
+                    job_type=job_type,
+                    size_bytes=size,
+                    source_codec=_codec(codec),
+                    resolution=_resolution(height),
+                    target_codec=_target_codec(job_type, policy_json),
+                ),
+                seconds,
+            )
+
+        stats = conn.execute(
+            f"""
+            SELECT s.duration_seconds, s.size_before, s.video_source_codec,
+                   CASE WHEN s.video_transcode_skipped = 0
+                        THEN s.video_target_codec END,
+                   {_video_track("height", "s.file_id")}
+            FROM processing_stats AS s
+            WHERE s.success = 1 AND s.duration_seconds > 0
+            ORDER BY s.processed_at DESC
+            LIMIT ?
+            """,
+            (limit,),
+        ).fetchall()
+        for seconds, size, source, target, height in stats:
+            estimator.add_sample(
+                JobFeatures(
+                    job_type=JobType.PROCESS,
+                    size_bytes=size,
+                    source_codec=_codec(source),
+                    resolution=_resolution(height),
+                    target_codec=_codec(target),
+                ),
+                seconds,
+            )
+
+        logger.debug(
+            "Duration estimator trained on %d job(s) and %d processing run(s)",
+            len(jobs),
+            len(stats),
+        )
+        return estimator
+
+
+def _file_features(
+    conn: sqlite3.Connection, file_ids: set[int]
+) -> dict[int, tuple[int | None, str | None, int | None]]:
+    """Look up (size, video codec, video height) for files."""
+    if not file_ids:
+        return {}
+    ids = sorted(file_ids)
+    rows = conn.execute(
+        f"""
+        SELECT f.id, f.size_bytes,
+               {_video_track("codec", "f.id")},
+               {_video_track("height", "f.id")}
+        FROM files AS f
+        WHERE f.id IN ({", ".join("?" * len(ids))})
+        """,
+        ids,
+    ).fetchall()
+    return {row[0]: (row[1], row[2], row[3]) for row in rows}
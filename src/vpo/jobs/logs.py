@@ -7,6 +7,15 @@ Log lifecycle:
 1. Created during job execution via JobLogWriter
 2. Compressed (gzip) after log_compression_days (default 7 days)
 3. Deleted after log_deletion_days (default 90 days)
+
+Line index:
+Each uncompressed log has a sidecar ``<job_id>.log.idx`` holding the byte
+offset of every LOG_INDEX_INTERVAL-th line. JobLogWriter appends to it as
+it writes, so readers seek straight to the requested line and only count
+the lines after the last indexed offset. Reading a page of a log therefore
+costs the lines shown plus at most one interval, not the file size. Logs
+without a sidecar (written before the index existed) are indexed on first
+read.
 """
 
 from __future__ import annotations
@@ -15,12 +24,13 @@ import gzip
 import logging
 import os
 import re
+import struct
 import threading
-from dataclasses import dataclass
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from itertools import islice
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import IO, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from types import TracebackType
@@ -33,6 +43,20 @@ DEFAULT_LOG_LINES = 500
 # Maximum log file size to read entirely into memory (10MB)
 MAX_LOG_SIZE_BYTES = 10 * 1024 * 1024
 
+# Number of lines between entries of the sidecar line-offset index
+LOG_INDEX_INTERVAL = 1000
+
+# Maximum bytes returned by one read_log_from call (follow mode)
+FOLLOW_MAX_BYTES = 256 * 1024
+
+# Sidecar index layout: magic, interval, then one offset per entry
+_INDEX_MAGIC = b"VPOI"
+_INDEX_HEADER = struct.Struct("<4sI")
+_INDEX_ENTRY = struct.Struct("<Q")
+
+# Read size when scanning a log for newlines
+_SCAN_CHUNK_BYTES = 1024 * 1024
+
 # Regex for validating UUID format (prevents path traversal)
 _UUID_PATTERN = re.compile(
     r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$",
@@ -104,9 +128,157 @@ def ensure_log_directory() -> Path:
     return log_dir
 
 
+def get_log_index_path(log_path: Path) -> Path:
+    """Get the sidecar line-offset index path for a log file.
+
+    Args:
+        log_path: Path to the .log file.
+
+    Returns:
+        Path to the index file (``<job_id>.log.idx``).
+    """
+    return log_path.with_name(log_path.name + ".idx")
+
+
+@dataclass
+class _LineIndex:
+    """Line-offset index of an uncompressed log file."""
+
+    interval: int
+    offsets: list[int] = field(default_factory=lambda: [0])
+    """offsets[k] is the byte offset of line k * interval (offsets[0] == 0)."""
+    newlines: int = 0
+    """Number of newline-terminated lines."""
+    size: int = 0
+    """File size the index was built against."""
+    partial: bool = False
+    """True if the file ends with a line that has no newline yet."""
+
+    @property
+    def total(self) -> int:
+        """Total number of lines, counting an unterminated last line."""
+        return self.newlines + (1 if self.partial else 0)
+
+
+def _scan_newlines(f: IO[bytes], index: _LineIndex, start: int) -> None:
+    """Count newlines from a byte offset to EOF, extending the index.
+
+    Args:
+        f: Log file opened in binary mode.
+        index: Index whose newlines/offsets describe the file up to start.
+        start: Byte offset of the start of line index.newlines.
+    """
+    f.seek(start)
+    position = start
+    last = b""
+    while chunk := f.read(_SCAN_CHUNK_BYTES):
+        found = chunk.find(b"\n")
+        while found != -1:
+            index.newlines += 1
+            if index.newlines % index.interval == 0:
+                index.offsets.append(position + found + 1)
+            found = chunk.find(b"\n", found + 1)
+        position += len(chunk)
+        last = chunk[-1:]
+    index.size = position
+    index.partial = position > start and last != b"\n"
+
+
+def _read_index_file(index_path: Path) -> tuple[int, list[int]] | None:
+    """Read a sidecar index file.
+
+    Returns:
+        Tuple of (interval, offsets excluding the implicit 0), or None if
+        the file is missing or malformed.
+    """
+    try:
+        data = index_path.read_bytes()
+    except OSError:
+        return None
+    if len(data) < _INDEX_HEADER.size:
+        return None
+    magic, interval = _INDEX_HEADER.unpack_from(data)
+    if magic != _INDEX_MAGIC or interval <= 0:
+        return None
+    body = data[_INDEX_HEADER.size :]
+    # Ignore a torn trailing entry from a concurrent append
+    body = body[: len(body) - len(body) % _INDEX_ENTRY.size]
+    return interval, [entry for (entry,) in _INDEX_ENTRY.iter_unpack(body)]
+
+
+def _write_index_file(index_path: Path, index: _LineIndex) -> None:
+    """Atomically write a complete sidecar index (best effort)."""
+    tmp_path = index_path.with_name(index_path.name + ".tmp")
+    try:
+        with tmp_path.open("wb") as f:
+            f.write(_INDEX_HEADER.pack(_INDEX_MAGIC, index.interval))
+            for offset in index.offsets[1:]:
+                f.write(_INDEX_ENTRY.pack(offset))
+        os.replace(tmp_path, index_path)
+    except OSError as e:
+        logger.debug("Could not write log index %s: %s", index_path, e)
+        tmp_path.unlink(missing_ok=True)
+
+
+def _load_line_index(
+    log_path: Path, f: IO[bytes], interval: int = LOG_INDEX_INTERVAL
+) -> _LineIndex:
+    """Load the line index of a log file, completing it from the file.
+
+    Uses the sidecar index up to its last entry and scans only the lines
+    after it. A missing or inconsistent sidecar is rebuilt from a full scan
+    and saved for subsequent reads.
+
+    Args:
+        log_path: Path to the .log file.
+        f: The same file opened in binary mode.
+        interval: Index interval to use if the sidecar has to be rebuilt.
+
+    Returns:
+        The index, describing the file up to its current end.
+    """
+    index_path = get_log_index_path(log_path)
+    stored = _read_index_file(index_path)
+    if stored is not None:
+        interval, offsets = stored
+        index = _LineIndex(interval=interval, offsets=[0, *offsets])
+        last = index.offsets[-1]
+        valid = last == 0
+        if not valid:
+            f.seek(last - 1)
+            valid = f.read(1) == b"\n"
+        if valid:
+            index.newlines = (len(index.offsets) - 1) * interval
+            _scan_newlines(f, index, last)
+            return index
+        logger.debug("Rebuilding stale log index %s", index_path)
+
+    index = _LineIndex(interval=interval)
+    _scan_newlines(f, index, 0)
+    _write_index_file(index_path, index)
+    return index
+
+
+def _seek_line(f: IO[bytes], index: _LineIndex, line: int) -> None:
+    """Position a binary file handle at the start of a line."""
+    entry = min(line // index.interval, len(index.offsets) - 1)
+    f.seek(index.offsets[entry])
+    for _ in range(line - entry * index.interval):
+        if not f.readline():
+            break
+
+
+def _decode_line(raw: bytes) -> str:
+    """Decode a raw log line, dropping its line terminator."""
+    return raw.decode("utf-8", errors="replace").rstrip("\n\r")
+
+
 def count_log_lines(job_id: str) -> int:
     """Count total lines in a job's log file.
 
+    Uses the line-offset index, so only lines written since the last index
+    entry are counted.
+
     Args:
         job_id: The job UUID.
 
@@ -127,8 +299,8 @@ def count_log_lines(job_id: str) -> int:
         return 0
 
     try:
-        with log_path.open("r", encoding="utf-8", errors="replace") as f:
-            return sum(1 for _ in f)
+        with log_path.open("rb") as f:
+            return _load_line_index(log_path, f).total
     except OSError:
         # File may be locked or inaccessible
         return 0
@@ -138,17 +310,20 @@ def read_log_tail(
     job_id: str,
     lines: int = DEFAULT_LOG_LINES,
     offset: int = 0,
+    tail: bool = False,
 ) -> tuple[list[str], int, bool]:
     """Read log lines from a job's log file.
 
-    Reads lines starting from the given offset. Uses memory-efficient
-    line-by-line iteration for large files. Supports both uncompressed
-    (.log) and compressed (.log.gz) files.
+    Reads lines starting from the given offset, seeking to it through the
+    line-offset index. Supports both uncompressed (.log) and compressed
+    (.log.gz) files; compressed files are streamed, as gzip cannot seek.
 
     Args:
         job_id: The job UUID.
         lines: Maximum number of lines to return (default 500).
         offset: Number of lines to skip from the beginning (default 0).
+        tail: If True, return the last ``lines`` lines and ignore offset.
+            The starting line is ``total - len(lines)``.
 
     Returns:
         Tuple of:
@@ -168,62 +343,99 @@ def read_log_tail(
     # Check for compressed version first, then uncompressed
     gz_path = log_path.with_suffix(".log.gz")
     if gz_path.exists():
-        return _read_compressed_log(gz_path, lines, offset)
+        return _read_compressed_log(gz_path, lines, offset, tail)
 
     if not log_path.exists():
         return [], 0, False
 
     try:
-        file_size = log_path.stat().st_size
+        with log_path.open("rb") as f:
+            index = _load_line_index(log_path, f)
+            total = index.total
+            if tail:
+                offset = max(0, total - lines)
+            _seek_line(f, index, offset)
+            # Stop at the indexed size so a concurrent append cannot make
+            # the page disagree with the total
+            remaining = index.size - f.tell()
+            chunk: list[str] = []
+            while len(chunk) < lines and remaining > 0:
+                raw = f.readline(remaining)
+                if not raw:
+                    break
+                remaining -= len(raw)
+                chunk.append(_decode_line(raw))
     except OSError:
+        # File may be locked or inaccessible
         return [], 0, False
 
-    try:
-        # For small files, read all at once (faster)
-        if file_size <= MAX_LOG_SIZE_BYTES:
-            with log_path.open("r", encoding="utf-8", errors="replace") as f:
-                all_lines = f.read().splitlines()
+    has_more = offset + len(chunk) < total
+    return chunk, total, has_more
 
-            total = len(all_lines)
-            chunk = all_lines[offset : offset + lines]
-            has_more = offset + lines < total
-            return chunk, total, has_more
 
-        # For large files, use memory-efficient iteration
-        return _read_log_tail_streaming(log_path, lines, offset)
+def get_log_end_position(job_id: str, lines: int = 0) -> int | None:
+    """Get the byte position to start following a job's log from.
 
+    Args:
+        job_id: The job UUID.
+        lines: Number of complete lines before the end to start at, so a
+            follower first receives the most recent lines (default 0).
+
+    Returns:
+        Byte offset for read_log_from, or None if there is no uncompressed
+        log file (not created yet, compressed or invalid job ID).
+    """
+    try:
+        log_path = get_log_path(job_id)
+    except ValueError:
+        return None
+
+    try:
+        with log_path.open("rb") as f:
+            index = _load_line_index(log_path, f)
+            _seek_line(f, index, max(0, index.newlines - lines))
+            return f.tell()
     except OSError:
-        # File may be locked or inaccessible
-        return [], 0, False
+        return None
 
 
-def _read_log_tail_streaming(
-    log_path: Path,
-    lines: int,
-    offset: int,
-) -> tuple[list[str], int, bool]:
-    """Read log lines using memory-efficient streaming for large files.
+def read_log_from(
+    job_id: str, position: int, max_bytes: int = FOLLOW_MAX_BYTES
+) -> tuple[list[str], int]:
+    """Read complete lines appended to a job's log since a byte position.
+
+    Only newline-terminated lines are returned; an unterminated last line
+    is left for the next call. A single line longer than max_bytes is
+    returned in max_bytes pieces.
 
     Args:
-        log_path: Path to the log file.
-        lines: Maximum number of lines to return.
-        offset: Number of lines to skip from the beginning.
+        job_id: The job UUID.
+        position: Byte offset returned by get_log_end_position or a
+            previous call.
+        max_bytes: Maximum bytes to read in this call.
 
     Returns:
-        Tuple of (lines, total, has_more).
-    """
-    with log_path.open("r", encoding="utf-8", errors="replace") as f:
-        # Count total lines first (memory-efficient generator)
-        total = sum(1 for _ in f)
-
-        # Seek back to beginning
-        f.seek(0)
-
-        # Skip to offset and read requested lines
-        chunk = [line.rstrip("\n\r") for line in islice(f, offset, offset + lines)]
+        Tuple of (lines, new position). The position is unchanged if
+        nothing new was written.
 
-    has_more = offset + len(chunk) < total
-    return chunk, total, has_more
+    Raises:
+        ValueError: If job_id is not a valid UUID format.
+        FileNotFoundError: If the uncompressed log no longer exists.
+    """
+    log_path = get_log_path(job_id)
+    with log_path.open("rb") as f:
+        f.seek(position)
+        data = f.read(max_bytes)
+
+    end = data.rfind(b"\n") + 1
+    if end == 0:
+        if len(data) < max_bytes:
+            return [], position
+        end = len(data)
+    raw_lines = data[:end].split(b"\n")
+    if not raw_lines[-1]:
+        raw_lines.pop()
+    return [_decode_line(raw) for raw in raw_lines], position + end
 
 
 def log_file_exists(job_id: str) -> bool:
@@ -249,7 +461,8 @@ class JobLogWriter:
     """Context manager for writing job execution logs.
 
     Thread-safe log writer that buffers writes and flushes periodically.
-    Uses context manager pattern for automatic cleanup.
+    Uses context manager pattern for automatic cleanup. Every flush also
+    appends to the log's sidecar line-offset index.
 
     Example:
         with JobLogWriter(job_id) as log:
@@ -259,12 +472,19 @@ class JobLogWriter:
             log.write_footer(success=True)
     """
 
-    def __init__(self, job_id: str, buffer_size: int = 100) -> None:
+    def __init__(
+        self,
+        job_id: str,
+        buffer_size: int = 100,
+        index_interval: int = LOG_INDEX_INTERVAL,
+    ) -> None:
         """Initialize log writer.
 
         Args:
             job_id: The job UUID.
             buffer_size: Number of lines to buffer before flushing.
+            index_interval: Lines between line-offset index entries for a
+                new log (an existing log keeps its index interval).
 
         Raises:
             ValueError: If job_id is not a valid UUID format.
@@ -274,15 +494,27 @@ class JobLogWriter:
         self.buffer_size = buffer_size
         self._buffer: list[str] = []
         self._lock = threading.Lock()
-        self._file_handle: open | None = None
+        self._file_handle: IO[bytes] | None = None
+        self._index_handle: IO[bytes] | None = None
+        self._index: _LineIndex | None = None
+        self._index_interval = index_interval
         self._log_path: Path | None = None
         self._closed = False
 
     def __enter__(self) -> JobLogWriter:
-        """Open log file for writing."""
+        """Open log file (and its line-offset index) for writing."""
         ensure_log_directory()
         self._log_path = get_log_path(self.job_id)
-        self._file_handle = self._log_path.open("a", encoding="utf-8")
+        self._file_handle = self._log_path.open("ab")
+        try:
+            with self._log_path.open("rb") as f:
+                # Also creates the sidecar, which marks the log as indexed
+                self._index = _load_line_index(self._log_path, f, self._index_interval)
+            self._index_handle = get_log_index_path(self._log_path).open("ab")
+        except OSError as e:
+            # The log itself is still written; readers rebuild the index
+            logger.warning("Cannot index job log %s: %s", self.job_id, e)
+            self._index = None
         return self
 
     def __exit__(
@@ -310,14 +542,44 @@ class JobLogWriter:
             if self._file_handle:
                 self._file_handle.close()
                 self._file_handle = None
+            if self._index_handle:
+                self._index_handle.close()
+                self._index_handle = None
             self._closed = True
 
     def _flush_unlocked(self) -> None:
         """Flush buffer to file. Must be called with lock held."""
         if self._buffer and self._file_handle:
-            self._file_handle.write("\n".join(self._buffer) + "\n")
+            data = ("\n".join(self._buffer) + "\n").encode("utf-8", "replace")
+            self._file_handle.write(data)
             self._file_handle.flush()
             self._buffer.clear()
+            self._index_unlocked(data)
+
+    def _index_unlocked(self, data: bytes) -> None:
+        """Append index entries for newly written data.
+
+        Entries are written after the data they point to has been flushed,
+        so a reader never sees an offset beyond the end of the log.
+        """
+        index = self._index
+        if index is None or self._index_handle is None:
+            return
+        entries = []
+        found = data.find(b"\n")
+        while found != -1:
+            index.newlines += 1
+            if index.newlines % index.interval == 0:
+                entries.append(_INDEX_ENTRY.pack(index.size + found + 1))
+            found = data.find(b"\n", found + 1)
+        index.size += len(data)
+        if entries:
+            try:
+                self._index_handle.write(b"".join(entries))
+                self._index_handle.flush()
+            except OSError as e:
+                logger.warning("Cannot index job log %s: %s", self.job_id, e)
+                self._index = None
 
     def flush(self) -> None:
         """Flush buffered lines to disk."""
@@ -541,8 +803,8 @@ def compress_old_logs(
 ) -> LogMaintenanceStats:
     """Compress log files older than the specified number of days.
 
-    Compresses .log files to .log.gz using gzip. The original file is
-    removed after successful compression.
+    Compresses .log files to .log.gz using gzip. The original file and its
+    line-offset index are removed after successful compression.
 
     Args:
         older_than_days: Compress logs older than this many days.
@@ -587,8 +849,9 @@ def compress_old_logs(
             # Preserve modification time
             os.utime(gz_path, (mtime, mtime))
 
-            # Remove original
+            # Remove original (offsets into it are useless for the .gz)
             path.unlink()
+            get_log_index_path(path).unlink(missing_ok=True)
 
             stats.compressed_bytes_after += gz_path.stat().st_size
             stats.compressed_count += 1
@@ -606,7 +869,8 @@ def compress_old_logs(
 def delete_old_logs(older_than_days: int, dry_run: bool = False) -> LogMaintenanceStats:
     """Delete log files older than the specified number of days.
 
-    Deletes both .log and .log.gz files that are older than the threshold.
+    Deletes both .log and .log.gz files that are older than the threshold,
+    along with the line-offset index of deleted .log files.
 
     Args:
         older_than_days: Delete logs older than this many days.
@@ -643,6 +907,8 @@ def delete_old_logs(older_than_days: int, dry_run: bool = False) -> LogMaintenan
 
             if not dry_run:
                 path.unlink()
+                if path.suffix == ".log":
+                    get_log_index_path(path).unlink(missing_ok=True)
                 logger.debug("Deleted log: %s", path.name)
 
         except OSError as e:
@@ -683,24 +949,40 @@ def _read_compressed_log(
     gz_path: Path,
     lines: int,
     offset: int,
+    tail: bool = False,
 ) -> tuple[list[str], int, bool]:
     """Read lines from a compressed log file.
 
+    gzip streams cannot seek, so the file is decompressed sequentially, but
+    only the requested lines are kept in memory.
+
     Args:
         gz_path: Path to the .log.gz file.
         lines: Maximum number of lines to return.
         offset: Number of lines to skip from the beginning.
+        tail: If True, return the last ``lines`` lines and ignore offset.
 
     Returns:
         Tuple of (lines, total, has_more).
     """
     try:
-        with gzip.open(gz_path, "rt", encoding="utf-8", errors="replace") as f:
-            all_lines = f.read().splitlines()
-
-        total = len(all_lines)
-        chunk = all_lines[offset : offset + lines]
-        has_more = offset + lines < total
-        return chunk, total, has_more
-    except (OSError, gzip.BadGzipFile):
+        with gzip.open(gz_path, "rb") as f:
+            total = 0
+            if tail:
+                kept: deque[bytes] = deque(maxlen=lines)
+                for raw in f:
+                    kept.append(raw)
+                    total += 1
+                chunk = [_decode_line(raw) for raw in kept]
+                offset = total - len(chunk)
+            else:
+                chunk = []
+                for raw in f:
+                    if offset <= total < offset + lines:
+                        chunk.append(_decode_line(raw))
+                    total += 1
+    except (OSError, EOFError, gzip.BadGzipFile):
         return [], 0, False
+
+    has_more = offset + len(chunk) < total
+    return chunk, total, has_more
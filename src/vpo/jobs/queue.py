@@ -1,21 +1,51 @@
 """Job queue operations for Video Policy Orchestrator.
 
 This module provides queue operations with SQLite-based job management:
-- Atomic job claiming with BEGIN IMMEDIATE transactions
-- Priority-based ordering
-- Stale job recovery for orphaned workers
+- Atomic job claiming with a single UPDATE ... RETURNING statement
+- Batch leasing: a worker can reserve several queued jobs at once
+- Priority-based ordering served by a partial index on queued jobs
+- Lease renewal with the heartbeat and stale job recovery for orphaned workers
+- Coalescing of duplicate submissions at enqueue time
+- Resource-class slots limiting running jobs per class across workers
+
+Leases:
+    A claimed or leased job carries lease_owner ("host:pid") and
+    lease_expires_at. Leased jobs stay QUEUED until start_leased_job moves
+    them to RUNNING, so they can still be cancelled; once a lease expires
+    any worker may claim the job again. Heartbeats extend the lease of the
+    running job and of the worker's remaining leased jobs.
+
+Coalescing:
+    Jobs for the same file, job type and policy are equivalent. A unique
+    partial index (idx_jobs_queued_unique) allows one queued job per key;
+    enqueue_job merges later submissions into it and counts them in
+    coalesced_count.
+
+Slots:
+    enqueue_job records each job's resource class (vpo.jobs.resources).
+    Claim functions accept per-class slot limits and skip queued jobs whose
+    class already has that many RUNNING jobs, so lighter jobs are claimed
+    around saturated classes. The running count is taken in the claiming
+    statement itself, under the write lock.
 """
 
 import logging
 import os
+import socket
 import sqlite3
+from collections.abc import Collection, Mapping
+from dataclasses import dataclass, replace
 from datetime import datetime, timedelta, timezone
 
 from vpo.db import (
     Job,
     JobStatus,
-    get_job,
+    JobType,
+    ResourceClass,
+    insert_job,
 )
+from vpo.db.queries.helpers import _escape_like_pattern, _row_to_job
+from vpo.jobs.resources import classify_job
 
 logger = logging.getLogger(__name__)
 
@@ -23,66 +53,170 @@ logger = logging.getLogger(__name__)
 # are considered stale and will be recovered
 DEFAULT_HEARTBEAT_TIMEOUT = 300  # 5 minutes
 
+# Default lease duration (seconds) - renewed by every heartbeat
+DEFAULT_LEASE_SECONDS = DEFAULT_HEARTBEAT_TIMEOUT
+
+# Columns returned by claim statements, matching get_job
+_JOB_COLUMNS = """
+    id, file_id, file_path, job_type, status, priority,
+    policy_name, policy_json, progress_percent, progress_json,
+    created_at, started_at, completed_at,
+    worker_pid, worker_heartbeat,
+    output_path, backup_path, error_message,
+    files_affected_json, summary_json, log_path,
+    origin, batch_id, resource_class
+"""
+
+
+# Matches a queued job equivalent to the outer jobs row (same key as
+# idx_jobs_queued_unique)
+_QUEUED_TWIN = """
+    EXISTS (
+        SELECT 1 FROM jobs AS twin
+        WHERE twin.status = 'queued'
+            AND twin.file_id = jobs.file_id
+            AND twin.job_type = jobs.job_type
+            AND IFNULL(twin.policy_name, '') = IFNULL(jobs.policy_name, '')
+    )
+"""
+
+
+@dataclass(frozen=True)
+class EnqueueResult:
+    """Outcome of enqueue_job."""
+
+    job_id: str
+    """ID of the job that will do the work (the new job or an existing one)."""
+
+    coalesced: bool
+    """True if the submission was merged into an existing job."""
 
-def claim_next_job(
-    conn: sqlite3.Connection,
-    worker_pid: int | None = None,
-) -> Job | None:
-    """Atomically claim the next available job from the queue.
 
-    Uses BEGIN IMMEDIATE to prevent race conditions when multiple
-    workers attempt to claim jobs simultaneously.
+def _lease_host(lease_owner: str) -> str:
+    """Return the host part of a lease owner ("host:pid" -> "host")."""
+    return lease_owner.rsplit(":", 1)[0]
+
+
+def _slot_filter(
+    slots: Mapping[ResourceClass, int] | None, lease_owner: str | None
+) -> tuple[str, tuple]:
+    """Build a condition excluding jobs whose resource class is saturated.
+
+    Slots are a host's resources, so only running jobs leased by the same
+    host as lease_owner count against them; every local or remote worker
+    host has its own slots. The subquery counts them per class through the
+    partial index idx_jobs_running_class; it is uncorrelated, so SQLite
+    evaluates it once per statement. Unclassified jobs are never held back.
 
     Args:
-        conn: Database connection.
-        worker_pid: Worker process ID (defaults to current PID).
+        slots: Running-job limit per class; missing classes or 0 mean
+            unlimited.
+        lease_owner: Lease owner of the claiming worker (defaults to
+            default_lease_owner()).
 
     Returns:
-        The claimed Job, or None if queue is empty.
+        Tuple of (SQL condition starting with AND, or "", parameters).
     """
-    if worker_pid is None:
-        worker_pid = os.getpid()
+    limits = [(rc.value, n) for rc, n in (slots or {}).items() if n > 0]
+    if not limits:
+        return "", ()
+    host = _lease_host(lease_owner or default_lease_owner())
+    cases = " ".join("WHEN ? THEN ?" for _ in limits)
+    sql = f"""
+        AND (resource_class IS NULL OR resource_class NOT IN (
+            SELECT running.resource_class
+            FROM jobs AS running INDEXED BY idx_jobs_running_class
+            WHERE running.status = 'running'
+                AND running.resource_class IS NOT NULL
+                AND (running.lease_owner = ?
+                     OR running.lease_owner LIKE ? ESCAPE '\\')
+            GROUP BY running.resource_class
+            HAVING COUNT(*) >= CASE running.resource_class {cases} END
+        ))
+    """
+    return sql, (
+        host,
+        _escape_like_pattern(host) + ":%",
+        *(value for limit in limits for value in limit),
+    )
 
-    now = datetime.now(timezone.utc).isoformat()
 
-    # Use BEGIN IMMEDIATE for exclusive write lock
-    try:
-        conn.execute("BEGIN IMMEDIATE")
+def _next_queued_ids(
+    now: str,
+    limit: int,
+    job_types: Collection[JobType] | None = None,
+    slots: Mapping[ResourceClass, int] | None = None,
+    job_ids: Collection[str] | None = None,
+    lease_owner: str | None = None,
+) -> tuple[str, tuple]:
+    """Build the subquery selecting the next claimable queued job IDs.
 
-        # Find highest priority queued job
-        cursor = conn.execute(
-            """
-            SELECT id FROM jobs
-            WHERE status = 'queued'
-            ORDER BY priority ASC, created_at ASC
-            LIMIT 1
-            """
-        )
-        row = cursor.fetchone()
+    It walks the partial index idx_jobs_queue in priority order, so the cost
+    does not grow with the number of finished jobs in the table. INDEXED BY
+    pins the plan: without ANALYZE statistics the planner prefers
+    idx_jobs_status plus a sort of every queued row.
 
-        if row is None:
-            conn.execute("ROLLBACK")
-            return None
+    Returns:
+        Tuple of (SQL, parameters).
+    """
+    params: list = [now]
+    type_filter = ""
+    if job_types:
+        types = sorted({JobType(t).value for t in job_types})
+        type_filter = f"AND job_type IN ({', '.join('?' * len(types))})"
+        params.extend(types)
+    slot_filter, slot_params = _slot_filter(slots, lease_owner)
+    params.extend(slot_params)
+    id_filter = ""
+    if job_ids is not None:
+        id_filter = f"AND id IN ({', '.join('?' * len(job_ids))})"
+        params.extend(job_ids)
+    params.append(limit)
+    sql = f"""
+        SELECT id FROM jobs INDEXED BY idx_jobs_queue
+        WHERE status = 'queued'
+            AND (lease_expires_at IS NULL OR lease_expires_at <= ?)
+            {type_filter}
+            {slot_filter}
+            {id_filter}
+        ORDER BY priority ASC, created_at ASC
+        LIMIT ?
+    """
+    return sql, tuple(params)
 
-        job_id = row[0]
 
-        # Claim the job atomically
-        conn.execute(
-            """
-            UPDATE jobs
-            SET status = 'running',
-                started_at = ?,
-                worker_pid = ?,
-                worker_heartbeat = ?
-            WHERE id = ? AND status = 'queued'
-            """,
-            (now, worker_pid, now, job_id),
-        )
+def default_lease_owner() -> str:
+    """Return the lease owner identifier for this process ("host:pid")."""
+    return f"{socket.gethostname()}:{os.getpid()}"
 
-        conn.execute("COMMIT")
 
-        # Return the claimed job
-        return get_job(conn, job_id)
+def _lease_expiry(now: datetime, lease_seconds: int) -> str:
+    return (now + timedelta(seconds=lease_seconds)).isoformat()
+
+
+def _sort_claimed(rows: list[sqlite3.Row]) -> list[Job]:
+    """Convert RETURNING rows (unordered) to Jobs in claim order."""
+    jobs = [_row_to_job(row) for row in rows]
+    jobs.sort(key=lambda job: (job.priority, job.created_at))
+    return jobs
+
+
+def _execute_claim(
+    conn: sqlite3.Connection,
+    sql: str,
+    params: tuple,
+    action: str,
+) -> list[sqlite3.Row] | None:
+    """Run a claim statement under BEGIN IMMEDIATE and commit.
+
+    The write lock is held for a single statement. Returns the RETURNING
+    rows, or None on lock contention so the caller can retry.
+    """
+    try:
+        conn.execute("BEGIN IMMEDIATE")
+        rows = conn.execute(sql, params).fetchall()
+        conn.execute("COMMIT")
+        return rows
 
     except sqlite3.OperationalError as e:
         try:
@@ -92,26 +226,290 @@ def claim_next_job(
         error_msg = str(e).casefold()
         # Distinguish lock contention from other errors
         if "locked" in error_msg or "busy" in error_msg:
-            logger.warning("Lock contention while claiming job: %s", e)
+            logger.warning("Lock contention while %s: %s", action, e)
             return None  # Caller can retry
-        logger.error("Database operational error while claiming job: %s", e)
+        logger.error("Database operational error while %s: %s", action, e)
         raise
     except sqlite3.IntegrityError as e:
         try:
             conn.execute("ROLLBACK")
         except sqlite3.Error:
             pass
-        logger.error("Database integrity error while claiming job: %s", e)
+        logger.error("Database integrity error while %s: %s", action, e)
         raise
     except sqlite3.DatabaseError as e:
         try:
             conn.execute("ROLLBACK")
         except sqlite3.Error:
             pass
-        logger.error("Database error while claiming job: %s", e)
+        logger.error("Database error while %s: %s", action, e)
         raise
 
 
+def claim_next_job(
+    conn: sqlite3.Connection,
+    worker_pid: int | None = None,
+    lease_owner: str | None = None,
+    lease_seconds: int = DEFAULT_LEASE_SECONDS,
+    job_types: Collection[JobType] | None = None,
+    slots: Mapping[ResourceClass, int] | None = None,
+    job_ids: Collection[str] | None = None,
+) -> Job | None:
+    """Atomically claim the next available job from the queue.
+
+    Selects, marks RUNNING and returns the job in one UPDATE ... RETURNING
+    statement under BEGIN IMMEDIATE, so concurrent workers never claim the
+    same job and the write lock is held only for that statement.
+
+    Args:
+        conn: Database connection.
+        worker_pid: Worker process ID (defaults to current PID).
+        lease_owner: Lease owner (defaults to default_lease_owner()).
+        lease_seconds: Lease duration; renewed by update_heartbeat.
+        job_types: Only claim jobs of these types (None = any type).
+        slots: Running-job limit per resource class on the lease owner's
+            host (None = unlimited).
+        job_ids: Only claim one of these jobs (None = any job), e.g. the
+            jobs that fit a worker's time window.
+
+    Returns:
+        The claimed Job, or None if queue is empty.
+    """
+    if job_ids is not None and not job_ids:
+        return None
+    if worker_pid is None:
+        worker_pid = os.getpid()
+    if lease_owner is None:
+        lease_owner = default_lease_owner()
+
+    now = datetime.now(timezone.utc)
+    now_iso = now.isoformat()
+    next_ids, next_params = _next_queued_ids(
+        now_iso, 1, job_types, slots, job_ids, lease_owner
+    )
+
+    rows = _execute_claim(
+        conn,
+        f"""
+        UPDATE jobs
+        SET status = 'running',
+            started_at = ?,
+            worker_pid = ?,
+            worker_heartbeat = ?,
+            lease_owner = ?,
+            lease_expires_at = ?
+        WHERE id = ({next_ids})
+        RETURNING {_JOB_COLUMNS}
+        """,
+        (
+            now_iso,
+            worker_pid,
+            now_iso,
+            lease_owner,
+            _lease_expiry(now, lease_seconds),
+            *next_params,
+        ),
+        "claiming job",
+    )
+    if not rows:
+        return None
+    return _row_to_job(rows[0])
+
+
+def lease_jobs(
+    conn: sqlite3.Connection,
+    limit: int,
+    lease_owner: str | None = None,
+    lease_seconds: int = DEFAULT_LEASE_SECONDS,
+    job_types: Collection[JobType] | None = None,
+    slots: Mapping[ResourceClass, int] | None = None,
+    job_ids: Collection[str] | None = None,
+) -> list[Job]:
+    """Lease up to limit queued jobs for one worker in a single statement.
+
+    Leased jobs stay QUEUED (and cancellable) but are skipped by other
+    workers until the lease expires. Start each one with start_leased_job
+    and hand back the rest with release_leases.
+
+    Args:
+        conn: Database connection.
+        limit: Maximum number of jobs to lease.
+        lease_owner: Lease owner (defaults to default_lease_owner()).
+        lease_seconds: Lease duration; renewed by update_heartbeat.
+        job_types: Only lease jobs of these types (None = any type).
+        slots: Running-job limit per resource class on the lease owner's
+            host (None = unlimited). Only classes with a free slot are
+            leased; start_leased_job checks the slot again.
+        job_ids: Only lease these jobs (None = any job).
+
+    Returns:
+        Leased jobs in priority order (empty if the queue is empty or the
+        database was busy).
+    """
+    if limit < 1 or (job_ids is not None and not job_ids):
+        return []
+    if lease_owner is None:
+        lease_owner = default_lease_owner()
+
+    now = datetime.now(timezone.utc)
+    next_ids, next_params = _next_queued_ids(
+        now.isoformat(), limit, job_types, slots, job_ids, lease_owner
+    )
+
+    rows = _execute_claim(
+        conn,
+        f"""
+        UPDATE jobs
+        SET lease_owner = ?, lease_expires_at = ?
+        WHERE id IN ({next_ids})
+        RETURNING {_JOB_COLUMNS}
+        """,
+        (lease_owner, _lease_expiry(now, lease_seconds), *next_params),
+        "leasing jobs",
+    )
+    return _sort_claimed(rows or [])
+
+
+def peek_queued_jobs(
+    conn: sqlite3.Connection,
+    limit: int,
+    job_types: Collection[JobType] | None = None,
+    slots: Mapping[ResourceClass, int] | None = None,
+    lease_owner: str | None = None,
+) -> list[Job]:
+    """Return the next claimable queued jobs without claiming them.
+
+    Lets a worker choose among the jobs it would claim next (see
+    claim_next_job's job_ids).
+
+    Args:
+        conn: Database connection.
+        limit: Maximum number of jobs to return.
+        job_types: Only return jobs of these types (None = any type).
+        slots: Running-job limit per resource class (None = unlimited).
+        lease_owner: Worker whose host's slots apply (defaults to
+            default_lease_owner()).
+
+    Returns:
+        Jobs in claim order.
+    """
+    next_ids, next_params = _next_queued_ids(
+        datetime.now(timezone.utc).isoformat(),
+        limit,
+        job_types,
+        slots,
+        lease_owner=lease_owner,
+    )
+    rows = conn.execute(
+        f"""
+        SELECT {_JOB_COLUMNS} FROM jobs
+        WHERE id IN ({next_ids})
+        """,
+        next_params,
+    ).fetchall()
+    return _sort_claimed(rows)
+
+
+def start_leased_job(
+    conn: sqlite3.Connection,
+    job_id: str,
+    lease_owner: str | None = None,
+    worker_pid: int | None = None,
+    lease_seconds: int = DEFAULT_LEASE_SECONDS,
+    slots: Mapping[ResourceClass, int] | None = None,
+) -> Job | None:
+    """Move a job leased by lease_jobs to RUNNING.
+
+    Args:
+        conn: Database connection.
+        job_id: Job UUID.
+        lease_owner: Lease owner (defaults to default_lease_owner()).
+        worker_pid: Worker process ID (defaults to current PID).
+        lease_seconds: Lease duration; renewed by update_heartbeat.
+        slots: Running-job limit per resource class on the lease owner's
+            host (None = unlimited).
+
+    Returns:
+        The started Job, or None if the job was cancelled, its lease was
+        taken over by another worker, its resource class has no free slot,
+        or the database was busy.
+    """
+    if worker_pid is None:
+        worker_pid = os.getpid()
+    if lease_owner is None:
+        lease_owner = default_lease_owner()
+
+    now = datetime.now(timezone.utc)
+    now_iso = now.isoformat()
+    slot_filter, slot_params = _slot_filter(slots, lease_owner)
+
+    rows = _execute_claim(
+        conn,
+        f"""
+        UPDATE jobs
+        SET status = 'running',
+            started_at = ?,
+            worker_pid = ?,
+            worker_heartbeat = ?,
+            lease_expires_at = ?
+        WHERE id = ? AND status = 'queued' AND lease_owner = ?
+            {slot_filter}
+        RETURNING {_JOB_COLUMNS}
+        """,
+        (
+            now_iso,
+            worker_pid,
+            now_iso,
+            _lease_expiry(now, lease_seconds),
+            job_id,
+            lease_owner,
+            *slot_params,
+        ),
+        "starting leased job",
+    )
+    if not rows:
+        return None
+    return _row_to_job(rows[0])
+
+
+def release_leases(
+    conn: sqlite3.Connection,
+    lease_owner: str | None = None,
+    job_ids: Collection[str] | None = None,
+) -> int:
+    """Return a worker's leased but unstarted jobs to the queue.
+
+    Args:
+        conn: Database connection.
+        lease_owner: Lease owner (defaults to default_lease_owner()).
+        job_ids: Only release these jobs (None = all of the owner's leases).
+
+    Returns:
+        Number of leases released.
+    """
+    if lease_owner is None:
+        lease_owner = default_lease_owner()
+
+    id_filter = ""
+    params: list = [lease_owner]
+    if job_ids is not None:
+        if not job_ids:
+            return 0
+        id_filter = f"AND id IN ({', '.join('?' * len(job_ids))})"
+        params.extend(job_ids)
+
+    cursor = conn.execute(
+        f"""
+        UPDATE jobs
+        SET lease_owner = NULL, lease_expires_at = NULL
+        WHERE status = 'queued' AND lease_owner = ? {id_filter}
+        """,
+        params,
+    )
+    conn.commit()
+    return cursor.rowcount
+
+
 def release_job(
     conn: sqlite3.Connection,
     job_id: str,
@@ -121,10 +519,11 @@ def release_job(
     backup_path: str | None = None,
     summary_json: str | None = None,
     set_progress_100: bool = False,
+    lease_owner: str | None = None,
 ) -> bool:
     """Release a job after processing.
 
-    Updates job status and clears worker info.
+    Updates job status and clears worker and lease info.
 
     Args:
         conn: Database connection.
@@ -135,9 +534,12 @@ def release_job(
         backup_path: Path to backup file if created.
         summary_json: Optional JSON summary data (phases_completed, total_changes, etc).
         set_progress_100: If True, set progress_percent to 100.0.
+        lease_owner: If given, only release the job while it is RUNNING
+            under this owner's lease.
 
     Returns:
-        True if job was released, False if not found.
+        True if job was released, False if not found (or not held by
+        lease_owner).
     """
     now = datetime.now(timezone.utc).isoformat()
 
@@ -154,8 +556,11 @@ def release_job(
             summary_json = ?,
             progress_percent = CASE WHEN ? THEN 100.0 ELSE progress_percent END,
             worker_pid = NULL,
-            worker_heartbeat = NULL
+            worker_heartbeat = NULL,
+            lease_owner = NULL,
+            lease_expires_at = NULL
         WHERE id = ?
+            AND (? IS NULL OR (status = 'running' AND lease_owner = ?))
         """,
         (
             status.value,
@@ -166,6 +571,8 @@ def release_job(
             summary_json,
             set_progress_100,
             job_id,
+            lease_owner,
+            lease_owner,
         ),
     )
     conn.commit()
@@ -180,34 +587,76 @@ def update_heartbeat(
     conn: sqlite3.Connection,
     job_id: str,
     worker_pid: int | None = None,
+    lease_owner: str | None = None,
+    lease_seconds: int = DEFAULT_LEASE_SECONDS,
 ) -> bool:
-    """Update job heartbeat timestamp.
+    """Update job heartbeat timestamp and renew its lease.
 
     Should be called periodically by workers to indicate they're still alive.
+    When lease_owner is given, the job must still be held by that owner, and
+    the leases of the owner's queued jobs (see lease_jobs) are renewed in
+    the same transaction.
 
     Args:
         conn: Database connection.
         job_id: Job UUID.
         worker_pid: Worker process ID (optional).
+        lease_owner: Expected lease owner, whose leased queued jobs are
+            renewed too.
+        lease_seconds: New lease duration from now.
 
     Returns:
-        True if heartbeat updated, False if job not found.
+        True if heartbeat updated, False if job not found (or its lease was
+        taken over by another worker).
     """
     if worker_pid is None:
         worker_pid = os.getpid()
 
-    now = datetime.now(timezone.utc).isoformat()
+    now = datetime.now(timezone.utc)
+    now_iso = now.isoformat()
+    expires_at = _lease_expiry(now, lease_seconds)
 
     cursor = conn.execute(
         """
         UPDATE jobs
-        SET worker_heartbeat = ?, worker_pid = ?
-        WHERE id = ? AND status = 'running'
+        SET worker_heartbeat = ?, worker_pid = ?, lease_expires_at = ?
+        WHERE id = ? AND status = 'running' AND (? IS NULL OR lease_owner = ?)
         """,
-        (now, worker_pid, job_id),
+        (now_iso, worker_pid, expires_at, job_id, lease_owner, lease_owner),
     )
+    updated = cursor.rowcount > 0
+    if lease_owner is not None:
+        conn.execute(
+            """
+            UPDATE jobs
+            SET lease_expires_at = ?
+            WHERE status = 'queued' AND lease_owner = ?
+            """,
+            (expires_at, lease_owner),
+        )
     conn.commit()
-    return cursor.rowcount > 0
+    return updated
+
+
+def holds_lease(conn: sqlite3.Connection, job_id: str, lease_owner: str) -> bool:
+    """Check whether a job is RUNNING under the given owner's lease.
+
+    Args:
+        conn: Database connection.
+        job_id: Job UUID.
+        lease_owner: Expected lease owner.
+
+    Returns:
+        True if the owner still holds the running job.
+    """
+    row = conn.execute(
+        """
+        SELECT 1 FROM jobs
+        WHERE id = ? AND status = 'running' AND lease_owner = ?
+        """,
+        (job_id, lease_owner),
+    ).fetchone()
+    return row is not None
 
 
 def recover_stale_jobs(
@@ -216,8 +665,16 @@ def recover_stale_jobs(
 ) -> int:
     """Recover stale jobs from dead workers.
 
-    Jobs in RUNNING status with no heartbeat update within the timeout
-    are reset to QUEUED status so they can be picked up by other workers.
+    Jobs in RUNNING status whose lease has expired, or with no heartbeat
+    update within the timeout, are reset to QUEUED status so they can be
+    picked up by other workers. Only running rows are visited (through
+    idx_jobs_status). Expired leases on QUEUED jobs need no recovery;
+    they are claimable again as soon as they expire. A stale job with an
+    equivalent job already queued (see enqueue_job) is cancelled instead,
+    since the queued job supersedes it; of several equivalent stale jobs,
+    only the newest is requeued and the rest are cancelled. Recovered jobs
+    keep their workflow checkpoint, so they resume after their finished
+    phases.
 
     Args:
         conn: Database connection.
@@ -226,9 +683,54 @@ def recover_stale_jobs(
     Returns:
         Number of jobs recovered.
     """
-    cutoff = (
-        datetime.now(timezone.utc) - timedelta(seconds=timeout_seconds)
-    ).isoformat()
+    now = datetime.now(timezone.utc)
+    cutoff = (now - timedelta(seconds=timeout_seconds)).isoformat()
+
+    superseded = conn.execute(
+        f"""
+        UPDATE jobs
+        SET status = 'cancelled',
+            completed_at = ?,
+            error_message = 'Superseded by an equivalent queued job',
+            worker_pid = NULL,
+            worker_heartbeat = NULL,
+            lease_owner = NULL,
+            lease_expires_at = NULL
+        WHERE status = 'running'
+            AND (lease_expires_at < ? OR worker_heartbeat < ?)
+            AND {_QUEUED_TWIN}
+        """,
+        (now.isoformat(), now.isoformat(), cutoff),
+    ).rowcount
+
+    # Equivalent jobs may run side by side (a follow-up with new options,
+    # see enqueue_job), but only one of them can be queued again: keep the
+    # newest
+    superseded += conn.execute(
+        """
+        UPDATE jobs
+        SET status = 'cancelled',
+            completed_at = ?,
+            error_message = 'Superseded by a newer equivalent job',
+            worker_pid = NULL,
+            worker_heartbeat = NULL,
+            lease_owner = NULL,
+            lease_expires_at = NULL
+        WHERE status = 'running'
+            AND (lease_expires_at < ? OR worker_heartbeat < ?)
+            AND EXISTS (
+                SELECT 1 FROM jobs AS newer
+                WHERE newer.status = 'running'
+                    AND (newer.lease_expires_at < ? OR newer.worker_heartbeat < ?)
+                    AND newer.file_id = jobs.file_id
+                    AND newer.job_type = jobs.job_type
+                    AND IFNULL(newer.policy_name, '')
+                        = IFNULL(jobs.policy_name, '')
+                    AND (newer.created_at, newer.id) > (jobs.created_at, jobs.id)
+            )
+        """,
+        (now.isoformat(), now.isoformat(), cutoff, now.isoformat(), cutoff),
+    ).rowcount
 
     cursor = conn.execute(
         """
@@ -237,22 +739,117 @@ def recover_stale_jobs(
             started_at = NULL,
             worker_pid = NULL,
             worker_heartbeat = NULL,
+            lease_owner = NULL,
+            lease_expires_at = NULL,
             progress_percent = 0.0,
             progress_json = NULL
         WHERE status = 'running'
-            AND worker_heartbeat < ?
+            AND (lease_expires_at < ? OR worker_heartbeat < ?)
         """,
-        (cutoff,),
+        (now.isoformat(), cutoff),
     )
     conn.commit()
 
-    count = cursor.rowcount
+    count = cursor.rowcount + superseded
     if count > 0:
         logger.info("Recovered %d stale job(s)", count)
 
     return count
 
 
+def enqueue_job(conn: sqlite3.Connection, job: Job) -> EnqueueResult:
+    """Queue a job, coalescing it with an equivalent pending job.
+
+    A job for the same file_id, job_type and policy_name is equivalent:
+
+    - If one is QUEUED, the submission is merged into it: the job keeps
+      the better (lower) priority of the two and takes the submission's
+      policy_json, so it runs with the latest options.
+    - Otherwise, if one is RUNNING with the same policy_json, it already
+      does the submitted work and the submission is counted against it.
+    - Otherwise job is inserted as given.
+
+    Jobs without a file_id (scan, prune) are never coalesced. A job
+    without a resource class is classified with classify_job.
+
+    Args:
+        conn: Database connection.
+        job: QUEUED job to submit.
+
+    Returns:
+        EnqueueResult with the ID of the job that will do the work.
+
+    Note:
+        This function does NOT commit. Caller must manage transactions.
+    """
+    if job.resource_class is None:
+        job = replace(job, resource_class=classify_job(job))
+
+    if job.file_id is None:
+        insert_job(conn, job)
+        return EnqueueResult(job.id, coalesced=False)
+
+    key = (job.file_id, job.job_type.value, job.policy_name)
+    row = conn.execute(
+        """
+        UPDATE jobs SET coalesced_count = coalesced_count + 1
+        WHERE id = (
+            SELECT id FROM jobs
+            WHERE status = 'running' AND file_id = ? AND job_type = ?
+                AND IFNULL(policy_name, '') = IFNULL(?, '')
+                AND policy_json IS ?
+            LIMIT 1
+        )
+        RETURNING id
+        """,
+        (*key, job.policy_json),
+    ).fetchone()
+    if row is not None:
+        logger.info(
+            "Job for %s coalesced into running job %s", job.file_path, row[0][:8]
+        )
+        return EnqueueResult(row[0], coalesced=True)
+
+    # Insert, or merge into the queued job holding idx_jobs_queued_unique
+    row = conn.execute(
+        """
+        INSERT INTO jobs (
+            id, file_id, file_path, job_type, status, priority,
+            policy_name, policy_json, progress_percent, progress_json,
+            created_at, files_affected_json, origin, batch_id, resource_class
+        ) VALUES (?, ?, ?, ?, 'queued', ?, ?, ?, 0.0, NULL, ?, ?, ?, ?, ?)
+        ON CONFLICT (file_id, job_type, IFNULL(policy_name, ''))
+            WHERE status = 'queued' AND file_id IS NOT NULL
+        DO UPDATE SET
+            priority = MIN(priority, excluded.priority),
+            policy_json = excluded.policy_json,
+            resource_class = excluded.resource_class,
+            coalesced_count = coalesced_count + 1
+        RETURNING id
+        """,
+        (
+            job.id,
+            job.file_id,
+            job.file_path,
+            job.job_type.value,
+            job.priority,
+            job.policy_name,
+            job.policy_json,
+            job.created_at,
+            job.files_affected_json,
+            job.origin,
+            job.batch_id,
+            job.resource_class.value,
+        ),
+    ).fetchone()
+    coalesced = row[0] != job.id
+    if coalesced:
+        logger.info(
+            "Job for %s coalesced into queued job %s", job.file_path, row[0][:8]
+        )
+    return EnqueueResult(row[0], coalesced=coalesced)
+
+
 def get_queue_stats(conn: sqlite3.Connection) -> dict[str, int]:
     """Get queue statistics.
 
@@ -260,7 +857,8 @@ def get_queue_stats(conn: sqlite3.Connection) -> dict[str, int]:
         conn: Database connection.
 
     Returns:
-        Dictionary with counts per status.
+        Dictionary with counts per status, the total, and "coalesced": the
+        number of submissions merged into existing jobs (see enqueue_job).
     """
     cursor = conn.execute(
         """
@@ -285,9 +883,35 @@ def get_queue_stats(conn: sqlite3.Connection) -> dict[str, int]:
         stats[status] = count
         stats["total"] += count
 
+    row = conn.execute("SELECT SUM(coalesced_count) FROM jobs").fetchone()
+    stats["coalesced"] = row[0] or 0
+
     return stats
 
 
+def get_running_by_class(conn: sqlite3.Connection) -> dict[ResourceClass, int]:
+    """Count running jobs per resource class (slot usage).
+
+    Args:
+        conn: Database connection.
+
+    Returns:
+        Dictionary with a count for every ResourceClass.
+    """
+    counts = dict.fromkeys(ResourceClass, 0)
+    cursor = conn.execute(
+        """
+        SELECT resource_class, COUNT(*)
+        FROM jobs INDEXED BY idx_jobs_running_class
+        WHERE status = 'running' AND resource_class IS NOT NULL
+        GROUP BY resource_class
+        """
+    )
+    for value, count in cursor.fetchall():
+        counts[ResourceClass(value)] = count
+    return counts
+
+
 def get_job_health_metrics(conn: sqlite3.Connection) -> dict[str, int]:
     """Get job metrics for health endpoint.
 
@@ -347,7 +971,8 @@ def cancel_job(conn: sqlite3.Connection, job_id: str) -> bool:
     cursor = conn.execute(
         """
         UPDATE jobs
-        SET status = 'cancelled', completed_at = ?
+        SET status = 'cancelled', completed_at = ?,
+            lease_owner = NULL, lease_expires_at = NULL
         WHERE id = ? AND status = 'queued'
         """,
         (now, job_id),
@@ -359,17 +984,20 @@ def cancel_job(conn: sqlite3.Connection, job_id: str) -> bool:
 def requeue_job(conn: sqlite3.Connection, job_id: str) -> bool:
     """Requeue a failed or cancelled job.
 
-    Resets the job to queued status for retry.
+    Resets the job to queued status for retry, unless an equivalent job
+    is already queued (see enqueue_job). A retried job starts its workflow
+    over rather than resuming from its checkpoint.
 
     Args:
         conn: Database connection.
         job_id: Job UUID.
 
     Returns:
-        True if job was requeued, False if not found or not requeuable.
+        True if job was requeued, False if not found, not requeuable, or
+        an equivalent job is already queued.
     """
     cursor = conn.execute(
-        """
+        f"""
         UPDATE jobs
         SET status = 'queued',
             started_at = NULL,
@@ -377,9 +1005,13 @@ def requeue_job(conn: sqlite3.Connection, job_id: str) -> bool:
             error_message = NULL,
             worker_pid = NULL,
             worker_heartbeat = NULL,
+            lease_owner = NULL,
+            lease_expires_at = NULL,
             progress_percent = 0.0,
-            progress_json = NULL
+            progress_json = NULL,
+            checkpoint_json = NULL
         WHERE id = ? AND status IN ('failed', 'cancelled')
+            AND NOT {_QUEUED_TWIN}
         """,
         (job_id,),
     )
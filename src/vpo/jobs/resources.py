@@ -0,0 +1,112 @@
+"""Resource classes for job scheduling.
+
+Every queued job is annotated at enqueue time with the resource it mainly
+consumes (see ResourceClass):
+
+- metadata: in-place header edits and database-only work
+- io: remux, copy and move; bound by disk throughput
+- cpu: video encodes
+- transcription: speech-to-text analysis
+
+Workers claim a job only while its class has a free slot. A slot limit caps
+the RUNNING jobs of a class across the workers of one host (local workers,
+or the workers of a remote broker host), so with a few workers one runs
+the encode and the others keep draining cheap jobs instead of all queueing
+behind heavy ones. Each host has its own slots, so adding hosts adds
+encode capacity.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import TYPE_CHECKING
+
+from vpo.db import Job, JobType, ResourceClass
+
+if TYPE_CHECKING:
+    from vpo.config.models import JobsConfig
+
+# Plan actions (PlannedAction.action_type) that rewrite the container
+_REMUX_ACTIONS = frozenset({"reorder", "move"})
+
+
+def resource_slots(config: JobsConfig) -> dict[ResourceClass, int]:
+    """Return the running-job limit of each resource class.
+
+    Args:
+        config: Jobs configuration.
+
+    Returns:
+        Mapping of class to limit (0 = unlimited).
+    """
+    return {
+        ResourceClass.METADATA: config.metadata_slots,
+        ResourceClass.IO: config.io_slots,
+        ResourceClass.CPU: config.cpu_slots,
+        ResourceClass.TRANSCRIPTION: config.transcription_slots,
+    }
+
+
+def _policy_data(job: Job) -> object:
+    if not job.policy_json:
+        return None
+    try:
+        return json.loads(job.policy_json)
+    except ValueError:
+        return None
+
+
+def _contains_key(data: object, keys: frozenset[str]) -> bool:
+    """Check whether any dict nested in data has one of keys."""
+    if isinstance(data, dict):
+        return any(k in keys or _contains_key(v, keys) for k, v in data.items())
+    if isinstance(data, list):
+        return any(_contains_key(item, keys) for item in data)
+    return False
+
+
+def _classify_apply(job: Job, requires_remux: bool) -> ResourceClass:
+    data = _policy_data(job)
+    actions = data if isinstance(data, list) else []
+    action_types = {a.get("action_type") for a in actions if isinstance(a, dict)}
+    if "transcode" in action_types:
+        return ResourceClass.CPU
+    if requires_remux or action_types & _REMUX_ACTIONS:
+        return ResourceClass.IO
+    return ResourceClass.METADATA
+
+
+def _classify_process(job: Job) -> ResourceClass:
+    data = _policy_data(job)
+    if data is None:
+        # Policy referenced by name only; assume the heaviest phase
+        return ResourceClass.CPU
+    if _contains_key(data, frozenset({"transcode"})):
+        return ResourceClass.CPU
+    if _contains_key(data, frozenset({"transcription"})):
+        return ResourceClass.TRANSCRIPTION
+    return ResourceClass.IO
+
+
+def classify_job(job: Job, requires_remux: bool = False) -> ResourceClass:
+    """Determine the resource class of a job from its type and options.
+
+    Args:
+        job: Job to classify.
+        requires_remux: For apply jobs, whether the plan rewrites the
+            container (track removal or container conversion are not
+            visible in the planned actions).
+
+    Returns:
+        The job's resource class.
+    """
+    if job.job_type == JobType.TRANSCODE:
+        return ResourceClass.CPU
+    if job.job_type == JobType.APPLY:
+        return _classify_apply(job, requires_remux)
+    if job.job_type == JobType.PROCESS:
+        return _classify_process(job)
+    if job.job_type == JobType.PRUNE:
+        return ResourceClass.METADATA
+    # MOVE, SCAN
+    return ResourceClass.IO
@@ -15,6 +15,7 @@ from typing import TYPE_CHECKING, Protocol, runtime_checkable
 
 from vpo.policy.types import FileProcessingResult, PhaseOutcome, PolicySchema
 from vpo.workflow import WorkflowProcessor
+from vpo.workflow.checkpoint import resume_path
 from vpo.workflow.phase_formatting import format_phase_details
 
 if TYPE_CHECKING:
@@ -91,12 +92,20 @@ class WorkflowRunnerConfig:
         verbose: Whether to emit verbose logging.
         selected_phases: Optional list of phases to execute (None = all).
         policy_name: Name of the policy for audit logging.
+        policy_hash: Content hash of the policy, used for the compliance
+            memo (None disables it).
+        use_compliance_memo: Whether to skip files recorded as compliant.
+        checkpoint: Whether to checkpoint finished phases to the job and
+            resume from its checkpoint (queued jobs that may be recovered).
     """
 
     dry_run: bool = False
     verbose: bool = False
     selected_phases: list[str] | None = None
     policy_name: str = ""
+    policy_hash: str | None = None
+    use_compliance_memo: bool = True
+    checkpoint: bool = False
 
 
 @runtime_checkable
@@ -367,6 +376,10 @@ class WorkflowRunner:
             job_log = getattr(self.lifecycle, "job_log", None)
 
         try:
+            # A phase of an interrupted earlier run may have renamed the file
+            if self.config.checkpoint and job_id and not self.config.dry_run:
+                file_path = resume_path(self.conn, job_id, file_path)
+
             # Validate input file exists
             if not file_path.exists():
                 job_id_short = job_id[:8] if job_id else "no-job"
@@ -395,6 +408,9 @@ class WorkflowRunner:
                 selected_phases=self.config.selected_phases,
                 job_id=job_id,
                 ffmpeg_progress_callback=self.ffmpeg_progress_callback,
+                policy_hash=self.config.policy_hash,
+                use_compliance_memo=self.config.use_compliance_memo,
+                checkpoint=self.config.checkpoint,
             )
 
             # Log workflow phases
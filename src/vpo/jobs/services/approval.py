@@ -15,7 +15,6 @@ from vpo.db import (
     JobStatus,
     JobType,
     PlanStatus,
-    insert_job,
 )
 from vpo.db.operations import (
     InvalidPlanTransitionError,
@@ -23,6 +22,8 @@ from vpo.db.operations import (
     update_plan_status,
 )
 from vpo.db.types import PlanRecord
+from vpo.jobs.queue import enqueue_job
+from vpo.jobs.resources import classify_job
 
 logger = logging.getLogger(__name__)
 
@@ -86,10 +87,10 @@ class PlanApprovalService:
             if updated_plan is None:
                 return ApprovalResult(success=False, error="Plan not found")
 
-            # Create execution job with high priority
-            job_id = str(uuid.uuid4())
+            # Create execution job with high priority, merged into an
+            # equivalent pending job if there is one
             job = Job(
-                id=job_id,
+                id=str(uuid.uuid4()),
                 file_id=plan.file_id,
                 file_path=plan.file_path,
                 job_type=JobType.APPLY,
@@ -111,7 +112,8 @@ class PlanApprovalService:
                 summary_json=None,
                 log_path=None,
             )
-            insert_job(conn, job)
+            job.resource_class = classify_job(job, requires_remux=plan.requires_remux)
+            job_id = enqueue_job(conn, job).job_id
 
             logger.info(
                 "Plan approved: plan_id=%s, job_id=%s, file_path=%s, policy=%s",
@@ -8,12 +8,13 @@ import json
 import logging
 import shutil
 import sqlite3
+from collections.abc import Callable
 from dataclasses import dataclass
 from pathlib import Path
 
 from vpo.db.queries import update_file_path
 from vpo.db.types import Job
-from vpo.executor.move import MoveExecutor
+from vpo.executor.move import MoveExecutor, MoveProgress
 from vpo.jobs.logs import JobLogWriter
 
 logger = logging.getLogger(__name__)
@@ -60,12 +61,14 @@ class MoveJobService:
         self,
         job: Job,
         job_log: JobLogWriter | None = None,
+        progress_callback: Callable[[MoveProgress], None] | None = None,
     ) -> MoveJobResult:
         """Process a move job end-to-end.
 
         Args:
             job: The job to process.
             job_log: Optional log writer for this job.
+            progress_callback: Optional callback for cross-device copy progress.
 
         Returns:
             MoveJobResult with success/failure status and paths.
@@ -92,6 +95,7 @@ class MoveJobService:
         executor = MoveExecutor(
             create_directories=config.create_directories,
             overwrite=config.overwrite,
+            progress_callback=progress_callback,
         )
         plan = executor.create_plan(
             source_path=source_path,
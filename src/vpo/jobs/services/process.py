@@ -19,6 +19,7 @@ from vpo.db.types import Job
 from vpo.jobs.logs import JobLogWriter
 from vpo.jobs.runner import WorkflowRunner, WorkflowRunnerConfig
 from vpo.logging import worker_context
+from vpo.policy.compiled import hash_policy_content, load_compiled_policy
 from vpo.policy.loader import load_policy
 from vpo.policy.types import PolicySchema
 from vpo.tools.ffmpeg_progress import FFmpegProgress
@@ -87,6 +88,9 @@ class ProcessJobService:
                 dry_run=False,
                 verbose=True,
                 policy_name=job.policy_name or "embedded",
+                policy_hash=self._policy_hash(job),
+                # Resume after finished phases if the job was recovered
+                checkpoint=True,
             )
 
             # Create runner for daemon mode (worker manages job lifecycle)
@@ -157,17 +161,13 @@ class ProcessJobService:
 
             # Fall back to policy_name (file path)
             if job.policy_name:
-                policy_path = Path(job.policy_name)
-                if not policy_path.exists():
-                    # Try in ~/.vpo/policies/
-                    policy_path = get_data_dir() / "policies" / job.policy_name
-                    if not policy_path.suffix:
-                        policy_path = policy_path.with_suffix(".yaml")
-
+                policy_path = self._resolve_policy_path(job.policy_name)
                 if not policy_path.exists():
                     return None, f"Policy file not found: {job.policy_name}"
 
-                policy = load_policy(policy_path)
+                # Cached by content hash: unchanged policies reuse their
+                # compiled conditions across jobs
+                policy = load_compiled_policy(policy_path).schema
                 if job_log:
                     ver = policy.schema_version
                     job_log.write_line(f"Policy: {policy_path} (v{ver})")
@@ -180,3 +180,42 @@ class ProcessJobService:
             if job_log:
                 job_log.write_error(error)
             return None, error
+
+    def _resolve_policy_path(self, policy_name: str) -> Path:
+        """Resolve a job's policy name to a policy file path.
+
+        Args:
+            policy_name: Policy file path or name under ~/.vpo/policies/.
+
+        Returns:
+            Resolved path (which may not exist).
+        """
+        policy_path = Path(policy_name)
+        if not policy_path.exists():
+            # Try in ~/.vpo/policies/
+            policy_path = get_data_dir() / "policies" / policy_name
+            if not policy_path.suffix:
+                policy_path = policy_path.with_suffix(".yaml")
+        return policy_path
+
+    def _policy_hash(self, job: Job) -> str | None:
+        """Get the content hash identifying a job's policy.
+
+        Used as the compliance memo key, so that files already compliant
+        with an unchanged policy are skipped.
+
+        Args:
+            job: The job with policy_json or policy_name.
+
+        Returns:
+            Policy content hash, or None if it cannot be determined.
+        """
+        if job.policy_json:
+            return hash_policy_content(job.policy_json.encode("utf-8"))
+        if job.policy_name:
+            try:
+                policy_path = self._resolve_policy_path(job.policy_name)
+                return load_compiled_policy(policy_path).content_hash
+            except Exception:
+                return None
+        return None
@@ -5,6 +5,9 @@ This module provides the worker that processes jobs from the queue:
 - Graceful shutdown on SIGTERM/SIGINT
 - Heartbeat updates to prevent stale job recovery
 - Progress reporting during transcoding
+- Resource-class slots, so light jobs are claimed around saturated classes
+- Time-window planning: with a deadline, only jobs expected to finish
+  before it are claimed
 """
 
 import json
@@ -14,7 +17,7 @@ import signal
 import sqlite3
 import threading
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Mapping
 from datetime import datetime, timezone
 from pathlib import Path
 
@@ -22,16 +25,25 @@ from vpo.db import (
     Job,
     JobStatus,
     JobType,
+    ResourceClass,
     get_tracks_for_file,
+    update_job_log_path,
     update_job_progress,
 )
 from vpo.db.connection import get_connection
+from vpo.executor.move import MoveProgress
+from vpo.jobs.estimates import DurationEstimator
 from vpo.jobs.logs import JobLogWriter
 from vpo.jobs.maintenance import purge_old_jobs
 from vpo.jobs.queue import (
     claim_next_job,
+    default_lease_owner,
+    lease_jobs,
+    peek_queued_jobs,
     recover_stale_jobs,
     release_job,
+    release_leases,
+    start_leased_job,
     update_heartbeat,
 )
 from vpo.jobs.services import (
@@ -50,6 +62,12 @@ logger = logging.getLogger(__name__)
 HEARTBEAT_INTERVAL = 30
 MAX_HEARTBEAT_FAILURES = 3  # Abort job after this many consecutive heartbeat failures
 
+# Queued jobs considered per claim when planning within a time window
+PLAN_LOOKAHEAD = 50
+
+# Seconds between claim attempts while queued jobs wait for a resource slot
+SLOT_WAIT_SECONDS = 5
+
 
 class WorkerShutdownRequested(Exception):
     """Exception raised when worker shutdown is requested."""
@@ -60,24 +78,32 @@ class JobWorker:
 
     def __init__(
         self,
-        conn: sqlite3.Connection,
+        conn: sqlite3.Connection | None,
         max_files: int | None = None,
         max_duration: int | None = None,
         end_by: str | None = None,
         cpu_cores: int | None = None,
         auto_purge: bool = True,
         retention_days: int = 30,
+        batch_size: int = 1,
+        resource_slots: Mapping[ResourceClass, int] | None = None,
     ) -> None:
         """Initialize the job worker.
 
         Args:
-            conn: Database connection.
+            conn: Database connection (None for subclasses that reach the
+                queue another way, such as RemoteJobWorker).
             max_files: Maximum files to process (None = unlimited).
             max_duration: Maximum duration in seconds (None = unlimited).
             end_by: End time in HH:MM format (None = run until complete).
             cpu_cores: CPU cores to use for transcoding.
             auto_purge: Whether to purge old jobs on start.
             retention_days: Days to keep completed jobs.
+            batch_size: Jobs to lease per claim. Leased jobs are reserved
+                for this worker and started one at a time.
+            resource_slots: Running-job limit per resource class across
+                this host's workers (None = unlimited; see
+                vpo.jobs.resources).
         """
         self.conn = conn
         self.max_files = max_files
@@ -86,12 +112,18 @@ class JobWorker:
         self.cpu_cores = cpu_cores
         self.auto_purge = auto_purge
         self.retention_days = retention_days
+        self.batch_size = max(1, batch_size)
+        self.resource_slots = resource_slots
+        self._lease_owner = default_lease_owner()
+        self._leased: list[Job] = []
+        self._estimator: DurationEstimator | None = None
 
         # Extract db_path from connection for heartbeat thread
         # PRAGMA database_list returns (seq, name, file) tuples
-        cursor = conn.execute("PRAGMA database_list")
-        row = cursor.fetchone()
-        self._db_path = Path(row[2]) if row and row[2] else None
+        self._db_path: Path | None = None
+        if conn is not None:
+            row = conn.execute("PRAGMA database_list").fetchone()
+            self._db_path = Path(row[2]) if row and row[2] else None
 
         # Cache services for reuse across jobs
         self._transcode_service = TranscodeJobService(cpu_cores=cpu_cores)
@@ -186,17 +218,13 @@ class JobWorker:
         self._consecutive_heartbeat_failures = 0
 
         def heartbeat_loop() -> None:
-            if self._db_path is None:
+            if not self._can_send_heartbeat():
                 logger.warning("Cannot start heartbeat: db_path not available")
                 return
 
             while not self._heartbeat_stop.wait(HEARTBEAT_INTERVAL):
                 try:
-                    # Create fresh connection for each heartbeat
-                    # This avoids holding a connection indefinitely and
-                    # ensures we don't accumulate transaction state
-                    with get_connection(self._db_path) as heartbeat_conn:
-                        update_heartbeat(heartbeat_conn, job_id, os.getpid())
+                    self._send_heartbeat(job_id)
                     self._consecutive_heartbeat_failures = 0  # Reset on success
                 except Exception as e:
                     self._consecutive_heartbeat_failures += 1
@@ -226,6 +254,23 @@ class JobWorker:
             HEARTBEAT_INTERVAL,
         )
 
+    def _can_send_heartbeat(self) -> bool:
+        """Check whether heartbeats can be recorded for this worker."""
+        return self._db_path is not None
+
+    def _send_heartbeat(self, job_id: str) -> None:
+        """Record a heartbeat for the running job and renew its leases."""
+        # Create fresh connection for each heartbeat
+        # This avoids holding a connection indefinitely and
+        # ensures we don't accumulate transaction state
+        with get_connection(self._db_path) as heartbeat_conn:
+            update_heartbeat(
+                heartbeat_conn,
+                job_id,
+                os.getpid(),
+                lease_owner=self._lease_owner,
+            )
+
     def _stop_heartbeat(self) -> None:
         """Stop heartbeat thread."""
         self._heartbeat_stop.set()
@@ -318,8 +363,7 @@ class JobWorker:
             percent = max(0.0, min(99.9, percent))
 
             try:
-                update_job_progress(
-                    self.conn,
+                self._report_progress(
                     job.id,
                     percent,
                     json.dumps(
@@ -339,6 +383,38 @@ class JobWorker:
 
         return callback
 
+    def _report_progress(
+        self, job_id: str, percent: float, progress_json: str | None
+    ) -> None:
+        """Record progress for a running job."""
+        update_job_progress(self.conn, job_id, percent, progress_json)
+
+    def _create_move_progress_callback(
+        self, job: Job
+    ) -> Callable[[MoveProgress], None]:
+        """Create a progress callback reporting cross-device copy progress."""
+
+        def callback(progress: MoveProgress) -> None:
+            # Cap at 99.9% until the job is released as completed
+            percent = max(0.0, min(99.9, progress.percent))
+            try:
+                self._report_progress(
+                    job.id,
+                    percent,
+                    json.dumps(
+                        {
+                            "bytes_copied": progress.bytes_copied,
+                            "total_bytes": progress.total_bytes,
+                        }
+                    ),
+                )
+            except Exception as e:
+                logger.warning(
+                    "Failed to update progress for job %s: %s", job.id[:8], e
+                )
+
+        return callback
+
     def _process_transcode_job(
         self, job: Job, job_log: JobLogWriter | None = None
     ) -> tuple[bool, str | None, str | None]:
@@ -411,7 +487,11 @@ class JobWorker:
         if self._move_service is None:
             self._move_service = MoveJobService(self.conn)
 
-        result = self._move_service.process(job, job_log=job_log)
+        result = self._move_service.process(
+            job,
+            job_log=job_log,
+            progress_callback=self._create_move_progress_callback(job),
+        )
         return result.success, result.error_message, result.destination_path
 
     def process_job(self, job: Job) -> None:
@@ -499,8 +579,7 @@ class JobWorker:
 
             # Release job with result
             status = JobStatus.COMPLETED if success else JobStatus.FAILED
-            release_job(
-                self.conn,
+            self._release_job(
                 job.id,
                 status,
                 error_message=error_msg,
@@ -520,8 +599,7 @@ class JobWorker:
             if job_log:
                 job_log.write_error("Job processing error", e)
                 job_log.write_footer(False, time.time() - job_start_time)
-            release_job(
-                self.conn,
+            self._release_job(
                 job.id,
                 JobStatus.FAILED,
                 error_message=str(e),
@@ -533,8 +611,7 @@ class JobWorker:
             if job_log:
                 job_log.write_error("Unexpected exception", e)
                 job_log.write_footer(False, time.time() - job_start_time)
-            release_job(
-                self.conn,
+            self._release_job(
                 job.id,
                 JobStatus.FAILED,
                 error_message=f"Unexpected {type(e).__name__}: {e}",
@@ -547,6 +624,10 @@ class JobWorker:
             self._current_job = None
             self._files_processed += 1
 
+    def _release_job(self, job_id: str, status: JobStatus, **kwargs) -> None:
+        """Record a job's final status; kwargs are passed to release_job."""
+        release_job(self.conn, job_id, status, **kwargs)
+
     def _update_job_log_path(self, job_id: str, log_path: str | None) -> None:
         """Update the job's log_path in the database.
 
@@ -557,14 +638,153 @@ class JobWorker:
         if log_path is None:
             return
         try:
-            self.conn.execute(
-                "UPDATE jobs SET log_path = ? WHERE id = ?",
-                (log_path, job_id),
-            )
+            update_job_log_path(self.conn, job_id, log_path)
             self.conn.commit()
         except Exception as e:
             logger.warning("Failed to update job log path: %s", e)
 
+    def _recover_stale_jobs(self) -> None:
+        """Requeue jobs left running by dead workers."""
+        recover_stale_jobs(self.conn)
+
+    def _remaining_window(self) -> float | None:
+        """Seconds left before end_by or max_duration (None = no deadline)."""
+        deadlines = []
+        if self.end_by is not None:
+            deadlines.append(self.end_by.timestamp())
+        if self.max_duration is not None and self._start_time is not None:
+            deadlines.append(self._start_time + self.max_duration)
+        if not deadlines:
+            return None
+        return min(deadlines) - time.time()
+
+    def _load_estimator(self) -> None:
+        """Learn job durations from history when running against a deadline."""
+        if self.conn is None or self._remaining_window() is None:
+            return
+        try:
+            self._estimator = DurationEstimator.from_history(self.conn)
+        except sqlite3.Error as e:
+            # Without estimates the worker claims as if there were no window
+            logger.warning("Cannot load job duration history: %s", e)
+
+    def _fits_window(self, jobs: list[Job]) -> list[str] | None:
+        """Return the IDs of jobs expected to finish within the window.
+
+        Jobs without an estimate (no history for their kind) are assumed to
+        fit. Returns None when there is no window to plan for.
+        """
+        remaining = self._remaining_window()
+        if remaining is None or self._estimator is None:
+            return None
+        estimates = self._estimator.estimate_jobs(self.conn, jobs)
+        fitting = []
+        for job in jobs:
+            estimate = estimates[job.id]
+            if estimate is not None and estimate > remaining:
+                logger.debug(
+                    "Job %s expected to take %.0fs; %.0fs left in window",
+                    job.id[:8],
+                    estimate,
+                    remaining,
+                )
+                continue
+            fitting.append(job.id)
+        return fitting
+
+    def _plan_job_ids(self) -> list[str] | None:
+        """Return the queued jobs this worker may claim within its window.
+
+        Looks at the next PLAN_LOOKAHEAD claimable jobs, so a job that
+        does not fit is passed over for a shorter one behind it.
+
+        Returns:
+            Claimable job IDs, or None to claim any job (no window).
+        """
+        if self._remaining_window() is None or self._estimator is None:
+            return None
+        candidates = peek_queued_jobs(
+            self.conn,
+            PLAN_LOOKAHEAD,
+            slots=self.resource_slots,
+            lease_owner=self._lease_owner,
+        )
+        fitting = self._fits_window(candidates)
+        if candidates and not fitting:
+            logger.info("No queued job is expected to finish before the deadline")
+        return fitting
+
+    def _claim_job(self) -> Job | None:
+        """Claim the next job, leasing batch_size jobs at a time."""
+        if self.batch_size == 1:
+            return claim_next_job(
+                self.conn,
+                lease_owner=self._lease_owner,
+                slots=self.resource_slots,
+                job_ids=self._plan_job_ids(),
+            )
+
+        while True:
+            if not self._leased:
+                limit = self.batch_size
+                if self.max_files is not None:
+                    limit = min(limit, self.max_files - self._files_processed)
+                self._leased = lease_jobs(
+                    self.conn,
+                    limit,
+                    lease_owner=self._lease_owner,
+                    slots=self.resource_slots,
+                    job_ids=self._plan_job_ids(),
+                )
+                if not self._leased:
+                    return None
+
+            leased = self._leased.pop(0)
+            if self._fits_window([leased]) == []:
+                # The window has shrunk since the job was leased
+                release_leases(self.conn, self._lease_owner, job_ids=[leased.id])
+                continue
+            job = start_leased_job(
+                self.conn,
+                leased.id,
+                lease_owner=self._lease_owner,
+                slots=self.resource_slots,
+            )
+            if job is not None:
+                return job
+            # Cancelled, taken over by another worker, or its class filled
+            # up since it was leased; hand it back so others can run it
+            logger.debug("Skipping job %s: cannot start it", leased.id[:8])
+            release_leases(self.conn, self._lease_owner, job_ids=[leased.id])
+
+    def _waiting_for_slot(self) -> bool:
+        """Return True if queued jobs are only held back by full slots.
+
+        Such jobs become claimable when a running job of their class
+        finishes, so the worker waits instead of exiting. Jobs that do not
+        fit the time window are not waited for.
+        """
+        if not self.resource_slots or not any(self.resource_slots.values()):
+            return False
+        blocked = peek_queued_jobs(self.conn, PLAN_LOOKAHEAD)
+        if self._remaining_window() is not None and self._estimator is not None:
+            blocked = self._fits_window(blocked)
+        return bool(blocked)
+
+    def _release_leases(self) -> None:
+        """Hand leased but unstarted jobs back to the queue."""
+        if not self._leased:
+            return
+        self._leased = []
+        try:
+            count = release_leases(self.conn, self._lease_owner)
+        except sqlite3.Error as e:
+            # Leases expire on their own; other workers pick the jobs up then
+            logger.warning("Failed to release leased jobs: %s", e)
+            return
+        if count:
+            logger.info("Released %d leased job(s)", count)
+
     def run(self) -> int:
         """Run the worker, processing jobs until limits reached or queue empty.
 
@@ -584,6 +804,12 @@ class JobWorker:
             config_parts.append(f"end_by={self.end_by.strftime('%H:%M')}")
         if self.cpu_cores is not None:
             config_parts.append(f"cpu_cores={self.cpu_cores}")
+        if self.batch_size > 1:
+            config_parts.append(f"batch_size={self.batch_size}")
+        if self.resource_slots:
+            limited = [f"{rc.value}={n}" for rc, n in self.resource_slots.items() if n]
+            if limited:
+                config_parts.append(f"slots={','.join(limited)}")
         config_parts.append(f"auto_purge={self.auto_purge}")
 
         logger.info("Starting job worker: %s", ", ".join(config_parts))
@@ -592,16 +818,33 @@ class JobWorker:
         self._purge_old_jobs()
 
         # Recover stale jobs
-        recover_stale_jobs(self.conn)
+        self._recover_stale_jobs()
 
-        # Process jobs
-        while self._should_continue():
-            job = claim_next_job(self.conn)
-            if job is None:
-                logger.info("Queue is empty")
-                break
+        # Plan within end_by/max_duration from historical durations
+        self._load_estimator()
 
-            self.process_job(job)
+        # Process jobs
+        waiting = False
+        try:
+            while self._should_continue():
+                job = self._claim_job()
+                if job is None and self._waiting_for_slot():
+                    if not waiting:
+                        logger.info("Waiting for a free resource slot")
+                        waiting = True
+                    time.sleep(SLOT_WAIT_SECONDS)
+                    # A slot held by a dead worker is freed by recovery
+                    self._recover_stale_jobs()
+                    continue
+                if job is None:
+                    # Jobs too long for the window are left to a later run
+                    logger.info("No claimable job left in the queue")
+                    break
+
+                waiting = False
+                self.process_job(job)
+        finally:
+            self._release_leases()
 
         # Log summary
         elapsed = time.time() - self._start_time
@@ -100,6 +100,9 @@ class WorkerContextFilter(logging.Filter):
     Adds worker_id, file_id, and file_path attributes to LogRecord from
     contextvars. For text format, also adds a formatted worker_tag for
     compact display like [W01:F001].
+
+    Records forwarded from worker processes (vpo process --executor process)
+    were already enriched in the worker and are left unchanged.
     """
 
     def filter(self, record: logging.LogRecord) -> bool:
@@ -112,6 +115,8 @@ class WorkerContextFilter(logging.Filter):
             Always True (does not filter, only enriches).
         """
         worker_id, file_id, file_path = get_worker_context()
+        if worker_id is None and getattr(record, "worker_id", None) is not None:
+            return True
 
         # Add raw values for JSON format
         record.worker_id = worker_id
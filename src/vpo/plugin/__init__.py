@@ -6,6 +6,13 @@ custom analyzers and mutators.
 API Version: 1.0.0
 """
 
+from vpo.plugin.dispatcher import (
+    PluginCallResult,
+    PluginCallStats,
+    PluginEventDispatcher,
+    get_event_dispatcher,
+    load_plugin_stats,
+)
 from vpo.plugin.events import (
     ANALYZER_EVENTS,
     FILE_METADATA_ENRICHED,
@@ -19,6 +26,7 @@ from vpo.plugin.events import (
     VALID_EVENTS,
     FileMetadataEnrichedEvent,
     FileScannedEvent,
+    FilesScannedEvent,
     PlanExecuteEvent,
     PolicyEvaluateEvent,
     is_analyzer_event,
@@ -95,6 +103,7 @@ __all__ = [
     "ANALYZER_EVENTS",
     "MUTATOR_EVENTS",
     "FileScannedEvent",
+    "FilesScannedEvent",
     "FileMetadataEnrichedEvent",
     "PolicyEvaluateEvent",
     "PlanExecuteEvent",
@@ -112,6 +121,12 @@ __all__ = [
     "LoadedPlugin",
     "PluginRegistry",
     "get_default_registry",
+    # Dispatcher
+    "PluginCallResult",
+    "PluginCallStats",
+    "PluginEventDispatcher",
+    "get_event_dispatcher",
+    "load_plugin_stats",
     # Loader
     "PluginLoader",
     "compute_plugin_hash",
@@ -0,0 +1,735 @@
+"""Concurrent plugin event dispatch.
+
+PluginEventDispatcher fans an event out to every enabled plugin that
+subscribes to it, running the handlers on a process-wide bounded thread
+pool so an event costs as long as its slowest plugin rather than the sum
+of all of them.
+
+Each call has a time budget, counted from when a pool worker starts the
+handler, so calls queued behind busy handlers are not charged for the
+wait. A call still queued after a full budget is cancelled without
+counting against its plugin. A plugin whose calls repeatedly overrun the
+budget trips its circuit breaker and is skipped until the breaker's reset
+period has passed; one trial call then decides whether it closes again.
+Overrunning calls cannot be interrupted (they are threads), but the
+breaker stops a hung plugin from claiming more pool workers.
+
+Per-plugin call counts and latency histograms are kept in memory and
+merged into ``<data_dir>/plugin-stats.json`` every STATS_FLUSH_INTERVAL
+seconds and at exit, so ``vpo plugin list`` and the plugins API can show
+them from any process.
+"""
+
+from __future__ import annotations
+
+import atexit
+import bisect
+import fcntl
+import json
+import logging
+import threading
+import time
+from collections.abc import Callable, Collection
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from vpo.config.loader import get_config, get_data_dir
+from vpo.metrics import get_metrics_store, increment_counter
+
+if TYPE_CHECKING:
+    from vpo.plugin.registry import LoadedPlugin, PluginRegistry
+
+logger = logging.getLogger(__name__)
+
+# Upper bounds (seconds) of the latency histogram buckets; one more bucket
+# counts calls slower than the last bound
+LATENCY_BUCKETS: tuple[float, ...] = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+# Threshold for warning about slow plugin handlers (seconds)
+SLOW_PLUGIN_THRESHOLD = 1.0
+
+# Seconds between merges of in-memory stats into the stats file
+STATS_FLUSH_INTERVAL = 30.0
+
+STATS_FILENAME = "plugin-stats.json"
+
+# Marker for "use the dispatcher's configured timeout"
+_DEFAULT_TIMEOUT: Any = object()
+
+
+@dataclass
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (see LATENCY_BUCKETS)."""
+
+    counts: list[int] = field(default_factory=lambda: [0] * (len(LATENCY_BUCKETS) + 1))
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    @property
+    def count(self) -> int:
+        """Number of observations."""
+        return sum(self.counts)
+
+    def observe(self, seconds: float) -> None:
+        """Record one call duration."""
+        self.counts[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        self.total_seconds += seconds
+        self.max_seconds = max(self.max_seconds, seconds)
+
+    def merge(self, other: LatencyHistogram) -> None:
+        """Add another histogram's observations to this one."""
+        self.counts = [a + b for a, b in zip(self.counts, other.counts, strict=True)]
+        self.total_seconds += other.total_seconds
+        self.max_seconds = max(self.max_seconds, other.max_seconds)
+
+    def quantile(self, q: float) -> float | None:
+        """Estimate a quantile as the upper bound of the bucket holding it.
+
+        Args:
+            q: Quantile between 0 and 1 (e.g. 0.95).
+
+        Returns:
+            Bucket upper bound in seconds (max_seconds for the overflow
+            bucket), or None if nothing has been observed.
+        """
+        total = self.count
+        if total == 0:
+            return None
+        rank = q * total
+        seen = 0
+        for index, bucket_count in enumerate(self.counts):
+            seen += bucket_count
+            if bucket_count and seen >= rank:
+                if index < len(LATENCY_BUCKETS):
+                    return min(LATENCY_BUCKETS[index], self.max_seconds)
+                break
+        return self.max_seconds
+
+
+@dataclass
+class PluginCallStats:
+    """Call outcomes and latency for one plugin."""
+
+    calls: int = 0
+    errors: int = 0
+    timeouts: int = 0
+    skipped: int = 0
+    breaker_trips: int = 0
+    last_tripped_at: str | None = None
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def merge(self, other: PluginCallStats) -> None:
+        """Add another set of stats to this one."""
+        self.calls += other.calls
+        self.errors += other.errors
+        self.timeouts += other.timeouts
+        self.skipped += other.skipped
+        self.breaker_trips += other.breaker_trips
+        if other.last_tripped_at and (
+            self.last_tripped_at is None or other.last_tripped_at > self.last_tripped_at
+        ):
+            self.last_tripped_at = other.last_tripped_at
+        self.latency.merge(other.latency)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for the stats file."""
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "skipped": self.skipped,
+            "breaker_trips": self.breaker_trips,
+            "last_tripped_at": self.last_tripped_at,
+            "latency_buckets": self.latency.counts,
+            "latency_total_seconds": self.latency.total_seconds,
+            "latency_max_seconds": self.latency.max_seconds,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> PluginCallStats:
+        """Deserialize from the stats file, tolerating missing fields."""
+        counts = list(data.get("latency_buckets") or [])
+        expected = len(LATENCY_BUCKETS) + 1
+        if len(counts) != expected:
+            counts = [0] * expected
+        return cls(
+            calls=int(data.get("calls", 0)),
+            errors=int(data.get("errors", 0)),
+            timeouts=int(data.get("timeouts", 0)),
+            skipped=int(data.get("skipped", 0)),
+            breaker_trips=int(data.get("breaker_trips", 0)),
+            last_tripped_at=data.get("last_tripped_at"),
+            latency=LatencyHistogram(
+                counts=[int(c) for c in counts],
+                total_seconds=float(data.get("latency_total_seconds", 0.0)),
+                max_seconds=float(data.get("latency_max_seconds", 0.0)),
+            ),
+        )
+
+    def summary(self) -> dict[str, Any]:
+        """Display-oriented summary for the CLI and API."""
+        count = self.latency.count
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "timeouts": self.timeouts,
+            "skipped": self.skipped,
+            "breaker_trips": self.breaker_trips,
+            "last_tripped_at": self.last_tripped_at,
+            "avg_seconds": self.latency.total_seconds / count if count else None,
+            "p50_seconds": self.latency.quantile(0.5),
+            "p95_seconds": self.latency.quantile(0.95),
+            "max_seconds": self.latency.max_seconds if count else None,
+            "histogram": {
+                **{
+                    f"le_{bound:g}": n
+                    for bound, n in zip(LATENCY_BUCKETS, self.latency.counts)
+                },
+                "le_inf": self.latency.counts[-1],
+            },
+        }
+
+
+class CircuitBreaker:
+    """Consecutive-overrun circuit breaker for one plugin.
+
+    Closed: calls pass. After threshold consecutive overruns the breaker
+    opens and calls are skipped. Once reset_seconds have passed a single
+    trial call is let through (half-open); success closes the breaker and
+    another overrun reopens it.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self) -> None:
+        self._consecutive = 0
+        self._opened_at: float | None = None
+        self._trial_in_flight = False
+
+    def state(self, reset_seconds: float) -> str:
+        """Current state given the configured reset period."""
+        if self._opened_at is None:
+            return self.CLOSED
+        if time.monotonic() - self._opened_at < reset_seconds:
+            return self.OPEN
+        return self.HALF_OPEN
+
+    def allow(self, reset_seconds: float) -> bool:
+        """Return True if a call may go ahead, claiming the trial if half-open."""
+        state = self.state(reset_seconds)
+        if state == self.CLOSED:
+            return True
+        if state == self.OPEN or self._trial_in_flight:
+            return False
+        self._trial_in_flight = True
+        return True
+
+    def release(self) -> None:
+        """Give back a trial claimed by allow() for a call that never ran."""
+        self._trial_in_flight = False
+
+    def record(self, overran: bool, threshold: int) -> bool:
+        """Record a call outcome.
+
+        Args:
+            overran: True if the call exceeded its time budget.
+            threshold: Consecutive overruns that open the breaker.
+
+        Returns:
+            True if this outcome opened the breaker.
+        """
+        trial = self._trial_in_flight
+        self._trial_in_flight = False
+        if not overran:
+            self._consecutive = 0
+            self._opened_at = None
+            return False
+        self._consecutive += 1
+        if trial or self._consecutive >= threshold:
+            self._opened_at = time.monotonic()
+            return True
+        return False
+
+
+@dataclass(frozen=True)
+class PluginCallResult:
+    """Outcome of one plugin handler call."""
+
+    plugin_name: str
+    value: Any = None
+    error: str | None = None
+    timed_out: bool = False
+    duration_seconds: float = 0.0
+    not_started: bool = False
+    """True if the call was cancelled while still queued for a pool worker."""
+
+    @property
+    def ok(self) -> bool:
+        """True if the handler returned within its budget without raising."""
+        return self.error is None and not self.timed_out
+
+
+class _DispatchState:
+    """Process-wide breaker and stats state shared by all dispatchers."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.breakers: dict[str, CircuitBreaker] = {}
+        self.pending: dict[str, PluginCallStats] = {}
+        self.last_flush = time.monotonic()
+        self.atexit_registered = False
+        self.pool: ThreadPoolExecutor | None = None
+
+    def breaker(self, name: str) -> CircuitBreaker:
+        return self.breakers.setdefault(name, CircuitBreaker())
+
+    def stats(self, name: str) -> PluginCallStats:
+        if not self.atexit_registered:
+            atexit.register(flush_plugin_stats)
+            self.atexit_registered = True
+        return self.pending.setdefault(name, PluginCallStats())
+
+
+_state = _DispatchState()
+
+# Recheck interval for a call caught between leaving the pool queue and
+# recording its start time
+_START_RECHECK_SECONDS = 0.01
+
+
+class _CallClock:
+    """Start time of a submitted handler call, set once it begins running."""
+
+    __slots__ = ("started_at",)
+
+    def __init__(self) -> None:
+        self.started_at: float | None = None
+
+
+def _shared_pool() -> ThreadPoolExecutor:
+    """Return the process-wide dispatch pool, creating it on first use."""
+    with _state.lock:
+        if _state.pool is None:
+            _state.pool = ThreadPoolExecutor(
+                max_workers=get_config().plugins.event_workers,
+                thread_name_prefix="vpo-plugin",
+            )
+        return _state.pool
+
+
+def get_stats_path() -> Path:
+    """Path of the shared plugin stats file."""
+    return get_data_dir() / STATS_FILENAME
+
+
+def _read_stats_file(path: Path) -> dict[str, PluginCallStats]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8") or "{}")
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as e:
+        logger.warning("Ignoring unreadable plugin stats file %s: %s", path, e)
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return {
+        name: PluginCallStats.from_dict(entry)
+        for name, entry in data.items()
+        if isinstance(entry, dict)
+    }
+
+
+def flush_plugin_stats(path: Path | None = None) -> None:
+    """Merge this process's unflushed plugin stats into the stats file."""
+    with _state.lock:
+        pending, _state.pending = _state.pending, {}
+        _state.last_flush = time.monotonic()
+    if not pending:
+        return
+
+    path = path or get_stats_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "a+", encoding="utf-8") as f:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                merged = _read_stats_file(path)
+                for name, stats in pending.items():
+                    merged.setdefault(name, PluginCallStats()).merge(stats)
+                f.seek(0)
+                f.truncate()
+                json.dump({n: s.to_dict() for n, s in merged.items()}, f)
+                f.flush()
+            finally:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+    except OSError as e:
+        logger.warning("Failed to write plugin stats to %s: %s", path, e)
+
+
+def load_plugin_stats(path: Path | None = None) -> dict[str, PluginCallStats]:
+    """Load plugin stats from the stats file plus this process's pending stats.
+
+    Returns:
+        Stats keyed by plugin name.
+    """
+    stats = _read_stats_file(path or get_stats_path())
+    with _state.lock:
+        for name, pending in _state.pending.items():
+            stats.setdefault(name, PluginCallStats()).merge(pending)
+    return stats
+
+
+def breaker_state(plugin_name: str) -> str:
+    """Current circuit breaker state of a plugin in this process."""
+    reset = get_config().plugins.circuit_breaker_reset_seconds
+    with _state.lock:
+        breaker = _state.breakers.get(plugin_name)
+        return breaker.state(reset) if breaker else CircuitBreaker.CLOSED
+
+
+def reset_dispatch_state() -> None:
+    """Forget breaker states and unflushed stats (for testing)."""
+    with _state.lock:
+        _state.breakers.clear()
+        _state.pending.clear()
+
+
+def _record_call(
+    plugin_name: str, event_name: str, duration: float, error: bool
+) -> None:
+    """Record a completed handler call in stats and the metrics store."""
+    increment_counter("plugin.invocations", plugin_name=plugin_name)
+    get_metrics_store().record_duration(
+        "plugin.duration", duration, plugin_name=plugin_name, event=event_name
+    )
+    if duration > SLOW_PLUGIN_THRESHOLD:
+        logger.warning(
+            "Slow plugin: %s took %.2fs for %s", plugin_name, duration, event_name
+        )
+    with _state.lock:
+        stats = _state.stats(plugin_name)
+        stats.calls += 1
+        stats.errors += int(error)
+        stats.latency.observe(duration)
+        due = time.monotonic() - _state.last_flush >= STATS_FLUSH_INTERVAL
+    if due:
+        flush_plugin_stats()
+
+
+class PluginEventDispatcher:
+    """Dispatches plugin events with time budgets and circuit breakers."""
+
+    def __init__(
+        self,
+        registry: PluginRegistry,
+        timeout_seconds: float | None = 30.0,
+        breaker_threshold: int = 3,
+        breaker_reset_seconds: float = 300.0,
+    ) -> None:
+        """Initialize the dispatcher.
+
+        Args:
+            registry: Registry providing the plugins subscribed to events.
+            timeout_seconds: Default time budget per plugin call
+                (None = unlimited).
+            breaker_threshold: Consecutive overruns that trip a plugin's
+                breaker (0 = never trip).
+            breaker_reset_seconds: Seconds a tripped breaker stays open.
+        """
+        self.registry = registry
+        self.timeout_seconds = timeout_seconds
+        self.breaker_threshold = breaker_threshold
+        self.breaker_reset_seconds = breaker_reset_seconds
+
+    @classmethod
+    def from_config(cls, registry: PluginRegistry) -> PluginEventDispatcher:
+        """Create a dispatcher from the [plugins] configuration."""
+        config = get_config().plugins
+        return cls(
+            registry,
+            timeout_seconds=config.event_timeout_seconds or None,
+            breaker_threshold=config.circuit_breaker_threshold,
+            breaker_reset_seconds=config.circuit_breaker_reset_seconds,
+        )
+
+    def handlers(
+        self, event_name: str, method_name: str
+    ) -> list[tuple[LoadedPlugin, Callable[[Any], Any]]]:
+        """Enabled plugins subscribed to event_name that implement method_name."""
+        result = []
+        for loaded in self.registry.get_by_event(event_name):
+            handler = getattr(loaded.instance, method_name, None)
+            if handler is None:
+                logger.debug("Plugin %s has no %s handler", loaded.name, method_name)
+                continue
+            result.append((loaded, handler))
+        return result
+
+    def dispatch(
+        self,
+        event_name: str,
+        method_name: str,
+        event: Any,
+        timeout: float | None = _DEFAULT_TIMEOUT,
+        exclude: Collection[str] = (),
+        count_overruns: bool = True,
+    ) -> list[PluginCallResult]:
+        """Call every subscribed plugin concurrently and wait for all of them.
+
+        Args:
+            event_name: Event name (e.g. 'file.scanned').
+            method_name: Handler method to call (e.g. 'on_file_scanned').
+            event: Event payload passed to each handler.
+            timeout: Time budget in seconds per call, counted from when the
+                handler starts. Defaults to the dispatcher's timeout_seconds;
+                None waits indefinitely.
+            exclude: Names of plugins not to call.
+            count_overruns: Whether overruns count towards the plugins'
+                circuit breakers. Callers whose budget is only an estimate
+                (e.g. batch calls) pass False, so a slow batch does not
+                disable a healthy plugin.
+
+        Returns:
+            One result per plugin called, in registry order. Plugins skipped
+            by an open circuit breaker are not included.
+        """
+        budget = self.timeout_seconds if timeout is _DEFAULT_TIMEOUT else timeout
+        calls = self._admit(
+            [
+                (loaded, handler)
+                for loaded, handler in self.handlers(event_name, method_name)
+                if loaded.name not in exclude
+            ]
+        )
+        if not calls:
+            return []
+
+        submitted = [
+            self._submit(loaded.name, event_name, handler, event)
+            for loaded, handler in calls
+        ]
+        results = self._await_results(
+            [loaded.name for loaded, _ in calls], submitted, budget
+        )
+        for result in results:
+            self._settle(result.plugin_name, event_name, result, count_overruns)
+        return results
+
+    def dispatch_first(
+        self,
+        event_name: str,
+        method_name: str,
+        event: Any,
+        timeout: float | None = _DEFAULT_TIMEOUT,
+    ) -> list[PluginCallResult]:
+        """Call subscribed plugins one at a time until one returns a value.
+
+        For request-style events where the first capable plugin answers
+        (e.g. transcription.requested). With timeout=None the handlers run
+        on the calling thread.
+
+        Returns:
+            Results of the calls made, in order. If a plugin returned a
+            non-None value its result is the last one.
+        """
+        budget = self.timeout_seconds if timeout is _DEFAULT_TIMEOUT else timeout
+        results: list[PluginCallResult] = []
+        for loaded, handler in self._admit(self.handlers(event_name, method_name)):
+            if budget is None:
+                value, error, duration = self._invoke(
+                    loaded.name, event_name, handler, event
+                )
+                result = PluginCallResult(loaded.name, value, error, False, duration)
+            else:
+                [result] = self._await_results(
+                    [loaded.name],
+                    [self._submit(loaded.name, event_name, handler, event)],
+                    budget,
+                )
+            self._settle(loaded.name, event_name, result)
+            results.append(result)
+            if result.ok and result.value is not None:
+                break
+        return results
+
+    def _admit(
+        self, calls: list[tuple[LoadedPlugin, Callable[[Any], Any]]]
+    ) -> list[tuple[LoadedPlugin, Callable[[Any], Any]]]:
+        """Drop calls to plugins whose circuit breaker is open."""
+        if self.breaker_threshold <= 0:
+            return calls
+        admitted = []
+        with _state.lock:
+            for loaded, handler in calls:
+                if _state.breaker(loaded.name).allow(self.breaker_reset_seconds):
+                    admitted.append((loaded, handler))
+                else:
+                    _state.stats(loaded.name).skipped += 1
+                    logger.debug("Skipping plugin %s: circuit open", loaded.name)
+        return admitted
+
+    def _submit(
+        self,
+        plugin_name: str,
+        event_name: str,
+        handler: Callable[[Any], Any],
+        event: Any,
+    ) -> tuple[Future[tuple[Any, str | None, float]], _CallClock]:
+        """Queue one handler call on the shared pool."""
+        clock = _CallClock()
+        future = _shared_pool().submit(
+            self._invoke, plugin_name, event_name, handler, event, clock
+        )
+        return future, clock
+
+    @staticmethod
+    def _await_results(
+        names: list[str],
+        submitted: list[tuple[Future[tuple[Any, str | None, float]], _CallClock]],
+        budget: float | None,
+    ) -> list[PluginCallResult]:
+        """Wait for submitted calls, timing each from when it started.
+
+        A call still queued a full budget after submission is cancelled and
+        reported as not started.
+
+        Returns:
+            One result per call, in the order given.
+        """
+        results: list[PluginCallResult | None] = [None] * len(submitted)
+        submitted_at = time.monotonic()
+        pending = set(range(len(submitted)))
+        while pending:
+            now = time.monotonic()
+            wake: float | None = None
+            for i in sorted(pending):
+                future, clock = submitted[i]
+                if future.done():
+                    value, error, duration = future.result()
+                    results[i] = PluginCallResult(
+                        names[i], value, error, False, duration
+                    )
+                    pending.discard(i)
+                    continue
+                if budget is None:
+                    continue
+                started = clock.started_at
+                deadline = (submitted_at if started is None else started) + budget
+                if now < deadline:
+                    wake = deadline if wake is None else min(wake, deadline)
+                elif started is not None:
+                    results[i] = PluginCallResult(
+                        names[i],
+                        error=f"timed out after {budget:g}s",
+                        timed_out=True,
+                        duration_seconds=budget,
+                    )
+                    pending.discard(i)
+                elif future.cancel():
+                    results[i] = PluginCallResult(
+                        names[i],
+                        error="not started: plugin event pool busy",
+                        not_started=True,
+                    )
+                    pending.discard(i)
+                else:
+                    # Just picked up by a worker; its own budget starts now
+                    recheck = now + _START_RECHECK_SECONDS
+                    wake = recheck if wake is None else min(wake, recheck)
+            if pending:
+                wait_futures(
+                    [submitted[i][0] for i in pending],
+                    timeout=None if wake is None else max(0.0, wake - now),
+                    return_when=FIRST_COMPLETED,
+                )
+        return [result for result in results if result is not None]
+
+    @staticmethod
+    def _invoke(
+        plugin_name: str,
+        event_name: str,
+        handler: Callable[[Any], Any],
+        event: Any,
+        clock: _CallClock | None = None,
+    ) -> tuple[Any, str | None, float]:
+        """Run one handler, recording its real duration even if it overruns."""
+        start = time.monotonic()
+        if clock is not None:
+            clock.started_at = start
+        value: Any = None
+        error: str | None = None
+        try:
+            value = handler(event)
+        except Exception as e:
+            logger.warning("Plugin %s failed on %s: %s", plugin_name, event_name, e)
+            error = str(e) or type(e).__name__
+        duration = time.monotonic() - start
+        _record_call(plugin_name, event_name, duration, error is not None)
+        return value, error, duration
+
+    def _settle(
+        self,
+        plugin_name: str,
+        event_name: str,
+        result: PluginCallResult,
+        count_overruns: bool = True,
+    ) -> None:
+        """Feed a call outcome to the plugin's circuit breaker."""
+        if result.not_started:
+            # Never ran, so it says nothing about the plugin's health
+            with _state.lock:
+                _state.stats(plugin_name).skipped += 1
+                _state.breaker(plugin_name).release()
+            logger.warning(
+                "Plugin %s not called for %s: event pool busy", plugin_name, event_name
+            )
+            return
+        with _state.lock:
+            if result.timed_out:
+                _state.stats(plugin_name).timeouts += 1
+            if self.breaker_threshold <= 0:
+                return
+            if result.timed_out and not count_overruns:
+                _state.breaker(plugin_name).release()
+                tripped = False
+            else:
+                tripped = _state.breaker(plugin_name).record(
+                    result.timed_out, self.breaker_threshold
+                )
+            if tripped:
+                stats = _state.stats(plugin_name)
+                stats.breaker_trips += 1
+                stats.last_tripped_at = datetime.now(timezone.utc).isoformat()
+        if result.timed_out:
+            logger.warning("Plugin %s timed out on %s", plugin_name, event_name)
+        if tripped:
+            logger.warning(
+                "Disabling plugin %s for %.0fs after repeated slow calls",
+                plugin_name,
+                self.breaker_reset_seconds,
+            )
+
+
+def get_event_dispatcher(registry: PluginRegistry) -> PluginEventDispatcher:
+    """Get a dispatcher for registry using the current configuration."""
+    return PluginEventDispatcher.from_config(registry)
@@ -80,6 +80,17 @@ class FileScannedEvent:
     tracks: list[TrackInfo]
 
 
+@dataclass
+class FilesScannedEvent:
+    """Event data for the batched file.scanned hook (on_files_scanned).
+
+    Carries a batch of newly scanned or changed files so plugins backed by
+    an external API can resolve many files per request.
+    """
+
+    files: list[FileScannedEvent]
+
+
 @dataclass
 class FileMetadataEnrichedEvent:
     """Event data for file.metadata_enriched event.
@@ -33,6 +33,13 @@ class AnalyzerPlugin(Protocol):
         description: str - Human-readable description
         min_api_version: str - Minimum API version (default: "1.0.0")
         max_api_version: str - Maximum API version (default: "1.99.99")
+
+    Optional methods:
+        on_files_scanned(event: FilesScannedEvent) -> list[dict | None]
+            Batched form of on_file_scanned used by the scan enrichment
+            stage. Returns one enrichment (or None) per file in
+            event.files, in order. Plugins without it get one
+            on_file_scanned call per file.
     """
 
     name: str
@@ -11,7 +11,7 @@ from typing import Any
 
 from vpo.config.models import PluginConnectionConfig
 from vpo.language import normalize_language
-from vpo.plugin.events import FileScannedEvent
+from vpo.plugin.events import FileScannedEvent, FilesScannedEvent
 from vpo.plugin_sdk.models import MetadataEnrichment
 from vpo.plugins.radarr_metadata.client import (
     RadarrAuthError,
@@ -134,6 +134,21 @@ class RadarrMetadataPlugin:
             logger.error("Radarr: unexpected error: %s", e)
             return None
 
+    def on_files_scanned(self, event: FilesScannedEvent) -> list[dict[str, Any] | None]:
+        """Enrich a batch of scanned files from Radarr.
+
+        The movie and movie file lists are fetched once (on the first call)
+        and every file in the batch is resolved against that cache, so a
+        batch costs no API requests after the first.
+
+        Args:
+            event: FilesScannedEvent with the batch of scanned files.
+
+        Returns:
+            One enrichment dict (or None) per file, in order.
+        """
+        return [self.on_file_scanned(file_event) for file_event in event.files]
+
     def _create_enrichment(
         self,
         movie: RadarrMovie,
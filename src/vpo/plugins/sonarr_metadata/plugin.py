@@ -7,11 +7,12 @@ scanned files with original language, series title, and episode information.
 from __future__ import annotations
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from vpo.config.models import PluginConnectionConfig
 from vpo.language import normalize_language
-from vpo.plugin.events import FileScannedEvent
+from vpo.plugin.events import FileScannedEvent, FilesScannedEvent
 from vpo.plugin_sdk.models import MetadataEnrichment
 from vpo.plugins.sonarr_metadata.client import (
     SonarrAuthError,
@@ -26,6 +27,9 @@ from vpo.plugins.sonarr_metadata.models import (
 
 logger = logging.getLogger(__name__)
 
+# Concurrent parse requests per on_files_scanned batch
+PARSE_CONCURRENCY = 4
+
 
 class SonarrMetadataPlugin:
     """Sonarr metadata enrichment plugin.
@@ -135,6 +139,26 @@ class SonarrMetadataPlugin:
             logger.error("Sonarr: unexpected error: %s", e)
             return None
 
+    def on_files_scanned(self, event: FilesScannedEvent) -> list[dict[str, Any] | None]:
+        """Enrich a batch of scanned files from Sonarr.
+
+        Sonarr identifies episodes one path at a time, so the batch's
+        uncached paths are sent to the parse endpoint PARSE_CONCURRENCY
+        requests at a time.
+
+        Args:
+            event: FilesScannedEvent with the batch of scanned files.
+
+        Returns:
+            One enrichment dict (or None) per file, in order.
+        """
+        if len(event.files) <= 1:
+            return [self.on_file_scanned(file_event) for file_event in event.files]
+        with ThreadPoolExecutor(
+            max_workers=PARSE_CONCURRENCY, thread_name_prefix="sonarr-parse"
+        ) as pool:
+            return list(pool.map(self.on_file_scanned, event.files))
+
     def _create_enrichment(self, result: SonarrParseResult) -> MetadataEnrichment:
         """Create enrichment data from Sonarr parse result.
 
@@ -0,0 +1,570 @@
+"""Compiled condition evaluation for conditional policy rules.
+
+The functions in :mod:`vpo.policy.conditions` interpret the condition tree
+on every call: they re-dispatch on condition type, normalize the policy's
+language codes, casefold codec names and look up title regexes for every
+track of every file. This module performs that work once per policy,
+turning each condition into a closure over pre-normalized lookup sets and
+pre-compiled patterns. Results (including reason strings) are identical to
+:func:`vpo.policy.conditions.evaluate_condition`.
+
+Key Functions:
+    compile_condition: Compile a Condition into a callable
+    get_compiled_rules: Compile (and cache) the conditions of a RulesConfig
+    load_compiled_policy: Load a policy file, cached by content hash
+
+Usage:
+    from vpo.policy.compiled import ConditionContext, compile_condition
+
+    check = compile_condition(condition)
+    result, reason = check(ConditionContext(tracks))
+"""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import operator
+import re
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from vpo.language import normalize_language
+from vpo.policy.conditions import (
+    DEFAULT_COMMENTARY_PATTERNS,
+    _compile_pattern,
+    _evaluate_metadata_comparison,
+    evaluate_audio_is_multi_language,
+    evaluate_container_metadata,
+    evaluate_is_dubbed,
+    evaluate_is_original,
+    evaluate_plugin_metadata,
+)
+from vpo.policy.types import (
+    AndCondition,
+    AudioIsMultiLanguageCondition,
+    Comparison,
+    ComparisonOperator,
+    Condition,
+    ContainerMetadataCondition,
+    CountCondition,
+    ExistsCondition,
+    IsDubbedCondition,
+    IsOriginalCondition,
+    NotCondition,
+    OrCondition,
+    PluginMetadataCondition,
+    PolicySchema,
+    RulesConfig,
+    TitleMatch,
+    TrackFilters,
+)
+
+if TYPE_CHECKING:
+    from vpo.domain import PluginMetadataDict, TrackInfo
+    from vpo.language_analysis.models import LanguageAnalysisResult
+    from vpo.track_classification.models import TrackClassificationResult
+
+
+# Maximum number of compiled rule sets / policies kept in memory
+_RULES_CACHE_SIZE = 64
+_POLICY_CACHE_SIZE = 16
+
+_COMPARISON_OPS: dict[ComparisonOperator, Callable[[int, int], bool]] = {
+    ComparisonOperator.EQ: operator.eq,
+    ComparisonOperator.LT: operator.lt,
+    ComparisonOperator.LTE: operator.le,
+    ComparisonOperator.GT: operator.gt,
+    ComparisonOperator.GTE: operator.ge,
+}
+
+
+class ConditionContext:
+    """Per-file inputs for compiled condition evaluation.
+
+    Tracks are grouped by (casefolded) track type on first use so that
+    several conditions over the same file share one pass over the tracks.
+    """
+
+    __slots__ = (
+        "tracks",
+        "language_results",
+        "plugin_metadata",
+        "classification_results",
+        "container_tags",
+        "_by_type",
+    )
+
+    def __init__(
+        self,
+        tracks: list[TrackInfo],
+        language_results: dict[int, LanguageAnalysisResult] | None = None,
+        plugin_metadata: PluginMetadataDict | None = None,
+        classification_results: dict[int, TrackClassificationResult] | None = None,
+        container_tags: dict[str, str] | None = None,
+    ) -> None:
+        self.tracks = tracks
+        self.language_results = language_results
+        self.plugin_metadata = plugin_metadata
+        self.classification_results = classification_results
+        self.container_tags = container_tags
+        self._by_type: dict[str, list[TrackInfo]] | None = None
+
+    def tracks_of_type(self, track_type: str) -> list[TrackInfo]:
+        """Return tracks whose casefolded type equals ``track_type``."""
+        if self._by_type is None:
+            by_type: dict[str, list[TrackInfo]] = {}
+            for track in self.tracks:
+                by_type.setdefault(track.track_type.casefold(), []).append(track)
+            self._by_type = by_type
+        return self._by_type.get(track_type, [])
+
+
+CompiledCondition = Callable[[ConditionContext], tuple[bool, str]]
+"""A compiled condition: takes a context, returns (result, reason)."""
+
+TrackPredicate = Callable[["TrackInfo"], bool]
+
+
+@functools.lru_cache(maxsize=512)
+def _normalized_language(code: str) -> str:
+    """Normalize a language code to ISO 639-2/B (cached, no warnings)."""
+    return normalize_language(code, "639-2/B", warn_on_conversion=False)
+
+
+def _compile_comparison(
+    spec: int | Comparison, attr: str
+) -> Callable[[TrackInfo], bool]:
+    """Compile a numeric track filter (exact value or comparison)."""
+    getter = operator.attrgetter(attr)
+
+    if isinstance(spec, int):
+        expected = spec
+
+        def exact(track: TrackInfo) -> bool:
+            actual = getter(track)
+            return actual is not None and actual == expected
+
+        return exact
+
+    op_func = _COMPARISON_OPS.get(spec.operator)
+    value = spec.value
+    if op_func is None:
+        return lambda track: False
+
+    def compare(track: TrackInfo) -> bool:
+        actual = getter(track)
+        return actual is not None and op_func(actual, value)
+
+    return compare
+
+
+def _compile_title(pattern: str | TitleMatch) -> Callable[[str], bool]:
+    """Compile a title filter into a predicate over a non-None title."""
+    if isinstance(pattern, str) or pattern.contains is not None:
+        needle = (pattern if isinstance(pattern, str) else pattern.contains).casefold()
+        return lambda title: needle in title.casefold()
+
+    if pattern.regex is not None:
+        try:
+            compiled = re.compile(pattern.regex, re.IGNORECASE)
+        except re.error:
+            # Invalid regex - shouldn't happen due to validation
+            return lambda title: False
+        return lambda title: compiled.search(title) is not None
+
+    # Should never reach here due to loader validation
+    raise ValueError("TitleMatch must have either 'contains' or 'regex' set")
+
+
+def _compile_commentary(
+    commentary_patterns: tuple[str, ...] | None,
+) -> Callable[[str], bool]:
+    """Compile commentary patterns into a predicate over a casefolded title."""
+    checks: list[Callable[[str], bool]] = []
+    for pattern in commentary_patterns or DEFAULT_COMMENTARY_PATTERNS:
+        compiled = _compile_pattern(pattern)
+        if compiled is not None:
+            checks.append(lambda title, c=compiled: c.search(title) is not None)
+        else:
+            # Invalid regex, fall back to substring match
+            needle = pattern.casefold()
+            checks.append(lambda title, n=needle: n in title)
+    return lambda title: any(check(title) for check in checks)
+
+
+def compile_track_filters(
+    filters: TrackFilters,
+    commentary_patterns: tuple[str, ...] | None = None,
+) -> TrackPredicate:
+    """Compile track filters into a single track predicate.
+
+    Equivalent to :func:`vpo.policy.conditions.matches_track`, with policy
+    languages normalized, codecs casefolded and patterns compiled up front.
+
+    Args:
+        filters: Filter criteria to compile.
+        commentary_patterns: Patterns to identify commentary tracks
+            (for not_commentary filter).
+
+    Returns:
+        Predicate returning True if a track matches all criteria.
+    """
+    checks: list[TrackPredicate] = []
+
+    if filters.language is not None:
+        patterns = (
+            (filters.language,)
+            if isinstance(filters.language, str)
+            else filters.language
+        )
+        languages = frozenset(_normalized_language(p) for p in patterns)
+        checks.append(
+            lambda t: (
+                t.language is not None and _normalized_language(t.language) in languages
+            )
+        )
+
+    if filters.codec is not None:
+        patterns = (filters.codec,) if isinstance(filters.codec, str) else filters.codec
+        codecs = frozenset(p.casefold() for p in patterns)
+        checks.append(lambda t: t.codec is not None and t.codec.casefold() in codecs)
+
+    if filters.is_default is not None:
+        is_default = filters.is_default
+        checks.append(lambda t: t.is_default == is_default)
+
+    if filters.is_forced is not None:
+        is_forced = filters.is_forced
+        checks.append(lambda t: t.is_forced == is_forced)
+
+    if filters.channels is not None:
+        checks.append(_compile_comparison(filters.channels, "channels"))
+    if filters.width is not None:
+        checks.append(_compile_comparison(filters.width, "width"))
+    if filters.height is not None:
+        checks.append(_compile_comparison(filters.height, "height"))
+
+    if filters.title is not None:
+        title_matches = _compile_title(filters.title)
+        checks.append(lambda t: t.title is not None and title_matches(t.title))
+
+    if filters.not_commentary is True:
+        is_commentary = _compile_commentary(commentary_patterns)
+        checks.append(lambda t: not (t.title and is_commentary(t.title.casefold())))
+
+    if not checks:
+        return lambda track: True
+    if len(checks) == 1:
+        return checks[0]
+    checks_tuple = tuple(checks)
+    return lambda track: all(check(track) for check in checks_tuple)
+
+
+def _compile_exists(
+    condition: ExistsCondition, commentary_patterns: tuple[str, ...] | None
+) -> CompiledCondition:
+    track_type = condition.track_type.casefold()
+    matches = compile_track_filters(condition.filters, commentary_patterns)
+    false_reason = f"exists({track_type}) → False (no matching tracks)"
+
+    def evaluate(ctx: ConditionContext) -> tuple[bool, str]:
+        for track in ctx.tracks_of_type(track_type):
+            if matches(track):
+                reason = f"exists({track_type}) → True (track[{track.index}]"
+                if track.codec:
+                    reason += f" {track.codec}"
+                if track.language:
+                    reason += f" {track.language}"
+                reason += ")"
+                return (True, reason)
+        return (False, false_reason)
+
+    return evaluate
+
+
+def _compile_count(
+    condition: CountCondition, commentary_patterns: tuple[str, ...] | None
+) -> CompiledCondition:
+    track_type = condition.track_type.casefold()
+    matches = compile_track_filters(condition.filters, commentary_patterns)
+    op_func = _COMPARISON_OPS.get(condition.operator)
+    value = condition.value
+    prefix = f"count({track_type}) {condition.operator.value} {value} →"
+
+    def evaluate(ctx: ConditionContext) -> tuple[bool, str]:
+        count = sum(1 for t in ctx.tracks_of_type(track_type) if matches(t))
+        result = op_func(count, value) if op_func is not None else False
+        return (result, f"{prefix} {result} (count={count})")
+
+    return evaluate
+
+
+def _compile_plugin_metadata(condition: PluginMetadataCondition) -> CompiledCondition:
+    plugin_name = condition.plugin.casefold()
+    field_name = condition.field.casefold()
+    label = f"plugin_metadata({plugin_name}.{field_name})"
+    op = condition.operator
+    expected = condition.value
+
+    def evaluate(ctx: ConditionContext) -> tuple[bool, str]:
+        metadata = ctx.plugin_metadata
+        if metadata is None:
+            return evaluate_plugin_metadata(condition, None)
+        # Fast path: exact (already casefolded) keys, the common case
+        plugin_data = metadata.get(plugin_name)
+        if plugin_data is None or field_name not in plugin_data:
+            return evaluate_plugin_metadata(condition, metadata)
+        return _evaluate_metadata_comparison(
+            context_label=label,
+            field_name=field_name,
+            actual_value=plugin_data[field_name],
+            expected_value=expected,
+            op=op,
+        )
+
+    return evaluate
+
+
+def _compile_and(
+    condition: AndCondition, commentary_patterns: tuple[str, ...] | None
+) -> CompiledCondition:
+    subs = tuple(
+        compile_condition(c, commentary_patterns) for c in condition.conditions
+    )
+    true_reason = f"and → True ({len(subs)} conditions)"
+
+    def evaluate(ctx: ConditionContext) -> tuple[bool, str]:
+        for sub in subs:
+            result, reason = sub(ctx)
+            if not result:
+                return (False, f"and → False ({reason})")
+        return (True, true_reason)
+
+    return evaluate
+
+
+def _compile_or(
+    condition: OrCondition, commentary_patterns: tuple[str, ...] | None
+) -> CompiledCondition:
+    subs = tuple(
+        compile_condition(c, commentary_patterns) for c in condition.conditions
+    )
+    false_reason = f"or → False ({len(subs)} conditions failed)"
+
+    def evaluate(ctx: ConditionContext) -> tuple[bool, str]:
+        for sub in subs:
+            result, reason = sub(ctx)
+            if result:
+                return (True, f"or → True ({reason})")
+        return (False, false_reason)
+
+    return evaluate
+
+
+def _compile_not(
+    condition: NotCondition, commentary_patterns: tuple[str, ...] | None
+) -> CompiledCondition:
+    inner = compile_condition(condition.inner, commentary_patterns)
+
+    def evaluate(ctx: ConditionContext) -> tuple[bool, str]:
+        result, reason = inner(ctx)
+        return (not result, f"not({reason}) → {not result}")
+
+    return evaluate
+
+
+def compile_condition(
+    condition: Condition,
+    commentary_patterns: tuple[str, ...] | None = None,
+) -> CompiledCondition:
+    """Compile a condition tree into a callable.
+
+    Args:
+        condition: The condition to compile.
+        commentary_patterns: Patterns to identify commentary tracks
+            (for not_commentary filter).
+
+    Returns:
+        Callable taking a ConditionContext and returning (result, reason),
+        matching evaluate_condition() for the same inputs.
+
+    Raises:
+        TypeError: If the condition type is unknown.
+    """
+    if isinstance(condition, ExistsCondition):
+        return _compile_exists(condition, commentary_patterns)
+
+    if isinstance(condition, CountCondition):
+        return _compile_count(condition, commentary_patterns)
+
+    if isinstance(condition, AudioIsMultiLanguageCondition):
+        return lambda ctx: evaluate_audio_is_multi_language(
+            condition, ctx.tracks, ctx.language_results
+        )
+
+    if isinstance(condition, PluginMetadataCondition):
+        return _compile_plugin_metadata(condition)
+
+    if isinstance(condition, ContainerMetadataCondition):
+        return lambda ctx: evaluate_container_metadata(condition, ctx.container_tags)
+
+    if isinstance(condition, IsOriginalCondition):
+        return lambda ctx: evaluate_is_original(
+            condition, ctx.tracks, ctx.classification_results
+        )
+
+    if isinstance(condition, IsDubbedCondition):
+        return lambda ctx: evaluate_is_dubbed(
+            condition, ctx.tracks, ctx.classification_results
+        )
+
+    if isinstance(condition, AndCondition):
+        return _compile_and(condition, commentary_patterns)
+
+    if isinstance(condition, OrCondition):
+        return _compile_or(condition, commentary_patterns)
+
+    if isinstance(condition, NotCondition):
+        return _compile_not(condition, commentary_patterns)
+
+    raise TypeError(f"Unknown condition type: {type(condition).__name__}")
+
+
+@dataclass(frozen=True)
+class CompiledRules:
+    """Compiled 'when' conditions for a RulesConfig, in rule order."""
+
+    rules: RulesConfig
+    """The source rules (kept alive so the id-based cache stays valid)."""
+
+    conditions: tuple[CompiledCondition, ...]
+    """One compiled condition per rule, aligned with rules.items."""
+
+
+_rules_cache: OrderedDict[int, CompiledRules] = OrderedDict()
+_rules_lock = threading.Lock()
+
+
+def get_compiled_rules(rules: RulesConfig) -> CompiledRules:
+    """Return compiled conditions for a RulesConfig, compiling on first use.
+
+    Compiled rules are cached by object identity. Policies are loaded once
+    per run (or shared via load_compiled_policy), so the same RulesConfig
+    instance is evaluated for every file and compiles exactly once.
+
+    Args:
+        rules: The rules configuration to compile.
+
+    Returns:
+        CompiledRules aligned with rules.items.
+    """
+    key = id(rules)
+    with _rules_lock:
+        cached = _rules_cache.get(key)
+        if cached is not None and cached.rules is rules:
+            _rules_cache.move_to_end(key)
+            return cached
+
+    compiled = CompiledRules(
+        rules=rules,
+        conditions=tuple(compile_condition(rule.when) for rule in rules.items),
+    )
+    with _rules_lock:
+        _rules_cache[key] = compiled
+        _rules_cache.move_to_end(key)
+        while len(_rules_cache) > _RULES_CACHE_SIZE:
+            _rules_cache.popitem(last=False)
+    return compiled
+
+
+@dataclass(frozen=True)
+class CompiledPolicy:
+    """A loaded policy with all conditional rules precompiled."""
+
+    schema: PolicySchema
+    """The validated policy."""
+
+    content_hash: str
+    """SHA-256 hex digest of the policy file content."""
+
+    rules_by_phase: dict[str, CompiledRules]
+    """Compiled rules keyed by phase name (phases without rules omitted)."""
+
+
+def compile_policy(schema: PolicySchema, content_hash: str) -> CompiledPolicy:
+    """Compile all conditional rules of a policy.
+
+    Args:
+        schema: The validated policy.
+        content_hash: Hash identifying the policy content.
+
+    Returns:
+        CompiledPolicy wrapping the schema.
+    """
+    rules_by_phase = {
+        phase.name: get_compiled_rules(phase.rules)
+        for phase in schema.phases
+        if phase.rules is not None
+    }
+    return CompiledPolicy(
+        schema=schema, content_hash=content_hash, rules_by_phase=rules_by_phase
+    )
+
+
+_policy_cache: OrderedDict[str, CompiledPolicy] = OrderedDict()
+_policy_lock = threading.Lock()
+
+
+def hash_policy_content(content: bytes) -> str:
+    """Return the SHA-256 hex digest identifying policy file content."""
+    return hashlib.sha256(content).hexdigest()
+
+
+def load_compiled_policy(policy_path: Path) -> CompiledPolicy:
+    """Load, validate and compile a policy file, cached by content hash.
+
+    Reloading an unchanged policy file returns the same CompiledPolicy
+    (and PolicySchema) instance, so compiled conditions are reused across
+    jobs. Editing the file changes its hash and triggers a fresh load.
+
+    Args:
+        policy_path: Path to the YAML policy file.
+
+    Returns:
+        CompiledPolicy for the file's current content.
+
+    Raises:
+        PolicyValidationError: If the policy file is invalid.
+        FileNotFoundError: If the policy file does not exist.
+    """
+    from vpo.policy.loader import load_policy
+
+    if not policy_path.exists():
+        raise FileNotFoundError(f"Policy file not found: {policy_path}")
+
+    content_hash = hash_policy_content(policy_path.read_bytes())
+    with _policy_lock:
+        cached = _policy_cache.get(content_hash)
+        if cached is not None:
+            _policy_cache.move_to_end(content_hash)
+            return cached
+
+    compiled = compile_policy(load_policy(policy_path), content_hash)
+    with _policy_lock:
+        _policy_cache[content_hash] = compiled
+        while len(_policy_cache) > _POLICY_CACHE_SIZE:
+            _policy_cache.popitem(last=False)
+    return compiled
+
+
+def clear_compiled_caches() -> None:
+    """Drop all cached compiled policies and rules (mainly for tests)."""
+    with _rules_lock:
+        _rules_cache.clear()
+    with _policy_lock:
+        _policy_cache.clear()
@@ -15,6 +15,11 @@ if TYPE_CHECKING:
     from vpo.track_classification.models import TrackClassificationResult
 
 from vpo.domain import TrackInfo
+from vpo.policy.compiled import (
+    CompiledCondition,
+    ConditionContext,
+    get_compiled_rules,
+)
 from vpo.policy.conditions import PluginMetadataDict
 from vpo.policy.types import (
     ConditionalResult,
@@ -81,39 +86,35 @@ def evaluate_conditional_rules(
             evaluation_trace=(),
         )
 
+    compiled = get_compiled_rules(rules)
+    ctx = ConditionContext(
+        tracks,
+        language_results=language_results,
+        plugin_metadata=plugin_metadata,
+        classification_results=classification_results,
+        container_tags=container_tags,
+    )
+
     if rules.match == MatchMode.FIRST:
         return _evaluate_first_match(
-            items,
-            tracks,
-            file_path,
-            language_results,
-            plugin_metadata,
-            classification_results,
-            container_tags,
+            items, compiled.conditions, ctx, file_path, plugin_metadata
         )
     return _evaluate_all_match(
-        items,
-        tracks,
-        file_path,
-        language_results,
-        plugin_metadata,
-        classification_results,
-        container_tags,
+        items, compiled.conditions, ctx, file_path, plugin_metadata
     )
 
 
 def _evaluate_first_match(
     rules: tuple[ConditionalRule, ...],
-    tracks: list[TrackInfo],
+    conditions: tuple[CompiledCondition, ...],
+    ctx: ConditionContext,
     file_path: Path,
-    language_results: dict[int, LanguageAnalysisResult] | None,
     plugin_metadata: PluginMetadataDict | None,
-    classification_results: dict[int, TrackClassificationResult] | None,
-    container_tags: dict[str, str] | None,
 ) -> ConditionalResult:
     """First-match-wins evaluation: stop on first matching rule."""
     from vpo.policy.actions import ActionContext, execute_actions
-    from vpo.policy.conditions import evaluate_condition
+
+    tracks = ctx.tracks
 
     evaluation_trace: list[RuleEvaluation] = []
     matched_rule: str | None = None
@@ -124,16 +125,8 @@ def _evaluate_first_match(
     track_language_changes: list[TrackLanguageChange] = []
     container_metadata_changes: list[ContainerMetadataChange] = []
 
-    for i, rule in enumerate(rules):
-        result, reason = evaluate_condition(
-            rule.when,
-            tracks,
-            language_results,
-            None,
-            plugin_metadata,
-            classification_results,
-            container_tags,
-        )
+    for i, (rule, condition) in enumerate(zip(rules, conditions)):
+        result, reason = condition(ctx)
 
         if result:
             evaluation_trace.append(
@@ -190,16 +183,15 @@ def _evaluate_first_match(
 
 def _evaluate_all_match(
     rules: tuple[ConditionalRule, ...],
-    tracks: list[TrackInfo],
+    conditions: tuple[CompiledCondition, ...],
+    ctx: ConditionContext,
     file_path: Path,
-    language_results: dict[int, LanguageAnalysisResult] | None,
     plugin_metadata: PluginMetadataDict | None,
-    classification_results: dict[int, TrackClassificationResult] | None,
-    container_tags: dict[str, str] | None,
 ) -> ConditionalResult:
     """All-match evaluation: evaluate every rule, accumulate results."""
     from vpo.policy.actions import ActionContext, execute_actions
-    from vpo.policy.conditions import evaluate_condition
+
+    tracks = ctx.tracks
 
     # Warn about else_actions on non-last rules (ignored in ALL mode)
     for rule in rules[:-1]:
@@ -220,16 +212,8 @@ def _evaluate_all_match(
     container_metadata_changes: list[ContainerMetadataChange] = []
     any_matched = False
 
-    for rule in rules:
-        result, reason = evaluate_condition(
-            rule.when,
-            tracks,
-            language_results,
-            None,
-            plugin_metadata,
-            classification_results,
-            container_tags,
-        )
+    for rule, condition in zip(rules, conditions):
+        result, reason = condition(ctx)
 
         if result:
             any_matched = True
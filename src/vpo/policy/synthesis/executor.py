@@ -3,6 +3,11 @@
 This module implements the execution of synthesis plans using FFmpeg
 to transcode audio tracks and mkvmerge to assemble the final file.
 
+All synthesized tracks are produced by a single FFmpeg process: each
+distinct source track is decoded once and fanned out with ``asplit`` into
+the requested downmixes and encoders, so creating stereo AAC, 5.1 AC3 and
+Opus from one TrueHD track costs one decode instead of three.
+
 Key Features:
     - Backup creation before any file modification
     - Clean cancellation via SIGINT handler
@@ -27,6 +32,7 @@ from vpo.config.loader import get_temp_directory_for_file
 from vpo.executor.interface import require_tool
 from vpo.policy.synthesis.encoders import (
     get_encoder_for_codec,
+    get_format_for_codec,
 )
 from vpo.policy.synthesis.exceptions import (
     SynthesisCancelledError,
@@ -42,6 +48,15 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# File extension for each synthesized track's temp file
+_CODEC_EXTENSIONS: dict[AudioCodec, str] = {
+    AudioCodec.EAC3: ".eac3",
+    AudioCodec.AAC: ".aac",
+    AudioCodec.AC3: ".ac3",
+    AudioCodec.OPUS: ".opus",
+    AudioCodec.FLAC: ".flac",
+}
+
 
 @contextmanager
 def _sigint_handler() -> Generator[None, None, None]:
@@ -107,7 +122,8 @@ class FFmpegSynthesisExecutor:
     """Executor for audio synthesis using FFmpeg and mkvmerge.
 
     This executor:
-    1. Transcodes source tracks to target codec using FFmpeg
+    1. Transcodes all synthesized tracks in one FFmpeg run, decoding each
+       distinct source track once and splitting it into every output
     2. Uses mkvmerge to add synthesized tracks to the output file
     3. Preserves all original tracks
     """
@@ -138,33 +154,78 @@ class FFmpegSynthesisExecutor:
             return self._mkvmerge_path
         return require_tool("mkvmerge")
 
+    def _build_filter_graph(
+        self,
+        operations: tuple[SynthesisOperation, ...],
+        audio_tracks: tuple,
+    ) -> tuple[str, list[str]]:
+        """Build an FFmpeg filter graph that decodes each source track once.
+
+        Operations that share a source track are fed from a single decode
+        through ``asplit``; each branch then applies its own downmix filter.
+        An operation whose source is used only once and needs no downmix
+        maps the input stream directly.
+
+        Args:
+            operations: Synthesis operations to perform.
+            audio_tracks: Tuple of audio TrackInfo from the file.
+
+        Returns:
+            Tuple of (filter_complex expression, or "" if no filtering is
+            needed; -map specifier for each operation, in order).
+        """
+        # Group operations by audio-relative stream index, preserving order.
+        # FFmpeg 0:a:N expects N to be the audio stream index (0-based
+        # within audio), not the global track index.
+        by_stream: dict[int, list[int]] = {}
+        for i, operation in enumerate(operations):
+            source_track_index = operation.source_track.track_index
+            audio_stream_index = sum(
+                1 for t in audio_tracks if t.index < source_track_index
+            )
+            by_stream.setdefault(audio_stream_index, []).append(i)
+
+        chains: list[str] = []
+        maps = [""] * len(operations)
+        for stream, op_indices in by_stream.items():
+            source = f"0:a:{stream}"
+            if len(op_indices) > 1:
+                branches = [f"[s{stream}_{j}]" for j in range(len(op_indices))]
+                chains.append(f"[{source}]asplit={len(op_indices)}{''.join(branches)}")
+            else:
+                branches = [f"[{source}]"]
+
+            for i, branch in zip(op_indices, branches, strict=True):
+                downmix_filter = operations[i].downmix_filter
+                if downmix_filter:
+                    chains.append(f"{branch}{downmix_filter}[out{i}]")
+                    maps[i] = f"[out{i}]"
+                elif len(op_indices) > 1:
+                    maps[i] = branch
+                else:
+                    maps[i] = source
+
+        return ";".join(chains), maps
+
     def _build_ffmpeg_args(
         self,
         input_path: Path,
-        operation: SynthesisOperation,
-        output_path: Path,
+        outputs: list[tuple[SynthesisOperation, Path]],
         audio_tracks: tuple,
     ) -> list[str]:
-        """Build FFmpeg command arguments for a synthesis operation.
+        """Build one FFmpeg command producing every synthesized track.
 
         Args:
             input_path: Path to input file.
-            operation: The synthesis operation to perform.
-            output_path: Path for output audio file.
+            outputs: List of (operation, output audio path) tuples.
             audio_tracks: Tuple of audio TrackInfo from the file.
 
         Returns:
             List of command arguments.
         """
         ffmpeg = str(self._get_ffmpeg())
-        encoder = get_encoder_for_codec(operation.target_codec)
-
-        # Calculate audio-relative stream index from global track index.
-        # FFmpeg -map 0:a:N expects N to be the audio stream index
-        # (0-based within audio), not the global track index.
-        source_track_index = operation.source_track.track_index
-        audio_stream_index = sum(
-            1 for t in audio_tracks if t.index < source_track_index
+        filter_graph, maps = self._build_filter_graph(
+            tuple(operation for operation, _ in outputs), audio_tracks
         )
 
         args = [
@@ -173,67 +234,59 @@ class FFmpegSynthesisExecutor:
             "-y",  # Overwrite output
             "-i",
             str(input_path),
-            "-map",
-            f"0:a:{audio_stream_index}",
         ]
+        if filter_graph:
+            args.extend(["-filter_complex", filter_graph])
+
+        for (operation, output_path), map_spec in zip(outputs, maps, strict=True):
+            args.extend(
+                [
+                    "-map",
+                    map_spec,
+                    "-c:a",
+                    get_encoder_for_codec(operation.target_codec),
+                ]
+            )
+            # Set bitrate (if applicable)
+            if operation.target_bitrate:
+                args.extend(["-b:a", str(operation.target_bitrate)])
+            args.extend(["-f", get_format_for_codec(operation.target_codec)])
+            args.append(str(output_path))
 
-        # Apply downmix filter if needed
-        if operation.downmix_filter:
-            args.extend(["-af", operation.downmix_filter])
-
-        # Set encoder
-        args.extend(["-c:a", encoder])
-
-        # Set bitrate (if applicable)
-        if operation.target_bitrate:
-            args.extend(["-b:a", str(operation.target_bitrate)])
-
-        # Set output format based on codec
-        if operation.target_codec == AudioCodec.EAC3:
-            args.extend(["-f", "eac3"])
-        elif operation.target_codec == AudioCodec.AAC:
-            args.extend(["-f", "adts"])
-        elif operation.target_codec == AudioCodec.AC3:
-            args.extend(["-f", "ac3"])
-        elif operation.target_codec == AudioCodec.OPUS:
-            args.extend(["-f", "opus"])
-        elif operation.target_codec == AudioCodec.FLAC:
-            args.extend(["-f", "flac"])
-
-        args.append(str(output_path))
         return args
 
-    def _transcode_track(
+    def _transcode_tracks(
         self,
         input_path: Path,
-        operation: SynthesisOperation,
+        operations: tuple[SynthesisOperation, ...],
         work_dir: Path,
         audio_tracks: tuple,
-    ) -> Path | None:
-        """Transcode a single audio track.
+    ) -> tuple[list[tuple[SynthesisOperation, Path]], list[str]]:
+        """Transcode all synthesized tracks in a single FFmpeg run.
 
         Args:
             input_path: Path to input file.
-            operation: The synthesis operation to perform.
+            operations: Synthesis operations to perform.
             work_dir: Working directory for temp files.
             audio_tracks: Tuple of audio TrackInfo for stream index calculation.
 
         Returns:
-            Path to transcoded audio file, or None on failure.
+            Tuple of (list of (operation, audio path) for created tracks,
+            list of error messages).
         """
-        # Determine output extension
-        ext_map = {
-            AudioCodec.EAC3: ".eac3",
-            AudioCodec.AAC: ".aac",
-            AudioCodec.AC3: ".ac3",
-            AudioCodec.OPUS: ".opus",
-            AudioCodec.FLAC: ".flac",
-        }
-        ext = ext_map.get(operation.target_codec, ".audio")
-        output_path = work_dir / f"synth_{operation.definition_name}{ext}"
-
-        args = self._build_ffmpeg_args(input_path, operation, output_path, audio_tracks)
+        outputs: list[tuple[SynthesisOperation, Path]] = []
+        for operation in operations:
+            ext = _CODEC_EXTENSIONS.get(operation.target_codec, ".audio")
+            outputs.append(
+                (operation, work_dir / f"synth_{operation.definition_name}{ext}")
+            )
+
+        args = self._build_ffmpeg_args(input_path, outputs, audio_tracks)
         logger.debug("FFmpeg command: %s", " ".join(args))
+        # A failed run produces none of the outputs
+        all_failed = [
+            f"Failed to transcode '{op.definition_name}'" for op in operations
+        ]
 
         try:
             result = subprocess.run(  # nosec B603 - args are controlled
@@ -242,42 +295,34 @@ class FFmpegSynthesisExecutor:
                 text=True,
                 timeout=3600,  # 1 hour timeout
             )
+        except subprocess.TimeoutExpired:
+            logger.error("FFmpeg transcode timed out")
+            return [], all_failed
+        except Exception as e:
+            logger.exception("Error running FFmpeg transcode: %s", e)
+            return [], all_failed
 
-            if result.returncode != 0:
-                logger.error(
-                    "FFmpeg transcode failed for '%s': %s",
-                    operation.definition_name,
-                    result.stderr,
-                )
-                return None
+        if result.returncode != 0:
+            logger.error("FFmpeg transcode failed: %s", result.stderr)
+            return [], all_failed
 
+        transcoded: list[tuple[SynthesisOperation, Path]] = []
+        errors: list[str] = []
+        for operation, output_path in outputs:
             if not output_path.exists():
                 logger.error(
                     "FFmpeg did not create output file for '%s'",
                     operation.definition_name,
                 )
-                return None
-
+                errors.append(f"Failed to transcode '{operation.definition_name}'")
+                continue
             logger.info(
                 "Transcoded track '%s' to %s",
                 operation.definition_name,
                 output_path.name,
             )
-            return output_path
-
-        except subprocess.TimeoutExpired:
-            logger.error(
-                "FFmpeg transcode timed out for '%s'",
-                operation.definition_name,
-            )
-            return None
-        except Exception as e:
-            logger.exception(
-                "Error transcoding track '%s': %s",
-                operation.definition_name,
-                e,
-            )
-            return None
+            transcoded.append((operation, output_path))
+        return transcoded, errors
 
     def _build_mkvmerge_args(
         self,
@@ -451,28 +496,26 @@ class FFmpegSynthesisExecutor:
         try:
             # Use SIGINT handler for clean cancellation
             with _sigint_handler():
-                # Step 1: Transcode each track
-                for i, operation in enumerate(plan.operations, 1):
-                    logger.info(
-                        "Transcoding track %d/%d: %s -> %s %dch",
-                        i,
-                        len(plan.operations),
-                        operation.definition_name,
-                        operation.target_codec.value,
-                        operation.target_channels,
-                    )
-                    audio_path = self._transcode_track(
-                        plan.file_path,
-                        operation,
-                        work_dir,
-                        plan.audio_tracks,
-                    )
-                    if audio_path is None:
-                        errors.append(
-                            f"Failed to transcode '{operation.definition_name}'"
-                        )
-                    else:
-                        transcoded_tracks.append((operation, audio_path))
+                # Step 1: Transcode all tracks, decoding each source once
+                source_count = len(
+                    {op.source_track.track_index for op in plan.operations}
+                )
+                logger.info(
+                    "Transcoding %d track(s) from %d source track(s): %s",
+                    len(plan.operations),
+                    source_count,
+                    ", ".join(
+                        f"{op.definition_name} -> {op.target_codec.value} "
+                        f"{op.target_channels}ch"
+                        for op in plan.operations
+                    ),
+                )
+                transcoded_tracks, errors = self._transcode_tracks(
+                    plan.file_path,
+                    plan.operations,
+                    work_dir,
+                    plan.audio_tracks,
+                )
 
                 if errors:
                     logger.error(
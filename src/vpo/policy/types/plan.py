@@ -509,6 +509,9 @@ class PhaseResult:
     operation_failures: tuple[tuple[str, str], ...] = ()
     """Operations that failed: (operation_name, error_message)."""
 
+    io_wait: tuple[tuple[str, float], ...] = ()
+    """Seconds waited for per-device I/O admission: (device, seconds)."""
+
     # Phase outcome tracking (for conditional phases feature)
     outcome: PhaseOutcome = PhaseOutcome.PENDING
     """Explicit outcome enum for dependency resolution."""
@@ -604,6 +607,10 @@ class FileProcessingResult:
     file_after: FileSnapshot | None = None
     """Track layout snapshot after processing (None if dry-run or failed)."""
 
+    already_compliant: bool = False
+    """True if processing was skipped because the compliance memo recorded
+    that this file, unchanged, already needs no changes under the policy."""
+
 
 class PhaseExecutionError(Exception):
     """Raised when phase execution fails.
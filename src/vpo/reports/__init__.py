@@ -2,9 +2,12 @@
 
 from vpo.reports.filters import TimeFilter, parse_relative_date
 from vpo.reports.formatters import (
+    REPORT_COLUMNS,
     ReportFormat,
+    buffer_chunks,
     format_duration,
     format_timestamp_local,
+    iter_report,
     render_csv,
     render_json,
     render_text_table,
@@ -12,10 +15,13 @@ from vpo.reports.formatters import (
 )
 
 __all__ = [
+    "REPORT_COLUMNS",
     "ReportFormat",
     "TimeFilter",
+    "buffer_chunks",
     "format_duration",
     "format_timestamp_local",
+    "iter_report",
     "parse_relative_date",
     "render_csv",
     "render_json",
@@ -5,6 +5,7 @@ import io
 import json
 import os
 import tempfile
+from collections.abc import Iterable, Iterator
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
@@ -19,6 +20,57 @@ class ReportFormat(Enum):
     TEXT = "text"
     CSV = "csv"
     JSON = "json"
+    NDJSON = "ndjson"
+
+
+# Target size of the text chunks produced by buffer_chunks
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Column layout (header, key, width) of each report shared by the
+# `vpo report` commands and the report download API; the keys also select
+# and order CSV columns.
+REPORT_COLUMNS: dict[str, list[tuple[str, str, int]]] = {
+    "jobs": [
+        ("ID", "job_id", 10),
+        ("TYPE", "type", 10),
+        ("STATUS", "status", 12),
+        ("TARGET", "target", 40),
+        ("STARTED", "started_at", 20),
+        ("COMPLETED", "completed_at", 20),
+        ("DURATION", "duration", 12),
+        ("ERROR", "error", 30),
+    ],
+    "library": [
+        ("PATH", "path", 50),
+        ("TITLE", "title", 30),
+        ("CONTAINER", "container", 10),
+        ("RESOLUTION", "resolution", 10),
+        ("AUDIO", "audio_languages", 15),
+        ("SUBTITLES", "has_subtitles", 10),
+        ("SCANNED", "scanned_at", 20),
+    ],
+    "scans": [
+        ("SCAN_ID", "scan_id", 10),
+        ("STARTED", "started_at", 20),
+        ("COMPLETED", "completed_at", 20),
+        ("DURATION", "duration", 12),
+        ("TOTAL", "files_scanned", 8),
+        ("NEW", "files_new", 8),
+        ("CHANGED", "files_changed", 8),
+        ("STATUS", "status", 12),
+    ],
+    "transcodes": [
+        ("JOB_ID", "job_id", 10),
+        ("FILE", "file_path", 40),
+        ("FROM", "source_codec", 10),
+        ("TO", "target_codec", 10),
+        ("STARTED", "started_at", 20),
+        ("COMPLETED", "completed_at", 20),
+        ("DURATION", "duration", 12),
+        ("STATUS", "status", 12),
+        ("SAVINGS", "size_change", 10),
+    ],
+}
 
 
 def _parse_iso_timestamp(iso_str: str) -> datetime:
@@ -159,26 +211,44 @@ def render_text_table(
     Returns:
         Formatted table string.
     """
-    if not rows:
-        return ""
+    return "".join(iter_text_table(rows, columns)).removesuffix("\n")
 
-    # Build header
-    header_parts = []
-    for header, _key, width in columns:
-        header_parts.append(f"{header:<{width}}")
-    header_line = " ".join(header_parts)
 
-    # Get terminal width for separator
-    try:
-        terminal_width = os.get_terminal_size().columns
-    except OSError:
-        terminal_width = 120
+def iter_text_table(
+    rows: Iterable[dict[str, Any]],
+    columns: list[tuple[str, str, int]],
+) -> Iterator[str]:
+    """Render rows as an aligned text table, one line at a time.
 
-    separator = "-" * min(len(header_line), terminal_width)
+    Column widths are fixed by columns, so each row is rendered as soon as
+    it is produced. Nothing is yielded for an empty iterable.
 
-    # Build rows
-    lines = [header_line, separator]
+    Args:
+        rows: Row dictionaries.
+        columns: List of (header, key, width) tuples defining column layout.
+
+    Yields:
+        Newline-terminated lines (header, separator, then one per row).
+    """
+    header_started = False
     for row in rows:
+        if not header_started:
+            header_started = True
+            # Build header
+            header_parts = []
+            for header, _key, width in columns:
+                header_parts.append(f"{header:<{width}}")
+            header_line = " ".join(header_parts)
+
+            # Get terminal width for separator
+            try:
+                terminal_width = os.get_terminal_size().columns
+            except OSError:
+                terminal_width = 120
+
+            yield header_line + "\n"
+            yield "-" * min(len(header_line), terminal_width) + "\n"
+
         row_parts = []
         for _header, key, width in columns:
             value = str(row.get(key, "-"))
@@ -186,9 +256,7 @@ def render_text_table(
             if len(value) > width:
                 value = value[: width - 3] + "..."
             row_parts.append(f"{value:<{width}}")
-        lines.append(" ".join(row_parts))
-
-    return "\n".join(lines)
+        yield " ".join(row_parts) + "\n"
 
 
 def _serialize_csv_value(value: Any) -> str:
@@ -220,19 +288,42 @@ def render_csv(
     Returns:
         CSV formatted string with headers.
     """
+    return "".join(iter_csv(rows, columns))
+
+
+def iter_csv(
+    rows: Iterable[dict[str, Any]],
+    columns: list[str],
+) -> Iterator[str]:
+    """Render rows as CSV with headers, one record at a time.
+
+    Args:
+        rows: Row dictionaries.
+        columns: List of column keys for CSV headers.
+
+    Yields:
+        The header record, then one CSV record per row.
+    """
     output = io.StringIO()
     writer = csv.DictWriter(
         output,
         fieldnames=columns,
         extrasaction="ignore",
     )
+
+    def take() -> str:
+        text = output.getvalue()
+        output.seek(0)
+        output.truncate()
+        return text
+
     writer.writeheader()
+    yield take()
 
     for row in rows:
         clean_row = {col: _serialize_csv_value(row.get(col)) for col in columns}
         writer.writerow(clean_row)
-
-    return output.getvalue()
+        yield take()
 
 
 def render_json(rows: list[dict[str, Any]]) -> str:
@@ -247,7 +338,89 @@ def render_json(rows: list[dict[str, Any]]) -> str:
     return json.dumps(rows, indent=2, sort_keys=True, default=str)
 
 
-def _atomic_write_text(path: Path, content: str) -> None:
+def iter_json_array(rows: Iterable[dict[str, Any]]) -> Iterator[str]:
+    """Render rows as a JSON array, one element at a time.
+
+    The concatenated output is identical to render_json().
+
+    Args:
+        rows: Row dictionaries.
+
+    Yields:
+        Pieces of the JSON document.
+    """
+    empty = True
+    for row in rows:
+        element = json.dumps(row, indent=2, sort_keys=True, default=str)
+        yield ("[\n  " if empty else ",\n  ") + element.replace("\n", "\n  ")
+        empty = False
+    yield "[]" if empty else "\n]"
+
+
+def iter_ndjson(rows: Iterable[dict[str, Any]]) -> Iterator[str]:
+    """Render rows as newline-delimited JSON (one compact object per line).
+
+    Args:
+        rows: Row dictionaries.
+
+    Yields:
+        One newline-terminated JSON object per row.
+    """
+    for row in rows:
+        yield json.dumps(row, sort_keys=True, default=str) + "\n"
+
+
+def iter_report(
+    rows: Iterable[dict[str, Any]],
+    fmt: ReportFormat,
+    columns: list[tuple[str, str, int]],
+) -> Iterator[str]:
+    """Render report rows incrementally in the given format.
+
+    Args:
+        rows: Row dictionaries (consumed lazily).
+        fmt: Output format.
+        columns: List of (header, key, width) tuples; the keys select and
+            order CSV columns.
+
+    Yields:
+        Text pieces whose concatenation is the full report.
+    """
+    if fmt == ReportFormat.TEXT:
+        return iter_text_table(rows, columns)
+    if fmt == ReportFormat.CSV:
+        return iter_csv(rows, [col[1] for col in columns])
+    if fmt == ReportFormat.NDJSON:
+        return iter_ndjson(rows)
+    return iter_json_array(rows)
+
+
+def buffer_chunks(
+    pieces: Iterable[str], chunk_size: int = STREAM_CHUNK_SIZE
+) -> Iterator[str]:
+    """Join small text pieces into chunks of roughly chunk_size characters.
+
+    Args:
+        pieces: Text pieces, e.g. from iter_report().
+        chunk_size: Minimum characters per yielded chunk (except the last).
+
+    Yields:
+        Non-empty text chunks.
+    """
+    buffer: list[str] = []
+    buffered = 0
+    for piece in pieces:
+        buffer.append(piece)
+        buffered += len(piece)
+        if buffered >= chunk_size:
+            yield "".join(buffer)
+            buffer.clear()
+            buffered = 0
+    if buffered:
+        yield "".join(buffer)
+
+
+def _atomic_write_text(path: Path, content: str | Iterable[str]) -> None:
     """Write content to file atomically using temp file + rename.
 
     Creates a temp file in the same directory as the target, writes content,
@@ -256,7 +429,7 @@ def _atomic_write_text(path: Path, content: str) -> None:
 
     Args:
         path: Target file path.
-        content: Content to write.
+        content: Content to write, as a string or an iterable of chunks.
 
     Raises:
         OSError: If write or rename fails.
@@ -273,7 +446,11 @@ def _atomic_write_text(path: Path, content: str) -> None:
             delete=False,
         ) as f:
             temp_path = Path(f.name)
-            f.write(content)
+            if isinstance(content, str):
+                f.write(content)
+            else:
+                for chunk in content:
+                    f.write(chunk)
         # File closed by context manager, now safe to rename
         temp_path.replace(path)  # Atomic on POSIX
     except Exception:
@@ -286,14 +463,16 @@ def _atomic_write_text(path: Path, content: str) -> None:
 
 
 def write_report_to_file(
-    content: str,
+    content: str | Iterable[str],
     output_path: Path,
     force: bool = False,
 ) -> None:
     """Write report content to file with overwrite protection.
 
     Uses atomic write (temp file + rename) to prevent corrupted partial
-    files if the process crashes during write.
+    files if the process crashes during write. Content may be an iterable
+    of chunks (e.g. from iter_report()), which is written as it is
+    produced.
 
     Args:
         content: Report content to write.
@@ -3,6 +3,7 @@
 import json
 import logging
 import sqlite3
+from collections.abc import Iterator
 from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Any
@@ -95,8 +96,31 @@ class PolicyApplyDetailRow:
     changes: str
 
 
+@dataclass
+class IOWaitReportRow:
+    """Represents I/O admission wait totals for one block device."""
+
+    device: str
+    phases: int
+    total_wait: str
+    avg_wait: str
+    max_wait: str
+
+
 MAX_LIMIT = 10000
 
+# Rows fetched from the cursor at a time by the streaming report queries
+REPORT_FETCH_SIZE = 500
+
+
+def _iter_cursor(cursor: sqlite3.Cursor, fetch_size: int) -> Iterator[Any]:
+    """Yield a cursor's rows, fetching fetch_size rows at a time."""
+    try:
+        while rows := cursor.fetchmany(fetch_size):
+            yield from rows
+    finally:
+        cursor.close()
+
 
 def _validate_limit(limit: int | None) -> None:
     """Validate limit parameter.
@@ -222,6 +246,35 @@ def get_jobs_report(
     Returns:
         List of job row dictionaries.
 
+    Raises:
+        ValueError: If limit is negative or exceeds MAX_LIMIT.
+    """
+    return list(
+        iter_jobs_report(
+            conn,
+            job_type=job_type,
+            status=status,
+            time_filter=time_filter,
+            limit=limit,
+        )
+    )
+
+
+def iter_jobs_report(
+    conn: sqlite3.Connection,
+    *,
+    job_type: str | None = None,
+    status: str | None = None,
+    time_filter: TimeFilter | None = None,
+    limit: int | None = 100,
+    fetch_size: int = REPORT_FETCH_SIZE,
+) -> Iterator[dict[str, Any]]:
+    """Stream the jobs report, fetching fetch_size rows at a time.
+
+    Arguments are validated and the query is executed when this function is
+    called; rows are produced as the returned iterator is consumed. See
+    get_jobs_report for the filters.
+
     Raises:
         ValueError: If limit is negative or exceeds MAX_LIMIT.
     """
@@ -258,10 +311,10 @@ def get_jobs_report(
         query += " LIMIT ?"
         params.append(limit)
 
-    cursor = conn.execute(query, params)
-    rows = cursor.fetchall()
+    return _jobs_rows(_iter_cursor(conn.execute(query, params), fetch_size))
 
-    result = []
+
+def _jobs_rows(rows: Iterator[Any]) -> Iterator[dict[str, Any]]:
     for row in rows:
         duration_seconds = calculate_duration_seconds(row[4], row[5])
         report_row = JobReportRow(
@@ -274,9 +327,7 @@ def get_jobs_report(
             duration=format_duration(duration_seconds),
             error=row[6][:50] if row[6] else "-",
         )
-        result.append(asdict(report_row))
-
-    return result
+        yield asdict(report_row)
 
 
 def get_library_report(
@@ -299,6 +350,34 @@ def get_library_report(
     Returns:
         List of library row dictionaries.
 
+    Raises:
+        ValueError: If limit is negative or exceeds MAX_LIMIT.
+    """
+    return list(
+        iter_library_report(
+            conn,
+            resolution=resolution,
+            language=language,
+            has_subtitles=has_subtitles,
+            limit=limit,
+        )
+    )
+
+
+def iter_library_report(
+    conn: sqlite3.Connection,
+    *,
+    resolution: str | None = None,
+    language: str | None = None,
+    has_subtitles: bool | None = None,
+    limit: int | None = 100,
+    fetch_size: int = REPORT_FETCH_SIZE,
+) -> Iterator[dict[str, Any]]:
+    """Stream the library report, fetching fetch_size rows at a time.
+
+    See get_library_report for the filters and iter_jobs_report for the
+    streaming behaviour.
+
     Raises:
         ValueError: If limit is negative or exceeds MAX_LIMIT.
     """
@@ -372,10 +451,14 @@ def get_library_report(
         query += " LIMIT ?"
         params.append(limit)
 
-    cursor = conn.execute(query, params)
-    rows = cursor.fetchall()
+    return _library_rows(
+        _iter_cursor(conn.execute(query, params), fetch_size), resolution
+    )
 
-    result = []
+
+def _library_rows(
+    rows: Iterator[Any], resolution: str | None
+) -> Iterator[dict[str, Any]]:
     for row in rows:
         file_path = row[1] or ""
         resolution_cat = get_resolution_category(row[6], row[5])
@@ -396,9 +479,7 @@ def get_library_report(
             has_subtitles="Yes" if subtitle_present else "No",
             scanned_at=format_timestamp_local(row[4]),
         )
-        result.append(asdict(report_row))
-
-    return result
+        yield asdict(report_row)
 
 
 def get_scans_report(
@@ -417,6 +498,24 @@ def get_scans_report(
     Returns:
         List of scan row dictionaries.
 
+    Raises:
+        ValueError: If limit is negative or exceeds MAX_LIMIT.
+    """
+    return list(iter_scans_report(conn, time_filter=time_filter, limit=limit))
+
+
+def iter_scans_report(
+    conn: sqlite3.Connection,
+    *,
+    time_filter: TimeFilter | None = None,
+    limit: int | None = 100,
+    fetch_size: int = REPORT_FETCH_SIZE,
+) -> Iterator[dict[str, Any]]:
+    """Stream the scans report, fetching fetch_size rows at a time.
+
+    See get_scans_report for the filters and iter_jobs_report for the
+    streaming behaviour.
+
     Raises:
         ValueError: If limit is negative or exceeds MAX_LIMIT.
     """
@@ -443,10 +542,10 @@ def get_scans_report(
         query += " LIMIT ?"
         params.append(limit)
 
-    cursor = conn.execute(query, params)
-    rows = cursor.fetchall()
+    return _scans_rows(_iter_cursor(conn.execute(query, params), fetch_size))
 
-    result = []
+
+def _scans_rows(rows: Iterator[Any]) -> Iterator[dict[str, Any]]:
     for row in rows:
         duration_seconds = calculate_duration_seconds(row[1], row[2])
         summary = extract_scan_summary(row[4])
@@ -461,9 +560,7 @@ def get_scans_report(
             files_changed=summary["files_changed"],
             status=row[3] or "-",
         )
-        result.append(asdict(report_row))
-
-    return result
+        yield asdict(report_row)
 
 
 def get_transcodes_report(
@@ -490,6 +587,27 @@ def get_transcodes_report(
     Returns:
         List of transcode row dictionaries.
 
+    Raises:
+        ValueError: If limit is negative or exceeds MAX_LIMIT.
+    """
+    return list(
+        iter_transcodes_report(conn, codec=codec, time_filter=time_filter, limit=limit)
+    )
+
+
+def iter_transcodes_report(
+    conn: sqlite3.Connection,
+    *,
+    codec: str | None = None,
+    time_filter: TimeFilter | None = None,
+    limit: int | None = 100,
+    fetch_size: int = REPORT_FETCH_SIZE,
+) -> Iterator[dict[str, Any]]:
+    """Stream the transcodes report, fetching fetch_size rows at a time.
+
+    See get_transcodes_report for the filters and iter_jobs_report for the
+    streaming behaviour.
+
     Raises:
         ValueError: If limit is negative or exceeds MAX_LIMIT.
     """
@@ -534,10 +652,14 @@ def get_transcodes_report(
         query += " LIMIT ?"
         params.append(limit)
 
-    cursor = conn.execute(query, params)
-    rows = cursor.fetchall()
+    return _transcodes_rows(
+        _iter_cursor(conn.execute(query, params), fetch_size), codec
+    )
 
-    result = []
+
+def _transcodes_rows(
+    rows: Iterator[Any], codec: str | None
+) -> Iterator[dict[str, Any]]:
     for row in rows:
         # Extract codec info from policy_json
         source_codec = "-"
@@ -574,9 +696,7 @@ def get_transcodes_report(
             status=row[4] or "-",
             size_change=size_change,
         )
-        result.append(asdict(report_row))
-
-    return result
+        yield asdict(report_row)
 
 
 def get_policy_apply_report(
@@ -708,3 +828,66 @@ def get_policy_apply_report(
         result.append(asdict(report_row))
 
     return result
+
+
+def get_io_wait_report(
+    conn: sqlite3.Connection,
+    *,
+    time_filter: TimeFilter | None = None,
+    limit: int | None = 100,
+) -> list[dict[str, Any]]:
+    """Query per-device I/O admission wait time from phase metrics.
+
+    Each processed phase records how long it waited for admission on each
+    block device it touched (see vpo.executor.io_admission). Rows are
+    aggregated per device, most-waited first.
+
+    Args:
+        conn: Database connection.
+        time_filter: Time range filter (on processing time).
+        limit: Maximum rows to return (None for no limit).
+
+    Returns:
+        List of I/O wait row dictionaries.
+
+    Raises:
+        ValueError: If limit is negative or exceeds MAX_LIMIT.
+    """
+    _validate_limit(limit)
+    query = """
+        SELECT
+            je.key AS device,
+            COUNT(*) AS phases,
+            SUM(je.value) AS total_wait,
+            AVG(je.value) AS avg_wait,
+            MAX(je.value) AS max_wait
+        FROM performance_metrics pm
+        JOIN processing_stats ps ON ps.id = pm.stats_id,
+            json_each(pm.io_wait_devices) je
+        WHERE pm.io_wait_devices IS NOT NULL
+    """
+    params: list[Any] = []
+
+    time_clause, time_params = _build_time_filter_clause(time_filter, "ps.processed_at")
+    query += time_clause
+    params.extend(time_params)
+
+    query += " GROUP BY je.key ORDER BY total_wait DESC"
+
+    if limit:
+        query += " LIMIT ?"
+        params.append(limit)
+
+    cursor = conn.execute(query, params)
+    return [
+        asdict(
+            IOWaitReportRow(
+                device=row[0],
+                phases=row[1],
+                total_wait=format_duration(row[2]),
+                avg_wait=format_duration(row[3]),
+                max_wait=format_duration(row[4]),
+            )
+        )
+        for row in cursor.fetchall()
+    ]
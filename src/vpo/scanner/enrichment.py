@@ -0,0 +1,240 @@
+"""Plugin enrichment stage for the scan pipeline.
+
+The scanner hands each newly scanned or changed file to an EnrichmentStage
+as soon as it has been introspected. A background thread groups the files
+into batches and fires the file.scanned event for them through the plugin
+event dispatcher:
+
+- Plugins that implement ``on_files_scanned`` get one call per batch, so
+  plugins backed by an external API can resolve many files per request.
+- Other subscribers get one ``on_file_scanned`` call per file.
+
+Plugin calls therefore overlap with the scanner's introspection instead of
+adding to it. The stage never touches the database: the scanner collects
+finished enrichments and writes them with its own connection, in bulk,
+inside the transactions it already commits.
+"""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from typing import TYPE_CHECKING, Any
+
+from vpo.plugin.dispatcher import PluginEventDispatcher, get_event_dispatcher
+from vpo.plugin.events import FILE_SCANNED, FileScannedEvent, FilesScannedEvent
+
+if TYPE_CHECKING:
+    from vpo.plugin.registry import PluginRegistry
+
+logger = logging.getLogger(__name__)
+
+# Maximum files per on_files_scanned call
+DEFAULT_BATCH_SIZE = 200
+
+# Files an on_files_scanned call is expected to resolve within one event
+# timeout; larger batches get proportionally more time
+FILES_PER_TIMEOUT = 25
+
+# How long to wait for more files before dispatching a partial batch
+BATCH_LINGER_SECONDS = 0.5
+
+BATCH_METHOD = "on_files_scanned"
+FILE_METHOD = "on_file_scanned"
+
+# Enrichments keyed by file ID, then by plugin metadata key
+Enrichments = dict[int, dict[str, dict[str, Any]]]
+
+_STOP = object()
+
+
+def metadata_key(plugin_name: str, data: dict[str, Any]) -> str:
+    """Return the plugin_metadata key an enrichment is stored under.
+
+    Enrichments that name their external_source (see MetadataEnrichment)
+    are stored under it, e.g. "radarr", which is what plugin_metadata
+    policy conditions refer to. Others are stored under the plugin name.
+    """
+    source = data.get("external_source")
+    if isinstance(source, str) and source:
+        return source
+    return plugin_name
+
+
+class EnrichmentStage:
+    """Runs file.scanned enrichment for a scan on a background thread.
+
+    Usage:
+        stage.start()
+        stage.submit(file_id, event)   # per scanned file
+        stage.collect()                # enrichments finished so far
+        stage.finish()                 # wait for the rest
+    """
+
+    def __init__(
+        self,
+        dispatcher: PluginEventDispatcher,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        linger_seconds: float = BATCH_LINGER_SECONDS,
+    ) -> None:
+        """Initialize the stage.
+
+        Args:
+            dispatcher: Dispatcher used to call the file.scanned plugins.
+            batch_size: Maximum files per batch.
+            linger_seconds: Time to wait for a batch to fill up.
+        """
+        self._dispatcher = dispatcher
+        self.batch_size = max(1, batch_size)
+        self.linger_seconds = linger_seconds
+        self._queue: queue.Queue[Any] = queue.Queue()
+        self._lock = threading.Lock()
+        self._ready: Enrichments = {}
+        self._cancelled = threading.Event()
+        self._thread: threading.Thread | None = None
+        self.files_submitted = 0
+        self.batches = 0
+
+    @classmethod
+    def from_registry(
+        cls, registry: PluginRegistry, batch_size: int = DEFAULT_BATCH_SIZE
+    ) -> EnrichmentStage | None:
+        """Create a stage for registry, or None if no plugin enriches files."""
+        if not registry.get_by_event(FILE_SCANNED):
+            return None
+        return cls(get_event_dispatcher(registry), batch_size=batch_size)
+
+    def start(self) -> None:
+        """Start the background thread."""
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run, name="vpo-scan-enrichment", daemon=True
+        )
+        self._thread.start()
+
+    def submit(self, file_id: int, event: FileScannedEvent) -> None:
+        """Queue a scanned file for enrichment."""
+        self.files_submitted += 1
+        self._queue.put((file_id, event))
+
+    def collect(self) -> Enrichments:
+        """Take the enrichments finished so far."""
+        with self._lock:
+            ready, self._ready = self._ready, {}
+        return ready
+
+    def finish(self, cancel: bool = False) -> Enrichments:
+        """Stop accepting files, wait for the thread and take what is left.
+
+        Args:
+            cancel: Drop queued files instead of enriching them. A batch
+                already being dispatched still completes.
+
+        Returns:
+            Enrichments not yet returned by collect().
+        """
+        if cancel:
+            self._cancelled.set()
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join()
+            self._thread = None
+        return self.collect()
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+            batch = [item]
+            deadline = time.monotonic() + self.linger_seconds
+            while len(batch) < self.batch_size:
+                try:
+                    item = self._queue.get(
+                        timeout=max(0.0, deadline - time.monotonic())
+                    )
+                except queue.Empty:
+                    break
+                if item is _STOP:
+                    stopping = True
+                    break
+                batch.append(item)
+            if self._cancelled.is_set():
+                continue
+            try:
+                enrichments = self._enrich(batch)
+            except Exception:
+                logger.exception("Enrichment of %d files failed", len(batch))
+                continue
+            with self._lock:
+                for file_id, data in enrichments.items():
+                    self._ready.setdefault(file_id, {}).update(data)
+
+    def _batch_timeout(self, files: int) -> float | None:
+        """Time budget for an on_files_scanned call covering files files."""
+        timeout = self._dispatcher.timeout_seconds
+        if timeout is None:
+            return None
+        return timeout * max(1.0, files / FILES_PER_TIMEOUT)
+
+    def _enrich(self, batch: list[tuple[int, FileScannedEvent]]) -> Enrichments:
+        """Dispatch file.scanned for one batch and gather the results."""
+        self.batches += 1
+        file_ids = [file_id for file_id, _ in batch]
+        enrichments: Enrichments = {}
+
+        batch_plugins = {
+            loaded.name
+            for loaded, _ in self._dispatcher.handlers(FILE_SCANNED, BATCH_METHOD)
+        }
+        if batch_plugins:
+            event = FilesScannedEvent(files=[event for _, event in batch])
+            # Slow batches are not held against the plugin's breaker: the
+            # budget is only an estimate of what a batch should take
+            for result in self._dispatcher.dispatch(
+                FILE_SCANNED,
+                BATCH_METHOD,
+                event,
+                timeout=self._batch_timeout(len(batch)),
+                count_overruns=False,
+            ):
+                if not result.ok or result.value is None:
+                    continue
+                values = result.value
+                if not isinstance(values, list) or len(values) != len(batch):
+                    logger.warning(
+                        "Plugin %s returned %s for %d files, expected a list "
+                        "with one entry per file",
+                        result.plugin_name,
+                        type(values).__name__,
+                        len(batch),
+                    )
+                    continue
+                for file_id, data in zip(file_ids, values, strict=True):
+                    _add(enrichments, file_id, result.plugin_name, data)
+
+        for file_id, event in batch:
+            for result in self._dispatcher.dispatch(
+                FILE_SCANNED, FILE_METHOD, event, exclude=batch_plugins
+            ):
+                if result.ok:
+                    _add(enrichments, file_id, result.plugin_name, result.value)
+        return enrichments
+
+
+def _add(enrichments: Enrichments, file_id: int, plugin_name: str, data: Any) -> None:
+    if data is None:
+        return
+    if not isinstance(data, dict):
+        logger.warning(
+            "Ignoring %s enrichment from plugin %s: expected a dict",
+            type(data).__name__,
+            plugin_name,
+        )
+        return
+    if data:
+        enrichments.setdefault(file_id, {})[metadata_key(plugin_name, data)] = data
@@ -20,7 +20,10 @@ from vpo.db import FileRecord
 logger = logging.getLogger(__name__)
 
 if TYPE_CHECKING:
+    from vpo.domain import IntrospectionResult
     from vpo.introspector.interface import MediaIntrospector
+    from vpo.plugin.events import FileScannedEvent
+    from vpo.scanner.enrichment import EnrichmentStage
 
 
 class ScanProgressCallback(Protocol):
@@ -100,6 +103,7 @@ class ScanResult:
     interrupted: bool = False  # True if scan was interrupted by Ctrl+C
     incremental: bool = True  # Whether incremental mode was used
     job_id: str | None = None  # UUID of the scan job (if job tracking enabled)
+    files_enriched: int = 0  # Files given plugin metadata by file.scanned plugins
 
 
 @dataclass
@@ -166,6 +170,37 @@ def detect_missing_files(db_paths: list[str]) -> list[str]:
     return missing
 
 
+def _scanned_event(
+    scanned: ScannedFile,
+    record: FileRecord,
+    introspection: IntrospectionResult,
+    scanned_at: datetime,
+) -> FileScannedEvent:
+    """Build the file.scanned event for a freshly persisted file."""
+    from vpo.domain import FileInfo
+    from vpo.plugin.events import FileScannedEvent
+
+    path = Path(scanned.path)
+    file_info = FileInfo(
+        path=path,
+        filename=record.filename,
+        directory=path.parent,
+        extension=record.extension,
+        size_bytes=scanned.size,
+        modified_at=scanned.modified_at,
+        content_hash=scanned.content_hash,
+        container_format=record.container_format,
+        scanned_at=scanned_at,
+        scan_status=record.scan_status,
+        scan_error=record.scan_error,
+        tracks=introspection.tracks,
+        container_tags=introspection.container_tags,
+    )
+    return FileScannedEvent(
+        file_path=path, file_info=file_info, tracks=introspection.tracks
+    )
+
+
 class ScannerOrchestrator:
     """Coordinates file discovery, hashing, and database operations."""
 
@@ -394,6 +429,7 @@ class ScannerOrchestrator:
         scan_progress: ScanProgressCallback | None = None,
         batch_commit_size: int = 100,
         job_id: str | None = None,
+        enrichment: EnrichmentStage | None = None,
     ) -> tuple[list[ScannedFile], ScanResult]:
         """Scan directories and persist results to database.
 
@@ -411,6 +447,10 @@ class ScannerOrchestrator:
                 Batching commits improves performance and reduces lock contention
                 in daemon mode. Set to 0 to commit after each file (legacy behavior).
             job_id: Optional job UUID to associate scanned files with.
+            enrichment: Optional file.scanned enrichment stage. Each
+                successfully introspected file is handed to it, and the
+                plugin metadata it produces is written in bulk with the
+                scan's batch commits and once more when the stage drains.
 
         Returns:
             Tuple of (list of scanned files, scan result summary).
@@ -422,10 +462,11 @@ class ScannerOrchestrator:
             FileRecord,
             delete_file,
             get_file_by_path,
-            get_files_by_paths,
+            get_file_table,
             upsert_file,
             upsert_tracks_for_file,
         )
+        from vpo.db.queries import merge_plugin_metadata
         from vpo.introspector.ffprobe import FFprobeIntrospector
         from vpo.introspector.interface import (
             MediaIntrospectionError,
@@ -488,11 +529,12 @@ class ScannerOrchestrator:
             result.files_found = len(all_files)
 
             # Check which files need processing (new or modified)
-            # Batch lookup for O(1) vs O(n) individual queries
+            # Batch lookup for O(1) vs O(n) individual queries; the columnar
+            # table keeps large libraries from holding a FileRecord per file
             files_to_process: list[ScannedFile] = []
             discovered_paths = {f.path for f in all_files}
             all_paths = [f.path for f in all_files]
-            existing_records = get_files_by_paths(conn, all_paths)
+            existing_records = get_file_table(conn, all_paths)
 
             for scanned in all_files:
                 if self._is_interrupted():
@@ -576,6 +618,9 @@ class ScannerOrchestrator:
             files_in_batch = 0
             in_transaction = False
 
+            if enrichment is not None and files_to_process:
+                enrichment.start()
+
             if batch_commit_size > 0 and files_to_process:
                 # Commit any implicit transaction from read operations before
                 # starting explicit transaction (Python sqlite3 starts implicit
@@ -648,6 +693,12 @@ class ScannerOrchestrator:
                 if introspection_result is not None and introspection_result.tracks:
                     upsert_tracks_for_file(conn, file_id, introspection_result.tracks)
 
+                if enrichment is not None and introspection_result is not None:
+                    enrichment.submit(
+                        file_id,
+                        _scanned_event(scanned, record, introspection_result, now),
+                    )
+
                 if existing is None:
                     result.files_new += 1
                 else:
@@ -657,6 +708,10 @@ class ScannerOrchestrator:
 
                 # Batch commit to reduce lock contention in daemon mode
                 if batch_commit_size > 0 and files_in_batch >= batch_commit_size:
+                    if enrichment is not None:
+                        result.files_enriched += merge_plugin_metadata(
+                            conn, enrichment.collect()
+                        )
                     conn.execute("COMMIT")
                     files_in_batch = 0
                     # Start new transaction for next batch (unless interrupted)
@@ -686,6 +741,13 @@ class ScannerOrchestrator:
                 conn.execute("COMMIT")
                 in_transaction = False
 
+            # Write whatever enrichment finished after the last batch commit
+            if enrichment is not None:
+                remaining = enrichment.finish(cancel=result.interrupted)
+                if remaining:
+                    result.files_enriched += merge_plugin_metadata(conn, remaining)
+                    conn.commit()
+
             result.elapsed_seconds = time.time() - start_time
 
             # Capture library snapshot for trend tracking
@@ -694,6 +756,9 @@ class ScannerOrchestrator:
             return all_files, result
 
         finally:
+            # Stop the enrichment thread if the scan failed part way
+            if enrichment is not None:
+                enrichment.finish(cancel=True)
             # Clear connection reference and restore original signal handler
             self._current_conn = None
             signal.signal(signal.SIGINT, old_handler)
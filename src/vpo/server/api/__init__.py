@@ -9,7 +9,9 @@ for better organization. Each module handles a specific domain:
 - plans.py: Plan listing, approval, and rejection endpoints
 - stats.py: Processing statistics endpoints
 - plugins.py: Plugin data browser endpoints
+- reports.py: Streaming report downloads
 - events.py: Server-Sent Events (SSE) for real-time updates
+- broker.py: Job broker for remote workers (only when enabled)
 
 API Versioning:
     All endpoints are available under both ``/api/`` (unversioned, backward
@@ -27,12 +29,14 @@ from pathlib import Path
 
 from aiohttp import web
 
+from vpo.server.api.broker import get_broker_routes
 from vpo.server.api.events import get_events_routes
 from vpo.server.api.files import get_file_routes
 from vpo.server.api.jobs import get_job_routes
 from vpo.server.api.plans import get_plan_routes
 from vpo.server.api.plugins import get_plugin_routes
 from vpo.server.api.policies import get_policy_routes
+from vpo.server.api.reports import get_report_routes
 from vpo.server.api.stats import get_stats_routes
 
 __all__ = [
@@ -47,6 +51,7 @@ _ROUTE_GETTERS = [
     get_plan_routes,
     get_stats_routes,
     get_plugin_routes,
+    get_report_routes,
     get_events_routes,
 ]
 
@@ -58,12 +63,17 @@ def setup_api_routes(app: web.Application) -> None:
     """Register all API routes with the application.
 
     Registers each route under both ``/api/`` (backward compatible) and
-    ``/api/v1/`` (versioned) prefixes.
+    ``/api/v1/`` (versioned) prefixes. Job broker routes are added only
+    when app["job_broker"] is true.
 
     Args:
         app: aiohttp Application to configure.
     """
-    for get_routes in _ROUTE_GETTERS:
+    getters = list(_ROUTE_GETTERS)
+    if app.get("job_broker"):
+        getters.append(get_broker_routes)
+
+    for get_routes in getters:
         for method, suffix, handler in get_routes():
             for prefix in _API_PREFIXES:
                 app.router.add_route(method, f"{prefix}{suffix}", handler)
@@ -0,0 +1,400 @@
+"""API handlers for the job broker used by remote workers.
+
+Lets ``vpo jobs worker --broker URL`` on another host claim and run jobs
+from this server's queue. Registered only when the broker is enabled
+(``vpo serve --broker`` or ``[server] broker = true``).
+
+Endpoints:
+    POST /api/broker/claim - Claim the next queued job for a worker
+    POST /api/broker/jobs/{job_id}/heartbeat - Renew the worker's lease
+    POST /api/broker/jobs/{job_id}/progress - Report transcode progress
+    PUT /api/broker/jobs/{job_id}/log - Upload the job log
+    POST /api/broker/jobs/{job_id}/complete - Record the job result
+
+Every request names its worker in the X-VPO-Worker header, which becomes
+the job's lease owner: only the worker that claimed a job may report on
+it, and a job recovered by the stale-job sweep answers 409. Because the
+header is custom, browsers cannot send these requests cross-origin without
+a CORS preflight, so the endpoints are exempt from CSRF tokens (and from
+the mutation rate limit, which a busy worker would exhaust). Basic auth
+still applies when the server has an auth token.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import re
+from pathlib import Path
+from typing import IO, Literal, TypeVar
+
+from aiohttp import web
+from pydantic import BaseModel, Field, ValidationError
+
+from vpo.config import get_config
+from vpo.core.validation import is_valid_uuid
+from vpo.db import (
+    JobStatus,
+    JobType,
+    get_tracks_for_file,
+    update_job_log_path,
+    update_job_progress,
+)
+from vpo.jobs.broker import REMOTE_JOB_TYPES, WORKER_HEADER
+from vpo.jobs.logs import ensure_log_directory, get_log_index_path, get_log_path
+from vpo.jobs.queue import claim_next_job, holds_lease, release_job, update_heartbeat
+from vpo.jobs.resources import resource_slots
+from vpo.server.api.errors import (
+    INVALID_ID_FORMAT,
+    INVALID_JSON,
+    INVALID_REQUEST,
+    RESOURCE_CONFLICT,
+    VALIDATION_FAILED,
+    api_error,
+)
+from vpo.server.serialization import json_response
+from vpo.server.ui.routes import (
+    database_required_middleware,
+    shutdown_check_middleware,
+)
+
+logger = logging.getLogger(__name__)
+
+_Body = TypeVar("_Body", bound=BaseModel)
+
+#: Request path prefixes of the broker endpoints (exempt from CSRF checks
+#: and rate limiting, see module docstring)
+BROKER_PATH_PREFIXES = ("/api/broker/", "/api/v1/broker/")
+
+# Largest job log accepted from a worker
+MAX_LOG_UPLOAD_BYTES = 64 * 1024 * 1024
+
+_LOG_CHUNK_BYTES = 64 * 1024
+
+_WORKER_ID_PATTERN = re.compile(r"^[A-Za-z0-9._:-]{1,128}$")
+
+_LEASE_LOST = "Job is not running under this worker's lease"
+
+
+class ClaimRequest(BaseModel):
+    """Request body for POST /api/broker/claim."""
+
+    job_types: list[JobType] = Field(
+        default_factory=lambda: sorted(REMOTE_JOB_TYPES, key=lambda t: t.value)
+    )
+    worker_pid: int | None = None
+
+
+class HeartbeatRequest(BaseModel):
+    """Request body for POST /api/broker/jobs/{job_id}/heartbeat."""
+
+    worker_pid: int | None = None
+
+
+class ProgressRequest(BaseModel):
+    """Request body for POST /api/broker/jobs/{job_id}/progress."""
+
+    percent: float = Field(ge=0.0, le=100.0)
+    progress_json: str | None = None
+
+
+class CompleteRequest(BaseModel):
+    """Request body for POST /api/broker/jobs/{job_id}/complete."""
+
+    status: Literal["completed", "failed"]
+    error_message: str | None = None
+    output_path: str | None = None
+    summary_json: str | None = None
+
+
+def _worker_id(request: web.Request) -> str | web.Response:
+    """Return the validated worker ID, or an error response."""
+    worker = request.headers.get(WORKER_HEADER, "")
+    if not _WORKER_ID_PATTERN.match(worker):
+        return api_error(
+            f"Missing or invalid {WORKER_HEADER} header",
+            code=INVALID_REQUEST,
+        )
+    return worker
+
+
+def _job_id(request: web.Request) -> str | web.Response:
+    """Return the validated job ID from the URL, or an error response."""
+    job_id = request.match_info["job_id"]
+    if not is_valid_uuid(job_id):
+        return api_error("Invalid job ID format", code=INVALID_ID_FORMAT)
+    return job_id
+
+
+async def _parse_body(request: web.Request, model: type[_Body]) -> _Body | web.Response:
+    """Parse and validate a JSON request body (an empty body means {})."""
+    try:
+        body = await request.json() if request.can_read_body else {}
+    except Exception:
+        return api_error("Invalid JSON body", code=INVALID_JSON)
+
+    try:
+        return model.model_validate(body)
+    except ValidationError as e:
+        details = [
+            {
+                "field": ".".join(str(loc) for loc in err["loc"]),
+                "message": err["msg"],
+            }
+            for err in e.errors()
+        ]
+        return api_error(str(e), code=VALIDATION_FAILED, details=details)
+
+
+def _lease_lost() -> web.Response:
+    return api_error(_LEASE_LOST, code=RESOURCE_CONFLICT, status=409)
+
+
+@shutdown_check_middleware
+@database_required_middleware
+async def api_broker_claim_handler(request: web.Request) -> web.Response:
+    """Handle POST /api/broker/claim - Claim the next queued job.
+
+    Request body:
+        { "job_types": ["transcode"], "worker_pid": 1234 }
+
+    Returns:
+        JSON response with the claimed job (or null when the queue has no
+        job the worker can run) and the primary video duration in seconds
+        for progress reporting.
+    """
+    worker = _worker_id(request)
+    if isinstance(worker, web.Response):
+        return worker
+    body = await _parse_body(request, ClaimRequest)
+    if isinstance(body, web.Response):
+        return body
+
+    job_types = [t for t in body.job_types if t in REMOTE_JOB_TYPES]
+    if not job_types:
+        return api_error(
+            "No requested job type can run on a remote worker",
+            code=INVALID_REQUEST,
+        )
+
+    pool = request["connection_pool"]
+    # This server's limits, counted per remote host (see _slot_filter)
+    slots = resource_slots(get_config().jobs)
+
+    def _claim():
+        with pool.write() as conn:
+            return claim_next_job(
+                conn,
+                worker_pid=body.worker_pid,
+                lease_owner=worker,
+                job_types=job_types,
+                slots=slots,
+            )
+
+    job = await asyncio.to_thread(_claim)
+    if job is None:
+        return json_response({"job": None, "duration_seconds": None})
+
+    def _duration() -> float | None:
+        if job.file_id is None:
+            return None
+        with pool.read() as conn:
+            tracks = get_tracks_for_file(conn, job.file_id)
+        for track in tracks:
+            if track.track_type == "video" and track.duration_seconds:
+                return track.duration_seconds
+        return None
+
+    duration = await asyncio.to_thread(_duration)
+    logger.info("Job %s claimed by remote worker %s", job.id[:8], worker)
+    return json_response({"job": job, "duration_seconds": duration})
+
+
+@shutdown_check_middleware
+@database_required_middleware
+async def api_broker_heartbeat_handler(request: web.Request) -> web.Response:
+    """Handle POST /api/broker/jobs/{job_id}/heartbeat - Renew a lease.
+
+    Returns:
+        JSON response {"ok": true}, or 409 if the worker lost the job.
+    """
+    worker = _worker_id(request)
+    if isinstance(worker, web.Response):
+        return worker
+    job_id = _job_id(request)
+    if isinstance(job_id, web.Response):
+        return job_id
+    body = await _parse_body(request, HeartbeatRequest)
+    if isinstance(body, web.Response):
+        return body
+
+    pool = request["connection_pool"]
+
+    def _heartbeat() -> bool:
+        with pool.write() as conn:
+            return update_heartbeat(
+                conn, job_id, worker_pid=body.worker_pid, lease_owner=worker
+            )
+
+    if not await asyncio.to_thread(_heartbeat):
+        return _lease_lost()
+    return json_response({"ok": True})
+
+
+@shutdown_check_middleware
+@database_required_middleware
+async def api_broker_progress_handler(request: web.Request) -> web.Response:
+    """Handle POST /api/broker/jobs/{job_id}/progress - Report progress.
+
+    Request body:
+        { "percent": 42.5, "progress_json": "{\\"fps\\": 30.0}" }
+
+    Returns:
+        JSON response {"ok": true}, or 409 if the worker lost the job.
+    """
+    worker = _worker_id(request)
+    if isinstance(worker, web.Response):
+        return worker
+    job_id = _job_id(request)
+    if isinstance(job_id, web.Response):
+        return job_id
+    body = await _parse_body(request, ProgressRequest)
+    if isinstance(body, web.Response):
+        return body
+
+    pool = request["connection_pool"]
+
+    def _progress() -> bool:
+        with pool.transaction() as conn:
+            if not holds_lease(conn, job_id, worker):
+                return False
+            return update_job_progress(conn, job_id, body.percent, body.progress_json)
+
+    if not await asyncio.to_thread(_progress):
+        return _lease_lost()
+    return json_response({"ok": True})
+
+
+def _open_upload(log_path: Path) -> tuple[Path, IO[bytes]]:
+    ensure_log_directory()
+    tmp_path = log_path.with_name(f".{log_path.name}.{os.getpid()}.upload")
+    return tmp_path, open(tmp_path, "wb")
+
+
+def _finish_upload(tmp_path: Path, log_path: Path) -> None:
+    os.replace(tmp_path, log_path)
+    # A local index would describe a different file
+    get_log_index_path(log_path).unlink(missing_ok=True)
+
+
+@shutdown_check_middleware
+@database_required_middleware
+async def api_broker_log_handler(request: web.Request) -> web.Response:
+    """Handle PUT /api/broker/jobs/{job_id}/log - Upload the job log.
+
+    The request body is the plain-text log. It replaces any log stored for
+    the job and is linked from the job detail view.
+
+    Returns:
+        JSON response {"ok": true, "bytes": N}, 409 if the worker lost the
+        job, or 413 if the log exceeds MAX_LOG_UPLOAD_BYTES.
+    """
+    worker = _worker_id(request)
+    if isinstance(worker, web.Response):
+        return worker
+    job_id = _job_id(request)
+    if isinstance(job_id, web.Response):
+        return job_id
+
+    pool = request["connection_pool"]
+
+    def _held() -> bool:
+        with pool.read() as conn:
+            return holds_lease(conn, job_id, worker)
+
+    if not await asyncio.to_thread(_held):
+        return _lease_lost()
+
+    log_path = get_log_path(job_id)
+    tmp_path, fh = await asyncio.to_thread(_open_upload, log_path)
+    size = 0
+    try:
+        async for chunk in request.content.iter_chunked(_LOG_CHUNK_BYTES):
+            size += len(chunk)
+            if size > MAX_LOG_UPLOAD_BYTES:
+                return api_error(
+                    f"Log exceeds {MAX_LOG_UPLOAD_BYTES} bytes",
+                    code=INVALID_REQUEST,
+                    status=413,
+                )
+            await asyncio.to_thread(fh.write, chunk)
+        await asyncio.to_thread(fh.close)
+        await asyncio.to_thread(_finish_upload, tmp_path, log_path)
+    finally:
+        if not fh.closed:
+            fh.close()
+        tmp_path.unlink(missing_ok=True)
+
+    def _link() -> None:
+        with pool.transaction() as conn:
+            update_job_log_path(conn, job_id, f"logs/{log_path.name}")
+
+    await asyncio.to_thread(_link)
+    return json_response({"ok": True, "bytes": size})
+
+
+@shutdown_check_middleware
+@database_required_middleware
+async def api_broker_complete_handler(request: web.Request) -> web.Response:
+    """Handle POST /api/broker/jobs/{job_id}/complete - Record the result.
+
+    Request body:
+        { "status": "completed", "output_path": "/media/out.mkv" }
+        { "status": "failed", "error_message": "..." }
+
+    Paths are server paths; the worker maps them before posting.
+
+    Returns:
+        JSON response {"ok": true}, or 409 if the worker lost the job.
+    """
+    worker = _worker_id(request)
+    if isinstance(worker, web.Response):
+        return worker
+    job_id = _job_id(request)
+    if isinstance(job_id, web.Response):
+        return job_id
+    body = await _parse_body(request, CompleteRequest)
+    if isinstance(body, web.Response):
+        return body
+
+    pool = request["connection_pool"]
+
+    def _complete() -> bool:
+        with pool.write() as conn:
+            return release_job(
+                conn,
+                job_id,
+                JobStatus(body.status),
+                error_message=body.error_message,
+                output_path=body.output_path,
+                summary_json=body.summary_json,
+                set_progress_100=True,
+                lease_owner=worker,
+            )
+
+    if not await asyncio.to_thread(_complete):
+        return _lease_lost()
+    logger.info("Job %s %s on remote worker %s", job_id[:8], body.status, worker)
+    return json_response({"ok": True})
+
+
+def get_broker_routes() -> list[tuple[str, str, object]]:
+    """Return broker API route definitions as (method, path_suffix, handler) tuples."""
+    return [
+        ("POST", "/broker/claim", api_broker_claim_handler),
+        ("POST", "/broker/jobs/{job_id}/heartbeat", api_broker_heartbeat_handler),
+        ("POST", "/broker/jobs/{job_id}/progress", api_broker_progress_handler),
+        ("PUT", "/broker/jobs/{job_id}/log", api_broker_log_handler),
+        ("POST", "/broker/jobs/{job_id}/complete", api_broker_complete_handler),
+    ]
@@ -18,6 +18,8 @@ from typing import Any
 
 from aiohttp import web
 
+from vpo.server.serialization import json_response
+
 # --- Error code constants ---
 
 INVALID_REQUEST = "INVALID_REQUEST"
@@ -59,4 +61,4 @@ def api_error(
     body: dict[str, Any] = {"error": message, "code": code}
     if details is not None:
         body["details"] = details
-    return web.json_response(body, status=status)
+    return json_response(body, status=status)
@@ -5,6 +5,7 @@ Falls back to polling automatically if SSE is not supported.
 
 Endpoints:
     GET /api/events/jobs - SSE stream for job status changes
+    GET /api/events/jobs/{job_id}/logs - SSE stream of lines appended to a job log
 """
 
 from __future__ import annotations
@@ -19,7 +20,8 @@ from typing import Any
 from aiohttp import web
 
 from vpo.core.datetime_utils import parse_iso_timestamp, parse_time_filter
-from vpo.server.api.errors import SERVICE_UNAVAILABLE, api_error
+from vpo.core.validation import is_valid_uuid
+from vpo.server.api.errors import INVALID_ID_FORMAT, SERVICE_UNAVAILABLE, api_error
 from vpo.server.ui.models import JobFilterParams, JobListItem
 from vpo.server.ui.routes import shutdown_check_middleware
 
@@ -30,6 +32,8 @@ SSE_HEARTBEAT_INTERVAL = 15  # seconds
 SSE_JOB_UPDATE_INTERVAL = 2  # seconds
 SSE_WRITE_TIMEOUT = 5.0  # seconds - timeout for writing to slow clients
 SSE_DB_TIMEOUT = 5.0  # seconds - timeout for database queries
+SSE_LOG_POLL_INTERVAL = 1  # seconds - how often followed logs are checked
+SSE_LOG_BACKLOG_LINES = 100  # lines sent when a log follow starts
 MAX_SSE_CONNECTIONS = 100  # Maximum concurrent SSE connections
 
 
@@ -271,6 +275,179 @@ async def sse_jobs_handler(request: web.Request) -> web.StreamResponse:
     return response
 
 
+@shutdown_check_middleware
+async def sse_job_logs_handler(request: web.Request) -> web.StreamResponse:
+    """Handle GET /api/events/jobs/{job_id}/logs - follow a job log.
+
+    Streams only the bytes appended to the log since the last check, as
+    ``log_lines`` events carrying the new lines and the byte ``position``
+    after them. The stream starts with the last SSE_LOG_BACKLOG_LINES lines
+    (or ``lines`` from the query), or exactly at ``position`` when a client
+    resumes. It waits for the log to be created and closes when the log is
+    compressed or removed.
+
+    Query parameters:
+        lines: Backlog lines to send first (default 100, max 1000)
+        position: Byte position to resume from (overrides lines)
+
+    Args:
+        request: aiohttp Request object.
+
+    Returns:
+        StreamResponse with SSE content type.
+    """
+    from vpo.jobs.logs import get_log_end_position, log_file_exists, read_log_from
+
+    job_id = request.match_info["job_id"]
+    if not is_valid_uuid(job_id):
+        return api_error("Invalid job ID format", code=INVALID_ID_FORMAT)
+
+    try:
+        backlog = int(request.query.get("lines", SSE_LOG_BACKLOG_LINES))
+        backlog = max(0, min(1000, backlog))
+    except ValueError:
+        backlog = SSE_LOG_BACKLOG_LINES
+    try:
+        position: int | None = max(0, int(request.query["position"]))
+    except (KeyError, ValueError):
+        position = None
+
+    client_ip, request_id = _get_client_info(request)
+
+    # Shares the connection limit with the jobs stream
+    sse_connections = request.app.setdefault("_sse_connections", {"count": 0})
+
+    if sse_connections["count"] >= MAX_SSE_CONNECTIONS:
+        logger.warning(
+            "SSE connection limit reached (%d), rejecting client=%s request_id=%s",
+            MAX_SSE_CONNECTIONS,
+            client_ip,
+            request_id,
+        )
+        resp = api_error(
+            "Service temporarily unavailable - too many connections",
+            code=SERVICE_UNAVAILABLE,
+            status=503,
+        )
+        resp.headers["Retry-After"] = "10"
+        return resp
+
+    sse_connections["count"] += 1
+    logger.debug(
+        "SSE log follow established job=%s client=%s request_id=%s (total: %d)",
+        job_id,
+        client_ip,
+        request_id,
+        sse_connections["count"],
+    )
+
+    response = web.StreamResponse(
+        status=200,
+        headers={
+            "Content-Type": "text/event-stream",
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",  # Disable nginx buffering
+        },
+    )
+    await response.prepare(request)
+
+    heartbeat_counter = 0
+
+    try:
+        while True:
+            if request.app.get("_shutdown_event", asyncio.Event()).is_set():
+                await _write_sse_event(
+                    response,
+                    "close",
+                    {"reason": "server_shutdown"},
+                )
+                break
+
+            if position is None:
+                # Log not created yet: wait for the job to start writing
+                position = await asyncio.to_thread(
+                    get_log_end_position, job_id, backlog
+                )
+                if position is None and log_file_exists(job_id):
+                    # Only the compressed log exists; nothing more to follow
+                    await _write_sse_event(
+                        response,
+                        "close",
+                        {"reason": "log_unavailable"},
+                    )
+                    break
+
+            lines: list[str] = []
+            if position is not None:
+                try:
+                    lines, position = await asyncio.to_thread(
+                        read_log_from, job_id, position
+                    )
+                except FileNotFoundError:
+                    await _write_sse_event(
+                        response,
+                        "close",
+                        {"reason": "log_unavailable"},
+                    )
+                    break
+
+            if lines:
+                success = await _write_sse_event(
+                    response,
+                    "log_lines",
+                    {"lines": lines, "position": position},
+                )
+                if not success:
+                    break
+                heartbeat_counter = 0
+                # More may be pending if the read hit its size limit
+                continue
+
+            heartbeat_counter += SSE_LOG_POLL_INTERVAL
+            if heartbeat_counter >= SSE_HEARTBEAT_INTERVAL:
+                success = await _write_sse_event(
+                    response,
+                    "heartbeat",
+                    {"timestamp": datetime.now(timezone.utc).isoformat()},
+                )
+                if not success:
+                    break
+                heartbeat_counter = 0
+
+            await asyncio.sleep(SSE_LOG_POLL_INTERVAL)
+
+    except asyncio.CancelledError:
+        logger.debug(
+            "SSE log follow cancelled job=%s client=%s request_id=%s",
+            job_id,
+            client_ip,
+            request_id,
+        )
+        # Best-effort close event - ignore errors during teardown
+        try:
+            await _write_sse_event(
+                response,
+                "close",
+                {"reason": "cancelled"},
+                timeout=1.0,  # Short timeout for cleanup
+            )
+        except Exception:  # nosec B110 - intentional pass during cleanup
+            pass
+        raise  # Re-raise for proper aiohttp cleanup
+    finally:
+        sse_connections["count"] = max(0, sse_connections["count"] - 1)
+        logger.debug(
+            "SSE log follow closed job=%s client=%s request_id=%s (remaining: %d)",
+            job_id,
+            client_ip,
+            request_id,
+            sse_connections["count"],
+        )
+
+    return response
+
+
 async def _get_jobs_for_sse(request: web.Request) -> dict[str, Any]:
     """Fetch jobs data for SSE streaming.
 
@@ -329,7 +506,7 @@ async def _get_jobs_for_sse(request: web.Request) -> dict[str, Any]:
 
     def _query_jobs() -> tuple[list, int]:
         """Query jobs from database (runs in thread pool)."""
-        with connection_pool.transaction() as conn:
+        with connection_pool.read() as conn:
             jobs, total = get_jobs_filtered(
                 conn,
                 status=status_enum,
@@ -402,4 +579,5 @@ def get_events_routes() -> list[tuple[str, str, object]]:
     """Return SSE event route definitions as (method, path_suffix, handler) tuples."""
     return [
         ("GET", "/events/jobs", sse_jobs_handler),
+        ("GET", "/events/jobs/{job_id}/logs", sse_job_logs_handler),
     ]
@@ -21,6 +21,8 @@ from vpo.server.middleware import (
     TRANSCRIPTIONS_ALLOWED_PARAMS,
     validate_query_params,
 )
+from vpo.server.response_cache import conditional_get
+from vpo.server.serialization import json_response
 from vpo.server.ui.models import (
     FileDetailResponse,
     FileListItem,
@@ -48,6 +50,7 @@ logger = logging.getLogger(__name__)
 @shutdown_check_middleware
 @database_required_middleware
 @validate_query_params(LIBRARY_ALLOWED_PARAMS, strict=True)
+@conditional_get
 async def library_api_handler(request: web.Request) -> web.Response:
     """Handle GET /api/library - JSON API for library files listing.
 
@@ -88,7 +91,7 @@ async def library_api_handler(request: web.Request) -> web.Response:
 
     # Query files from database using thread-safe connection access
     def _query_files() -> tuple[list[dict], int]:
-        with connection_pool.transaction() as conn:
+        with connection_pool.read() as conn:
             result = get_files_filtered(
                 conn,
                 status=params.status,
@@ -140,11 +143,12 @@ async def library_api_handler(request: web.Request) -> web.Response:
         has_filters=has_filters,
     )
 
-    return web.json_response(response.to_dict())
+    return json_response(response)
 
 
 @shutdown_check_middleware
 @database_required_middleware
+@conditional_get
 async def api_library_languages_handler(request: web.Request) -> web.Response:
     """Handle GET /api/library/languages - Get available audio languages.
 
@@ -158,16 +162,17 @@ async def api_library_languages_handler(request: web.Request) -> web.Response:
 
     # Query distinct languages from database
     def _query_languages() -> list[dict]:
-        with connection_pool.transaction() as conn:
+        with connection_pool.read() as conn:
             return get_distinct_audio_languages(conn)
 
     languages = await asyncio.to_thread(_query_languages)
 
-    return web.json_response({"languages": languages})
+    return json_response({"languages": languages})
 
 
 @shutdown_check_middleware
 @database_required_middleware
+@conditional_get
 async def api_file_detail_handler(request: web.Request) -> web.Response:
     """Handle GET /api/library/{file_id} - JSON API for file detail.
 
@@ -198,7 +203,7 @@ async def api_file_detail_handler(request: web.Request) -> web.Response:
 
     # Query file from database
     def _query_file():
-        with connection_pool.transaction() as conn:
+        with connection_pool.read() as conn:
             file_record = get_file_by_id(conn, file_id)
             if file_record is None:
                 return None, [], {}
@@ -219,7 +224,7 @@ async def api_file_detail_handler(request: web.Request) -> web.Response:
     # Build response
     response = FileDetailResponse(file=detail_item)
 
-    return web.json_response(response.to_dict())
+    return json_response(response.to_dict())
 
 
 @shutdown_check_middleware
@@ -246,7 +251,7 @@ async def api_transcriptions_handler(request: web.Request) -> web.Response:
 
     # Query files from database using thread-safe connection access
     def _query_files() -> tuple[list[dict], int]:
-        with connection_pool.transaction() as conn:
+        with connection_pool.read() as conn:
             result = get_files_with_transcriptions(
                 conn,
                 show_all=params.show_all,
@@ -283,7 +288,7 @@ async def api_transcriptions_handler(request: web.Request) -> web.Response:
         has_filters=params.show_all,
     )
 
-    return web.json_response(response.to_dict())
+    return json_response(response.to_dict())
 
 
 @shutdown_check_middleware
@@ -314,7 +319,7 @@ async def api_transcription_detail_handler(request: web.Request) -> web.Response
 
     # Query transcription from database
     def _query_transcription():
-        with connection_pool.transaction() as conn:
+        with connection_pool.read() as conn:
             return get_transcription_detail(conn, transcription_id)
 
     data = await asyncio.to_thread(_query_transcription)
@@ -328,7 +333,7 @@ async def api_transcription_detail_handler(request: web.Request) -> web.Response
     # Build response
     response = TranscriptionDetailResponse(transcription=detail_item)
 
-    return web.json_response(response.to_dict())
+    return json_response(response.to_dict())
 
 
 def get_file_routes() -> list[tuple[str, str, object]]:
@@ -26,6 +26,8 @@ from vpo.server.api.errors import (
     api_error,
 )
 from vpo.server.middleware import JOBS_ALLOWED_PARAMS, validate_query_params
+from vpo.server.response_cache import conditional_get
+from vpo.server.serialization import json_response
 from vpo.server.ui.models import (
     JobFilterParams,
     JobListItem,
@@ -44,6 +46,7 @@ from vpo.server.ui.routes import (
 @shutdown_check_middleware
 @database_required_middleware
 @validate_query_params(JOBS_ALLOWED_PARAMS, strict=True)
+@conditional_get
 async def api_jobs_handler(request: web.Request) -> web.Response:
     """Handle GET /api/jobs - JSON API for jobs listing.
 
@@ -99,8 +102,8 @@ async def api_jobs_handler(request: web.Request) -> web.Response:
     def _query_jobs() -> tuple[list, int]:
         from vpo.db import get_jobs_filtered
 
-        # Use transaction context manager to hold lock during entire operation
-        with connection_pool.transaction() as conn:
+        # Pooled read-only connection: does not wait behind job writes
+        with connection_pool.read() as conn:
             # Use SQL-level pagination for efficiency
             jobs, total = get_jobs_filtered(
                 conn,
@@ -154,11 +157,12 @@ async def api_jobs_handler(request: web.Request) -> web.Response:
         has_filters=has_filters,
     )
 
-    return web.json_response(response.to_dict())
+    return json_response(response)
 
 
 @shutdown_check_middleware
 @database_required_middleware
+@conditional_get
 async def api_job_detail_handler(request: web.Request) -> web.Response:
     """Handle GET /api/jobs/{job_id} - JSON API for job detail.
 
@@ -183,7 +187,7 @@ async def api_job_detail_handler(request: web.Request) -> web.Response:
     def _query_job():
         from vpo.db import get_job
 
-        with connection_pool.transaction() as conn:
+        with connection_pool.read() as conn:
             return get_job(conn, job_id)
 
     job = await asyncio.to_thread(_query_job)
@@ -197,7 +201,7 @@ async def api_job_detail_handler(request: web.Request) -> web.Response:
     # Convert to detail item
     detail_item = build_job_detail_item(job, has_logs)
 
-    return web.json_response(detail_item.to_dict())
+    return json_response(detail_item.to_dict())
 
 
 @shutdown_check_middleware
@@ -207,6 +211,8 @@ async def api_job_logs_handler(request: web.Request) -> web.Response:
     Query parameters:
         lines: Number of lines to return (default 500, max 1000)
         offset: Line offset from start (default 0)
+        tail: If "true", return the last `lines` lines (offset is ignored
+            and the response offset is the first returned line)
 
     Args:
         request: aiohttp Request object.
@@ -240,8 +246,14 @@ async def api_job_logs_handler(request: web.Request) -> web.Response:
     except (ValueError, TypeError):
         offset = 0
 
+    tail = request.query.get("tail", "").lower() in ("true", "1")
+
     # Read logs
-    log_lines, total_lines, has_more = read_log_tail(job_id, lines=lines, offset=offset)
+    log_lines, total_lines, has_more = await asyncio.to_thread(
+        read_log_tail, job_id, lines=lines, offset=offset, tail=tail
+    )
+    if tail:
+        offset = total_lines - len(log_lines)
 
     response = JobLogsResponse(
         job_id=job_id,
@@ -251,7 +263,7 @@ async def api_job_logs_handler(request: web.Request) -> web.Response:
         has_more=has_more,
     )
 
-    return web.json_response(response.to_dict())
+    return json_response(response.to_dict())
 
 
 @shutdown_check_middleware
@@ -279,7 +291,7 @@ async def api_job_errors_handler(request: web.Request) -> web.Response:
 
     def _query_scan_errors() -> list[ScanErrorItem]:
         """Query files with scan errors (runs in thread pool)."""
-        with pool.transaction() as conn:
+        with pool.read() as conn:
             result = get_scan_errors_for_job(conn, job_id)
             if result is None:
                 return []
@@ -296,7 +308,7 @@ async def api_job_errors_handler(request: web.Request) -> web.Response:
         total_errors=len(errors),
     )
 
-    return web.json_response(response.to_dict())
+    return json_response(response.to_dict())
 
 
 def get_job_routes() -> list[tuple[str, str, object]]:
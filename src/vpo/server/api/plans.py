@@ -28,6 +28,8 @@ from vpo.server.api.errors import (
     api_error,
 )
 from vpo.server.middleware import PLANS_ALLOWED_PARAMS, validate_query_params
+from vpo.server.response_cache import conditional_get
+from vpo.server.serialization import json_response
 from vpo.server.ui.models import (
     PlanActionResponse,
     PlanDetailItem,
@@ -44,6 +46,7 @@ from vpo.server.ui.routes import (
 @shutdown_check_middleware
 @database_required_middleware
 @validate_query_params(PLANS_ALLOWED_PARAMS, strict=True)
+@conditional_get
 async def api_plans_handler(request: web.Request) -> web.Response:
     """Handle GET /api/plans - JSON API for plans listing.
 
@@ -87,7 +90,7 @@ async def api_plans_handler(request: web.Request) -> web.Response:
 
     # Query plans from database using thread-safe connection access
     def _query_plans() -> tuple[list, int]:
-        with connection_pool.transaction() as conn:
+        with connection_pool.read() as conn:
             plans, total = get_plans_filtered(
                 conn,
                 status=status_enum,
@@ -115,11 +118,12 @@ async def api_plans_handler(request: web.Request) -> web.Response:
         has_filters=has_filters,
     )
 
-    return web.json_response(response.to_dict())
+    return json_response(response)
 
 
 @shutdown_check_middleware
 @database_required_middleware
+@conditional_get
 async def api_plan_detail_handler(request: web.Request) -> web.Response:
     """Handle GET /api/plans/{plan_id} - JSON API for single plan detail.
 
@@ -142,7 +146,7 @@ async def api_plan_detail_handler(request: web.Request) -> web.Response:
 
     # Query plan from database
     def _query_plan():
-        with connection_pool.transaction() as conn:
+        with connection_pool.read() as conn:
             return get_plan_by_id(conn, plan_id)
 
     plan = await asyncio.to_thread(_query_plan)
@@ -153,7 +157,7 @@ async def api_plan_detail_handler(request: web.Request) -> web.Response:
     # Convert to detail item with deserialized actions
     detail_item = PlanDetailItem.from_plan_record(plan)
 
-    return web.json_response(detail_item.to_dict())
+    return json_response(detail_item.to_dict())
 
 
 def _plan_action_error_response(
@@ -179,7 +183,7 @@ def _plan_action_error_response(
     else:
         status = 409
 
-    return web.json_response(
+    return json_response(
         PlanActionResponse(success=False, error=error, code=code).to_dict(),
         status=status,
     )
@@ -228,7 +232,7 @@ async def api_plan_approve_handler(request: web.Request) -> web.Response:
         job_url=f"/jobs/{result.job_id}",
         warning=result.warning,
     )
-    return web.json_response(response.to_dict())
+    return json_response(response.to_dict())
 
 
 @shutdown_check_middleware
@@ -269,7 +273,7 @@ async def api_plan_reject_handler(request: web.Request) -> web.Response:
         success=True,
         plan=PlanListItem.from_plan_record(result.plan),
     )
-    return web.json_response(response.to_dict())
+    return json_response(response.to_dict())
 
 
 @dataclass
@@ -394,7 +398,7 @@ async def api_plans_bulk_approve_handler(request: web.Request) -> web.Response:
         failed=failed,
         errors=errors if errors else None,
     )
-    return web.json_response(response.to_dict())
+    return json_response(response.to_dict())
 
 
 @shutdown_check_middleware
@@ -447,7 +451,7 @@ async def api_plans_bulk_reject_handler(request: web.Request) -> web.Response:
         failed=failed,
         errors=errors if errors else None,
     )
-    return web.json_response(response.to_dict())
+    return json_response(response.to_dict())
 
 
 def get_plan_routes() -> list[tuple[str, str, object]]:
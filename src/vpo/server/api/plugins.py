@@ -2,7 +2,8 @@
 
 Endpoints:
     GET /api/plugins - List registered plugins
-    GET /api/plugins/{name}/files - Files with data from plugin
+    GET /api/plugins/{name}/files - Files with data from plugin (optionally
+        filtered on a plugin field, e.g. ?field=original_language&value=jpn)
     GET /api/files/{file_id}/plugin-data - All plugin data for file
     GET /api/files/{file_id}/plugin-data/{plugin} - Single plugin's data for file
 """
@@ -16,12 +17,15 @@ import re
 from aiohttp import web
 
 from vpo.db.connection import DaemonConnectionPool
+from vpo.db.queries import plugin_value_filter
 from vpo.server.api.errors import (
     INVALID_ID_FORMAT,
     INVALID_REQUEST,
     NOT_FOUND,
     api_error,
 )
+from vpo.server.response_cache import conditional_get
+from vpo.server.serialization import json_response
 from vpo.server.ui.models import (
     FilePluginDataResponse,
     PluginFileItem,
@@ -54,7 +58,7 @@ def _make_file_plugin_query(connection_pool: DaemonConnectionPool, file_id: int)
     from vpo.db.views import get_plugin_data_for_file
 
     def _query():
-        with connection_pool.transaction() as conn:
+        with connection_pool.read() as conn:
             file_record = get_file_by_id(conn, file_id)
             if file_record is None:
                 return None, {}
@@ -64,6 +68,20 @@ def _make_file_plugin_query(connection_pool: DaemonConnectionPool, file_id: int)
     return _query
 
 
+def _parse_filter_value(raw: str | None) -> str | int | float | bool | None:
+    """Convert a query string filter value to a typed comparison value."""
+    if raw is None:
+        return None
+    if raw.casefold() in ("true", "false"):
+        return raw.casefold() == "true"
+    for convert in (int, float):
+        try:
+            return convert(raw)
+        except ValueError:
+            pass
+    return raw
+
+
 @shutdown_check_middleware
 async def api_plugins_list_handler(request: web.Request) -> web.Response:
     """Handle GET /api/plugins - JSON API for registered plugins list.
@@ -71,6 +89,7 @@ async def api_plugins_list_handler(request: web.Request) -> web.Response:
     Returns:
         JSON response with PluginListResponse payload.
     """
+    from vpo.plugin.dispatcher import breaker_state, load_plugin_stats
     from vpo.plugin.manifest import PluginSource
 
     # Get plugin registry from app context
@@ -78,10 +97,11 @@ async def api_plugins_list_handler(request: web.Request) -> web.Response:
     if registry is None:
         # No registry configured - return empty list
         response = PluginListResponse(plugins=[], total=0)
-        return web.json_response(response.to_dict())
+        return json_response(response.to_dict())
 
     # Get all loaded plugins
     loaded_plugins = registry.get_all()
+    call_stats = await asyncio.to_thread(load_plugin_stats)
 
     # Build plugin info with defensive error handling
     plugins = []
@@ -94,17 +114,22 @@ async def api_plugins_list_handler(request: web.Request) -> web.Response:
                     enabled=p.enabled,
                     is_builtin=p.source == PluginSource.BUILTIN,
                     events=p.events,
+                    circuit_state=breaker_state(p.name),
+                    stats=(
+                        call_stats[p.name].summary() if p.name in call_stats else None
+                    ),
                 )
             )
         except AttributeError as e:
             logger.warning("Skipping malformed plugin: %s", e)
 
     response = PluginListResponse(plugins=plugins, total=len(plugins))
-    return web.json_response(response.to_dict())
+    return json_response(response.to_dict())
 
 
 @shutdown_check_middleware
 @database_required_middleware
+@conditional_get
 async def api_plugin_files_handler(request: web.Request) -> web.Response:
     """Handle GET /api/plugins/{name}/files - Files with data from plugin.
 
@@ -112,6 +137,11 @@ async def api_plugin_files_handler(request: web.Request) -> web.Response:
         name: Plugin identifier (e.g., "whisper-transcriber").
 
     Query parameters:
+        field: Optional plugin field to filter on (e.g., "original_language").
+        op: Comparison operator for field (eq, neq, contains, lt, lte, gt,
+            gte, exists; default eq, or exists if no value is given).
+        value: Value to compare field against. "true"/"false" and numbers
+            are compared as booleans and numbers.
         limit: Page size (1-100, default 50).
         offset: Pagination offset (default 0).
 
@@ -126,6 +156,18 @@ async def api_plugin_files_handler(request: web.Request) -> web.Response:
     if not re.match(r"^[a-zA-Z0-9_-]+$", plugin_name):
         return api_error("Invalid plugin name format", code=INVALID_REQUEST)
 
+    # Parse field filter
+    field = request.query.get("field") or None
+    value = _parse_filter_value(request.query.get("value"))
+    operator = request.query.get("op") or ("exists" if value is None else "eq")
+    if field is not None and not re.match(r"^[a-zA-Z0-9_.-]+$", field):
+        return api_error("Invalid field name format", code=INVALID_REQUEST)
+    if field is not None:
+        try:
+            plugin_value_filter(operator, value)
+        except ValueError as e:
+            return api_error(str(e), code=INVALID_REQUEST)
+
     # Parse pagination parameters
     try:
         limit = int(request.query.get("limit", 50))
@@ -144,10 +186,13 @@ async def api_plugin_files_handler(request: web.Request) -> web.Response:
 
     # Query files from database
     def _query_files() -> tuple[list[dict], int]:
-        with connection_pool.transaction() as conn:
+        with connection_pool.read() as conn:
             result = get_files_with_plugin_data(
                 conn,
                 plugin_name,
+                field=field,
+                operator=operator,
+                value=value,
                 limit=limit,
                 offset=offset,
                 return_total=True,
@@ -176,7 +221,7 @@ async def api_plugin_files_handler(request: web.Request) -> web.Response:
         offset=offset,
     )
 
-    return web.json_response(response.to_dict())
+    return json_response(response.to_dict())
 
 
 @shutdown_check_middleware
@@ -216,7 +261,7 @@ async def api_file_plugin_data_handler(request: web.Request) -> web.Response:
         plugin_data=plugin_data,
     )
 
-    return web.json_response(response.to_dict())
+    return json_response(response.to_dict())
 
 
 @shutdown_check_middleware
@@ -265,7 +310,7 @@ async def api_file_plugin_data_single_handler(request: web.Request) -> web.Respo
             status=404,
         )
 
-    return web.json_response(
+    return json_response(
         {
             "file_id": file_id,
             "filename": file_record.filename,
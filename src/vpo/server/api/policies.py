@@ -6,6 +6,7 @@ Endpoints:
     GET /api/policies/{name} - Get policy detail
     PUT /api/policies/{name} - Update policy
     POST /api/policies/{name}/validate - Validate policy
+    GET /api/policies/{name}/simulate - Preview library-wide changes
 """
 
 from __future__ import annotations
@@ -27,7 +28,15 @@ from vpo.server.api.errors import (
     VALIDATION_FAILED,
     api_error,
 )
-from vpo.server.ui.routes import shutdown_check_middleware
+from vpo.server.middleware import (
+    POLICY_SIMULATE_ALLOWED_PARAMS,
+    validate_query_params,
+)
+from vpo.server.serialization import json_response
+from vpo.server.ui.routes import (
+    database_required_middleware,
+    shutdown_check_middleware,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -43,7 +52,7 @@ async def api_policy_schema_handler(request: web.Request) -> web.Response:
     from vpo.policy.pydantic_models import PolicyModel
 
     schema = PolicyModel.model_json_schema()
-    return web.json_response(
+    return json_response(
         {
             "schema_version": SCHEMA_VERSION,
             "json_schema": schema,
@@ -62,7 +71,7 @@ async def policies_api_handler(request: web.Request) -> web.Response:
 
     response = await asyncio.to_thread(list_policies)
 
-    return web.json_response(response.to_dict())
+    return json_response(response.to_dict())
 
 
 @shutdown_check_middleware
@@ -140,7 +149,7 @@ async def api_policy_detail_handler(request: web.Request) -> web.Response:
         parse_error=parse_error,
     )
 
-    return web.json_response(response.to_dict())
+    return json_response(response.to_dict())
 
 
 @shutdown_check_middleware
@@ -219,7 +228,7 @@ async def api_policy_update_handler(request: web.Request) -> web.Response:
             errors=error_items,
             details=f"{len(error_items)} validation error(s) found",
         )
-        return web.json_response(error_response.to_dict(), status=400)
+        return json_response(error_response.to_dict(), status=400)
 
     # Load original policy data for diff calculation
     def _load_original():
@@ -315,7 +324,7 @@ async def api_policy_update_handler(request: web.Request) -> web.Response:
         policy=policy_context.to_dict(),
     )
 
-    return web.json_response(response.to_dict())
+    return json_response(response.to_dict())
 
 
 @shutdown_check_middleware
@@ -363,7 +372,7 @@ async def api_policy_validate_handler(request: web.Request) -> web.Response:
             errors=[],
             message="Policy configuration is valid",
         )
-        return web.json_response(response.to_dict())
+        return json_response(response.to_dict())
     else:
         error_items = [
             ValidationErrorItem(
@@ -378,7 +387,7 @@ async def api_policy_validate_handler(request: web.Request) -> web.Response:
             errors=error_items,
             message=f"{len(error_items)} validation error(s) found",
         )
-        return web.json_response(response.to_dict())
+        return json_response(response.to_dict())
 
 
 @shutdown_check_middleware
@@ -538,7 +547,7 @@ async def api_policy_create_handler(request: web.Request) -> web.Response:
         },
     )
 
-    return web.json_response(
+    return json_response(
         {
             "success": True,
             "message": f"Policy '{policy_name}' created successfully",
@@ -548,6 +557,85 @@ async def api_policy_create_handler(request: web.Request) -> web.Response:
     )
 
 
+@shutdown_check_middleware
+@database_required_middleware
+@validate_query_params(POLICY_SIMULATE_ALLOWED_PARAMS, strict=True)
+async def api_policy_simulate_handler(request: web.Request) -> web.Response:
+    """Handle GET /api/policies/{name}/simulate - Preview library-wide changes.
+
+    Evaluates the policy against every scanned file's stored track metadata
+    without modifying anything.
+
+    Query parameters:
+        path: Only simulate files under this directory.
+        phases: Comma-separated phases to simulate (default: all).
+        limit: Maximum changed files to list (0-1000, default 100).
+
+    Returns:
+        JSON response with SimulationResult payload.
+    """
+    from vpo.policy.compiled import load_compiled_policy
+    from vpo.policy.discovery import DEFAULT_POLICIES_DIR
+    from vpo.policy.loader import PolicyValidationError
+    from vpo.workflow.simulation import simulate_policy
+
+    policy_name = request.match_info["name"]
+    if not re.match(r"^[a-zA-Z0-9_-]+$", policy_name):
+        return api_error("Invalid policy name format", code=INVALID_REQUEST)
+
+    try:
+        limit = int(request.query.get("limit", "100"))
+    except ValueError:
+        return api_error("limit must be an integer", code=INVALID_REQUEST)
+    if not 0 <= limit <= 1000:
+        return api_error("limit must be between 0 and 1000", code=INVALID_REQUEST)
+
+    path_prefix = request.query.get("path") or None
+    phases_param = request.query.get("phases", "")
+    selected_phases = [p.strip() for p in phases_param.split(",") if p.strip()]
+
+    policies_dir = request.app.get("policy_dir", DEFAULT_POLICIES_DIR)
+    policy_path = policies_dir / f"{policy_name}.yaml"
+    if not policy_path.exists():
+        policy_path = policies_dir / f"{policy_name}.yml"
+    if not policy_path.exists():
+        return api_error("Policy not found", code=NOT_FOUND, status=404)
+
+    try:
+        policy = (await asyncio.to_thread(load_compiled_policy, policy_path)).schema
+    except PolicyValidationError as e:
+        return api_error(str(e), code=VALIDATION_FAILED)
+
+    invalid = [name for name in selected_phases if name not in policy.phase_names]
+    if invalid:
+        return api_error(
+            f"Invalid phase name(s): {', '.join(invalid)}", code=INVALID_REQUEST
+        )
+
+    connection_pool = request["connection_pool"]
+
+    def _simulate():
+        # Read-only and potentially long: use a dedicated read connection
+        # rather than holding the shared write connection.
+        with connection_pool.read() as conn:
+            return simulate_policy(
+                conn,
+                policy,
+                policy_name=policy.name or policy_name,
+                selected_phases=selected_phases or None,
+                path_prefix=path_prefix,
+                max_files=limit,
+            )
+
+    try:
+        result = await asyncio.to_thread(_simulate)
+    except Exception as e:
+        logger.error("Policy simulation failed for %s: %s", policy_name, e)
+        return api_error("Policy simulation failed", code=INTERNAL_ERROR, status=500)
+
+    return json_response(result.to_dict())
+
+
 def get_policy_routes() -> list[tuple[str, str, object]]:
     """Return policy API route definitions as (method, path_suffix, handler) tuples.
 
@@ -561,4 +649,5 @@ def get_policy_routes() -> list[tuple[str, str, object]]:
         ("GET", "/policies/{name}", api_policy_detail_handler),
         ("PUT", "/policies/{name}", api_policy_update_handler),
         ("POST", "/policies/{name}/validate", api_policy_validate_handler),
+        ("GET", "/policies/{name}/simulate", api_policy_simulate_handler),
     ]
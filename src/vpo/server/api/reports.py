@@ -0,0 +1,251 @@
+"""API handlers for report downloads.
+
+Endpoints:
+    GET /api/reports/{name} - Download a report (jobs, library, scans,
+        transcodes) as a chunked stream
+
+Reports are produced by the same streaming queries and formatters as
+``vpo report``: rows are read from the database a batch at a time on a
+worker thread and written to the client as they are rendered, so a full
+library export never has to fit in memory.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import concurrent.futures
+import logging
+import threading
+from collections.abc import Callable, Iterator
+from typing import Any
+
+from aiohttp import web
+
+from vpo.reports.filters import TimeFilter
+from vpo.reports.formatters import (
+    REPORT_COLUMNS,
+    ReportFormat,
+    buffer_chunks,
+    iter_report,
+)
+from vpo.reports.queries import (
+    MAX_LIMIT,
+    iter_jobs_report,
+    iter_library_report,
+    iter_scans_report,
+    iter_transcodes_report,
+)
+from vpo.server.api.errors import (
+    INTERNAL_ERROR,
+    INVALID_PARAMETER,
+    NOT_FOUND,
+    api_error,
+)
+from vpo.server.middleware import REPORTS_ALLOWED_PARAMS, validate_query_params
+from vpo.server.ui.routes import (
+    database_required_middleware,
+    shutdown_check_middleware,
+)
+
+logger = logging.getLogger(__name__)
+
+# Rendered chunks buffered between the query thread and the response
+REPORT_QUEUE_SIZE = 8
+
+# How often a blocked query thread checks whether the client went away
+REPORT_PUT_POLL_SECONDS = 0.5
+
+_CONTENT_TYPES = {
+    ReportFormat.TEXT: ("text/plain", "txt"),
+    ReportFormat.CSV: ("text/csv", "csv"),
+    ReportFormat.JSON: ("application/json", "json"),
+    ReportFormat.NDJSON: ("application/x-ndjson", "ndjson"),
+}
+
+_JOB_TYPES = frozenset({"scan", "apply", "transcode", "move"})
+_JOB_STATUSES = frozenset({"queued", "running", "completed", "failed", "cancelled"})
+_RESOLUTIONS = frozenset({"4K", "1080P", "720P", "480P", "SD"})
+
+# Filter parameters accepted by each report (format and limit always are)
+_REPORT_PARAMS: dict[str, frozenset[str]] = {
+    "jobs": frozenset({"type", "status", "since", "until"}),
+    "library": frozenset({"resolution", "language", "has_subtitles"}),
+    "scans": frozenset({"since", "until"}),
+    "transcodes": frozenset({"codec", "since", "until"}),
+}
+
+_DONE = object()
+
+
+def _parse_filters(name: str, query: Any) -> dict[str, Any]:
+    """Turn report query parameters into keyword arguments for its query.
+
+    Raises:
+        ValueError: If a parameter is not accepted by the report or has an
+            invalid value.
+    """
+    unexpected = set(query) - _REPORT_PARAMS[name] - {"format", "limit"}
+    if unexpected:
+        raise ValueError(
+            f"Parameters not supported by the {name} report: "
+            f"{', '.join(sorted(unexpected))}"
+        )
+
+    kwargs: dict[str, Any] = {"limit": None}
+    if limit := query.get("limit"):
+        try:
+            kwargs["limit"] = int(limit)
+        except ValueError:
+            raise ValueError(f"Invalid limit value: '{limit}'") from None
+        if not 1 <= kwargs["limit"] <= MAX_LIMIT:
+            raise ValueError(f"limit must be between 1 and {MAX_LIMIT}")
+
+    if "since" in _REPORT_PARAMS[name]:
+        kwargs["time_filter"] = TimeFilter.from_strings(
+            query.get("since") or None, query.get("until") or None
+        )
+
+    if job_type := query.get("type"):
+        if job_type.casefold() not in _JOB_TYPES:
+            raise ValueError(f"Invalid type value: '{job_type}'")
+        kwargs["job_type"] = job_type.casefold()
+    if status := query.get("status"):
+        if status.casefold() not in _JOB_STATUSES:
+            raise ValueError(f"Invalid status value: '{status}'")
+        kwargs["status"] = status.casefold()
+    if resolution := query.get("resolution"):
+        if resolution.upper() not in _RESOLUTIONS:
+            raise ValueError(f"Invalid resolution value: '{resolution}'")
+        kwargs["resolution"] = resolution.upper()
+    if language := query.get("language"):
+        kwargs["language"] = language
+    if has_subtitles := query.get("has_subtitles"):
+        if has_subtitles.casefold() not in ("true", "false"):
+            raise ValueError("has_subtitles must be 'true' or 'false'")
+        kwargs["has_subtitles"] = has_subtitles.casefold() == "true"
+    if codec := query.get("codec"):
+        kwargs["codec"] = codec
+    return kwargs
+
+
+_QUERIES: dict[str, Callable[..., Iterator[dict[str, Any]]]] = {
+    "jobs": iter_jobs_report,
+    "library": iter_library_report,
+    "scans": iter_scans_report,
+    "transcodes": iter_transcodes_report,
+}
+
+
+@shutdown_check_middleware
+@database_required_middleware
+@validate_query_params(REPORTS_ALLOWED_PARAMS, strict=True)
+async def api_report_download_handler(request: web.Request) -> web.StreamResponse:
+    """Handle GET /api/reports/{name} - stream a report download.
+
+    Path parameters:
+        name: Report name (jobs, library, scans, transcodes)
+
+    Query parameters:
+        format: ndjson (default), csv, json or text
+        limit: Maximum rows (1-10000, default: all rows)
+        since, until: Time filter (relative like 7d or ISO-8601) for jobs,
+            scans and transcodes
+        type, status: Job filters (jobs report)
+        resolution, language, has_subtitles: Library filters
+        codec: Target codec filter (transcodes report)
+
+    Returns:
+        Chunked response with the report as an attachment.
+    """
+    name = request.match_info["name"]
+    if name not in _QUERIES:
+        return api_error(f"Unknown report: '{name}'", code=NOT_FOUND, status=404)
+
+    raw_format = request.query.get("format", ReportFormat.NDJSON.value)
+    try:
+        fmt = ReportFormat(raw_format.casefold())
+    except ValueError:
+        return api_error(
+            f"Invalid format value: '{raw_format}'", code=INVALID_PARAMETER
+        )
+    try:
+        filters = _parse_filters(name, request.query)
+    except ValueError as e:
+        return api_error(str(e), code=INVALID_PARAMETER)
+
+    connection_pool = request["connection_pool"]
+    query = _QUERIES[name]
+    columns = REPORT_COLUMNS[name]
+    loop = asyncio.get_running_loop()
+    chunks: asyncio.Queue[Any] = asyncio.Queue(maxsize=REPORT_QUEUE_SIZE)
+    stop = threading.Event()
+
+    def _put(item: Any) -> bool:
+        """Hand an item to the response, waiting while the queue is full."""
+        future = asyncio.run_coroutine_threadsafe(chunks.put(item), loop)
+        while True:
+            try:
+                future.result(timeout=REPORT_PUT_POLL_SECONDS)
+                return True
+            except concurrent.futures.TimeoutError:
+                if stop.is_set():
+                    future.cancel()
+                    return False
+
+    def _produce() -> None:
+        try:
+            with connection_pool.read() as conn:
+                rows = query(conn, **filters)
+                for chunk in buffer_chunks(iter_report(rows, fmt, columns)):
+                    if stop.is_set() or not _put(chunk):
+                        return
+        except Exception as e:
+            logger.exception("Report %s failed", name)
+            _put(e)
+            return
+        _put(_DONE)
+
+    content_type, extension = _CONTENT_TYPES[fmt]
+    threading.Thread(target=_produce, name=f"vpo-report-{name}", daemon=True).start()
+    try:
+        item = await chunks.get()
+        if isinstance(item, Exception):
+            return api_error(
+                "Failed to generate report", code=INTERNAL_ERROR, status=500
+            )
+
+        response = web.StreamResponse(
+            status=200,
+            headers={
+                "Content-Type": f"{content_type}; charset=utf-8",
+                "Content-Disposition": (
+                    f'attachment; filename="vpo-{name}.{extension}"'
+                ),
+                "Cache-Control": "no-store",
+            },
+        )
+        response.enable_chunked_encoding()
+        await response.prepare(request)
+
+        try:
+            while item is not _DONE:
+                if isinstance(item, Exception):
+                    # Headers are already sent; end the body early so the
+                    # client sees a truncated download rather than a hang.
+                    break
+                await response.write(item.encode("utf-8"))
+                item = await chunks.get()
+            await response.write_eof()
+        except (ConnectionResetError, ConnectionAbortedError, BrokenPipeError):
+            logger.debug("Report download client disconnected")
+        return response
+    finally:
+        # Also reached when aiohttp cancels the handler on disconnect
+        stop.set()
+
+
+def get_report_routes() -> list[tuple[str, str, object]]:
+    """Return report API route definitions as (method, path_suffix, handler)."""
+    return [
+        ("GET", "/reports/{name}", api_report_download_handler),
+    ]
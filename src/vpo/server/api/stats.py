@@ -13,7 +13,6 @@ Endpoints:
 from __future__ import annotations
 
 import asyncio
-from dataclasses import asdict
 
 from aiohttp import web
 
@@ -40,6 +39,8 @@ from vpo.server.middleware import (
     STATS_PURGE_ALLOWED_PARAMS,
     validate_query_params,
 )
+from vpo.server.response_cache import conditional_get
+from vpo.server.serialization import json_response
 from vpo.server.ui.routes import (
     database_required_middleware,
     shutdown_check_middleware,
@@ -74,6 +75,7 @@ def _parse_time_param(
 @shutdown_check_middleware
 @database_required_middleware
 @validate_query_params(STATS_ALLOWED_PARAMS, strict=True)
+@conditional_get
 async def api_stats_summary_handler(request: web.Request) -> web.Response:
     """Handle GET /api/stats/summary - JSON API for statistics summary.
 
@@ -99,7 +101,7 @@ async def api_stats_summary_handler(request: web.Request) -> web.Response:
 
     # Query stats summary
     def _query_summary():
-        with connection_pool.transaction() as conn:
+        with connection_pool.read() as conn:
             return get_stats_summary(
                 conn,
                 since=since_ts,
@@ -109,12 +111,13 @@ async def api_stats_summary_handler(request: web.Request) -> web.Response:
 
     summary = await asyncio.to_thread(_query_summary)
 
-    return web.json_response(asdict(summary))
+    return json_response(summary)
 
 
 @shutdown_check_middleware
 @database_required_middleware
 @validate_query_params(frozenset({"limit", "policy"}), strict=True)
+@conditional_get
 async def api_stats_recent_handler(request: web.Request) -> web.Response:
     """Handle GET /api/stats/recent - JSON API for recent processing history.
 
@@ -139,7 +142,7 @@ async def api_stats_recent_handler(request: web.Request) -> web.Response:
 
     # Query recent stats
     def _query_recent():
-        with connection_pool.transaction() as conn:
+        with connection_pool.read() as conn:
             return get_recent_stats(
                 conn,
                 limit=limit,
@@ -148,12 +151,13 @@ async def api_stats_recent_handler(request: web.Request) -> web.Response:
 
     entries = await asyncio.to_thread(_query_recent)
 
-    return web.json_response([asdict(e) for e in entries])
+    return json_response(entries)
 
 
 @shutdown_check_middleware
 @database_required_middleware
 @validate_query_params(STATS_ALLOWED_PARAMS, strict=True)
+@conditional_get
 async def api_stats_policies_handler(request: web.Request) -> web.Response:
     """Handle GET /api/stats/policies - JSON API for per-policy statistics.
 
@@ -176,7 +180,7 @@ async def api_stats_policies_handler(request: web.Request) -> web.Response:
 
     # Query policy stats
     def _query_policies():
-        with connection_pool.transaction() as conn:
+        with connection_pool.read() as conn:
             return get_policy_stats(
                 conn,
                 since=since_ts,
@@ -185,12 +189,13 @@ async def api_stats_policies_handler(request: web.Request) -> web.Response:
 
     policies = await asyncio.to_thread(_query_policies)
 
-    return web.json_response([asdict(p) for p in policies])
+    return json_response(policies)
 
 
 @shutdown_check_middleware
 @database_required_middleware
 @validate_query_params(STATS_ALLOWED_PARAMS, strict=True)
+@conditional_get
 async def api_stats_trends_handler(request: web.Request) -> web.Response:
     """Handle GET /api/stats/trends - JSON API for processing trends.
 
@@ -219,7 +224,7 @@ async def api_stats_trends_handler(request: web.Request) -> web.Response:
 
     # Query trends
     def _query_trends():
-        with connection_pool.transaction() as conn:
+        with connection_pool.read() as conn:
             return get_stats_trends(
                 conn,
                 since=since_ts,
@@ -228,10 +233,11 @@ async def api_stats_trends_handler(request: web.Request) -> web.Response:
 
     trends = await asyncio.to_thread(_query_trends)
 
-    return web.json_response([asdict(t) for t in trends])
+    return json_response(trends)
 
 
 @database_required_middleware
+@conditional_get
 async def api_stats_detail_handler(request: web.Request) -> web.Response:
     """Handle GET /api/stats/{stats_id} - JSON API for single stats record detail.
 
@@ -249,7 +255,7 @@ async def api_stats_detail_handler(request: web.Request) -> web.Response:
     connection_pool = request["connection_pool"]
 
     def _query_detail():
-        with connection_pool.transaction() as conn:
+        with connection_pool.read() as conn:
             return get_stats_detail(conn, stats_id)
 
     detail = await asyncio.to_thread(_query_detail)
@@ -261,10 +267,11 @@ async def api_stats_detail_handler(request: web.Request) -> web.Response:
             status=404,
         )
 
-    return web.json_response(asdict(detail))
+    return json_response(detail)
 
 
 @database_required_middleware
+@conditional_get
 async def api_stats_file_handler(request: web.Request) -> web.Response:
     """Handle GET /api/stats/files/{file_id} - JSON API for file processing history.
 
@@ -287,12 +294,12 @@ async def api_stats_file_handler(request: web.Request) -> web.Response:
     connection_pool = request["connection_pool"]
 
     def _query_file_stats():
-        with connection_pool.transaction() as conn:
+        with connection_pool.read() as conn:
             return get_stats_for_file(conn, file_id=file_id)
 
     history = await asyncio.to_thread(_query_file_stats)
 
-    return web.json_response([asdict(h) for h in history])
+    return json_response(history)
 
 
 @shutdown_check_middleware
@@ -375,7 +382,7 @@ async def api_stats_purge_handler(request: web.Request) -> web.Response:
         target = f"stats for policy '{policy_name}'"
 
     if dry_run:
-        return web.json_response(
+        return json_response(
             {
                 "dry_run": True,
                 "would_delete": deleted,
@@ -383,7 +390,7 @@ async def api_stats_purge_handler(request: web.Request) -> web.Response:
             }
         )
     else:
-        return web.json_response(
+        return json_response(
             {
                 "deleted": deleted,
                 "target": target,
@@ -392,6 +399,7 @@ async def api_stats_purge_handler(request: web.Request) -> web.Response:
 
 
 @database_required_middleware
+@conditional_get
 async def api_stats_policy_handler(request: web.Request) -> web.Response:
     """Handle GET /api/stats/policies/{name} - JSON API for single policy stats.
 
@@ -420,7 +428,7 @@ async def api_stats_policy_handler(request: web.Request) -> web.Response:
     connection_pool = request["connection_pool"]
 
     def _query_policy():
-        with connection_pool.transaction() as conn:
+        with connection_pool.read() as conn:
             return get_policy_stats_by_name(
                 conn,
                 policy_name,
@@ -437,12 +445,13 @@ async def api_stats_policy_handler(request: web.Request) -> web.Response:
             status=404,
         )
 
-    return web.json_response(asdict(policy))
+    return json_response(policy)
 
 
 @shutdown_check_middleware
 @database_required_middleware
 @validate_query_params(frozenset(), strict=True)
+@conditional_get
 async def api_library_distribution_handler(
     request: web.Request,
 ) -> web.Response:
@@ -461,12 +470,12 @@ async def api_library_distribution_handler(
     connection_pool = request["connection_pool"]
 
     def _query():
-        with connection_pool.transaction() as conn:
+        with connection_pool.read() as conn:
             return get_library_distribution(conn)
 
     distribution = await asyncio.to_thread(_query)
 
-    return web.json_response(asdict(distribution))
+    return json_response(distribution)
 
 
 LIBRARY_TRENDS_ALLOWED_PARAMS = frozenset({"since"})
@@ -475,6 +484,7 @@ LIBRARY_TRENDS_ALLOWED_PARAMS = frozenset({"since"})
 @shutdown_check_middleware
 @database_required_middleware
 @validate_query_params(LIBRARY_TRENDS_ALLOWED_PARAMS, strict=True)
+@conditional_get
 async def api_library_trends_handler(
     request: web.Request,
 ) -> web.Response:
@@ -498,12 +508,12 @@ async def api_library_trends_handler(
     connection_pool = request["connection_pool"]
 
     def _query():
-        with connection_pool.transaction() as conn:
+        with connection_pool.read() as conn:
             return get_library_snapshots(conn, since=since_ts)
 
     snapshots = await asyncio.to_thread(_query)
 
-    return web.json_response([asdict(s) for s in snapshots])
+    return json_response(snapshots)
 
 
 def get_stats_routes() -> list[tuple[str, str, object]]:
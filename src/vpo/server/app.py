@@ -21,6 +21,7 @@ from aiohttp_session.cookie_storage import EncryptedCookieStorage
 from cryptography import fernet
 
 from vpo import __version__
+from vpo.server.serialization import json_response
 from vpo.server.ui import setup_ui_routes
 
 if TYPE_CHECKING:
@@ -71,6 +72,10 @@ class HealthStatus:
     config_reload_error: str | None = None
     """Error message from last failed reload, or None if succeeded."""
 
+    # Connection pool metrics
+    database_pool: dict | None = None
+    """DaemonConnectionPool.stats() as a dict, or None without a database."""
+
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
         return asdict(self)
@@ -134,7 +139,9 @@ async def _cleanup_connection_pool(app: web.Application) -> None:
 
 
 def create_app(
-    db_path: Path | None = None, auth_token: str | None = None
+    db_path: Path | None = None,
+    auth_token: str | None = None,
+    job_broker: bool = False,
 ) -> web.Application:
     """Create and configure the aiohttp Application.
 
@@ -143,6 +150,8 @@ def create_app(
             If provided and exists, a connection pool will be created.
         auth_token: Optional authentication token for HTTP Basic Auth.
             If provided (non-empty), all endpoints except /health require auth.
+        job_broker: Expose the job broker API that remote workers
+            (``vpo jobs worker --broker``) claim jobs through.
 
     Returns:
         Configured aiohttp Application instance.
@@ -153,7 +162,9 @@ def create_app(
         create_auth_middleware,
         is_auth_enabled,
     )
+    from vpo.server.compression import compression_middleware
     from vpo.server.rate_limit import RateLimiter, rate_limit_middleware
+    from vpo.server.response_cache import ResponseCache
 
     app = web.Application()
 
@@ -225,6 +236,15 @@ def create_app(
 
     # Store runtime state in app dict
     app["lifecycle"] = None  # Will be set by serve command
+    app["job_broker"] = job_broker
+    if job_broker:
+        if is_auth_enabled(auth_token):
+            logger.info("Job broker enabled for remote workers")
+        else:
+            logger.warning(
+                "Job broker enabled without authentication: anyone who can "
+                "reach the server can claim jobs. Set VPO_AUTH_TOKEN."
+            )
 
     # Create connection pool if database path provided
     if db_path is not None and db_path.exists():
@@ -233,6 +253,8 @@ def create_app(
         pool_timeout = float(os.environ.get("VPO_DB_TIMEOUT", "30.0"))
         pool = DaemonConnectionPool(db_path, timeout=pool_timeout)
         app["connection_pool"] = pool
+        # ETag/304 cache for API GETs, keyed on the database change counter
+        app["response_cache"] = ResponseCache()
 
         # Run database migrations if needed
         # Note: initialize_database is NOT wrapped in transaction() because:
@@ -248,6 +270,7 @@ def create_app(
         )
     else:
         app["connection_pool"] = None
+        app["response_cache"] = None
 
     # Initialize maintenance task (will be started on server startup)
     app["maintenance_task"] = None
@@ -288,6 +311,9 @@ def create_app(
     # Insert at beginning so it runs after static handler
     app.middlewares.insert(0, static_cache_middleware)
 
+    # Outermost, so it compresses the final body of every response
+    app.middlewares.insert(0, compression_middleware)
+
     # Register startup and cleanup handlers
     app.on_startup.append(_start_maintenance_task)
     app.on_startup.append(_start_auto_prune_task)
@@ -414,8 +440,8 @@ async def health_handler(request: web.Request) -> web.Response:
         try:
 
             def _get_metrics() -> dict[str, int]:
-                conn = connection_pool.get_connection()
-                return get_job_health_metrics(conn)
+                with connection_pool.read() as conn:
+                    return get_job_health_metrics(conn)
 
             job_metrics = await asyncio.to_thread(_get_metrics)
         except Exception as e:
@@ -456,12 +482,15 @@ async def health_handler(request: web.Request) -> web.Response:
         last_config_reload=last_config_reload,
         config_reload_count=config_reload_count,
         config_reload_error=config_reload_error,
+        database_pool=(
+            asdict(connection_pool.stats()) if connection_pool is not None else None
+        ),
     )
 
     # Return 503 for degraded/unhealthy, 200 for healthy
     http_status = 200 if status == "healthy" else 503
 
-    return web.json_response(health.to_dict(), status=http_status)
+    return json_response(health.to_dict(), status=http_status)
 
 
 async def api_about_handler(request: web.Request) -> web.Response:
@@ -478,4 +507,4 @@ async def api_about_handler(request: web.Request) -> web.Response:
     from vpo.server.ui.routes import get_about_info
 
     about_info = get_about_info(request)
-    return web.json_response(about_info.to_dict())
+    return json_response(about_info.to_dict())
@@ -11,6 +11,7 @@ from collections.abc import Awaitable, Callable
 from aiohttp import web
 from aiohttp_session import get_session
 
+from vpo.server.api.broker import BROKER_PATH_PREFIXES
 from vpo.server.api.errors import CSRF_ERROR, api_error
 
 logger = logging.getLogger(__name__)
@@ -78,8 +79,11 @@ async def csrf_middleware(
         request["csrf_token"] = token
         return await handler(request)
 
-    # State-changing methods require CSRF validation
-    if request.method in ("POST", "PUT", "DELETE", "PATCH"):
+    # State-changing methods require CSRF validation, except from remote
+    # workers, whose required X-VPO-Worker header forces a CORS preflight
+    if request.method in ("POST", "PUT", "DELETE", "PATCH") and not (
+        request.path.startswith(BROKER_PATH_PREFIXES)
+    ):
         # Get session token
         session = await get_session(request)
         session_token = session.get(CSRF_SESSION_KEY)
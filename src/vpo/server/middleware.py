@@ -118,6 +118,14 @@ TRANSCRIPTIONS_ALLOWED_PARAMS = frozenset(
     }
 )
 
+POLICY_SIMULATE_ALLOWED_PARAMS = frozenset(
+    {
+        "path",
+        "phases",
+        "limit",
+    }
+)
+
 STATS_ALLOWED_PARAMS = frozenset(
     {
         "since",
@@ -128,6 +136,21 @@ STATS_ALLOWED_PARAMS = frozenset(
     }
 )
 
+REPORTS_ALLOWED_PARAMS = frozenset(
+    {
+        "format",
+        "limit",
+        "since",
+        "until",
+        "type",
+        "status",
+        "codec",
+        "resolution",
+        "language",
+        "has_subtitles",
+    }
+)
+
 STATS_PURGE_ALLOWED_PARAMS = frozenset(
     {
         "before",
@@ -19,6 +19,7 @@ from dataclasses import dataclass, field
 from aiohttp import web
 
 from vpo.config.models import RateLimitConfig
+from vpo.server.api.broker import BROKER_PATH_PREFIXES
 from vpo.server.api.errors import RATE_LIMITED, api_error
 
 logger = logging.getLogger(__name__)
@@ -77,6 +78,7 @@ class RateLimiter:
     """Per-IP rate limiter with separate GET and mutate counters."""
 
     EXEMPT_PATHS: frozenset[str] = frozenset({"/health", "/api/about", "/api/v1/about"})
+    EXEMPT_PREFIXES: tuple[str, ...] = BROKER_PATH_PREFIXES
     _MUTATING_METHODS: frozenset[str] = frozenset({"POST", "PUT", "DELETE", "PATCH"})
     _CLEANUP_INTERVAL = 300  # seconds between stale counter cleanup
 
@@ -136,7 +138,11 @@ class RateLimiter:
         Returns:
             Tuple of (allowed, retry_after_seconds).
         """
-        if not self._config.enabled or path in self.EXEMPT_PATHS:
+        if (
+            not self._config.enabled
+            or path in self.EXEMPT_PATHS
+            or path.startswith(self.EXEMPT_PREFIXES)
+        ):
             return (True, 0.0)
 
         now = time.monotonic()
@@ -0,0 +1,214 @@
+"""Conditional-GET caching for JSON API endpoints.
+
+Handlers decorated with ``conditional_get`` get an ETag derived from:
+
+- the database change counter (``PRAGMA data_version`` on a dedicated
+  read-only connection, see DaemonConnectionPool.data_version), which
+  moves whenever any connection or process commits a write,
+- the request path and its normalized query parameters,
+- a time bucket, so results built from relative times ("7d") or the
+  current clock are recomputed at least every RESPONSE_CACHE_MAX_AGE
+  seconds, and
+- a random per-process salt, so ETags from before a daemon restart never
+  match.
+
+A request whose If-None-Match carries the current ETag gets ``304 Not
+Modified`` without running the handler. Otherwise a small in-memory LRU of
+serialized bodies is consulted before the handler runs, so dashboards that
+poll an idle library cost one PRAGMA per request.
+
+Note: The cache is in-memory and per-process, like the rate limiter.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from functools import wraps
+from urllib.parse import urlencode
+
+from aiohttp import web
+
+logger = logging.getLogger(__name__)
+
+Handler = Callable[[web.Request], Awaitable[web.StreamResponse]]
+
+# Maximum number of cached response bodies
+RESPONSE_CACHE_ENTRIES = 256
+
+# Bodies larger than this are served with an ETag but not kept in memory
+RESPONSE_CACHE_MAX_BODY_BYTES = 1024 * 1024
+
+# Upper bound on how long a response is reused without a database change
+RESPONSE_CACHE_MAX_AGE = 60
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """A serialized response body and the ETag it was produced under."""
+
+    etag: str
+    body: bytes
+    content_type: str
+
+
+class ResponseCache:
+    """Thread-safe LRU of serialized JSON responses keyed by request."""
+
+    def __init__(
+        self,
+        max_entries: int = RESPONSE_CACHE_ENTRIES,
+        max_body_bytes: int = RESPONSE_CACHE_MAX_BODY_BYTES,
+        max_age: int = RESPONSE_CACHE_MAX_AGE,
+    ) -> None:
+        self.max_entries = max(1, max_entries)
+        self.max_body_bytes = max_body_bytes
+        self.max_age = max(1, max_age)
+        self._salt = os.urandom(8).hex()
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.not_modified = 0
+        self.misses = 0
+
+    def etag_for(self, key: str, data_version: int) -> str:
+        """Return the weak ETag for key at the given database version."""
+        bucket = int(time.time() // self.max_age)
+        digest = hashlib.blake2b(
+            f"{self._salt}:{data_version}:{bucket}:{key}".encode(),
+            digest_size=12,
+        ).hexdigest()
+        return f'W/"{digest}"'
+
+    def get(self, key: str, etag: str) -> CachedResponse | None:
+        """Return the cached response for key if it is still current."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry.etag != etag:
+                return None
+            self._entries.move_to_end(key)
+            return entry
+
+    def put(self, key: str, entry: CachedResponse) -> None:
+        """Store a response, evicting the least recently used ones."""
+        if len(entry.body) > self.max_body_bytes:
+            return
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached responses."""
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+def cache_key(request: web.Request) -> str:
+    """Return the cache key for a request: path plus sorted query items.
+
+    Repeated parameters keep their relative order, since handlers such as
+    the library filter treat them as an ordered list.
+    """
+    items = sorted(request.query.items(), key=lambda item: item[0])
+    return f"{request.path}?{urlencode(items)}"
+
+
+def _matches(request: web.Request, etag: str) -> bool:
+    """Check If-None-Match against etag using weak comparison."""
+    if_none_match = request.if_none_match
+    if not if_none_match:
+        return False
+    value = etag[2:].strip('"')
+    return any(tag.value in ("*", value) for tag in if_none_match)
+
+
+def _with_etag(response: web.Response, etag: str) -> web.Response:
+    response.headers["ETag"] = etag
+    # Let clients keep the body but revalidate before every use
+    response.headers["Cache-Control"] = "no-cache"
+    return response
+
+
+def conditional_get(handler: Handler) -> Handler:
+    """Decorator adding ETag/304 handling and body caching to a GET handler.
+
+    Must be applied inside database_required_middleware, which provides
+    request["connection_pool"]. Requests pass straight through when the
+    application has no ResponseCache (app["response_cache"]) or the
+    database change counter cannot be read. Only 200 JSON responses are
+    cached; errors are never cached.
+
+    Example:
+        @database_required_middleware
+        @validate_query_params(PLANS_ALLOWED_PARAMS)
+        @conditional_get
+        async def api_plans_handler(request: web.Request) -> web.Response:
+            ...
+    """
+
+    @wraps(handler)
+    async def wrapper(request: web.Request) -> web.StreamResponse:
+        cache: ResponseCache | None = request.app.get("response_cache")
+        pool = request.get("connection_pool")
+        if cache is None or pool is None:
+            return await handler(request)
+
+        try:
+            # Read the counter before the handler queries, so a write that
+            # lands mid-request invalidates the stored body.
+            data_version = await asyncio.to_thread(pool.data_version)
+        except Exception as e:
+            logger.debug("Response cache bypassed: %s", e)
+            return await handler(request)
+
+        key = cache_key(request)
+        etag = cache.etag_for(key, data_version)
+
+        if _matches(request, etag):
+            cache.not_modified += 1
+            return web.Response(
+                status=304,
+                headers={"ETag": etag, "Cache-Control": "no-cache"},
+            )
+
+        entry = cache.get(key, etag)
+        if entry is not None:
+            cache.hits += 1
+            return _with_etag(
+                web.Response(body=entry.body, content_type=entry.content_type),
+                etag,
+            )
+
+        cache.misses += 1
+        response = await handler(request)
+        if (
+            isinstance(response, web.Response)
+            and response.status == 200
+            and response.content_type == "application/json"
+            and isinstance(response.body, bytes)
+        ):
+            cache.put(
+                key,
+                CachedResponse(
+                    etag=etag,
+                    body=response.body,
+                    content_type=response.content_type,
+                ),
+            )
+            _with_etag(response, etag)
+        return response
+
+    return wrapper
@@ -18,6 +18,10 @@ class PluginInfo:
         enabled: Whether the plugin is currently enabled.
         is_builtin: True if this is a built-in plugin.
         events: List of events this plugin handles.
+        circuit_state: Circuit breaker state in the server process
+            ("closed", "open" or "half_open").
+        stats: Event call statistics and latency histogram, or None if the
+            plugin has not handled any dispatched events.
     """
 
     name: str
@@ -25,6 +29,8 @@ class PluginInfo:
     enabled: bool
     is_builtin: bool
     events: list[str]
+    circuit_state: str = "closed"
+    stats: dict | None = None
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
@@ -34,6 +40,8 @@ class PluginInfo:
             "enabled": self.enabled,
             "is_builtin": self.is_builtin,
             "events": self.events,
+            "circuit_state": self.circuit_state,
+            "stats": self.stats,
         }
 
 
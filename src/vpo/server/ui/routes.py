@@ -251,7 +251,7 @@ async def job_detail_handler(request: web.Request) -> dict:
     def _query_job():
         from vpo.db import get_job
 
-        with connection_pool.transaction() as conn:
+        with connection_pool.read() as conn:
             return get_job(conn, job_id)
 
     job = await asyncio.to_thread(_query_job)
@@ -337,7 +337,7 @@ async def file_detail_handler(request: web.Request) -> dict:
 
     # Query file from database
     def _query_file():
-        with connection_pool.transaction() as conn:
+        with connection_pool.read() as conn:
             file_record = get_file_by_id(conn, file_id)
             if file_record is None:
                 return None, [], {}
@@ -412,7 +412,7 @@ async def transcription_detail_handler(request: web.Request) -> dict:
 
     # Query transcription from database
     def _query_transcription():
-        with connection_pool.transaction() as conn:
+        with connection_pool.read() as conn:
             return get_transcription_detail(conn, transcription_id)
 
     data = await asyncio.to_thread(_query_transcription)
@@ -649,7 +649,7 @@ async def plan_detail_handler(request: web.Request) -> dict:
 
     # Query plan from database
     def _query_plan():
-        with connection_pool.transaction() as conn:
+        with connection_pool.read() as conn:
             return get_plan_by_id(conn, plan_id)
 
     plan = await asyncio.to_thread(_query_plan)
@@ -749,7 +749,7 @@ async def file_plugin_data_handler(request: web.Request) -> dict:
 
     # Query file and plugin data
     def _query_data():
-        with connection_pool.transaction() as conn:
+        with connection_pool.read() as conn:
             file_record = get_file_by_id(conn, file_id)
             if file_record is None:
                 return None, {}
@@ -33,6 +33,7 @@ from vpo.tools.encoders import (
 from vpo.tools.ffmpeg_progress import (
     PROGRESS_PATTERNS,
     FFmpegProgress,
+    FFmpegProgressParser,
     parse_progress_block,
     parse_progress_line,
     parse_stderr_progress,
@@ -62,6 +63,7 @@ from vpo.tools.requirements import (
 __all__ = [
     # FFmpeg progress parsing
     "FFmpegProgress",
+    "FFmpegProgressParser",
     "PROGRESS_PATTERNS",
     "parse_progress_line",
     "parse_progress_block",
@@ -4,7 +4,7 @@ This module provides utilities for collecting and aggregating FFmpeg encoding
 metrics during transcode operations (Issue #264).
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
 from vpo.tools.ffmpeg_progress import FFmpegProgress
 
@@ -42,9 +42,12 @@ class FFmpegMetricsAggregator:
         summary = aggregator.summarize()
     """
 
-    # Collected samples
-    fps_samples: list[float] = field(default_factory=list)
-    bitrate_samples: list[int] = field(default_factory=list)
+    # Running aggregates, so memory stays constant however long the encode
+    fps_sum: float = 0.0
+    fps_count: int = 0
+    fps_peak: float | None = None
+    bitrate_sum: int = 0
+    bitrate_count: int = 0
     last_frame: int | None = None
 
     def add_sample(self, progress: FFmpegProgress) -> None:
@@ -54,13 +57,17 @@ class FFmpegMetricsAggregator:
             progress: FFmpegProgress object from parsing FFmpeg output.
         """
         if progress.fps is not None and progress.fps > 0:
-            self.fps_samples.append(progress.fps)
+            self.fps_sum += progress.fps
+            self.fps_count += 1
+            if self.fps_peak is None or progress.fps > self.fps_peak:
+                self.fps_peak = progress.fps
 
         # Parse bitrate (e.g., "5000kbits/s" or "5000.5kbits/s")
         if progress.bitrate is not None:
             bitrate_kbps = self._parse_bitrate(progress.bitrate)
             if bitrate_kbps is not None and bitrate_kbps > 0:
-                self.bitrate_samples.append(bitrate_kbps)
+                self.bitrate_sum += bitrate_kbps
+                self.bitrate_count += 1
 
         if progress.frame is not None:
             self.last_frame = progress.frame
@@ -104,26 +111,27 @@ class FFmpegMetricsAggregator:
             FFmpegMetricsSummary with computed averages and totals.
         """
         avg_fps: float | None = None
-        peak_fps: float | None = None
         avg_bitrate: int | None = None
 
-        if self.fps_samples:
-            avg_fps = sum(self.fps_samples) / len(self.fps_samples)
-            peak_fps = max(self.fps_samples)
+        if self.fps_count:
+            avg_fps = self.fps_sum / self.fps_count
 
-        if self.bitrate_samples:
-            avg_bitrate = int(sum(self.bitrate_samples) / len(self.bitrate_samples))
+        if self.bitrate_count:
+            avg_bitrate = int(self.bitrate_sum / self.bitrate_count)
 
         return FFmpegMetricsSummary(
             avg_fps=avg_fps,
-            peak_fps=peak_fps,
+            peak_fps=self.fps_peak,
             avg_bitrate_kbps=avg_bitrate,
             total_frames=self.last_frame,
-            sample_count=len(self.fps_samples),
+            sample_count=self.fps_count,
         )
 
     def reset(self) -> None:
         """Clear all collected samples."""
-        self.fps_samples.clear()
-        self.bitrate_samples.clear()
+        self.fps_sum = 0.0
+        self.fps_count = 0
+        self.fps_peak = None
+        self.bitrate_sum = 0
+        self.bitrate_count = 0
         self.last_frame = None
@@ -131,6 +131,38 @@ def parse_progress_block(block: str) -> FFmpegProgress:
     return result
 
 
+class FFmpegProgressParser:
+    """Incremental parser for FFmpeg ``-progress`` output.
+
+    FFmpeg writes one key=value pair per line and closes each block with a
+    ``progress=continue`` (or ``progress=end``) line. Lines are fed as they
+    arrive and a completed FFmpegProgress is returned at each block end,
+    so only the block being assembled is held in memory.
+    """
+
+    def __init__(self) -> None:
+        self._current = FFmpegProgress()
+
+    def feed_line(self, line: str) -> FFmpegProgress | None:
+        """Consume one line of progress output.
+
+        Args:
+            line: A line from FFmpeg's -progress output.
+
+        Returns:
+            The completed FFmpegProgress if line ends a block, else None.
+        """
+        key, sep, _ = line.partition("=")
+        if not sep:
+            return None
+        if key.strip() == "progress":
+            progress, self._current = self._current, FFmpegProgress()
+            return progress
+        for field_name, value in parse_progress_line(line).items():
+            setattr(self._current, field_name, value)
+        return None
+
+
 def parse_stderr_progress(line: str) -> FFmpegProgress | None:
     """Parse FFmpeg stderr progress line.
 
@@ -13,7 +13,6 @@ from __future__ import annotations
 
 import logging
 import sqlite3
-import time
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
@@ -24,7 +23,7 @@ from vpo.db.types import (
     TrackInfo,
     TranscriptionResultRecord,
 )
-from vpo.metrics import get_metrics_store, increment_counter
+from vpo.plugin.dispatcher import get_event_dispatcher
 from vpo.plugin.events import (
     TRANSCRIPTION_COMPLETED,
     TRANSCRIPTION_REQUESTED,
@@ -51,37 +50,6 @@ logger = logging.getLogger(__name__)
 # Default confidence threshold for language detection
 DEFAULT_CONFIDENCE_THRESHOLD = 0.8
 
-# Threshold for warning about slow plugin handlers (seconds)
-SLOW_PLUGIN_THRESHOLD = 1.0
-
-
-def _record_plugin_metrics(
-    plugin_name: str,
-    event_name: str,
-    duration: float,
-) -> None:
-    """Record metrics and log warnings for plugin invocations.
-
-    Args:
-        plugin_name: Name of the plugin.
-        event_name: Name of the event being handled.
-        duration: Duration of the handler call in seconds.
-    """
-    increment_counter("plugin.invocations", plugin_name=plugin_name)
-    get_metrics_store().record_duration(
-        "plugin.duration",
-        duration,
-        plugin_name=plugin_name,
-        event=event_name,
-    )
-    if duration > SLOW_PLUGIN_THRESHOLD:
-        logger.warning(
-            "Slow plugin: %s took %.2fs for %s",
-            plugin_name,
-            duration,
-            event_name,
-        )
-
 
 class NoTranscriptionPluginError(Exception):
     """Raised when no transcription plugin is available."""
@@ -144,6 +112,7 @@ class PluginTranscriberAdapter:
             track: TrackInfo for the audio track being transcribed.
         """
         self._registry = registry
+        self._dispatcher = get_event_dispatcher(registry)
         self._file_path = file_path
         self._track = track
         self._last_plugin_name: str | None = None
@@ -211,43 +180,21 @@ class PluginTranscriberAdapter:
                 "Install a transcription plugin (e.g., whisper-local)."
             )
 
-        errors: list[str] = []
-        for loaded_plugin in plugins:
-            try:
-                handler = getattr(
-                    loaded_plugin.instance, "on_transcription_requested", None
-                )
-                if handler is None:
-                    logger.debug(
-                        "Plugin %s has no on_transcription_requested handler",
-                        loaded_plugin.name,
-                    )
-                    continue
-
-                # Time the handler call
-                start_time = time.monotonic()
-                result = handler(event)
-                duration = time.monotonic() - start_time
-
-                _record_plugin_metrics(
-                    loaded_plugin.name, "transcription.requested", duration
-                )
-
-                if result is not None:
-                    self._last_plugin_name = loaded_plugin.name
-                    logger.debug(
-                        "Plugin %s handled transcription request in %.2fs",
-                        loaded_plugin.name,
-                        duration,
-                    )
-                    return result
-            except Exception as e:
-                logger.warning(
-                    "Plugin %s failed: %s",
-                    loaded_plugin.name,
-                    e,
-                )
-                errors.append(f"{loaded_plugin.name}: {e}")
+        # Plugins are tried in order and the first answer wins; transcription
+        # time depends on the model, so these calls get no time budget
+        results = self._dispatcher.dispatch_first(
+            TRANSCRIPTION_REQUESTED, "on_transcription_requested", event, timeout=None
+        )
+        if results and results[-1].ok and results[-1].value is not None:
+            winner = results[-1]
+            self._last_plugin_name = winner.plugin_name
+            logger.debug(
+                "Plugin %s handled transcription request in %.2fs",
+                winner.plugin_name,
+                winner.duration_seconds,
+            )
+            return winner.value
+        errors = [f"{r.plugin_name}: {r.error}" for r in results if r.error]
 
         # All plugins failed or returned None
         if errors:
@@ -600,23 +547,8 @@ class TranscriptionCoordinator:
             result=transcription_result,
         )
 
-        # Dispatch to plugins subscribed to transcription.completed
-        plugins = self._registry.get_by_event(TRANSCRIPTION_COMPLETED)
-        for loaded_plugin in plugins:
-            try:
-                handler = getattr(
-                    loaded_plugin.instance, "on_transcription_completed", None
-                )
-                if handler:
-                    start_time = time.monotonic()
-                    handler(event)
-                    duration = time.monotonic() - start_time
-                    _record_plugin_metrics(
-                        loaded_plugin.name, "transcription.completed", duration
-                    )
-            except Exception as e:
-                logger.warning(
-                    "Plugin %s failed to handle completion event: %s",
-                    loaded_plugin.name,
-                    e,
-                )
+        # Notify plugins subscribed to transcription.completed concurrently;
+        # failures are logged by the dispatcher and never fail the caller
+        get_event_dispatcher(self._registry).dispatch(
+            TRANSCRIPTION_COMPLETED, "on_transcription_completed", event
+        )
@@ -0,0 +1,242 @@
+"""Workflow checkpoints for resuming recovered jobs.
+
+After each phase of a queued process job, WorkflowProcessor stores a
+checkpoint in the job's checkpoint_json: the results of the phases done so
+far and a fingerprint (path, size, mtime, partial hash) of the file they
+left behind. If the worker dies, recover_stale_jobs requeues the job with
+its checkpoint, and the next run resumes at the first unfinished phase
+instead of repeating encodes. A checkpoint is only used if the policy and
+phase list are unchanged and the file still matches its fingerprint;
+otherwise the workflow starts over.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+
+from vpo.db.queries import get_job_checkpoint, update_job_checkpoint
+from vpo.policy.types import PhaseOutcome, PhaseResult
+from vpo.workflow.stats_capture import compute_partial_hash
+
+logger = logging.getLogger(__name__)
+
+# Bumped when the checkpoint layout changes; other versions are ignored
+CHECKPOINT_VERSION = 1
+
+
+@dataclass(frozen=True)
+class FileFingerprint:
+    """Identity of a file's content, cheap enough to take after each phase."""
+
+    path: str
+    size_bytes: int
+    mtime_ns: int
+    partial_hash: str
+
+    @classmethod
+    def of(cls, file_path: Path) -> FileFingerprint:
+        """Fingerprint a file.
+
+        Raises:
+            OSError: If the file cannot be read.
+        """
+        stat = file_path.stat()
+        return cls(
+            path=str(file_path),
+            size_bytes=stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            partial_hash=compute_partial_hash(file_path),
+        )
+
+
+@dataclass(frozen=True)
+class PhaseCheckpoint:
+    """Recorded result of a finished phase."""
+
+    phase_name: str
+    outcome: PhaseOutcome
+    changes_made: int = 0
+    file_modified: bool = False
+    message: str | None = None
+    error: str | None = None
+
+    @classmethod
+    def from_result(cls, result: PhaseResult) -> PhaseCheckpoint:
+        return cls(
+            phase_name=result.phase_name,
+            outcome=result.outcome,
+            changes_made=result.changes_made,
+            file_modified=result.file_modified,
+            message=result.message,
+            error=result.error,
+        )
+
+    def to_result(self) -> PhaseResult:
+        """Rebuild the phase's result (without timings or details)."""
+        return PhaseResult(
+            phase_name=self.phase_name,
+            success=self.outcome != PhaseOutcome.FAILED,
+            duration_seconds=0.0,
+            operations_executed=(),
+            changes_made=self.changes_made,
+            message=self.message,
+            error=self.error,
+            outcome=self.outcome,
+            file_modified=self.file_modified,
+        )
+
+
+@dataclass(frozen=True)
+class WorkflowCheckpoint:
+    """Progress of a job's workflow after its last finished phase."""
+
+    policy_hash: str | None
+    phase_names: tuple[str, ...]
+    phases: tuple[PhaseCheckpoint, ...]
+    file: FileFingerprint
+
+    def to_json(self) -> str:
+        return json.dumps(
+            {
+                "version": CHECKPOINT_VERSION,
+                "policy_hash": self.policy_hash,
+                "phase_names": list(self.phase_names),
+                "phases": [
+                    {
+                        "phase_name": p.phase_name,
+                        "outcome": p.outcome.value,
+                        "changes_made": p.changes_made,
+                        "file_modified": p.file_modified,
+                        "message": p.message,
+                        "error": p.error,
+                    }
+                    for p in self.phases
+                ],
+                "file": {
+                    "path": self.file.path,
+                    "size_bytes": self.file.size_bytes,
+                    "mtime_ns": self.file.mtime_ns,
+                    "partial_hash": self.file.partial_hash,
+                },
+            }
+        )
+
+    @classmethod
+    def from_json(cls, data: str) -> WorkflowCheckpoint | None:
+        """Parse a checkpoint, returning None if it is invalid or outdated."""
+        try:
+            raw = json.loads(data)
+            if raw.get("version") != CHECKPOINT_VERSION:
+                return None
+            return cls(
+                policy_hash=raw["policy_hash"],
+                phase_names=tuple(raw["phase_names"]),
+                phases=tuple(
+                    PhaseCheckpoint(
+                        phase_name=p["phase_name"],
+                        outcome=PhaseOutcome(p["outcome"]),
+                        changes_made=p["changes_made"],
+                        file_modified=p["file_modified"],
+                        message=p["message"],
+                        error=p["error"],
+                    )
+                    for p in raw["phases"]
+                ),
+                file=FileFingerprint(**raw["file"]),
+            )
+        except (AttributeError, KeyError, TypeError, ValueError):
+            return None
+
+
+def load_checkpoint(conn: sqlite3.Connection, job_id: str) -> WorkflowCheckpoint | None:
+    """Load a job's checkpoint.
+
+    Args:
+        conn: Database connection.
+        job_id: Job UUID.
+
+    Returns:
+        The checkpoint, or None if the job has no usable checkpoint.
+    """
+    data = get_job_checkpoint(conn, job_id)
+    if data is None:
+        return None
+    checkpoint = WorkflowCheckpoint.from_json(data)
+    if checkpoint is None:
+        logger.warning("Ignoring unreadable checkpoint of job %s", job_id[:8])
+    return checkpoint
+
+
+def save_checkpoint(
+    conn: sqlite3.Connection, job_id: str, checkpoint: WorkflowCheckpoint
+) -> None:
+    """Store a job's checkpoint and commit.
+
+    Args:
+        conn: Database connection.
+        job_id: Job UUID.
+        checkpoint: Checkpoint to store.
+    """
+    update_job_checkpoint(conn, job_id, checkpoint.to_json())
+    conn.commit()
+
+
+def resume_path(conn: sqlite3.Connection, job_id: str, file_path: Path) -> Path:
+    """Return the file a job should resume on.
+
+    A phase may have moved the file (container conversion), in which case
+    the job's original path no longer exists.
+
+    Args:
+        conn: Database connection.
+        job_id: Job UUID.
+        file_path: The job's original file path.
+
+    Returns:
+        The checkpointed path if the original is gone and the checkpointed
+        file exists, otherwise file_path.
+    """
+    if file_path.exists():
+        return file_path
+    checkpoint = load_checkpoint(conn, job_id)
+    if checkpoint is not None and Path(checkpoint.file.path).exists():
+        return Path(checkpoint.file.path)
+    return file_path
+
+
+def checkpoint_mismatch(
+    checkpoint: WorkflowCheckpoint,
+    policy_hash: str | None,
+    phase_names: tuple[str, ...],
+    file_path: Path,
+) -> str | None:
+    """Check whether a checkpoint can be resumed.
+
+    Args:
+        checkpoint: Checkpoint to verify.
+        policy_hash: Content hash of the policy being run.
+        phase_names: Names of the phases being run, in order.
+        file_path: File the workflow is about to process.
+
+    Returns:
+        Why the checkpoint cannot be used, or None if it can.
+    """
+    if checkpoint.policy_hash != policy_hash:
+        return "policy changed"
+    if checkpoint.phase_names != phase_names:
+        return "phases changed"
+    if len(checkpoint.phases) > len(phase_names):
+        return "more phases recorded than the policy has"
+    if checkpoint.file.path != str(file_path):
+        return "file path changed"
+    try:
+        current = FileFingerprint.of(file_path)
+    except OSError as e:
+        return f"cannot read file: {e}"
+    if current != checkpoint.file:
+        return "file changed since the checkpoint"
+    return None
@@ -9,6 +9,7 @@ from __future__ import annotations
 import json
 import logging
 from collections.abc import Callable
+from functools import lru_cache
 from pathlib import Path
 from sqlite3 import Connection
 from typing import TYPE_CHECKING
@@ -64,6 +65,12 @@ def get_tracks(conn: Connection, file_id: int) -> list[TrackInfo]:
     return tracks_to_track_info(track_records)
 
 
+@lru_cache(maxsize=256)
+def _load_plugin_metadata(text: str) -> object:
+    """Parse plugin metadata JSON, cached by the JSON text."""
+    return json.loads(text)
+
+
 def parse_plugin_metadata(
     file_record: FileRecord | None,
     file_path: Path,
@@ -72,6 +79,10 @@ def parse_plugin_metadata(
 ) -> dict | None:
     """Parse plugin metadata JSON from FileRecord.
 
+    Parsed results are cached by JSON text, so the phases and operations
+    processing one file parse its metadata once. The returned dict is
+    shared between callers and must not be modified.
+
     Args:
         file_record: File record from database (may be None).
         file_path: Path to file (for error logging).
@@ -85,7 +96,7 @@ def parse_plugin_metadata(
         return None
 
     try:
-        parsed = json.loads(file_record.plugin_metadata)
+        parsed = _load_plugin_metadata(file_record.plugin_metadata)
     except json.JSONDecodeError as e:
         logger.error(
             "Corrupted plugin_metadata JSON for file %s (file_id=%s): %s. "
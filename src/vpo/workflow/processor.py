@@ -5,8 +5,10 @@ processing through user-defined phases in phased policies.
 """
 
 import logging
+import sqlite3
 import time
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, replace
 from datetime import datetime, timezone
 from pathlib import Path
@@ -14,17 +16,22 @@ from sqlite3 import Connection
 from typing import TYPE_CHECKING
 
 from vpo._core import hash_files
-from vpo.config import get_config
+from vpo.config import get_config, get_temp_directory_for_file
 from vpo.core import parse_iso_timestamp
 from vpo.executor.backup import InsufficientDiskSpaceError, check_min_free_disk_percent
+from vpo.executor.io_admission import IOAdmission, get_io_admission
 from vpo.tools.ffmpeg_progress import FFmpegProgress
 
 if TYPE_CHECKING:
     from vpo.plugin import PluginRegistry
 
 from vpo.db.queries import (
+    get_compliance_memo,
     get_file_by_path,
     get_tracks_for_file,
+    hash_plugin_metadata,
+    phases_key_for,
+    record_compliance,
     update_file_attributes,
     upsert_tracks_for_file,
 )
@@ -46,6 +53,14 @@ from vpo.policy.types import (
     SkipReason,
     SkipReasonType,
 )
+from vpo.workflow.checkpoint import (
+    FileFingerprint,
+    PhaseCheckpoint,
+    WorkflowCheckpoint,
+    checkpoint_mismatch,
+    load_checkpoint,
+    save_checkpoint,
+)
 from vpo.workflow.phases.executor import PhaseExecutor
 from vpo.workflow.skip_conditions import evaluate_skip_when
 from vpo.workflow.stats_capture import (
@@ -106,6 +121,9 @@ class WorkflowProcessor:
         plugin_registry: "PluginRegistry | None" = None,
         ffmpeg_progress_callback: Callable[[FFmpegProgress], None] | None = None,
         job_id: str | None = None,
+        policy_hash: str | None = None,
+        use_compliance_memo: bool = True,
+        checkpoint: bool = False,
     ) -> None:
         """Initialize the workflow processor.
 
@@ -125,6 +143,13 @@ class WorkflowProcessor:
                 Used during container conversion with audio transcoding.
             job_id: Optional job ID for unified CLI/daemon tracking.
                 If provided, processing_stats will link to this job.
+            policy_hash: Content hash of the policy file. Required for the
+                compliance memo; if None, every file is fully evaluated.
+            use_compliance_memo: If False, ignore and do not record
+                compliance memo entries.
+            checkpoint: If True (and job_id is set), record finished phases
+                in the job's checkpoint and resume after them when the job
+                is run again (see vpo.workflow.checkpoint).
         """
         self.conn = conn
         self.policy = policy
@@ -135,6 +160,10 @@ class WorkflowProcessor:
         self._plugin_registry = plugin_registry
         self._ffmpeg_progress_callback = ffmpeg_progress_callback
         self._job_id = job_id
+        self._policy_hash = policy_hash if use_compliance_memo else None
+        self._checkpoint_policy_hash = policy_hash
+        self._checkpoint = checkpoint and job_id is not None and not dry_run
+        self._phases_key = phases_key_for(selected_phases)
 
         # Determine which phases to execute
         if selected_phases:
@@ -284,6 +313,26 @@ class WorkflowProcessor:
             return phase.on_error
         return self.policy.config.on_error
 
+    @contextmanager
+    def _io_admission(
+        self,
+        phase: PhaseDefinition,
+        file_path: Path,
+        file_info: FileInfo | None,
+    ) -> Iterator[IOAdmission]:
+        """Hold per-device I/O admission while a phase modifies the file.
+
+        Dry runs and phases without operations are admitted immediately.
+        """
+        if self.dry_run or not phase.get_operations():
+            yield IOAdmission()
+            return
+        with get_io_admission().admit(
+            [file_path, get_temp_directory_for_file(file_path)],
+            size_bytes=file_info.size_bytes if file_info else 0,
+        ) as admission:
+            yield admission
+
     def _check_min_free_disk_threshold(self, file_path: Path) -> None:
         """Pre-flight check for minimum free disk space threshold.
 
@@ -333,6 +382,28 @@ class WorkflowProcessor:
         file_path = file_path.expanduser().resolve()
         start_time = time.time()
 
+        # Skip files already known to comply with this policy (before any
+        # DB loads, snapshots or stats capture)
+        if self._is_known_compliant(file_path):
+            logger.info(
+                "Skipping %s: already compliant with policy (unchanged)",
+                file_path.name,
+            )
+            return FileProcessingResult(
+                file_path=file_path,
+                success=True,
+                phase_results=(),
+                total_duration_seconds=time.time() - start_time,
+                total_changes=0,
+                phases_completed=0,
+                phases_failed=0,
+                phases_skipped=len(self.phases_to_execute),
+                already_compliant=True,
+            )
+
+        # A recovered job resumes after the phases it already finished
+        resume = self._load_checkpoint(file_path)
+
         # Pre-flight check: minimum free disk space
         # In dry-run mode, warn but don't block; in normal mode, block on failure
         try:
@@ -412,7 +483,36 @@ class WorkflowProcessor:
         self._phase_outcomes = {}
         self._phase_modified = {}
 
-        for idx, phase in enumerate(self.phases_to_execute):
+        # Restore the results of checkpointed phases
+        start_index = 0
+        if resume is not None:
+            start_index = len(resume.phases)
+            for checkpointed in resume.phases:
+                phase_result = checkpointed.to_result()
+                phase_results.append(phase_result)
+                self._phase_outcomes[phase_result.phase_name] = phase_result.outcome
+                self._phase_modified[phase_result.phase_name] = (
+                    phase_result.file_modified
+                )
+                if phase_result.outcome == PhaseOutcome.COMPLETED:
+                    phases_completed.append(phase_result.phase_name)
+                    total_changes += phase_result.changes_made
+                elif phase_result.outcome == PhaseOutcome.SKIPPED:
+                    phases_skipped.append(phase_result.phase_name)
+                else:
+                    phases_failed.append(phase_result.phase_name)
+                    failed_phase = phase_result.phase_name
+                    error_message = phase_result.error
+            logger.info(
+                "Resuming %s at phase %d/%d from checkpoint",
+                file_path.name,
+                start_index + 1,
+                len(self.phases_to_execute),
+            )
+
+        for idx, phase in enumerate(
+            self.phases_to_execute[start_index:], start=start_index
+        ):
             # Report progress
             if self.progress_callback:
                 progress = WorkflowProgress(
@@ -465,6 +565,7 @@ class WorkflowProcessor:
                     phase.name,
                     skip_reason.message,
                 )
+                self._save_checkpoint(file_path, phase_results)
                 continue  # Move to next phase
 
             # Log phase start
@@ -477,12 +578,13 @@ class WorkflowProcessor:
 
             phase_start_time = time.time()
             try:
-                # Execute the phase
-                phase_result = self._executor.execute_phase(
-                    phase=phase,
-                    file_path=file_path,
-                    file_info=file_info,
-                )
+                # Execute the phase once its disks admit more work
+                with self._io_admission(phase, file_path, file_info) as admission:
+                    phase_result = self._executor.execute_phase(
+                        phase=phase,
+                        file_path=file_path,
+                        file_info=file_info,
+                    )
 
                 # Determine if file was modified
                 file_was_modified = phase_result.changes_made > 0
@@ -496,6 +598,7 @@ class WorkflowProcessor:
                     phase_result,
                     outcome=outcome,
                     file_modified=file_was_modified,
+                    io_wait=tuple(admission.wait_seconds.items()),
                 )
                 phase_results.append(phase_result)
 
@@ -512,6 +615,7 @@ class WorkflowProcessor:
                             wall_time_seconds=phase_duration,
                             encoding_fps=phase_result.encoding_fps,
                             encoding_bitrate=phase_result.encoding_bitrate_kbps,
+                            io_wait=dict(phase_result.io_wait),
                         )
                     )
                     # Capture transcode info if present
@@ -555,6 +659,8 @@ class WorkflowProcessor:
                     # Re-introspect if file was modified
                     if file_was_modified and not self.dry_run:
                         file_info = self._re_introspect(file_path)
+
+                    self._save_checkpoint(file_path, phase_results)
                 else:
                     # Phase returned success=False (should not happen normally)
                     phases_failed.append(phase.name)
@@ -616,6 +722,7 @@ class WorkflowProcessor:
                         )
                     break
                 # OnErrorMode.CONTINUE - proceed to next phase
+                self._save_checkpoint(file_path, phase_results)
 
         duration = time.time() - start_time
 
@@ -649,6 +756,9 @@ class WorkflowProcessor:
                 # Stats persistence failure should not affect workflow result
                 logger.warning("Failed to persist processing stats: %s", e)
 
+        if not self.dry_run and result.success and result.total_changes == 0:
+            self._record_compliance(file_path)
+
         return result
 
     def process_files(self, file_paths: list[Path]) -> list[FileProcessingResult]:
@@ -675,6 +785,129 @@ class WorkflowProcessor:
 
         return results
 
+    def _is_known_compliant(self, file_path: Path) -> bool:
+        """Check the compliance memo for an unchanged, compliant file.
+
+        A memo entry is valid only if the file's content hash and plugin
+        metadata in the database, and its size and mtime on disk, all still
+        match the values recorded when it was found compliant.
+
+        Args:
+            file_path: Resolved path to the file.
+
+        Returns:
+            True if the file can be skipped.
+        """
+        if self._policy_hash is None:
+            return False
+
+        entry = get_compliance_memo(
+            self.conn, str(file_path), self._policy_hash, self._phases_key
+        )
+        if entry is None:
+            return False
+        if entry.current_content_hash != entry.content_hash:
+            return False
+        current_metadata_hash = hash_plugin_metadata(entry.current_plugin_metadata)
+        if current_metadata_hash != entry.plugin_metadata_hash:
+            return False
+
+        try:
+            stat = file_path.stat()
+        except OSError:
+            return False
+        return stat.st_size == entry.size_bytes and stat.st_mtime_ns == entry.mtime_ns
+
+    def _record_compliance(self, file_path: Path) -> None:
+        """Record that a file needed no changes under this policy.
+
+        Failures are logged and ignored; the memo is only an optimization.
+
+        Args:
+            file_path: Path to the file.
+        """
+        if self._policy_hash is None:
+            return
+
+        try:
+            file_record = get_file_by_path(self.conn, str(file_path))
+            if file_record is None or not file_record.content_hash:
+                return
+            stat = file_path.stat()
+            record_compliance(
+                self.conn,
+                file_id=file_record.id,
+                policy_hash=self._policy_hash,
+                phases_key=self._phases_key,
+                content_hash=file_record.content_hash,
+                size_bytes=stat.st_size,
+                mtime_ns=stat.st_mtime_ns,
+                plugin_metadata_hash=hash_plugin_metadata(file_record.plugin_metadata),
+            )
+            self.conn.commit()
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("Failed to record compliance for %s: %s", file_path, e)
+
+    def _load_checkpoint(self, file_path: Path) -> WorkflowCheckpoint | None:
+        """Load the job's checkpoint if the workflow can resume from it.
+
+        Args:
+            file_path: Resolved path to the file (the checkpointed path for
+                a job whose file was renamed by a phase).
+
+        Returns:
+            The checkpoint, or None to run all phases.
+        """
+        if not self._checkpoint:
+            return None
+        try:
+            checkpoint = load_checkpoint(self.conn, self._job_id)
+        except sqlite3.Error as e:
+            logger.warning("Failed to load checkpoint for %s: %s", file_path, e)
+            return None
+        if checkpoint is None:
+            return None
+
+        mismatch = checkpoint_mismatch(
+            checkpoint,
+            self._checkpoint_policy_hash,
+            tuple(p.name for p in self.phases_to_execute),
+            file_path,
+        )
+        if mismatch is not None:
+            logger.warning(
+                "Not resuming %s from checkpoint (%s); running all phases",
+                file_path.name,
+                mismatch,
+            )
+            return None
+        return checkpoint
+
+    def _save_checkpoint(
+        self, file_path: Path, phase_results: list[PhaseResult]
+    ) -> None:
+        """Record the finished phases in the job's checkpoint.
+
+        Failures are logged and ignored; without a checkpoint a recovered
+        job just runs all phases again.
+
+        Args:
+            file_path: Current path to the file.
+            phase_results: Results of the phases finished so far.
+        """
+        if not self._checkpoint:
+            return
+        try:
+            checkpoint = WorkflowCheckpoint(
+                policy_hash=self._checkpoint_policy_hash,
+                phase_names=tuple(p.name for p in self.phases_to_execute),
+                phases=tuple(PhaseCheckpoint.from_result(r) for r in phase_results),
+                file=FileFingerprint.of(file_path),
+            )
+            save_checkpoint(self.conn, self._job_id, checkpoint)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning("Failed to save checkpoint for %s: %s", file_path, e)
+
     def _get_file_info(self, file_path: Path) -> FileInfo | None:
         """Get file info from database.
 
@@ -0,0 +1,367 @@
+"""Library-wide dry-run simulation of a policy.
+
+Answers "which files would this policy change?" without running the
+per-file workflow. Files and their tracks are loaded from the database in
+large batches (one query for files and one for tracks per batch), each
+phase's EvaluationPolicy is built once, and the compiled policy conditions
+are evaluated for every file in the batch.
+
+Only plan-based operations (container, filters, track order, default
+flags, conditional rules and track actions) are evaluated. Operations that
+need media analysis or external tools (transcode, audio synthesis,
+transcription, file timestamps) are reported as not simulated.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from collections import Counter
+from dataclasses import dataclass, field
+from pathlib import Path
+from sqlite3 import Connection
+
+from vpo.core import parse_iso_timestamp
+from vpo.db.queries import get_file_batch, get_track_table
+from vpo.db.queries.helpers import deserialize_container_tags
+from vpo.db.types import FileInfo, FileRecord, TrackInfo
+from vpo.policy.evaluator import EvaluationError, evaluate_policy
+from vpo.policy.exceptions import PolicyError
+from vpo.policy.types import (
+    EvaluationPolicy,
+    OperationType,
+    PhaseDefinition,
+    PhaseOutcome,
+    PolicySchema,
+)
+from vpo.workflow.phases.executor.helpers import (
+    get_language_results_for_tracks,
+    parse_container_tags,
+    parse_plugin_metadata,
+)
+from vpo.workflow.skip_conditions import evaluate_skip_when
+
+logger = logging.getLogger(__name__)
+
+#: Default number of files loaded and evaluated per batch.
+DEFAULT_BATCH_SIZE = 500
+
+#: Operations evaluated through evaluate_policy().
+PLAN_OPERATIONS = frozenset(
+    {
+        OperationType.CONTAINER,
+        OperationType.AUDIO_FILTER,
+        OperationType.SUBTITLE_FILTER,
+        OperationType.ATTACHMENT_FILTER,
+        OperationType.TRACK_ORDER,
+        OperationType.DEFAULT_FLAGS,
+        OperationType.CONDITIONAL,
+    }
+)
+
+
+@dataclass(frozen=True)
+class FileSimulation:
+    """Simulated outcome of a policy for a single file."""
+
+    file_id: int
+    path: str
+    changes: int
+    """Planned actions plus removed tracks across all simulated phases."""
+    phases_changed: tuple[str, ...]
+    """Names of phases that would modify the file."""
+    action_counts: dict[str, int]
+    """Planned action count keyed by action type."""
+    tracks_removed: int = 0
+    requires_remux: bool = False
+    error: str | None = None
+    """Evaluation error that would fail processing, if any."""
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "file_id": self.file_id,
+            "path": self.path,
+            "changes": self.changes,
+            "phases_changed": list(self.phases_changed),
+            "action_counts": self.action_counts,
+            "tracks_removed": self.tracks_removed,
+            "requires_remux": self.requires_remux,
+            "error": self.error,
+        }
+
+
+@dataclass
+class SimulationResult:
+    """Aggregate result of simulating a policy across the library."""
+
+    policy_name: str
+    total_files: int = 0
+    files_changed: int = 0
+    files_compliant: int = 0
+    files_errored: int = 0
+    tracks_removed: int = 0
+    remux_required: int = 0
+    action_counts: Counter[str] = field(default_factory=Counter)
+    """Planned action count keyed by action type, across all files."""
+    phase_counts: Counter[str] = field(default_factory=Counter)
+    """Number of files each phase would modify."""
+    unsimulated_operations: tuple[str, ...] = ()
+    """Operations in the policy that the simulation cannot evaluate."""
+    files: list[FileSimulation] = field(default_factory=list)
+    """Per-file summaries for changed or errored files (up to max_files)."""
+    truncated: bool = False
+    """True if more files changed than are listed in files."""
+    duration_seconds: float = 0.0
+
+    def to_dict(self) -> dict:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "policy": self.policy_name,
+            "total_files": self.total_files,
+            "files_changed": self.files_changed,
+            "files_compliant": self.files_compliant,
+            "files_errored": self.files_errored,
+            "tracks_removed": self.tracks_removed,
+            "remux_required": self.remux_required,
+            "action_counts": dict(self.action_counts.most_common()),
+            "phase_counts": dict(self.phase_counts.most_common()),
+            "unsimulated_operations": list(self.unsimulated_operations),
+            "files": [f.to_dict() for f in self.files],
+            "truncated": self.truncated,
+            "duration_seconds": round(self.duration_seconds, 2),
+        }
+
+
+@dataclass(frozen=True)
+class _PhasePlan:
+    """Per-phase evaluation inputs, built once per simulation."""
+
+    phase: PhaseDefinition
+    eval_policy: EvaluationPolicy | None
+    """None if the phase has no plan-based operations."""
+
+
+def _build_phase_plans(
+    policy: PolicySchema, selected_phases: list[str] | None
+) -> tuple[list[_PhasePlan], tuple[str, ...]]:
+    """Build evaluation inputs for each phase to simulate.
+
+    Returns:
+        Tuple of (phase plans, sorted names of unsimulated operations).
+    """
+    plans: list[_PhasePlan] = []
+    unsimulated: set[str] = set()
+    for phase in policy.phases:
+        if selected_phases and phase.name not in selected_phases:
+            continue
+        ops = phase.get_operations()
+        unsimulated.update(op.value for op in ops if op not in PLAN_OPERATIONS)
+        has_plan = any(op in PLAN_OPERATIONS for op in ops) or (
+            phase.audio_actions is not None
+            or phase.subtitle_actions is not None
+            or phase.video_actions is not None
+        )
+        eval_policy = (
+            EvaluationPolicy.from_phase(phase, policy.config) if has_plan else None
+        )
+        plans.append(_PhasePlan(phase=phase, eval_policy=eval_policy))
+    return plans, tuple(sorted(unsimulated))
+
+
+def _to_file_info(record: FileRecord, tracks: list[TrackInfo]) -> FileInfo:
+    """Build a FileInfo for skip_when evaluation (mirrors the processor)."""
+    return FileInfo(
+        path=Path(record.path),
+        filename=record.filename,
+        directory=Path(record.directory),
+        extension=record.extension,
+        size_bytes=record.size_bytes,
+        modified_at=parse_iso_timestamp(record.modified_at),
+        content_hash=record.content_hash,
+        container_format=record.container_format,
+        tracks=tracks,
+        container_tags=deserialize_container_tags(record.container_tags),
+    )
+
+
+def _phase_skipped(
+    phase: PhaseDefinition,
+    outcomes: dict[str, PhaseOutcome],
+    modified: dict[str, bool],
+    record: FileRecord,
+    tracks: list[TrackInfo],
+) -> bool:
+    """Apply the processor's depends_on, skip_when and run_if checks."""
+    if phase.depends_on is not None and any(
+        outcomes.get(dep, PhaseOutcome.PENDING) != PhaseOutcome.COMPLETED
+        for dep in phase.depends_on
+    ):
+        return True
+    if phase.skip_when is not None:
+        file_info = _to_file_info(record, tracks)
+        if evaluate_skip_when(phase.skip_when, file_info, file_info.path):
+            return True
+    if phase.run_if is not None:
+        ref = phase.run_if.phase_modified
+        if ref and not modified.get(ref, False):
+            return True
+        ref = phase.run_if.phase_completed
+        if ref and outcomes.get(ref, PhaseOutcome.PENDING) != PhaseOutcome.COMPLETED:
+            return True
+    return False
+
+
+def _simulate_file(
+    record: FileRecord,
+    tracks: list[TrackInfo],
+    phase_plans: list[_PhasePlan],
+    language_results: dict | None,
+) -> FileSimulation:
+    """Simulate all phases for one file against its stored tracks."""
+    file_path = Path(record.path)
+    file_id = str(record.id)
+    container = record.container_format or file_path.suffix.lstrip(".")
+    plugin_metadata = parse_plugin_metadata(
+        record, file_path, file_id, "policy simulation"
+    )
+    container_tags = parse_container_tags(record, file_path, file_id)
+
+    outcomes: dict[str, PhaseOutcome] = {}
+    modified: dict[str, bool] = {}
+    action_counts: Counter[str] = Counter()
+    phases_changed: list[str] = []
+    tracks_removed = 0
+    requires_remux = False
+    error: str | None = None
+
+    for phase_plan in phase_plans:
+        phase = phase_plan.phase
+        if _phase_skipped(phase, outcomes, modified, record, tracks):
+            outcomes[phase.name] = PhaseOutcome.SKIPPED
+            modified[phase.name] = False
+            continue
+
+        changes = 0
+        if phase_plan.eval_policy is not None:
+            try:
+                plan = evaluate_policy(
+                    file_id=file_id,
+                    file_path=file_path,
+                    container=container,
+                    tracks=tracks,
+                    policy=phase_plan.eval_policy,
+                    plugin_metadata=plugin_metadata,
+                    language_results=language_results,
+                    container_tags=container_tags,
+                )
+            except PolicyError:
+                # Constraint skips are not failures (see execute_operation)
+                plan = None
+            except EvaluationError as e:
+                error = f"{phase.name}: {e}"
+                outcomes[phase.name] = PhaseOutcome.FAILED
+                break
+
+            if plan is not None:
+                changes = len(plan.actions) + plan.tracks_removed
+                action_counts.update(a.action_type.value for a in plan.actions)
+                tracks_removed += plan.tracks_removed
+                requires_remux = requires_remux or plan.requires_remux
+
+        outcomes[phase.name] = PhaseOutcome.COMPLETED
+        modified[phase.name] = changes > 0
+        if changes > 0:
+            phases_changed.append(phase.name)
+
+    return FileSimulation(
+        file_id=record.id,
+        path=record.path,
+        changes=sum(action_counts.values()) + tracks_removed,
+        phases_changed=tuple(phases_changed),
+        action_counts=dict(action_counts),
+        tracks_removed=tracks_removed,
+        requires_remux=requires_remux,
+        error=error,
+    )
+
+
+def simulate_policy(
+    conn: Connection,
+    policy: PolicySchema,
+    *,
+    policy_name: str = "",
+    selected_phases: list[str] | None = None,
+    path_prefix: str | None = None,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    max_files: int = 100,
+) -> SimulationResult:
+    """Simulate a policy against every scanned file in the library.
+
+    Read-only: no files or database rows are modified.
+
+    Args:
+        conn: Database connection.
+        policy: Policy to simulate.
+        policy_name: Display name for the result.
+        selected_phases: Optional list of phases to simulate (None = all).
+        path_prefix: Optional directory to restrict the simulation to.
+        batch_size: Number of files loaded and evaluated per batch.
+        max_files: Maximum number of per-file summaries to include.
+
+    Returns:
+        SimulationResult with aggregate counts and per-file summaries.
+    """
+    start_time = time.monotonic()
+    phase_plans, unsimulated = _build_phase_plans(policy, selected_phases)
+    result = SimulationResult(
+        policy_name=policy_name or policy.name or "",
+        unsimulated_operations=unsimulated,
+    )
+
+    after_id = 0
+    while True:
+        records = get_file_batch(conn, after_id, batch_size, path_prefix)
+        if not records:
+            break
+        after_id = records[-1].id
+
+        track_table = get_track_table(conn, records[0].id, after_id, path_prefix)
+        tracks_by_file = {
+            file_id: [track_table.track_info(i) for i in rows]
+            for file_id, rows in track_table.file_rows().items()
+        }
+        language_results = get_language_results_for_tracks(
+            conn, [t for tracks in tracks_by_file.values() for t in tracks]
+        )
+
+        for record in records:
+            sim = _simulate_file(
+                record,
+                tracks_by_file.get(record.id, []),
+                phase_plans,
+                language_results,
+            )
+            result.total_files += 1
+            if sim.error is not None:
+                result.files_errored += 1
+            elif sim.changes > 0:
+                result.files_changed += 1
+            else:
+                result.files_compliant += 1
+                continue
+
+            result.action_counts.update(sim.action_counts)
+            result.phase_counts.update(sim.phases_changed)
+            result.tracks_removed += sim.tracks_removed
+            if sim.requires_remux:
+                result.remux_required += 1
+            if len(result.files) < max_files:
+                result.files.append(sim)
+            else:
+                result.truncated = True
+
+        logger.debug("Simulated %d files (through id %d)", result.total_files, after_id)
+
+    result.duration_seconds = time.monotonic() - start_time
+    return result
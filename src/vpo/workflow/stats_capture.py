@@ -122,6 +122,8 @@ class PhaseMetrics:
     bytes_written: int | None = None
     encoding_fps: float | None = None
     encoding_bitrate: int | None = None
+    io_wait: dict[str, float] = field(default_factory=dict)
+    """Seconds waited for I/O admission, keyed by device identifier."""
 
 
 @dataclass
@@ -312,8 +314,9 @@ class StatsCollector:
     def persist(self) -> str:
         """Persist collected statistics to database.
 
-        All inserts are performed atomically within a single transaction.
-        If any insert fails, all changes are rolled back.
+        All inserts, including the hourly/daily stats rollups updated by
+        insert_processing_stats, are performed atomically within a single
+        transaction. If any insert fails, all changes are rolled back.
 
         Returns:
             The stats_id (UUID) of the persisted record.
@@ -400,6 +403,12 @@ class StatsCollector:
                     bytes_written=metrics.bytes_written,
                     encoding_fps=metrics.encoding_fps,
                     encoding_bitrate=metrics.encoding_bitrate,
+                    io_wait_seconds=sum(metrics.io_wait.values())
+                    if metrics.io_wait
+                    else None,
+                    io_wait_devices=json.dumps(metrics.io_wait)
+                    if metrics.io_wait
+                    else None,
                 )
                 insert_performance_metric(self.conn, metric_record)
 
@@ -87,7 +87,7 @@ class TestReportJobsWithMock:
         ]
 
         with patch(
-            "vpo.reports.queries.get_jobs_report",
+            "vpo.reports.queries.iter_jobs_report",
             return_value=mock_rows,
         ):
             result = runner.invoke(main, ["report", "jobs"])
@@ -112,7 +112,7 @@ class TestReportJobsWithMock:
         ]
 
         with patch(
-            "vpo.reports.queries.get_jobs_report",
+            "vpo.reports.queries.iter_jobs_report",
             return_value=mock_rows,
         ) as mock_query:
             result = runner.invoke(main, ["report", "jobs", "--type", "scan"])
@@ -138,7 +138,7 @@ class TestReportJobsWithMock:
         ]
 
         with patch(
-            "vpo.reports.queries.get_jobs_report",
+            "vpo.reports.queries.iter_jobs_report",
             return_value=mock_rows,
         ):
             result = runner.invoke(main, ["report", "jobs", "--format", "json"])
@@ -164,7 +164,7 @@ class TestReportJobsWithMock:
         ]
 
         with patch(
-            "vpo.reports.queries.get_jobs_report",
+            "vpo.reports.queries.iter_jobs_report",
             return_value=mock_rows,
         ):
             result = runner.invoke(main, ["report", "jobs", "--format", "csv"])
@@ -176,7 +176,7 @@ class TestReportJobsWithMock:
 
     def test_empty_results(self, runner):
         """Handle empty results."""
-        with patch("vpo.reports.queries.get_jobs_report", return_value=[]):
+        with patch("vpo.reports.queries.iter_jobs_report", return_value=[]):
             result = runner.invoke(main, ["report", "jobs"])
             assert result.exit_code == 0
             assert "No records found" in result.output
@@ -200,7 +200,7 @@ class TestReportLibraryWithMock:
         ]
 
         with patch(
-            "vpo.reports.queries.get_library_report",
+            "vpo.reports.queries.iter_library_report",
             return_value=mock_rows,
         ):
             result = runner.invoke(main, ["report", "library"])
@@ -223,7 +223,7 @@ class TestReportLibraryWithMock:
         ]
 
         with patch(
-            "vpo.reports.queries.get_library_report",
+            "vpo.reports.queries.iter_library_report",
             return_value=mock_rows,
         ) as mock_query:
             result = runner.invoke(main, ["report", "library", "--resolution", "4K"])
@@ -259,7 +259,7 @@ class TestReportScansWithMock:
         ]
 
         with patch(
-            "vpo.reports.queries.get_scans_report",
+            "vpo.reports.queries.iter_scans_report",
             return_value=mock_rows,
         ):
             result = runner.invoke(main, ["report", "scans"])
@@ -283,7 +283,7 @@ class TestReportScansWithMock:
         ]
 
         with patch(
-            "vpo.reports.queries.get_scans_report",
+            "vpo.reports.queries.iter_scans_report",
             return_value=mock_rows,
         ):
             result = runner.invoke(main, ["report", "scans", "--format", "json"])
@@ -313,7 +313,7 @@ class TestReportTranscodesWithMock:
         ]
 
         with patch(
-            "vpo.reports.queries.get_transcodes_report",
+            "vpo.reports.queries.iter_transcodes_report",
             return_value=mock_rows,
         ):
             result = runner.invoke(main, ["report", "transcodes"])
@@ -325,7 +325,7 @@ class TestReportTranscodesWithMock:
         mock_rows = []
 
         with patch(
-            "vpo.reports.queries.get_transcodes_report",
+            "vpo.reports.queries.iter_transcodes_report",
             return_value=mock_rows,
         ) as mock_query:
             result = runner.invoke(main, ["report", "transcodes", "--codec", "hevc"])
@@ -399,7 +399,7 @@ class TestReportFileOutput:
         output_file = tmp_path / "report.csv"
 
         with patch(
-            "vpo.reports.queries.get_jobs_report",
+            "vpo.reports.queries.iter_jobs_report",
             return_value=mock_rows,
         ):
             result = runner.invoke(
@@ -431,7 +431,7 @@ class TestReportFileOutput:
         output_file.write_text("existing content")
 
         with patch(
-            "vpo.reports.queries.get_jobs_report",
+            "vpo.reports.queries.iter_jobs_report",
             return_value=mock_rows,
         ):
             result = runner.invoke(
@@ -462,7 +462,7 @@ class TestReportFileOutput:
         output_file.write_text("existing content")
 
         with patch(
-            "vpo.reports.queries.get_jobs_report",
+            "vpo.reports.queries.iter_jobs_report",
             return_value=mock_rows,
         ):
             result = runner.invoke(
@@ -491,7 +491,7 @@ class TestReportTimeFilters:
         mock_rows = []
 
         with patch(
-            "vpo.reports.queries.get_jobs_report",
+            "vpo.reports.queries.iter_jobs_report",
             return_value=mock_rows,
         ) as mock_query:
             result = runner.invoke(main, ["report", "jobs", "--since", "7d"])
@@ -505,7 +505,7 @@ class TestReportTimeFilters:
         mock_rows = []
 
         with patch(
-            "vpo.reports.queries.get_jobs_report",
+            "vpo.reports.queries.iter_jobs_report",
             return_value=mock_rows,
         ) as mock_query:
             result = runner.invoke(main, ["report", "jobs", "--until", "1d"])
@@ -529,7 +529,7 @@ class TestReportLimitOptions:
         mock_rows = []
 
         with patch(
-            "vpo.reports.queries.get_jobs_report",
+            "vpo.reports.queries.iter_jobs_report",
             return_value=mock_rows,
         ) as mock_query:
             result = runner.invoke(main, ["report", "jobs", "--limit", "50"])
@@ -542,7 +542,7 @@ class TestReportLimitOptions:
         mock_rows = []
 
         with patch(
-            "vpo.reports.queries.get_jobs_report",
+            "vpo.reports.queries.iter_jobs_report",
             return_value=mock_rows,
         ) as mock_query:
             result = runner.invoke(main, ["report", "jobs", "--no-limit"])
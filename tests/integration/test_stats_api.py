@@ -13,6 +13,7 @@ from uuid import uuid4
 
 from aiohttp.test_utils import AioHTTPTestCase
 
+from vpo.db.queries import rebuild_stats_rollups
 from vpo.db.schema import initialize_database
 from vpo.server.app import create_app
 
@@ -84,7 +85,8 @@ class TestStatsTrendsEndpoint(AioHTTPTestCase):
                 encoder_type,
             ),
         )
-        conn.commit()
+        # Raw inserts bypass insert_processing_stats, so backfill rollups
+        rebuild_stats_rollups(conn)
         conn.close()
         return db_file_id
 
@@ -249,7 +251,8 @@ class TestStatsEncoderTypeEndpoint(AioHTTPTestCase):
             """,
             (stats_id, db_file_id, now.isoformat(), encoder_type),
         )
-        conn.commit()
+        # Raw inserts bypass insert_processing_stats, so backfill rollups
+        rebuild_stats_rollups(conn)
         conn.close()
 
     async def test_summary_includes_encoder_counts(self) -> None:
@@ -0,0 +1,77 @@
+"""Tests for the policy simulate command."""
+
+import json
+from pathlib import Path
+
+import pytest
+from click.testing import CliRunner
+
+from vpo.cli.policy import policy_group
+
+POLICY_YAML = """\
+schema_version: 13
+phases:
+  - name: filter
+    keep_audio:
+      languages: [eng]
+"""
+
+
+@pytest.fixture
+def policy_file(tmp_path: Path) -> Path:
+    path = tmp_path / "filter.yaml"
+    path.write_text(POLICY_YAML)
+    return path
+
+
+@pytest.fixture
+def foreign_file(insert_test_file, insert_test_track) -> int:
+    file_id = insert_test_file(path="/media/movies/foreign.mkv")
+    insert_test_track(file_id=file_id, track_index=0, is_default=True)
+    insert_test_track(
+        file_id=file_id,
+        track_index=1,
+        track_type="audio",
+        language="eng",
+        is_default=True,
+    )
+    insert_test_track(
+        file_id=file_id, track_index=2, track_type="audio", language="fre"
+    )
+    return file_id
+
+
+class TestPolicySimulateCommand:
+    """Tests for vpo policy simulate."""
+
+    def test_json_output(self, db_conn, policy_file, foreign_file):
+        result = CliRunner().invoke(
+            policy_group,
+            ["simulate", str(policy_file), "--format", "json"],
+            obj={"db_conn": db_conn},
+        )
+
+        assert result.exit_code == 0, result.output
+        data = json.loads(result.output)
+        assert data["total_files"] == 1
+        assert data["files_changed"] == 1
+        assert data["files"][0]["file_id"] == foreign_file
+
+    def test_human_output(self, db_conn, policy_file, foreign_file):
+        result = CliRunner().invoke(
+            policy_group, ["simulate", str(policy_file)], obj={"db_conn": db_conn}
+        )
+
+        assert result.exit_code == 0, result.output
+        assert "Would change: 1" in result.output
+        assert "/media/movies/foreign.mkv" in result.output
+
+    def test_invalid_phase(self, db_conn, policy_file):
+        result = CliRunner().invoke(
+            policy_group,
+            ["simulate", str(policy_file), "--phases", "missing"],
+            obj={"db_conn": db_conn},
+        )
+
+        assert result.exit_code != 0
+        assert "Invalid phase name" in result.output
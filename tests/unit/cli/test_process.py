@@ -4,7 +4,11 @@ Renamed as part of CLI reorganization. The `policy run` command
 was promoted to top-level `process` command.
 """
 
+import logging
+import multiprocessing
+import pickle
 import threading
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -12,13 +16,18 @@ import pytest
 
 from vpo.cli.process import (
     _format_multi_policy_result_human,
+    _init_process_worker,
+    _process_file_in_worker,
     _process_single_file,
     get_max_workers,
     resolve_worker_count,
 )
+from vpo.db.connection import get_connection
+from vpo.db.schema import create_schema
 from vpo.jobs import WorkflowRunnerConfig
 from vpo.policy.types import FileProcessingResult
 from vpo.workflow.multi_policy import MultiPolicyResult
+from vpo.workflow.processor import NOT_IN_DB_MESSAGE
 
 
 class TestGetMaxWorkers:
@@ -299,6 +308,118 @@ class TestProcessSingleFileMultiPolicy:
         assert "disk full" in result.error_message
 
 
+class TestProcessExecutor:
+    """Tests for the --executor=process worker helpers."""
+
+    @patch("vpo.cli.process.get_connection")
+    @patch("vpo.cli.process.run_policies_for_file")
+    @patch("vpo.cli.process.worker_context")
+    def test_supplied_connection_is_reused(
+        self, mock_ctx, mock_run, mock_conn, make_policy
+    ):
+        """A per-process connection is used instead of opening one."""
+        mock_run.return_value = MultiPolicyResult(
+            policy_results=(("test", _make_result()),), overall_success=True
+        )
+        conn = MagicMock()
+
+        _process_single_file(
+            Path("/tmp/test.mkv"),
+            0,
+            Path("/tmp/db.sqlite"),
+            [(Path("/tmp/test.yaml"), make_policy())],
+            [WorkflowRunnerConfig(dry_run=True, policy_name="test")],
+            MagicMock(),
+            threading.Event(),
+            "01",
+            "F001",
+            None,
+            conn=conn,
+        )
+
+        mock_conn.assert_not_called()
+        assert mock_run.call_args.kwargs["conn"] is conn
+
+    @patch("vpo.cli.process.run_policies_for_file")
+    @patch("vpo.cli.process.worker_context")
+    def test_worker_uses_process_state(self, mock_ctx, mock_run, make_policy):
+        """Worker tasks use the policies and connection from the initializer."""
+        mock_run.return_value = MultiPolicyResult(
+            policy_results=(("test", _make_result()),), overall_success=True
+        )
+        conn = MagicMock()
+        state = {
+            "db_path": Path("/tmp/db.sqlite"),
+            "policies": [(Path("/tmp/test.yaml"), make_policy())],
+            "conn": conn,
+            "stop_event": threading.Event(),
+        }
+
+        with patch.dict("vpo.cli.process._process_worker_state", state):
+            path, results, success = _process_file_in_worker(
+                Path("/tmp/test.mkv"),
+                0,
+                [WorkflowRunnerConfig(dry_run=True, policy_name="test")],
+                "01",
+                "F001",
+                None,
+            )
+
+        assert success is True
+        assert results[0][0] == "test"
+        assert mock_run.call_args.kwargs["conn"] is conn
+
+    def test_results_are_picklable(self):
+        """Results cross the process boundary back to the parent."""
+        result = _make_result(success=False, error_message="boom")
+
+        assert pickle.loads(pickle.dumps(result)) == result
+
+    def test_spawned_workers_process_files(self, temp_dir: Path):
+        """Files round-trip through real spawned worker processes."""
+        db_path = temp_dir / "library.db"
+        with get_connection(db_path) as conn:
+            create_schema(conn)
+        policy_path = temp_dir / "policy.yaml"
+        policy_path.write_text("schema_version: 13\nphases:\n  - name: default\n")
+        files = [temp_dir / "a.mkv", temp_dir / "b.mkv"]
+        for path in files:
+            path.touch()
+
+        mp_context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(
+            max_workers=2,
+            mp_context=mp_context,
+            initializer=_init_process_worker,
+            initargs=(
+                db_path,
+                [policy_path],
+                mp_context.Event(),
+                mp_context.Queue(),
+                logging.WARNING,
+            ),
+        ) as pool:
+            futures = [
+                pool.submit(
+                    _process_file_in_worker,
+                    path,
+                    index,
+                    [WorkflowRunnerConfig(dry_run=False, policy_name="policy")],
+                    f"{index + 1:02d}",
+                    f"F{index + 1}",
+                    None,
+                )
+                for index, path in enumerate(files)
+            ]
+            outcomes = [future.result(timeout=60) for future in futures]
+
+        assert [path for path, _, _ in outcomes] == files
+        for _, results, _ in outcomes:
+            [(policy_name, result)] = results
+            assert policy_name == "policy"
+            assert result.error_message == NOT_IN_DB_MESSAGE
+
+
 class TestFormatMultiPolicyResult:
     """Tests for _format_multi_policy_result_human."""
 
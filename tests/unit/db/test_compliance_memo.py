@@ -0,0 +1,165 @@
+"""Tests for compliance memo queries and the v27 to v28 migration."""
+
+import sqlite3
+
+from vpo.db.queries import (
+    ALL_PHASES_KEY,
+    delete_all_compliance_memo,
+    delete_compliance_memo_for_file,
+    get_compliance_memo,
+    hash_plugin_metadata,
+    phases_key_for,
+    record_compliance,
+)
+from vpo.db.schema.migrations.v26_to_v30 import migrate_v27_to_v28
+
+
+def _record(conn, file_id: int, policy_hash: str = "p1", **kwargs) -> None:
+    values = {
+        "phases_key": ALL_PHASES_KEY,
+        "content_hash": "xxh64:abc",
+        "size_bytes": 1000,
+        "mtime_ns": 123,
+        "plugin_metadata_hash": None,
+    }
+    values.update(kwargs)
+    record_compliance(conn, file_id=file_id, policy_hash=policy_hash, **values)
+
+
+class TestPhasesKey:
+    """Tests for phases_key_for."""
+
+    def test_all_phases(self):
+        assert phases_key_for(None) == ALL_PHASES_KEY
+        assert phases_key_for([]) == ALL_PHASES_KEY
+
+    def test_selected_phases(self):
+        assert phases_key_for(["analyze", "apply"]) == "analyze,apply"
+
+
+class TestHashPluginMetadata:
+    """Tests for hash_plugin_metadata."""
+
+    def test_none_for_missing_metadata(self):
+        assert hash_plugin_metadata(None) is None
+        assert hash_plugin_metadata("") is None
+
+    def test_stable_and_content_sensitive(self):
+        first = hash_plugin_metadata('{"radarr": {"year": 2010}}')
+        assert first == hash_plugin_metadata('{"radarr": {"year": 2010}}')
+        assert first != hash_plugin_metadata('{"radarr": {"year": 2011}}')
+
+
+class TestComplianceMemo:
+    """Tests for compliance memo record/lookup/delete."""
+
+    def test_missing_entry_returns_none(self, db_conn, insert_test_file):
+        insert_test_file(path="/media/a.mkv")
+        assert get_compliance_memo(db_conn, "/media/a.mkv", "p1", "*") is None
+
+    def test_record_and_lookup(self, db_conn, insert_test_file):
+        file_id = insert_test_file(
+            path="/media/a.mkv",
+            content_hash="xxh64:abc",
+            plugin_metadata='{"radarr": {}}',
+        )
+        _record(db_conn, file_id, plugin_metadata_hash="h1")
+
+        entry = get_compliance_memo(db_conn, "/media/a.mkv", "p1", ALL_PHASES_KEY)
+        assert entry is not None
+        assert entry.file_id == file_id
+        assert entry.content_hash == "xxh64:abc"
+        assert entry.size_bytes == 1000
+        assert entry.mtime_ns == 123
+        assert entry.plugin_metadata_hash == "h1"
+        assert entry.current_content_hash == "xxh64:abc"
+        assert entry.current_plugin_metadata == '{"radarr": {}}'
+
+    def test_keyed_by_policy_and_phases(self, db_conn, insert_test_file):
+        file_id = insert_test_file(path="/media/a.mkv")
+        _record(db_conn, file_id)
+
+        assert get_compliance_memo(db_conn, "/media/a.mkv", "p2", "*") is None
+        assert get_compliance_memo(db_conn, "/media/a.mkv", "p1", "apply") is None
+
+    def test_record_replaces_existing(self, db_conn, insert_test_file):
+        file_id = insert_test_file(path="/media/a.mkv")
+        _record(db_conn, file_id, mtime_ns=1)
+        _record(db_conn, file_id, mtime_ns=2)
+
+        entry = get_compliance_memo(db_conn, "/media/a.mkv", "p1", "*")
+        assert entry.mtime_ns == 2
+        count = db_conn.execute("SELECT COUNT(*) FROM compliance_memo").fetchone()[0]
+        assert count == 1
+
+    def test_reflects_current_file_hash(self, db_conn, insert_test_file):
+        file_id = insert_test_file(path="/media/a.mkv", content_hash="xxh64:abc")
+        _record(db_conn, file_id)
+        db_conn.execute(
+            "UPDATE files SET content_hash = 'xxh64:new' WHERE id = ?", (file_id,)
+        )
+
+        entry = get_compliance_memo(db_conn, "/media/a.mkv", "p1", "*")
+        assert entry.content_hash == "xxh64:abc"
+        assert entry.current_content_hash == "xxh64:new"
+
+    def test_delete_for_file(self, db_conn, insert_test_file):
+        a = insert_test_file(path="/media/a.mkv")
+        b = insert_test_file(path="/media/b.mkv")
+        _record(db_conn, a)
+        _record(db_conn, a, policy_hash="p2")
+        _record(db_conn, b)
+
+        assert delete_compliance_memo_for_file(db_conn, a) == 2
+        assert get_compliance_memo(db_conn, "/media/b.mkv", "p1", "*") is not None
+
+    def test_delete_all(self, db_conn, insert_test_file):
+        _record(db_conn, insert_test_file(path="/media/a.mkv"))
+        _record(db_conn, insert_test_file(path="/media/b.mkv"))
+
+        assert delete_all_compliance_memo(db_conn) == 2
+
+    def test_cascade_on_file_delete(self, db_conn, insert_test_file):
+        file_id = insert_test_file(path="/media/a.mkv")
+        _record(db_conn, file_id)
+        db_conn.execute("DELETE FROM files WHERE id = ?", (file_id,))
+
+        count = db_conn.execute("SELECT COUNT(*) FROM compliance_memo").fetchone()[0]
+        assert count == 0
+
+
+class TestMigrateV27ToV28:
+    """Tests for the v27→v28 migration."""
+
+    def _v27_conn(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(":memory:")
+        conn.executescript("""
+            CREATE TABLE _meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+            INSERT INTO _meta (key, value) VALUES ('schema_version', '27');
+            CREATE TABLE files (id INTEGER PRIMARY KEY, path TEXT UNIQUE NOT NULL);
+        """)
+        return conn
+
+    def test_creates_table_and_updates_version(self):
+        conn = self._v27_conn()
+        migrate_v27_to_v28(conn)
+
+        tables = {
+            row[0]
+            for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
+        }
+        assert "compliance_memo" in tables
+        version = conn.execute(
+            "SELECT value FROM _meta WHERE key = 'schema_version'"
+        ).fetchone()[0]
+        assert version == "28"
+
+    def test_idempotent(self):
+        conn = self._v27_conn()
+        migrate_v27_to_v28(conn)
+        migrate_v27_to_v28(conn)
+
+        version = conn.execute(
+            "SELECT value FROM _meta WHERE key = 'schema_version'"
+        ).fetchone()[0]
+        assert version == "28"
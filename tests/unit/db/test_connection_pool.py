@@ -369,6 +369,146 @@ class TestDaemonConnectionPool:
         assert len(errors) == 0, f"Errors: {errors}"
 
 
+class TestReadPool:
+    """Tests for the pooled read-only connections behind read()."""
+
+    @pytest.fixture
+    def db_path(self, tmp_path: Path) -> Path:
+        db_path = tmp_path / "test.db"
+        conn = sqlite3.connect(str(db_path))
+        conn.execute("PRAGMA journal_mode = WAL")
+        conn.execute("CREATE TABLE test (id INTEGER)")
+        conn.execute("INSERT INTO test VALUES (1)")
+        conn.commit()
+        conn.close()
+        return db_path
+
+    def test_reuses_connections(self, db_path: Path) -> None:
+        pool = DaemonConnectionPool(db_path)
+
+        with pool.read() as first:
+            pass
+        with pool.read() as second:
+            pass
+
+        assert first is second
+        assert pool.stats().read_connections == 1
+        assert pool.stats().read_checkouts == 2
+        pool.close()
+
+    def test_rejects_writes(self, db_path: Path) -> None:
+        pool = DaemonConnectionPool(db_path)
+
+        with pool.read() as conn, pytest.raises(sqlite3.OperationalError):
+            conn.execute("INSERT INTO test VALUES (2)")
+
+        pool.close()
+
+    def test_does_not_wait_for_write_transaction(self, db_path: Path) -> None:
+        pool = DaemonConnectionPool(db_path)
+
+        with pool.transaction() as conn:
+            conn.execute("INSERT INTO test VALUES (2)")
+            with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
+                future = executor.submit(
+                    pool.execute_read, "SELECT COUNT(*) AS cnt FROM test"
+                )
+                rows = future.result(timeout=5)
+
+        assert rows[0]["cnt"] == 1
+        assert pool.execute_read("SELECT COUNT(*) AS cnt FROM test")[0]["cnt"] == 2
+        pool.close()
+
+    def test_waits_for_free_connection(self, db_path: Path) -> None:
+        pool = DaemonConnectionPool(db_path, timeout=5.0, read_pool_size=1)
+        held = threading.Event()
+        release = threading.Event()
+
+        def hold() -> None:
+            with pool.read():
+                held.set()
+                release.wait(5)
+
+        holder = threading.Thread(target=hold)
+        holder.start()
+        held.wait(5)
+        threading.Timer(0.1, release.set).start()
+
+        assert pool.execute_read("SELECT id FROM test")[0]["id"] == 1
+        holder.join()
+        stats = pool.stats()
+        assert stats.read_connections == 1
+        assert stats.read_waits == 1
+        assert stats.read_wait_seconds > 0
+        pool.close()
+
+    def test_times_out_when_exhausted(self, db_path: Path) -> None:
+        pool = DaemonConnectionPool(db_path, timeout=0.1, read_pool_size=1)
+
+        with pool.read():
+            with pytest.raises(sqlite3.OperationalError, match="read connection"):
+                with pool.read():
+                    pass
+
+        assert pool.stats().read_in_use == 0
+        pool.close()
+
+    def test_close_closes_idle_connections(self, db_path: Path) -> None:
+        pool = DaemonConnectionPool(db_path)
+        with pool.read() as conn:
+            pass
+
+        pool.close()
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+        with pytest.raises(RuntimeError, match="closed"):
+            with pool.read():
+                pass
+
+    def test_data_version_changes_on_commit(self, db_path: Path) -> None:
+        pool = DaemonConnectionPool(db_path)
+        before = pool.data_version()
+
+        assert pool.data_version() == before
+        with pool.transaction() as conn:
+            conn.execute("INSERT INTO test VALUES (2)")
+        after_pool_write = pool.data_version()
+        other = sqlite3.connect(str(db_path))
+        other.execute("INSERT INTO test VALUES (3)")
+        other.commit()
+        other.close()
+
+        assert after_pool_write != before
+        assert pool.data_version() != after_pool_write
+        pool.close()
+
+    def test_stats_count_write_transactions(self, db_path: Path) -> None:
+        pool = DaemonConnectionPool(db_path)
+
+        with pool.transaction() as conn:
+            conn.execute("INSERT INTO test VALUES (2)")
+
+        assert pool.stats().write_transactions == 1
+        pool.close()
+
+    def test_write_lets_caller_manage_transaction(self, db_path: Path) -> None:
+        pool = DaemonConnectionPool(db_path)
+
+        with pool.write() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            conn.execute("INSERT INTO test VALUES (2)")
+            conn.execute("COMMIT")
+        with pool.write() as conn:
+            conn.execute("INSERT INTO test VALUES (3)")  # left uncommitted
+
+        with pool.read() as conn:
+            values = [row[0] for row in conn.execute("SELECT id FROM test")]
+        assert values == [1, 2]
+        assert pool.stats().write_transactions == 2
+        pool.close()
+
+
 class TestExecuteWithRetry:
     """Tests for execute_with_retry function."""
 
@@ -0,0 +1,215 @@
+"""Tests for incremental page-level database backups."""
+
+import io
+import os
+import sqlite3
+import sys
+import tarfile
+import threading
+import types
+from pathlib import Path
+
+import pytest
+
+from vpo.db.backup import (
+    BackupValidationError,
+    create_backup,
+    list_backups,
+    restore_backup,
+    validate_backup,
+)
+from vpo.db.incremental_backup import (
+    PAGE_BACKUP_EXTENSION,
+    find_parent,
+    materialize_page_backup,
+    resolve_chain,
+)
+
+
+@pytest.fixture
+def library(tmp_path: Path):
+    """A WAL-mode database with a few hundred pages of data."""
+    db_path = tmp_path / "library.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(
+        """
+        CREATE TABLE files (id INTEGER PRIMARY KEY, size_bytes INTEGER);
+        CREATE TABLE blobs (id INTEGER PRIMARY KEY, data BLOB);
+        """
+    )
+    conn.executemany(
+        "INSERT INTO blobs (data) VALUES (?)",
+        [(os.urandom(2000),) for _ in range(400)],
+    )
+    conn.commit()
+    yield db_path, conn
+    conn.close()
+
+
+def _backup(library, backup_dir: Path, day: int):
+    db_path, conn = library
+    name = f"vpo-library-2026-01-{day:02d}T00-00-00Z{PAGE_BACKUP_EXTENSION}"
+    return create_backup(db_path, backup_dir / name, conn, incremental=True)
+
+
+def _blobs(db_path: Path) -> list[tuple[int, bytes]]:
+    conn = sqlite3.connect(db_path)
+    try:
+        return conn.execute("SELECT id, data FROM blobs ORDER BY id").fetchall()
+    finally:
+        conn.close()
+
+
+class TestCreateIncrementalBackup:
+    """Tests for create_backup(incremental=True)."""
+
+    def test_first_backup_is_base(self, library, tmp_path):
+        result = _backup(library, tmp_path / "backups", 1)
+
+        metadata = result.metadata
+        assert metadata.kind == "base"
+        assert metadata.parent is None
+        assert metadata.compression in ("zlib", "zstd")
+        assert 0 < metadata.pages_stored <= metadata.page_count
+        assert metadata.database_size_bytes == (
+            metadata.page_count * metadata.page_size
+        )
+
+    def test_delta_stores_only_changed_pages(self, library, tmp_path):
+        db_path, conn = library
+        base = _backup(library, tmp_path / "backups", 1)
+
+        conn.execute("UPDATE blobs SET data = ? WHERE id = 7", (os.urandom(2000),))
+        conn.commit()
+        delta = _backup(library, tmp_path / "backups", 2)
+
+        assert delta.metadata.kind == "delta"
+        assert delta.metadata.parent == base.path.name
+        assert delta.metadata.chain_length == 1
+        assert delta.metadata.pages_stored <= 3
+        assert delta.archive_size_bytes < base.archive_size_bytes / 10
+
+    def test_chain_length_limit_starts_new_base(self, library, tmp_path):
+        backup_dir = tmp_path / "backups"
+        base = _backup(library, backup_dir, 1)
+
+        assert find_parent(backup_dir, base.metadata.page_size, 0) is None
+        assert find_parent(backup_dir, base.metadata.page_size * 2) is None
+        assert find_parent(backup_dir, base.metadata.page_size)[0] == base.path
+
+    def test_concurrent_writes_do_not_restart_snapshot(self, library, tmp_path):
+        db_path, _ = library
+        stop = threading.Event()
+
+        def write() -> None:
+            writer = sqlite3.connect(db_path)
+            try:
+                while not stop.is_set():
+                    writer.execute("INSERT INTO files (size_bytes) VALUES (1)")
+                    writer.commit()
+            finally:
+                writer.close()
+
+        thread = threading.Thread(target=write)
+        thread.start()
+        try:
+            result = _backup(library, tmp_path / "backups", 1)
+        finally:
+            stop.set()
+            thread.join()
+
+        target = tmp_path / "restored.db"
+        restore_backup(result.path, target)
+        check = sqlite3.connect(target)
+        try:
+            assert check.execute("PRAGMA integrity_check").fetchone() == ("ok",)
+        finally:
+            check.close()
+
+    def test_listed_with_full_backups(self, library, tmp_path):
+        backup_dir = tmp_path / "backups"
+        _backup(library, backup_dir, 1)
+        _backup(library, backup_dir, 2)
+
+        kinds = [b.metadata.kind for b in list_backups(backup_dir)]
+
+        assert kinds == ["delta", "base"]
+
+
+class TestRestoreIncrementalBackup:
+    """Tests for restoring page backups."""
+
+    def test_restores_each_point_in_time(self, library, tmp_path):
+        db_path, conn = library
+        backup_dir = tmp_path / "backups"
+        base = _backup(library, backup_dir, 1)
+        before = _blobs(db_path)
+        conn.execute("DELETE FROM blobs WHERE id > 300")
+        conn.execute("UPDATE blobs SET data = ? WHERE id = 1", (b"changed",))
+        conn.commit()
+        delta = _backup(library, backup_dir, 2)
+        after = _blobs(db_path)
+
+        target = tmp_path / "restored.db"
+        restore_backup(delta.path, target)
+        assert _blobs(target) == after
+
+        restore_backup(base.path, target)
+        assert _blobs(target) == before
+
+    def test_validate_rebuilds_chain(self, library, tmp_path):
+        backup_dir = tmp_path / "backups"
+        _backup(library, backup_dir, 1)
+        delta = _backup(library, backup_dir, 2)
+
+        assert validate_backup(delta.path).kind == "delta"
+        assert len(resolve_chain(delta.path)) == 2
+
+    def test_missing_parent_is_reported(self, library, tmp_path):
+        backup_dir = tmp_path / "backups"
+        base = _backup(library, backup_dir, 1)
+        delta = _backup(library, backup_dir, 2)
+        base.path.unlink()
+
+        with pytest.raises(BackupValidationError, match="chain is broken"):
+            materialize_page_backup(delta.path, tmp_path / "out.db")
+
+    def test_corrupt_page_is_detected(self, library, tmp_path):
+        base = _backup(library, tmp_path / "backups", 1)
+        tampered = tmp_path / "tampered" / base.path.name
+        tampered.parent.mkdir()
+        with (
+            tarfile.open(base.path) as src,
+            tarfile.open(tampered, "w") as dst,
+        ):
+            for member in src.getmembers():
+                data = src.extractfile(member).read()
+                if member.name == "stored.idx":
+                    data = bytes(16) + data[16:]
+                member.size = len(data)
+                dst.addfile(member, io.BytesIO(data))
+
+        with pytest.raises(BackupValidationError):
+            materialize_page_backup(tampered, tmp_path / "out.db")
+
+    def test_corrupt_zstd_segment_is_reported(self, library, tmp_path, monkeypatch):
+        class ZstdError(Exception):
+            pass
+
+        class ZstdDecompressor:
+            def decompress(self, data):
+                raise ZstdError("Unknown frame descriptor")
+
+        zstandard = types.ModuleType("zstandard")
+        zstandard.ZstdError = ZstdError
+        zstandard.ZstdCompressor = lambda level: types.SimpleNamespace(
+            compress=lambda data: data
+        )
+        zstandard.ZstdDecompressor = ZstdDecompressor
+        monkeypatch.setitem(sys.modules, "zstandard", zstandard)
+        base = _backup(library, tmp_path / "backups", 1)
+        assert base.metadata.compression == "zstd"
+
+        with pytest.raises(BackupValidationError, match="Corrupt segment"):
+            materialize_page_backup(base.path, tmp_path / "out.db")
@@ -100,13 +100,6 @@ def v25_conn():
     return conn
 
 
-class TestSchemaVersion:
-    """Tests for schema version constants."""
-
-    def test_schema_version_is_27(self):
-        assert SCHEMA_VERSION == 27
-
-
 class TestMigrateV25ToV26:
     """Tests for the v25→v26 migration."""
 
@@ -419,7 +412,7 @@ class TestMigrateV26ToV27:
         # Verify final schema version is current
         cursor = conn.execute("SELECT value FROM _meta WHERE key = 'schema_version'")
         version = int(cursor.fetchone()[0])
-        assert version >= 27
+        assert version == SCHEMA_VERSION
 
         # Verify container_tags column exists
         cursor = conn.execute("PRAGMA table_info(files)")
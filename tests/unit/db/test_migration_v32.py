@@ -0,0 +1,34 @@
+"""Tests for schema migration v31 to v32 (job leases)."""
+
+import sqlite3
+
+from vpo.db.schema.definition import create_schema
+from vpo.db.schema.migrations import migrate_v31_to_v32
+
+
+def test_adds_lease_columns_and_queue_index() -> None:
+    """Migration adds lease columns to a v31 jobs table and is idempotent."""
+    conn = sqlite3.connect(":memory:")
+    create_schema(conn)
+    # Reduce the jobs table to its v31 shape
+    conn.executescript("""
+        DROP INDEX idx_jobs_queue;
+        ALTER TABLE jobs DROP COLUMN lease_owner;
+        ALTER TABLE jobs DROP COLUMN lease_expires_at;
+        UPDATE _meta SET value = '31' WHERE key = 'schema_version';
+    """)
+
+    migrate_v31_to_v32(conn)
+    migrate_v31_to_v32(conn)
+
+    columns = {row[1] for row in conn.execute("PRAGMA table_info(jobs)")}
+    assert {"lease_owner", "lease_expires_at"} <= columns
+    index_sql = conn.execute(
+        "SELECT sql FROM sqlite_master WHERE name = 'idx_jobs_queue'"
+    ).fetchone()[0]
+    assert "WHERE status = 'queued'" in index_sql
+    version = conn.execute(
+        "SELECT value FROM _meta WHERE key = 'schema_version'"
+    ).fetchone()[0]
+    assert version == "32"
+    conn.close()
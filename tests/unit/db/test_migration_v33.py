@@ -0,0 +1,51 @@
+"""Tests for schema migration v32 to v33 (job coalescing)."""
+
+import sqlite3
+
+from vpo.db.schema.definition import create_schema
+from vpo.db.schema.migrations import migrate_v32_to_v33
+
+
+def test_merges_duplicate_queued_jobs_and_adds_index() -> None:
+    """Migration merges duplicate queued jobs and is idempotent."""
+    conn = sqlite3.connect(":memory:")
+    create_schema(conn)
+    # Reduce the jobs table to its v32 shape
+    conn.executescript("""
+        DROP INDEX idx_jobs_queued_unique;
+        ALTER TABLE jobs DROP COLUMN coalesced_count;
+        UPDATE _meta SET value = '32' WHERE key = 'schema_version';
+        INSERT INTO files (id, path, filename, directory, extension, size_bytes,
+                           modified_at, scanned_at, scan_status)
+        VALUES (1, '/m/a.mkv', 'a.mkv', '/m', '.mkv', 1, 'x', 'x', 'ok');
+        INSERT INTO jobs (id, file_id, file_path, job_type, status, priority,
+                          policy_name, policy_json, created_at)
+        VALUES ('a', 1, '/m/a.mkv', 'apply', 'queued', 100, 'p', '{}', '1'),
+               ('b', 1, '/m/a.mkv', 'apply', 'queued', 10, 'p', '{}', '2'),
+               ('c', 1, '/m/a.mkv', 'apply', 'queued', 100, 'p', '{}', '3'),
+               ('d', 1, '/m/a.mkv', 'apply', 'queued', 100, 'q', '{}', '4');
+    """)
+
+    migrate_v32_to_v33(conn)
+    migrate_v32_to_v33(conn)
+
+    rows = dict(
+        conn.execute(
+            "SELECT id, status || ':' || coalesced_count FROM jobs ORDER BY id"
+        ).fetchall()
+    )
+    assert rows == {
+        "a": "cancelled:0",
+        "b": "queued:2",
+        "c": "cancelled:0",
+        "d": "queued:0",
+    }
+    index_sql = conn.execute(
+        "SELECT sql FROM sqlite_master WHERE name = 'idx_jobs_queued_unique'"
+    ).fetchone()[0]
+    assert "WHERE status = 'queued'" in index_sql
+    version = conn.execute(
+        "SELECT value FROM _meta WHERE key = 'schema_version'"
+    ).fetchone()[0]
+    assert version == "33"
+    conn.close()
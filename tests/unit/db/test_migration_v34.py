@@ -0,0 +1,38 @@
+"""Tests for schema migration v33 to v34 (job resource classes)."""
+
+import sqlite3
+
+from vpo.db.schema.definition import create_schema
+from vpo.db.schema.migrations import migrate_v33_to_v34
+
+
+def test_adds_resource_class_and_classifies_pending_jobs() -> None:
+    """Migration classifies queued and running jobs and is idempotent."""
+    conn = sqlite3.connect(":memory:")
+    create_schema(conn)
+    # Reduce the jobs table to its v33 shape
+    conn.executescript("""
+        DROP INDEX idx_jobs_running_class;
+        ALTER TABLE jobs DROP COLUMN resource_class;
+        UPDATE _meta SET value = '33' WHERE key = 'schema_version';
+        INSERT INTO jobs (id, file_path, job_type, status, created_at)
+        VALUES ('t', '/m/a.mkv', 'transcode', 'queued', '1'),
+               ('m', '/m/a.mkv', 'move', 'running', '2'),
+               ('p', '/m', 'prune', 'queued', '3'),
+               ('done', '/m/a.mkv', 'transcode', 'completed', '4');
+    """)
+
+    migrate_v33_to_v34(conn)
+    migrate_v33_to_v34(conn)
+
+    classes = dict(conn.execute("SELECT id, resource_class FROM jobs").fetchall())
+    assert classes == {"t": "cpu", "m": "io", "p": "metadata", "done": None}
+    index_sql = conn.execute(
+        "SELECT sql FROM sqlite_master WHERE name = 'idx_jobs_running_class'"
+    ).fetchone()[0]
+    assert "WHERE status = 'running'" in index_sql
+    version = conn.execute(
+        "SELECT value FROM _meta WHERE key = 'schema_version'"
+    ).fetchone()[0]
+    assert version == "34"
+    conn.close()
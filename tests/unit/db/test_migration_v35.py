@@ -0,0 +1,30 @@
+"""Tests for schema migration v34 to v35 (job workflow checkpoints)."""
+
+import sqlite3
+
+from vpo.db.schema.definition import create_schema
+from vpo.db.schema.migrations import migrate_v34_to_v35
+
+
+def test_adds_checkpoint_column() -> None:
+    """Migration adds checkpoint_json and is idempotent."""
+    conn = sqlite3.connect(":memory:")
+    create_schema(conn)
+    # Reduce the jobs table to its v34 shape
+    conn.executescript("""
+        ALTER TABLE jobs DROP COLUMN checkpoint_json;
+        UPDATE _meta SET value = '34' WHERE key = 'schema_version';
+        INSERT INTO jobs (id, file_path, job_type, status, created_at)
+        VALUES ('p', '/m/a.mkv', 'process', 'queued', '1');
+    """)
+
+    migrate_v34_to_v35(conn)
+    migrate_v34_to_v35(conn)
+
+    row = conn.execute("SELECT checkpoint_json FROM jobs WHERE id = 'p'").fetchone()
+    assert row == (None,)
+    version = conn.execute(
+        "SELECT value FROM _meta WHERE key = 'schema_version'"
+    ).fetchone()[0]
+    assert version == "35"
+    conn.close()
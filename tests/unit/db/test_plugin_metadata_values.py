@@ -0,0 +1,204 @@
+"""Tests for plugin metadata value queries and the v29 to v30 migration."""
+
+import json
+import sqlite3
+
+import pytest
+
+from vpo.db.queries import (
+    get_file_by_id,
+    get_plugin_metadata_values,
+    merge_plugin_metadata,
+    plugin_value_filter,
+    upsert_file,
+)
+from vpo.db.schema.migrations.v26_to_v30 import migrate_v29_to_v30
+from vpo.db.views import get_files_with_plugin_data
+
+RADARR = {
+    "radarr": {
+        "original_language": "jpn",
+        "tmdb_id": 129,
+        "rating": 8.6,
+        "monitored": True,
+        "collection": None,
+        "genres": ["Animation", "Fantasy"],
+    }
+}
+
+
+def _row_count(conn, file_id: int) -> int:
+    return conn.execute(
+        "SELECT COUNT(*) FROM plugin_metadata_values WHERE file_id = ?", (file_id,)
+    ).fetchone()[0]
+
+
+class TestPluginMetadataValuesSync:
+    """Values are written whenever a file record is written."""
+
+    def test_insert_round_trips_typed_values(self, db_conn, insert_test_file):
+        file_id = insert_test_file(plugin_metadata=json.dumps(RADARR))
+
+        assert get_plugin_metadata_values(db_conn, file_id) == RADARR
+
+    def test_no_metadata_writes_no_rows(self, db_conn, insert_test_file):
+        file_id = insert_test_file()
+
+        assert _row_count(db_conn, file_id) == 0
+        assert get_plugin_metadata_values(db_conn, file_id) == {}
+
+    def test_upsert_replaces_and_clears_values(self, db_conn, insert_test_file):
+        file_id = insert_test_file(plugin_metadata=json.dumps(RADARR))
+        record = get_file_by_id(db_conn, file_id)
+
+        record.plugin_metadata = json.dumps({"sonarr": {"series_title": "X"}})
+        upsert_file(db_conn, record)
+        assert get_plugin_metadata_values(db_conn, file_id) == {
+            "sonarr": {"series_title": "X"}
+        }
+
+        record.plugin_metadata = None
+        upsert_file(db_conn, record)
+        assert _row_count(db_conn, file_id) == 0
+
+    @pytest.mark.parametrize("metadata", ["{not json", "[1, 2]", '{"radarr": 5}'])
+    def test_malformed_metadata_writes_no_rows(
+        self, db_conn, insert_test_file, metadata
+    ):
+        file_id = insert_test_file(plugin_metadata=metadata)
+
+        assert _row_count(db_conn, file_id) == 0
+
+    def test_rows_deleted_with_file(self, db_conn, insert_test_file):
+        file_id = insert_test_file(plugin_metadata=json.dumps(RADARR))
+
+        db_conn.execute("DELETE FROM files WHERE id = ?", (file_id,))
+
+        assert _row_count(db_conn, file_id) == 0
+
+
+class TestMergePluginMetadata:
+    """Tests for bulk merging of plugin enrichments."""
+
+    def test_merges_per_plugin_and_syncs_values(self, db_conn, insert_test_file):
+        first = insert_test_file(path="/m/a.mkv", plugin_metadata=json.dumps(RADARR))
+        second = insert_test_file(path="/m/b.mkv")
+
+        updated = merge_plugin_metadata(
+            db_conn,
+            {
+                first: {"sonarr": {"series_title": "X"}},
+                second: {"radarr": {"tmdb_id": 7}},
+            },
+        )
+
+        assert updated == 2
+        assert get_plugin_metadata_values(db_conn, first) == {
+            **RADARR,
+            "sonarr": {"series_title": "X"},
+        }
+        assert json.loads(get_file_by_id(db_conn, second).plugin_metadata) == {
+            "radarr": {"tmdb_id": 7}
+        }
+        assert get_plugin_metadata_values(db_conn, second) == {"radarr": {"tmdb_id": 7}}
+
+    def test_replaces_existing_plugin_entry(self, db_conn, insert_test_file):
+        file_id = insert_test_file(plugin_metadata=json.dumps(RADARR))
+
+        merge_plugin_metadata(db_conn, {file_id: {"radarr": {"tmdb_id": 1}}})
+
+        assert get_plugin_metadata_values(db_conn, file_id) == {
+            "radarr": {"tmdb_id": 1}
+        }
+
+    def test_skips_missing_files(self, db_conn):
+        assert merge_plugin_metadata(db_conn, {999: {"radarr": {"a": 1}}}) == 0
+
+
+class TestPluginValueFilter:
+    """Tests for plugin_value_filter and field-filtered file lookups."""
+
+    @pytest.fixture
+    def files(self, insert_test_file) -> dict[str, int]:
+        return {
+            "jpn": insert_test_file(
+                path="/m/a.mkv",
+                plugin_metadata=json.dumps(
+                    {"radarr": {"original_language": "jpn", "year": 2001}}
+                ),
+            ),
+            "eng": insert_test_file(
+                path="/m/b.mkv",
+                plugin_metadata=json.dumps(
+                    {"Radarr": {"Original_Language": "eng", "year": 1999}}
+                ),
+            ),
+            "null": insert_test_file(
+                path="/m/c.mkv",
+                plugin_metadata=json.dumps({"radarr": {"original_language": None}}),
+            ),
+        }
+
+    def _ids(self, conn, **kwargs) -> set[int]:
+        return {f["id"] for f in get_files_with_plugin_data(conn, "radarr", **kwargs)}
+
+    def test_plugin_only_matches_case_insensitively(self, db_conn, files):
+        assert self._ids(db_conn) == set(files.values())
+
+    def test_eq_is_case_insensitive(self, db_conn, files):
+        ids = self._ids(db_conn, field="original_language", operator="eq", value="JPN")
+
+        assert ids == {files["jpn"]}
+
+    def test_neq_excludes_null_values(self, db_conn, files):
+        ids = self._ids(db_conn, field="original_language", operator="neq", value="jpn")
+
+        assert ids == {files["eng"]}
+
+    def test_numeric_comparison(self, db_conn, files):
+        ids = self._ids(db_conn, field="year", operator="gte", value=2000)
+
+        assert ids == {files["jpn"]}
+
+    def test_plugin_data_uses_stored_plugin_name(self, db_conn, files):
+        result = get_files_with_plugin_data(
+            db_conn, "radarr", field="year", operator="lt", value=2000
+        )
+
+        assert result[0]["plugin_data"] == {"Original_Language": "eng", "year": 1999}
+
+    def test_rejects_unknown_operator(self):
+        with pytest.raises(ValueError, match="Unknown"):
+            plugin_value_filter("like", "x")
+
+    def test_rejects_non_numeric_ordering_value(self):
+        with pytest.raises(ValueError, match="numeric"):
+            plugin_value_filter("lt", "2000")
+
+
+class TestMigrateV29ToV30:
+    """Tests for the plugin_metadata_values migration."""
+
+    def test_creates_and_backfills_table(self):
+        conn = sqlite3.connect(":memory:")
+        conn.executescript("""
+            CREATE TABLE _meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+            INSERT INTO _meta (key, value) VALUES ('schema_version', '29');
+            CREATE TABLE files (id INTEGER PRIMARY KEY, plugin_metadata TEXT);
+        """)
+        conn.execute(
+            "INSERT INTO files (id, plugin_metadata) VALUES (1, ?), (2, ?), (3, NULL)",
+            (json.dumps(RADARR), "{broken"),
+        )
+        conn.commit()
+
+        migrate_v29_to_v30(conn)
+        migrate_v29_to_v30(conn)
+
+        assert get_plugin_metadata_values(conn, 1) == RADARR
+        assert get_plugin_metadata_values(conn, 2) == {}
+        version = conn.execute(
+            "SELECT value FROM _meta WHERE key = 'schema_version'"
+        ).fetchone()[0]
+        assert version == "30"
+        conn.close()
@@ -19,6 +19,7 @@ from vpo.db.queries import (
     insert_processing_stats,
 )
 from vpo.db.schema import create_schema
+from vpo.db.schema.migrations import migrate_v28_to_v29
 from vpo.db.types import (
     ActionResultRecord,
     PerformanceMetricsRecord,
@@ -585,6 +586,63 @@ class TestGetPerformanceMetricsForStats:
         assert len(results) == 3
 
 
+class TestPerformanceMetricIOWait:
+    """Tests for the I/O admission wait columns (schema v29)."""
+
+    def test_io_wait_round_trip(self, conn: sqlite3.Connection, file_id: int) -> None:
+        """Should persist and return per-device admission wait."""
+        stats_record = _create_stats_record(file_id)
+        insert_processing_stats(conn, stats_record)
+        insert_performance_metric(
+            conn,
+            PerformanceMetricsRecord(
+                id=None,
+                stats_id=stats_record.id,
+                phase_name="remux",
+                wall_time_seconds=10.0,
+                bytes_read=None,
+                bytes_written=None,
+                encoding_fps=None,
+                encoding_bitrate=None,
+                io_wait_seconds=2.5,
+                io_wait_devices='{"8:16": 2.5}',
+            ),
+        )
+        conn.commit()
+
+        (metric,) = get_performance_metrics_for_stats(conn, stats_record.id)
+
+        assert metric.io_wait_seconds == 2.5
+        assert metric.io_wait_devices == '{"8:16": 2.5}'
+
+    def test_migration_adds_columns(self) -> None:
+        """migrate_v28_to_v29 adds the columns and is idempotent."""
+        conn = sqlite3.connect(":memory:")
+        conn.executescript("""
+            CREATE TABLE _meta (key TEXT PRIMARY KEY, value TEXT NOT NULL);
+            INSERT INTO _meta (key, value) VALUES ('schema_version', '28');
+            CREATE TABLE performance_metrics (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                stats_id TEXT NOT NULL,
+                phase_name TEXT NOT NULL,
+                wall_time_seconds REAL NOT NULL
+            );
+        """)
+
+        migrate_v28_to_v29(conn)
+        migrate_v28_to_v29(conn)
+
+        columns = {
+            row[1] for row in conn.execute("PRAGMA table_info(performance_metrics)")
+        }
+        assert {"io_wait_seconds", "io_wait_devices"} <= columns
+        version = conn.execute(
+            "SELECT value FROM _meta WHERE key = 'schema_version'"
+        ).fetchone()[0]
+        assert version == "29"
+        conn.close()
+
+
 class TestCascadeDelete:
     """Tests for CASCADE delete behavior."""
 
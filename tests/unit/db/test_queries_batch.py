@@ -1,6 +1,10 @@
-"""Tests for batch file lookup function get_files_by_paths()."""
+"""Tests for batch file and track lookup functions."""
 
-from vpo.db.queries import get_files_by_paths
+from vpo.db.queries import (
+    get_file_batch,
+    get_files_by_paths,
+    get_tracks_for_file_range,
+)
 
 
 class TestGetFilesByPaths:
@@ -125,3 +129,67 @@ class TestGetFilesByPaths:
 
         assert len(result) == 1
         assert path in result
+
+
+class TestGetFileBatch:
+    """Tests for get_file_batch keyset pagination."""
+
+    def test_pages_through_files_in_id_order(self, db_conn, insert_test_file):
+        ids = [insert_test_file(path=f"/media/{i}.mkv") for i in range(5)]
+
+        first = get_file_batch(db_conn, after_id=0, limit=2)
+        second = get_file_batch(db_conn, after_id=first[-1].id, limit=2)
+        third = get_file_batch(db_conn, after_id=second[-1].id, limit=2)
+
+        assert [r.id for r in first + second + third] == ids
+        assert get_file_batch(db_conn, after_id=third[-1].id, limit=2) == []
+
+    def test_excludes_unscanned_files(self, db_conn, insert_test_file):
+        insert_test_file(path="/media/ok.mkv")
+        insert_test_file(path="/media/bad.mkv", scan_status="error")
+
+        result = get_file_batch(db_conn)
+
+        assert [r.path for r in result] == ["/media/ok.mkv"]
+
+    def test_path_prefix_matches_directory_only(self, db_conn, insert_test_file):
+        insert_test_file(path="/media/movies/a.mkv")
+        insert_test_file(path="/media/movies_old/b.mkv")
+        insert_test_file(path="/media/tv/c.mkv")
+
+        result = get_file_batch(db_conn, path_prefix="/media/movies")
+
+        assert [r.path for r in result] == ["/media/movies/a.mkv"]
+
+
+class TestGetTracksForFileRange:
+    """Tests for get_tracks_for_file_range."""
+
+    def test_groups_tracks_by_file(self, db_conn, insert_test_file, insert_test_track):
+        a = insert_test_file(path="/media/a.mkv")
+        b = insert_test_file(path="/media/b.mkv")
+        c = insert_test_file(path="/media/c.mkv")
+        insert_test_track(file_id=a, track_index=1, track_type="audio")
+        insert_test_track(file_id=a, track_index=0)
+        insert_test_track(file_id=b, track_index=0)
+        insert_test_track(file_id=c, track_index=0)
+
+        result = get_tracks_for_file_range(db_conn, a, b)
+
+        assert set(result) == {a, b}
+        assert [t.track_index for t in result[a]] == [0, 1]
+        assert len(result[b]) == 1
+
+    def test_path_prefix(self, db_conn, insert_test_file, insert_test_track):
+        a = insert_test_file(path="/media/movies/a.mkv")
+        b = insert_test_file(path="/media/movies-old/b.mkv")
+        c = insert_test_file(path="/media/movies/c.mkv")
+        for file_id in (a, b, c):
+            insert_test_track(file_id=file_id, track_index=0)
+
+        result = get_tracks_for_file_range(db_conn, a, c, "/media/movies")
+
+        assert set(result) == {a, c}
+
+    def test_empty_range(self, db_conn):
+        assert get_tracks_for_file_range(db_conn, 1, 10) == {}
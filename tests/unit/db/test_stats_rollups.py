@@ -0,0 +1,253 @@
+"""Tests for processing_stats rollups and the views that read them."""
+
+import sqlite3
+import uuid
+from dataclasses import replace
+
+import pytest
+
+from vpo.db.queries import (
+    delete_file,
+    delete_processing_stats_before,
+    insert_processing_stats,
+    rebuild_stats_rollups,
+)
+from vpo.db.schema import create_schema
+from vpo.db.schema.migrations import migrate_v30_to_v31
+from vpo.db.types import ProcessingStatsRecord
+from vpo.db.views import get_policy_stats, get_stats_summary, get_stats_trends
+
+# (processed_at, policy, size_change, success)
+HISTORY = [
+    ("2024-01-14T23:10:00+00:00", "a", 10, True),
+    ("2024-01-15T00:00:00+00:00", "a", 20, True),
+    ("2024-01-15T09:59:59.500000+00:00", "b", 40, False),
+    ("2024-01-15T10:00:00+00:00", "a", 80, True),
+    ("2024-01-15T10:30:00+00:00", "b", 160, True),
+    ("2024-01-16T12:45:00+00:00", "a", 320, True),
+    ("2024-01-18T01:00:00+00:00", "b", 640, False),
+]
+
+
+def _record(file_id: int, processed_at: str, policy: str, size_change: int, ok: bool):
+    return ProcessingStatsRecord(
+        id=str(uuid.uuid4()),
+        file_id=file_id,
+        processed_at=processed_at,
+        policy_name=policy,
+        size_before=1000,
+        size_after=1000 - size_change,
+        size_change=size_change,
+        audio_tracks_before=2,
+        subtitle_tracks_before=1,
+        attachments_before=0,
+        audio_tracks_after=1,
+        subtitle_tracks_after=1,
+        attachments_after=0,
+        audio_tracks_removed=1,
+        subtitle_tracks_removed=0,
+        attachments_removed=0,
+        duration_seconds=2.0,
+        phases_completed=1,
+        phases_total=1,
+        total_changes=1,
+        video_source_codec="h264",
+        video_target_codec="hevc",
+        video_transcode_skipped=False,
+        video_skip_reason=None,
+        audio_tracks_transcoded=0,
+        audio_tracks_preserved=0,
+        hash_before=None,
+        hash_after=None,
+        success=ok,
+        error_message=None,
+        encoder_type="hardware",
+    )
+
+
+@pytest.fixture
+def conn() -> sqlite3.Connection:
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    create_schema(conn)
+    conn.execute("PRAGMA foreign_keys = ON")
+    yield conn
+    conn.close()
+
+
+@pytest.fixture
+def file_ids(conn: sqlite3.Connection) -> list[int]:
+    ids = []
+    for i, (processed_at, policy, size_change, ok) in enumerate(HISTORY):
+        cursor = conn.execute(
+            """
+            INSERT INTO files (
+                path, filename, directory, extension, size_bytes,
+                modified_at, scanned_at, scan_status
+            ) VALUES (?, 'v.mkv', '/t', '.mkv', 1, '2024-01-01', '2024-01-01', 'ok')
+            """,
+            (f"/t/{i}.mkv",),
+        )
+        ids.append(cursor.lastrowid)
+        insert_processing_stats(
+            conn, _record(cursor.lastrowid, processed_at, policy, size_change, ok)
+        )
+    conn.commit()
+    return ids
+
+
+def _expected(since: str | None, until: str | None) -> list[tuple]:
+    return [
+        row
+        for row in HISTORY
+        if (since is None or row[0] >= since) and (until is None or row[0] <= until)
+    ]
+
+
+RANGES = [
+    (None, None),
+    ("2024-01-15T00:00:00+00:00", None),
+    ("2024-01-14T23:30:00+00:00", "2024-01-16T13:00:00+00:00"),
+    ("2024-01-15T09:59:59+00:00", "2024-01-15T10:00:00+00:00"),
+    ("2024-01-15T10:00:00+00:00", "2024-01-15T10:30:00+00:00"),
+    (None, "2024-01-15T10:00:00+00:00"),
+    ("2024-01-15T05:00:00+00:00", "2024-01-18T00:59:00+00:00"),
+]
+
+
+class TestRollupViews:
+    """Views must match a straight filter over the raw history."""
+
+    @pytest.mark.parametrize(("since", "until"), RANGES)
+    def test_summary_matches_raw_history(self, conn, file_ids, since, until):
+        expected = _expected(since, until)
+
+        summary = get_stats_summary(conn, since=since, until=until)
+
+        assert summary.total_files_processed == len(expected)
+        assert summary.total_size_saved == sum(row[2] for row in expected)
+        assert summary.total_failed == sum(1 for row in expected if not row[3])
+        assert summary.hardware_encodes == len(expected)
+        assert summary.earliest_processing == min(
+            (row[0] for row in expected), default=None
+        )
+        assert summary.latest_processing == max(
+            (row[0] for row in expected), default=None
+        )
+        if expected:
+            assert summary.avg_processing_time == pytest.approx(2.0)
+
+    @pytest.mark.parametrize(("since", "until"), RANGES)
+    def test_policy_stats_match_raw_history(self, conn, file_ids, since, until):
+        expected = _expected(since, until)
+
+        stats = {
+            p.policy_name: p for p in get_policy_stats(conn, since=since, until=until)
+        }
+
+        for policy in ("a", "b"):
+            rows = [row for row in expected if row[1] == policy]
+            if not rows:
+                assert policy not in stats
+                continue
+            assert stats[policy].files_processed == len(rows)
+            assert stats[policy].total_size_saved == sum(row[2] for row in rows)
+            assert stats[policy].last_used == max(row[0] for row in rows)
+
+    def test_policy_filter(self, conn, file_ids):
+        summary = get_stats_summary(conn, policy_name="b")
+
+        assert summary.total_files_processed == 3
+
+    def test_trends_from_rollups(self, conn, file_ids):
+        trends = get_stats_trends(conn, since="2024-01-14T23:30:00+00:00")
+
+        assert [(t.date, t.files_processed) for t in trends] == [
+            ("2024-01-15", 4),
+            ("2024-01-16", 1),
+            ("2024-01-18", 1),
+        ]
+
+
+class TestRollupMaintenance:
+    """Rollups follow inserts and deletes."""
+
+    def _rollups(self, conn) -> list[tuple]:
+        return [
+            tuple(row)
+            for row in conn.execute(
+                "SELECT * FROM processing_stats_rollups "
+                "ORDER BY granularity, bucket_start, policy_name"
+            )
+        ]
+
+    def test_insert_updates_hour_and_day_buckets(self, conn, file_ids):
+        row = conn.execute(
+            """
+            SELECT files_processed, size_change FROM processing_stats_rollups
+            WHERE granularity = 'hour' AND bucket_start = ? AND policy_name = 'b'
+            """,
+            ("2024-01-15T10:00:00+00:00",),
+        ).fetchone()
+        day = conn.execute(
+            """
+            SELECT SUM(files_processed) FROM processing_stats_rollups
+            WHERE granularity = 'day' AND bucket_start = ?
+            """,
+            ("2024-01-15T00:00:00+00:00",),
+        ).fetchone()
+
+        assert tuple(row) == (1, 160)
+        assert day[0] == 4
+
+    def test_rebuild_matches_incremental(self, conn, file_ids):
+        incremental = self._rollups(conn)
+
+        rebuild_stats_rollups(conn)
+
+        assert self._rollups(conn) == incremental
+
+    def test_delete_before_recomputes_partial_bucket(self, conn, file_ids):
+        delete_processing_stats_before(conn, "2024-01-15T10:15:00+00:00")
+
+        summary = get_stats_summary(conn)
+        incremental = self._rollups(conn)
+        rebuild_stats_rollups(conn)
+
+        assert summary.total_files_processed == 3
+        assert summary.earliest_processing == "2024-01-15T10:30:00+00:00"
+        assert incremental == self._rollups(conn)
+
+    def test_delete_file_removes_its_stats(self, conn, file_ids):
+        delete_file(conn, file_ids[-1])
+
+        assert get_stats_summary(conn).total_files_processed == len(HISTORY) - 1
+        stats = {p.policy_name: p.files_processed for p in get_policy_stats(conn)}
+        assert stats == {"a": 4, "b": 2}
+
+
+class TestMigrateV30ToV31:
+    """Tests for the rollup migration."""
+
+    def test_creates_and_backfills_rollups(self, conn, file_ids):
+        conn.execute("DROP TABLE processing_stats_rollups")
+        conn.execute("UPDATE _meta SET value = '30' WHERE key = 'schema_version'")
+        conn.commit()
+
+        migrate_v30_to_v31(conn)
+        migrate_v30_to_v31(conn)
+
+        assert get_stats_summary(conn).total_files_processed == len(HISTORY)
+        version = conn.execute(
+            "SELECT value FROM _meta WHERE key = 'schema_version'"
+        ).fetchone()[0]
+        assert version == "31"
+
+    def test_unparseable_timestamp_is_counted_from_raw_rows(self, conn, file_ids):
+        insert_processing_stats(
+            conn, replace(_record(file_ids[0], "x", "a", 1, True), processed_at="bad")
+        )
+
+        assert get_stats_summary(conn, until="zzz").total_files_processed == (
+            len(HISTORY) + 1
+        )
@@ -0,0 +1,113 @@
+"""Tests for columnar file and track tables (vpo.db.tables)."""
+
+from vpo.db.queries import (
+    get_file_by_path,
+    get_file_table,
+    get_track_table,
+    get_tracks_for_file,
+    get_tracks_for_file_range,
+)
+
+
+class TestGetTrackTable:
+    """Tests for get_track_table and TrackTable."""
+
+    def test_records_match_row_queries(
+        self, db_conn, insert_test_file, insert_test_track
+    ):
+        file_id = insert_test_file(path="/media/a.mkv")
+        insert_test_track(file_id=file_id, track_index=0, width=1920, height=1080)
+        insert_test_track(
+            file_id=file_id,
+            track_index=1,
+            track_type="audio",
+            codec="aac",
+            channels=6,
+            duration_seconds=None,
+        )
+
+        table = get_track_table(db_conn)
+
+        assert len(table) == 2
+        assert list(table) == get_tracks_for_file(db_conn, file_id)
+        assert [table.track_info(i) for i in range(len(table))] == [
+            t.to_track_info() for t in get_tracks_for_file(db_conn, file_id)
+        ]
+
+    def test_nulls_round_trip(self, db_conn, insert_test_file, insert_test_track):
+        file_id = insert_test_file(path="/media/a.mkv")
+        insert_test_track(
+            file_id=file_id, channels=None, width=None, duration_seconds=None
+        )
+
+        record = get_track_table(db_conn).record(0)
+
+        assert record.channels is None
+        assert record.width is None
+        assert record.duration_seconds is None
+
+    def test_groups_by_file(self, db_conn, insert_test_file, insert_test_track):
+        a = insert_test_file(path="/media/a.mkv")
+        b = insert_test_file(path="/media/b.mkv")
+        c = insert_test_file(path="/media/c.mkv")
+        insert_test_track(file_id=a, track_index=1, track_type="audio")
+        insert_test_track(file_id=a, track_index=0)
+        insert_test_track(file_id=c, track_index=0)
+
+        table = get_track_table(db_conn, a, b)
+
+        assert table.file_rows() == {a: range(0, 2)}
+        assert table.records_for_file(a) == get_tracks_for_file_range(db_conn, a, b)[a]
+        assert table.records_for_file(b) == []
+
+    def test_path_prefix(self, db_conn, insert_test_file, insert_test_track):
+        a = insert_test_file(path="/media/movies/a.mkv")
+        b = insert_test_file(path="/media/tv/b.mkv")
+        c = insert_test_file(path="/media/movies/c.mkv")
+        for file_id in (a, b, c):
+            insert_test_track(file_id=file_id, track_index=0)
+
+        table = get_track_table(db_conn, a, c, "/media/movies/")
+
+        assert list(table.file_rows()) == [a, c]
+        assert list(get_track_table(db_conn, path_prefix="/media/tv").file_ids) == [b]
+
+    def test_interns_repeated_strings(
+        self, db_conn, insert_test_file, insert_test_track
+    ):
+        for i in range(2):
+            file_id = insert_test_file(path=f"/media/{i}.mkv")
+            insert_test_track(file_id=file_id, codec="h" + "evc")
+
+        table = get_track_table(db_conn)
+
+        assert table.codecs[0] is table.codecs[1]
+
+
+class TestGetFileTable:
+    """Tests for get_file_table and FileTable."""
+
+    def test_lookup_by_path(self, db_conn, insert_test_file):
+        paths = [f"/media/{i}.mkv" for i in range(5)]
+        for path in paths:
+            insert_test_file(path=path)
+
+        table = get_file_table(db_conn, paths[:3] + ["/media/missing.mkv"], 2)
+
+        assert len(table) == 3
+        assert table.get(paths[1]) == get_file_by_path(db_conn, paths[1])
+        assert table.get(paths[4]) is None
+        assert table.get("/media/missing.mkv") is None
+
+    def test_all_files(self, db_conn, insert_test_file):
+        insert_test_file(path="/media/a.mkv")
+        insert_test_file(path="/media/b.mkv")
+
+        table = get_file_table(db_conn)
+
+        assert [r.path for r in table] == ["/media/a.mkv", "/media/b.mkv"]
+
+    def test_empty_paths(self, db_conn, insert_test_file):
+        insert_test_file(path="/media/a.mkv")
+
+        assert len(get_file_table(db_conn, [])) == 0
@@ -1,11 +1,13 @@
 """Tests for FFmpegExecutorBase."""
 
+import sys
+import time
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
 
-from vpo.executor.ffmpeg_base import FFmpegExecutorBase
+from vpo.executor.ffmpeg_base import FFmpegExecutorBase, _LineSplitter
 from vpo.tools.ffmpeg_progress import FFmpegProgress
 
 
@@ -265,184 +267,158 @@ class TestFFmpegExecutorBaseInheritance:
 # ============================================================================
 
 
+FAKE_FFMPEG = """#!{python}
+import os, sys, time
+
+args = sys.argv[1:]
+progress = os.fdopen(int(args[args.index("-progress") + 1].split(":")[1]), "w")
+assert "-nostats" in args
+for line in os.environ.get("FAKE_STDERR", "").split("|"):
+    if line:
+        sys.stderr.write(line + "\\n")
+for n in range(1, int(os.environ.get("FAKE_BLOCKS", "0")) + 1):
+    progress.write(
+        f"frame={{n * 100}}\\nfps={{25 + n}}.0\\nbitrate=1000.0kbits/s\\n"
+        f"out_time_us={{n * 4_000_000}}\\nspeed=1.0x\\n"
+        f"progress={{'end' if n == int(os.environ['FAKE_BLOCKS']) else 'continue'}}\\n"
+    )
+    progress.flush()
+time.sleep(float(os.environ.get("FAKE_SLEEP", "0")))
+sys.exit(int(os.environ.get("FAKE_EXIT", "0")))
+"""
+
+
+@pytest.fixture
+def fake_ffmpeg(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    """Create an executable that mimics FFmpeg's -progress and stderr output."""
+    script = tmp_path / "ffmpeg"
+    script.write_text(FAKE_FFMPEG.format(python=sys.executable))
+    script.chmod(0o755)
+
+    def configure(**env: object) -> list[str]:
+        for key, value in env.items():
+            monkeypatch.setenv(f"FAKE_{key.upper()}", str(value))
+        return [str(script), "-i", "input.mkv", "output.mp4"]
+
+    return configure
+
+
 class TestRunFFmpegWithTimeout:
     """Tests for _run_ffmpeg_with_timeout method."""
 
-    def test_success_returns_true_and_zero_returncode(self):
+    def test_success_returns_true_and_zero_returncode(self, fake_ffmpeg):
         """Should return success=True and returncode=0 on successful execution."""
-        executor = ConcreteExecutor()
-        with patch("vpo.executor.ffmpeg_base.subprocess.Popen") as mock_popen:
-            mock_process = MagicMock()
-            mock_process.returncode = 0
-            mock_process.poll.side_effect = [None, 0]
-            mock_process.stderr.readline.return_value = ""
-            mock_process.stderr.__iter__ = lambda self: iter([])
-            mock_process.wait.return_value = 0
-            mock_popen.return_value = mock_process
-
-            success, rc, stderr_lines, metrics = executor._run_ffmpeg_with_timeout(
-                ["ffmpeg", "-i", "input.mkv", "output.mp4"],
-                "test operation",
-            )
-
-            assert success is True
-            assert rc == 0
-
-    def test_failure_returns_false_and_nonzero_returncode(self):
+        success, rc, _, _ = ConcreteExecutor()._run_ffmpeg_with_timeout(
+            fake_ffmpeg(), "test operation"
+        )
+
+        assert success is True
+        assert rc == 0
+
+    def test_failure_returns_false_and_nonzero_returncode(self, fake_ffmpeg):
         """Should return success=False and actual returncode on failure."""
-        executor = ConcreteExecutor()
-        with patch("vpo.executor.ffmpeg_base.subprocess.Popen") as mock_popen:
-            mock_process = MagicMock()
-            mock_process.returncode = 1
-            mock_process.poll.side_effect = [None, 1]
-            mock_process.stderr.__iter__ = lambda self: iter([])
-            mock_process.wait.return_value = 1
-            mock_popen.return_value = mock_process
-
-            success, rc, stderr_lines, metrics = executor._run_ffmpeg_with_timeout(
-                ["ffmpeg", "-i", "input.mkv", "output.mp4"],
-                "test operation",
-            )
-
-            assert success is False
-            assert rc == 1
-
-    def test_timeout_returns_false_and_minus_one(self):
+        success, rc, _, _ = ConcreteExecutor()._run_ffmpeg_with_timeout(
+            fake_ffmpeg(exit=3), "test operation"
+        )
+
+        assert success is False
+        assert rc == 3
+
+    def test_timeout_returns_false_and_minus_one(self, fake_ffmpeg):
         """Should return success=False and rc=-1 when timeout expires."""
+        start = time.monotonic()
+
+        success, rc, _, _ = ConcreteExecutor()._run_ffmpeg_with_timeout(
+            fake_ffmpeg(sleep=30), "test operation", timeout=0.5
+        )
+
+        assert success is False
+        assert rc == -1
+        assert time.monotonic() - start < 10
+
+    def test_progress_callback_invoked_per_block(self, fake_ffmpeg):
+        """Should invoke progress callback once per -progress block."""
+        callback_calls: list[FFmpegProgress] = []
+
+        success, _, _, _ = ConcreteExecutor()._run_ffmpeg_with_timeout(
+            fake_ffmpeg(blocks=3),
+            "test operation",
+            progress_callback=callback_calls.append,
+        )
+
+        assert success is True
+        assert [p.frame for p in callback_calls] == [100, 200, 300]
+        assert callback_calls[0].fps == 26.0
+        assert callback_calls[-1].out_time_seconds == 12.0
+
+    def test_callback_errors_do_not_stop_processing(self, fake_ffmpeg):
+        """Should keep running when the progress callback raises."""
+
+        def failing_callback(progress: FFmpegProgress) -> None:
+            raise RuntimeError("boom")
+
+        success, _, _, metrics = ConcreteExecutor()._run_ffmpeg_with_timeout(
+            fake_ffmpeg(blocks=2),
+            "test operation",
+            progress_callback=failing_callback,
+        )
+
+        assert success is True
+        assert metrics is not None
+        assert metrics.sample_count == 2
+
+    def test_metrics_aggregated_from_progress(self, fake_ffmpeg):
+        """Should aggregate metrics from progress blocks."""
+        _, _, _, metrics = ConcreteExecutor()._run_ffmpeg_with_timeout(
+            fake_ffmpeg(blocks=2), "test operation"
+        )
+
+        assert metrics is not None
+        assert metrics.sample_count == 2
+        assert metrics.avg_fps == 26.5
+        assert metrics.peak_fps == 27.0
+        assert metrics.total_frames == 200
+
+    def test_stderr_lines_collected(self, fake_ffmpeg):
+        """Should collect stderr lines in output."""
+        _, _, lines, _ = ConcreteExecutor()._run_ffmpeg_with_timeout(
+            fake_ffmpeg(stderr="Some info line|Error while encoding"),
+            "test operation",
+        )
+
+        assert lines == ["Some info line\n", "Error while encoding\n"]
+
+    def test_stderr_keeps_only_tail(self, fake_ffmpeg):
+        """Should keep only the last STDERR_TAIL_LINES lines of stderr."""
         executor = ConcreteExecutor()
+        executor.STDERR_TAIL_LINES = 5
 
-        with (
-            patch("vpo.executor.ffmpeg_base.subprocess.Popen") as mock_popen,
-            patch("vpo.executor.ffmpeg_base.time.monotonic") as mock_time,
-        ):
-            mock_process = MagicMock()
-            mock_process.returncode = -9
-            mock_process.poll.return_value = None  # Process never completes
-            mock_process.stderr.__iter__ = lambda self: iter([])
-            mock_process.stderr.close.return_value = None
-            mock_process.kill.return_value = None
-            mock_process.wait.return_value = -9
-            mock_popen.return_value = mock_process
-
-            # Simulate time progressing past the timeout
-            mock_time.side_effect = [0.0, 100.0]  # start_time=0, elapsed=100
-
-            success, rc, stderr_lines, metrics = executor._run_ffmpeg_with_timeout(
-                ["ffmpeg", "-i", "input.mkv", "output.mp4"],
-                "test operation",
-                timeout=10.0,
-            )
-
-            assert success is False
-            assert rc == -1
-            mock_process.kill.assert_called_once()
-
-    def test_progress_callback_invoked_with_parsed_progress(self):
-        """Should invoke progress callback when progress lines are parsed."""
-        executor = ConcreteExecutor()
-        callback_calls = []
-
-        def mock_callback(progress: FFmpegProgress):
-            callback_calls.append(progress)
-
-        with patch("vpo.executor.ffmpeg_base.subprocess.Popen") as mock_popen:
-            mock_process = MagicMock()
-            mock_process.returncode = 0
-            mock_process.poll.side_effect = [None, None, 0]
-
-            # Simulate FFmpeg stderr output with progress line
-            progress_line = (
-                "frame=  100 fps= 30 time=00:00:03.33 bitrate=1000kbits/s speed=1.0x"
-            )
-            mock_process.stderr.__iter__ = lambda self: iter([progress_line])
-            mock_process.wait.return_value = 0
-            mock_popen.return_value = mock_process
-
-            success, rc, stderr_lines, metrics = executor._run_ffmpeg_with_timeout(
-                ["ffmpeg", "-i", "input.mkv", "output.mp4"],
-                "test operation",
-                progress_callback=mock_callback,
-            )
-
-            assert success is True
-            assert len(callback_calls) == 1
-            assert callback_calls[0].frame == 100
-            assert callback_calls[0].fps == 30.0
-
-    def test_no_callback_when_none_provided(self):
-        """Should not fail when progress_callback is None."""
-        executor = ConcreteExecutor()
-        with patch("vpo.executor.ffmpeg_base.subprocess.Popen") as mock_popen:
-            mock_process = MagicMock()
-            mock_process.returncode = 0
-            mock_process.poll.side_effect = [None, 0]
-            mock_process.stderr.__iter__ = lambda self: iter(
-                ["frame=  100 fps= 30 time=00:00:03.33 bitrate=1000kbits/s speed=1.0x"]
-            )
-            mock_process.wait.return_value = 0
-            mock_popen.return_value = mock_process
-
-            # Should not raise even without callback
-            success, rc, stderr_lines, metrics = executor._run_ffmpeg_with_timeout(
-                ["ffmpeg", "-i", "input.mkv", "output.mp4"],
-                "test operation",
-                progress_callback=None,
-            )
-
-            assert success is True
-
-    def test_metrics_aggregator_collects_fps_samples(self):
-        """Should collect metrics from progress lines."""
-        executor = ConcreteExecutor()
-        with patch("vpo.executor.ffmpeg_base.subprocess.Popen") as mock_popen:
-            mock_process = MagicMock()
-            mock_process.returncode = 0
-            mock_process.poll.side_effect = [None, None, None, 0]
-
-            # Multiple progress lines
-            progress_lines = [
-                "frame=  100 fps= 30 time=00:00:03.33 bitrate=1000kbits/s speed=1.0x",
-                "frame=  200 fps= 35 time=00:00:06.66 bitrate=1200kbits/s speed=1.2x",
-            ]
-            mock_process.stderr.__iter__ = lambda self: iter(progress_lines)
-            mock_process.wait.return_value = 0
-            mock_popen.return_value = mock_process
-
-            success, rc, stderr_lines, metrics = executor._run_ffmpeg_with_timeout(
-                ["ffmpeg", "-i", "input.mkv", "output.mp4"],
-                "test operation",
-            )
-
-            assert success is True
-            assert metrics is not None
-            assert metrics.sample_count == 2
-            assert metrics.avg_fps is not None
-            assert metrics.avg_fps > 0
-
-    def test_stderr_lines_collected(self):
-        """Should collect all stderr lines in output."""
-        executor = ConcreteExecutor()
-        with patch("vpo.executor.ffmpeg_base.subprocess.Popen") as mock_popen:
-            mock_process = MagicMock()
-            mock_process.returncode = 0
-            mock_process.poll.side_effect = [None, None, 0]
-
-            stderr_lines = [
-                "Some info line\n",
-                "frame=  100 fps= 30 time=00:00:03.33 bitrate=1000kbits/s speed=1.0x\n",
-            ]
-            mock_process.stderr.__iter__ = lambda self: iter(stderr_lines)
-            mock_process.wait.return_value = 0
-            mock_popen.return_value = mock_process
-
-            success, rc, result_lines, metrics = executor._run_ffmpeg_with_timeout(
-                ["ffmpeg", "-i", "input.mkv", "output.mp4"],
-                "test operation",
-            )
-
-            assert success is True
-            assert len(result_lines) == 2
-            assert "Some info line" in result_lines[0]
+        _, _, lines, _ = executor._run_ffmpeg_with_timeout(
+            fake_ffmpeg(stderr="|".join(f"line {i}" for i in range(100))),
+            "test operation",
+        )
+
+        assert lines == [f"line {i}\n" for i in range(95, 100)]
+
+
+class TestLineSplitter:
+    """Tests for _LineSplitter."""
+
+    def test_splits_across_reads(self):
+        splitter = _LineSplitter()
+
+        assert splitter.feed(b"frame=1\nfp") == ["frame=1\n"]
+        assert splitter.feed(b"s=2\r") == ["fps=2\n"]
+        assert splitter.feed(b"tail") == []
+        assert splitter.flush() == ["tail"]
+
+    def test_bounds_unterminated_line(self):
+        splitter = _LineSplitter()
+
+        lines = splitter.feed(b"x" * 10_000)
+
+        assert [len(line) for line in lines] == [4097, 4097]
+        assert splitter.flush() == ["x" * (10_000 - 8192)]
 
 
 # ============================================================================
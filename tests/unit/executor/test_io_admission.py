@@ -0,0 +1,118 @@
+"""Tests for per-device I/O admission control."""
+
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from vpo.config.models import ProcessingConfig
+from vpo.executor.io_admission import (
+    IOAdmission,
+    IOAdmissionController,
+    device_id,
+)
+
+
+@pytest.fixture
+def lock_dir(tmp_path: Path) -> Path:
+    return tmp_path / "locks"
+
+
+class TestDeviceId:
+    """Tests for device_id."""
+
+    def test_matches_st_dev(self, tmp_path: Path):
+        st_dev = os.stat(tmp_path).st_dev
+
+        assert device_id(tmp_path) == f"{os.major(st_dev)}:{os.minor(st_dev)}"
+
+    def test_missing_path_uses_existing_parent(self, tmp_path: Path):
+        assert device_id(tmp_path / "not" / "yet.mkv") == device_id(tmp_path)
+
+
+class TestIOAdmissionController:
+    """Tests for IOAdmissionController."""
+
+    def test_disabled_admits_immediately(self, lock_dir: Path, tmp_path: Path):
+        controller = IOAdmissionController(lock_dir)
+
+        with controller.admit([tmp_path]) as admission:
+            assert admission == IOAdmission()
+        assert not lock_dir.exists()
+
+    def test_records_wait_per_device(self, lock_dir: Path, tmp_path: Path):
+        controller = IOAdmissionController(lock_dir, concurrency=2)
+
+        with controller.admit([tmp_path, tmp_path / "out.mkv"]) as admission:
+            assert list(admission.wait_seconds) == [device_id(tmp_path)]
+
+    def test_concurrency_limit_serializes_work(self, lock_dir: Path, tmp_path: Path):
+        controller = IOAdmissionController(lock_dir, concurrency=1)
+        holding = threading.Event()
+        waits: list[float] = []
+
+        def first() -> None:
+            with controller.admit([tmp_path]):
+                holding.set()
+                time.sleep(0.5)
+
+        thread = threading.Thread(target=first)
+        thread.start()
+        holding.wait()
+        with controller.admit([tmp_path]) as admission:
+            waits.append(admission.total_wait_seconds)
+        thread.join()
+
+        assert waits[0] >= 0.3
+
+    def test_free_slot_is_not_blocked(self, lock_dir: Path, tmp_path: Path):
+        controller = IOAdmissionController(lock_dir, concurrency=2)
+
+        with controller.admit([tmp_path]):
+            with controller.admit([tmp_path]) as second:
+                assert second.total_wait_seconds < 0.2
+
+    def test_device_limit_override(self, lock_dir: Path, tmp_path: Path):
+        controller = IOAdmissionController(
+            lock_dir, concurrency=4, device_limits={str(tmp_path): 1}
+        )
+
+        assert controller.limit_for(device_id(tmp_path)) == 1
+        assert controller.limit_for("254:99") == 4
+
+    def test_bandwidth_cap_paces_admission(self, lock_dir: Path, tmp_path: Path):
+        controller = IOAdmissionController(lock_dir, bandwidth_mb_per_sec=1.0)
+        half_mb = 512 * 1024
+
+        with controller.admit([tmp_path], size_bytes=half_mb) as first:
+            pass
+        with controller.admit([tmp_path], size_bytes=half_mb) as second:
+            pass
+
+        assert first.total_wait_seconds < 0.2
+        assert second.total_wait_seconds >= 0.3
+
+    def test_from_config(self, lock_dir: Path):
+        config = ProcessingConfig(
+            io_device_concurrency=3, io_device_bandwidth_mb_per_sec=2.0
+        )
+
+        controller = IOAdmissionController.from_config(config, lock_dir)
+
+        assert controller.enabled
+        assert controller.concurrency == 3
+        assert controller.bandwidth_bytes_per_sec == 2 * 1024 * 1024
+
+
+class TestProcessingConfigValidation:
+    """Validation of the I/O admission settings."""
+
+    def test_rejects_negative_concurrency(self):
+        with pytest.raises(ValueError, match="io_device_concurrency"):
+            ProcessingConfig(io_device_concurrency=-1)
+
+    def test_rejects_zero_device_limit(self):
+        with pytest.raises(ValueError, match="io_device_limits"):
+            ProcessingConfig(io_device_limits={"/mnt/a": 0})
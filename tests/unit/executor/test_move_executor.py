@@ -9,15 +9,19 @@ Tests the MoveExecutor class and ensure_unique_path function:
 """
 
 import errno
-import shutil
+import hashlib
+import os
+from contextlib import contextmanager
 from unittest.mock import patch
 
 import pytest
 
+import vpo.executor.move as move_module
 from vpo.executor.move import (
     MoveErrorType,
     MoveExecutor,
     MovePlan,
+    MoveProgress,
     ensure_unique_path,
 )
 
@@ -40,6 +44,35 @@ def source_file(tmp_path):
     return f
 
 
+def _fake_hash_files(paths, progress_callback=None):
+    """Stand-in for vpo._core.hash_files hashing whole file contents."""
+    return [
+        {
+            "path": path,
+            "hash": hashlib.sha256(open(path, "rb").read()).hexdigest(),
+            "error": None,
+        }
+        for path in paths
+    ]
+
+
+@contextmanager
+def cross_device(source, hash_files=_fake_hash_files):
+    """Make renames of source fail with EXDEV, as across filesystems."""
+    real_replace = os.replace
+
+    def replace(src, dst):
+        if os.fspath(src) == os.fspath(source):
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+        return real_replace(src, dst)
+
+    with (
+        patch("vpo.executor.move.os.replace", side_effect=replace),
+        patch("vpo.executor.move.hash_files", side_effect=hash_files),
+    ):
+        yield
+
+
 # =============================================================================
 # Tests for MoveExecutor.execute
 # =============================================================================
@@ -107,16 +140,12 @@ class TestMoveExecutorExecute:
             create_directories=True,
         )
 
-        # Mock shutil.move to raise EXDEV (cross-device)
-        with patch.object(shutil, "move") as mock_move:
-            err = OSError("Cross-device link")
-            err.errno = errno.EXDEV
-            mock_move.side_effect = err
-
+        with cross_device(source_file):
             result = executor.execute(plan)
 
-        assert result.success is False
-        assert result.error_type == MoveErrorType.CROSS_DEVICE
+        assert result.success is True
+        assert dest_path.read_bytes() == b"video content" * 100
+        assert not source_file.exists()
 
     def test_handles_permission_error(self, executor, source_file, tmp_path):
         """Handles EACCES/EPERM for permission errors."""
@@ -128,7 +157,7 @@ class TestMoveExecutorExecute:
             create_directories=True,
         )
 
-        with patch.object(shutil, "move") as mock_move:
+        with patch("vpo.executor.move.os.replace") as mock_move:
             err = OSError("Permission denied")
             err.errno = errno.EACCES
             mock_move.side_effect = err
@@ -148,7 +177,7 @@ class TestMoveExecutorExecute:
             create_directories=True,
         )
 
-        with patch.object(shutil, "move") as mock_move:
+        with patch("vpo.executor.move.os.replace") as mock_move:
             err = OSError("No space left on device")
             err.errno = errno.ENOSPC
             mock_move.side_effect = err
@@ -168,7 +197,7 @@ class TestMoveExecutorExecute:
             create_directories=True,
         )
 
-        with patch.object(shutil, "move") as mock_move:
+        with patch("vpo.executor.move.os.replace") as mock_move:
             err = OSError("No such file or directory")
             err.errno = errno.ENOENT
             mock_move.side_effect = err
@@ -196,6 +225,181 @@ class TestMoveExecutorExecute:
             assert MoveErrorType[expected_type.name] == expected_type
 
 
+# =============================================================================
+# Tests for cross-device moves
+# =============================================================================
+
+
+class TestCrossDeviceMove:
+    """Tests for the copy/verify/unlink path used across filesystems."""
+
+    @pytest.fixture
+    def large_source(self, tmp_path):
+        f = tmp_path / "large.mkv"
+        f.write_bytes(os.urandom(300_000))
+        return f
+
+    def test_reports_progress_per_chunk(self, large_source, tmp_path):
+        updates: list[MoveProgress] = []
+        executor = MoveExecutor(progress_callback=updates.append, chunk_size=100_000)
+        dest = tmp_path / "lib" / "large.mkv"
+
+        with cross_device(large_source):
+            result = executor.execute(executor.create_plan(large_source, dest))
+
+        assert result.success is True
+        assert [u.bytes_copied for u in updates] == [100_000, 200_000, 300_000]
+        assert updates[-1].percent == 100.0
+
+    def test_preserves_mtime_and_leaves_no_temp_files(self, large_source, tmp_path):
+        os.utime(large_source, (1_000_000, 1_000_000))
+        dest = tmp_path / "lib" / "large.mkv"
+
+        with cross_device(large_source):
+            MoveExecutor().execute(MoveExecutor().create_plan(large_source, dest))
+
+        assert dest.stat().st_mtime == 1_000_000
+        assert sorted(p.name for p in dest.parent.iterdir()) == ["large.mkv"]
+
+    def test_resumes_partial_copy(self, large_source, tmp_path):
+        dest = tmp_path / "lib" / "large.mkv"
+        executor = MoveExecutor(chunk_size=100_000)
+        plan = executor.create_plan(large_source, dest)
+        calls = 0
+
+        def crash_after_first_chunk(progress):
+            nonlocal calls
+            calls += 1
+            raise KeyboardInterrupt
+
+        executor.progress_callback = crash_after_first_chunk
+        with cross_device(large_source), pytest.raises(KeyboardInterrupt):
+            executor.execute(plan)
+        partial = dest.with_name(".large.mkv.vpo-partial")
+        assert partial.stat().st_size == 100_000
+
+        updates: list[MoveProgress] = []
+        executor.progress_callback = updates.append
+        with cross_device(large_source):
+            result = executor.execute(plan)
+
+        assert result.success is True
+        assert updates[0].bytes_copied == 200_000
+        assert not large_source.exists()
+
+    def test_restarts_when_source_changed(self, large_source, tmp_path):
+        dest = tmp_path / "lib" / "large.mkv"
+        dest.parent.mkdir()
+        dest.with_name(".large.mkv.vpo-partial").write_bytes(b"stale" * 1000)
+        dest.with_name(".large.mkv.vpo-move").write_text('{"size": 1}')
+        content = large_source.read_bytes()
+
+        with cross_device(large_source):
+            result = MoveExecutor().execute(
+                MoveExecutor().create_plan(large_source, dest)
+            )
+
+        assert result.success is True
+        assert dest.read_bytes() == content
+
+    def test_verification_failure_keeps_source(self, large_source, tmp_path):
+        dest = tmp_path / "lib" / "large.mkv"
+
+        def mismatched(paths, progress_callback=None):
+            return [{"path": p, "hash": p, "error": None} for p in paths]
+
+        with cross_device(large_source, hash_files=mismatched):
+            result = MoveExecutor().execute(
+                MoveExecutor().create_plan(large_source, dest)
+            )
+
+        assert result.success is False
+        assert result.error_type == MoveErrorType.VERIFICATION
+        assert large_source.exists()
+        assert list(dest.parent.iterdir()) == []
+
+    def test_completes_move_interrupted_before_unlink(self, large_source, tmp_path):
+        dest = tmp_path / "lib" / "large.mkv"
+        executor = MoveExecutor()
+        plan = executor.create_plan(large_source, dest)
+
+        with (
+            cross_device(large_source),
+            patch.object(type(large_source), "unlink", side_effect=KeyboardInterrupt),
+            pytest.raises(KeyboardInterrupt),
+        ):
+            executor.execute(plan)
+        assert dest.exists() and large_source.exists()
+
+        with cross_device(large_source):
+            result = executor.execute(plan)
+
+        assert result.success is True
+        assert not large_source.exists()
+        assert sorted(p.name for p in dest.parent.iterdir()) == ["large.mkv"]
+
+    def test_stale_marker_with_different_destination_keeps_source(
+        self, large_source, tmp_path
+    ):
+        dest = tmp_path / "lib" / "large.mkv"
+        dest.parent.mkdir()
+        dest.write_bytes(os.urandom(300_000))
+        other = dest.read_bytes()
+        marker = dest.with_name(".large.mkv.vpo-move")
+        move_module._write_marker(marker, move_module._source_identity(large_source))
+        executor = MoveExecutor()
+
+        with cross_device(large_source):
+            result = executor.execute(executor.create_plan(large_source, dest))
+
+        assert result.success is False
+        assert large_source.exists()
+        assert dest.read_bytes() == other
+
+    def test_falls_back_when_kernel_copy_unsupported(self, large_source, tmp_path):
+        dest = tmp_path / "lib" / "large.mkv"
+        content = large_source.read_bytes()
+        unsupported = OSError(errno.EXDEV, "Invalid cross-device link")
+
+        methods = (move_module._copy_file_range, move_module._read_write)
+
+        with (
+            cross_device(large_source),
+            patch("vpo.executor.move._COPY_METHODS", methods),
+            patch(
+                "vpo.executor.move.os.copy_file_range", side_effect=unsupported
+            ) as copy_file_range,
+        ):
+            result = MoveExecutor().execute(
+                MoveExecutor().create_plan(large_source, dest)
+            )
+
+        assert result.success is True
+        assert dest.read_bytes() == content
+        # Tried once for this copy, not once per chunk
+        assert copy_file_range.call_count == 1
+
+    def test_fallback_does_not_outlive_the_copy(self, tmp_path):
+        """A strategy rejected for one copy is tried again by the next."""
+        source = tmp_path / "a.bin"
+        source.write_bytes(b"x" * 10)
+        calls = []
+
+        def flaky(src_fd, dst_fd, offset, count):
+            calls.append(offset)
+            if len(calls) == 1:
+                raise OSError(errno.EXDEV, "Invalid cross-device link")
+            return move_module._read_write(src_fd, dst_fd, offset, count)
+
+        methods = (flaky, move_module._read_write)
+        with patch("vpo.executor.move._COPY_METHODS", methods):
+            for name in ("b.bin", "c.bin"):
+                MoveExecutor()._copy(source, tmp_path / name, 0, 10)
+
+        assert len(calls) == 2
+        assert (tmp_path / "c.bin").read_bytes() == b"x" * 10
+
+
 # =============================================================================
 # Tests for MoveExecutor.validate
 # =============================================================================
@@ -485,6 +485,7 @@ class TestMoveJobServiceProcess:
         mock_executor_cls.assert_called_once_with(
             create_directories=False,
             overwrite=True,
+            progress_callback=None,
         )
 
     def test_process_rollback_on_db_failure(self, mock_conn, sample_move_job):
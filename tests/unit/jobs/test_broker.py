@@ -0,0 +1,195 @@
+"""Unit tests for remote job workers (vpo.jobs.broker)."""
+
+import base64
+import json
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+
+from vpo.db.types import JobStatus, JobType
+from vpo.jobs.broker import (
+    WORKER_HEADER,
+    BrokerClient,
+    BrokerError,
+    BrokerLeaseLostError,
+    PathMapper,
+    PathMapping,
+    RemoteJobWorker,
+)
+
+
+@pytest.fixture(autouse=True)
+def mock_transcode_service():
+    """Mock TranscodeJobService to avoid the ffprobe dependency."""
+    with patch("vpo.jobs.worker.TranscodeJobService") as mock_service:
+        mock_service.return_value = MagicMock()
+        yield mock_service
+
+
+@pytest.fixture(autouse=True)
+def data_dir(tmp_path, monkeypatch):
+    """Keep job logs written by the worker under tmp_path."""
+    monkeypatch.setenv("VPO_DATA_DIR", str(tmp_path))
+    return tmp_path
+
+
+def _client(handler, **kwargs) -> BrokerClient:
+    return BrokerClient(
+        "http://server:8321/",
+        worker_id="host-b:42",
+        transport=httpx.MockTransport(handler),
+        **kwargs,
+    )
+
+
+class TestPathMapping:
+    """Tests for PathMapping and PathMapper."""
+
+    def test_parse(self) -> None:
+        assert PathMapping.parse("/media=/mnt/media") == PathMapping(
+            "/media", "/mnt/media"
+        )
+
+    @pytest.mark.parametrize("value", ["/media", "=/mnt", "/media="])
+    def test_parse_rejects_invalid(self, value: str) -> None:
+        with pytest.raises(ValueError, match="SERVER_PREFIX=LOCAL_PREFIX"):
+            PathMapping.parse(value)
+
+    def test_maps_whole_components_longest_first(self) -> None:
+        mapper = PathMapper(
+            [
+                PathMapping("/media/", "/mnt/media"),
+                PathMapping("/media/tv", "/mnt/tv"),
+            ]
+        )
+
+        assert mapper.to_local("/media/a.mkv") == "/mnt/media/a.mkv"
+        assert mapper.to_local("/media/tv/b.mkv") == "/mnt/tv/b.mkv"
+        assert mapper.to_local("/media2/a.mkv") == "/media2/a.mkv"
+        assert mapper.to_server("/mnt/tv/b.mkv") == "/media/tv/b.mkv"
+
+
+class TestBrokerClient:
+    """Tests for BrokerClient request handling."""
+
+    def test_claim_sends_worker_and_auth(self, make_job) -> None:
+        job = make_job(status=JobStatus.RUNNING)
+        seen = {}
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen["path"] = request.url.path
+            seen["worker"] = request.headers[WORKER_HEADER]
+            seen["auth"] = request.headers["Authorization"]
+            payload = {"job": {**job.__dict__, "unknown": 1}, "duration_seconds": 90}
+            payload["job"]["job_type"] = job.job_type.value
+            payload["job"]["status"] = job.status.value
+            return httpx.Response(200, json=payload)
+
+        claimed, duration = _client(handler, auth_token="t" * 16).claim()
+
+        assert claimed == job
+        assert duration == 90
+        assert seen["path"] == "/api/v1/broker/claim"
+        assert seen["worker"] == "host-b:42"
+        assert seen["auth"] == "Basic " + base64.b64encode(b"vpo:" + b"t" * 16).decode(
+            "ascii"
+        )
+
+    def test_empty_queue(self) -> None:
+        client = _client(lambda r: httpx.Response(200, json={"job": None}))
+
+        assert client.claim() == (None, None)
+
+    def test_conflict_raises_lease_lost(self) -> None:
+        client = _client(lambda r: httpx.Response(409, json={"error": "gone"}))
+
+        with pytest.raises(BrokerLeaseLostError, match="gone"):
+            client.heartbeat("abc")
+
+    def test_disabled_broker(self) -> None:
+        client = _client(lambda r: httpx.Response(404, text="Not Found"))
+
+        with pytest.raises(BrokerError, match="--broker"):
+            client.claim()
+
+    def test_connection_error(self) -> None:
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("refused", request=request)
+
+        with pytest.raises(BrokerError, match="Cannot reach"):
+            _client(handler).claim()
+
+
+class TestRemoteJobWorker:
+    """Tests for RemoteJobWorker job processing."""
+
+    @pytest.fixture
+    def client(self) -> MagicMock:
+        client = MagicMock(spec=BrokerClient)
+        client.worker_id = "host-b:42"
+        return client
+
+    def test_runs_job_with_local_paths(self, client, make_job, data_dir) -> None:
+        job = make_job(
+            file_path="/media/a.mkv",
+            status=JobStatus.RUNNING,
+            policy_json=json.dumps({"output_dir": "/media/out"}),
+        )
+        client.claim.side_effect = [(job, 120.0), (None, None)]
+        worker = RemoteJobWorker(
+            client, path_mapper=PathMapper([PathMapping("/media", "/mnt/media")])
+        )
+        result = MagicMock(
+            success=True, error_message=None, output_path="/mnt/media/out/a.mkv"
+        )
+
+        with patch.object(worker._transcode_service, "process") as mock_process:
+            mock_process.return_value = result
+            assert worker.run() == 1
+
+        local_job = mock_process.call_args.args[0]
+        assert local_job.file_path == "/mnt/media/a.mkv"
+        assert json.loads(local_job.policy_json)["output_dir"] == "/mnt/media/out"
+        client.upload_log.assert_called_once_with(
+            job.id, data_dir / "logs" / f"{job.id}.log"
+        )
+        client.complete.assert_called_once_with(
+            job.id,
+            JobStatus.COMPLETED,
+            error_message=None,
+            output_path="/media/out/a.mkv",
+            summary_json=None,
+        )
+
+    def test_uses_claimed_duration(self, client) -> None:
+        worker = RemoteJobWorker(client)
+        worker._duration = 60.0
+
+        assert worker._get_file_duration(7) == 60.0
+
+    def test_throttles_progress(self, client) -> None:
+        worker = RemoteJobWorker(client)
+
+        worker._report_progress("abc", 1.0, None)
+        worker._report_progress("abc", 2.0, None)
+
+        client.progress.assert_called_once_with("abc", 1.0, None)
+
+    def test_claim_error_stops_worker(self, client) -> None:
+        client.claim.side_effect = BrokerError("refused")
+
+        assert RemoteJobWorker(client).run() == 0
+
+    def test_lost_lease_is_not_raised(self, client, make_job) -> None:
+        job = make_job(job_type=JobType.TRANSCODE, status=JobStatus.RUNNING)
+        client.complete.side_effect = BrokerLeaseLostError("gone")
+        worker = RemoteJobWorker(client)
+
+        with patch.object(worker._transcode_service, "process") as mock_process:
+            mock_process.return_value = MagicMock(
+                success=False, error_message="boom", output_path=None
+            )
+            worker.process_job(job)
+
+        assert client.complete.call_args.args[1] == JobStatus.FAILED
@@ -0,0 +1,157 @@
+"""Unit tests for job duration estimates (vpo.jobs.estimates)."""
+
+import json
+import uuid
+from dataclasses import replace
+
+import pytest
+
+from vpo.db import JobStatus, JobType
+from vpo.db.queries import insert_processing_stats
+from vpo.db.types import ProcessingStatsRecord
+from vpo.jobs.estimates import DurationEstimator, JobFeatures
+
+HEVC_1080P = JobFeatures(
+    job_type=JobType.TRANSCODE,
+    size_bytes=1000,
+    source_codec="h264",
+    resolution="1080p",
+    target_codec="hevc",
+)
+
+
+@pytest.fixture
+def media_file(insert_test_file, insert_test_track):
+    """Insert a 1080p h264 file of the given size, returning its ID."""
+
+    def _insert(path: str, size_bytes: int) -> int:
+        file_id = insert_test_file(path=path, size_bytes=size_bytes)
+        insert_test_track(file_id=file_id, codec="h264", height=1080)
+        return file_id
+
+    return _insert
+
+
+def _stats(file_id: int, seconds: float, size: int) -> ProcessingStatsRecord:
+    return ProcessingStatsRecord(
+        id=str(uuid.uuid4()),
+        file_id=file_id,
+        processed_at="2025-01-15T10:00:00+00:00",
+        policy_name="p",
+        size_before=size,
+        size_after=size,
+        size_change=0,
+        audio_tracks_before=1,
+        subtitle_tracks_before=0,
+        attachments_before=0,
+        audio_tracks_after=1,
+        subtitle_tracks_after=0,
+        attachments_after=0,
+        audio_tracks_removed=0,
+        subtitle_tracks_removed=0,
+        attachments_removed=0,
+        duration_seconds=seconds,
+        phases_completed=1,
+        phases_total=1,
+        total_changes=1,
+        video_source_codec="h264",
+        video_target_codec="hevc",
+        video_transcode_skipped=False,
+        video_skip_reason=None,
+        audio_tracks_transcoded=0,
+        audio_tracks_preserved=1,
+        hash_before=None,
+        hash_after=None,
+        success=True,
+        error_message=None,
+        encoder_type="software",
+    )
+
+
+class TestDurationEstimator:
+    """Tests for estimates from recorded samples."""
+
+    def test_scales_rate_by_size(self) -> None:
+        estimator = DurationEstimator()
+        for _ in range(3):
+            estimator.add_sample(HEVC_1080P, 10.0)
+
+        assert estimator.estimate(HEVC_1080P) == 10.0
+        assert estimator.estimate(replace(HEVC_1080P, size_bytes=3000)) == 30.0
+
+    def test_falls_back_to_coarser_group(self) -> None:
+        estimator = DurationEstimator()
+        for _ in range(3):
+            estimator.add_sample(HEVC_1080P, 10.0)
+        av1 = JobFeatures(
+            job_type=JobType.TRANSCODE,
+            size_bytes=2000,
+            source_codec="mpeg2video",
+            resolution="1080p",
+            target_codec="av1",
+        )
+
+        # Neither codec has history; the resolution group does
+        assert estimator.estimate(av1) == 20.0
+        assert estimator.estimate(JobFeatures(job_type=JobType.MOVE)) is None
+
+    def test_needs_min_samples(self) -> None:
+        estimator = DurationEstimator()
+        estimator.add_sample(HEVC_1080P, 10.0)
+
+        assert estimator.estimate(HEVC_1080P) is None
+        assert estimator.sample_count == 1
+
+    def test_uses_upper_quantile_without_size(self) -> None:
+        estimator = DurationEstimator()
+        for seconds in (10.0, 40.0, 20.0, 30.0):
+            estimator.add_sample(JobFeatures(job_type=JobType.SCAN), seconds)
+
+        assert estimator.estimate(JobFeatures(job_type=JobType.SCAN)) == 30.0
+
+
+class TestFromHistory:
+    """Tests for learning durations from the database."""
+
+    def test_learns_completed_jobs(self, db_conn, media_file, insert_test_job) -> None:
+        for i in range(3):
+            insert_test_job(
+                file_id=media_file(f"/media/done{i}.mkv", 1000),
+                status=JobStatus.COMPLETED,
+                policy_json=json.dumps({"target_video_codec": "hevc"}),
+                started_at="2025-01-15T10:00:00+00:00",
+                completed_at="2025-01-15T10:01:40+00:00",
+            )
+        insert_test_job(
+            file_id=media_file("/media/failed.mkv", 1000),
+            status=JobStatus.FAILED,
+            started_at="2025-01-15T10:00:00+00:00",
+            completed_at="2025-01-15T12:00:00+00:00",
+        )
+        queued = insert_test_job(
+            file_id=media_file("/media/next.mkv", 2500),
+            policy_json=json.dumps({"target_video_codec": "HEVC"}),
+        )
+        scan = insert_test_job(job_type=JobType.SCAN)
+
+        estimator = DurationEstimator.from_history(db_conn)
+
+        assert estimator.sample_count == 3
+        assert estimator.estimate_jobs(db_conn, [queued, scan]) == {
+            queued.id: 250.0,
+            scan.id: None,
+        }
+
+    def test_learns_process_runs_from_stats(
+        self, db_conn, media_file, insert_test_job
+    ) -> None:
+        for i in range(3):
+            file_id = media_file(f"/media/run{i}.mkv", 1000)
+            insert_processing_stats(db_conn, _stats(file_id, 50.0, 1000))
+        queued = insert_test_job(
+            job_type=JobType.PROCESS, file_id=media_file("/media/next.mkv", 4000)
+        )
+
+        estimator = DurationEstimator.from_history(db_conn)
+
+        assert estimator.estimate_jobs(db_conn, [queued]) == {queued.id: 200.0}
@@ -711,3 +711,139 @@ class TestCompressedLogReading:
             result = log_file_exists(job_id)
 
         assert result is True
+
+
+JOB_ID = "12345678-1234-1234-1234-123456789abc"
+
+
+@pytest.fixture
+def log_dir(tmp_path: Path):
+    """Point the log directory at tmp_path."""
+    with patch("vpo.jobs.logs.get_log_directory", return_value=tmp_path):
+        yield tmp_path
+
+
+class TestLineIndex:
+    """Tests for the sidecar line-offset index."""
+
+    def _write(self, count: int, interval: int = 10) -> None:
+        from vpo.jobs.logs import JobLogWriter
+
+        with JobLogWriter(JOB_ID, buffer_size=7, index_interval=interval) as w:
+            for i in range(count):
+                w.write_line(f"line {i}")
+
+    def test_writer_indexes_every_interval(self, log_dir: Path):
+        from vpo.jobs.logs import _read_index_file
+
+        self._write(25)
+
+        data = (log_dir / f"{JOB_ID}.log").read_bytes()
+        interval, offsets = _read_index_file(log_dir / f"{JOB_ID}.log.idx")
+        assert interval == 10
+        assert len(offsets) == 2
+        for n, offset in zip((10, 20), offsets, strict=True):
+            assert data[offset:].startswith(b"[")
+            assert data[:offset].count(b"\n") == n
+
+    def test_reader_seeks_to_offset(self, log_dir: Path):
+        self._write(25)
+
+        lines, total, has_more = read_log_tail(JOB_ID, lines=3, offset=19)
+
+        assert [line.split("] ")[1] for line in lines] == [
+            "line 19",
+            "line 20",
+            "line 21",
+        ]
+        assert total == 25
+        assert has_more is True
+
+    def test_writer_appends_to_existing_log(self, log_dir: Path):
+        self._write(15)
+        self._write(15)
+
+        lines, total, _ = read_log_tail(JOB_ID, lines=1, offset=20)
+
+        assert total == 30
+        assert lines[0].endswith("line 5")
+
+    def test_unindexed_log_is_indexed_on_read(self, log_dir: Path):
+        log_file = log_dir / f"{JOB_ID}.log"
+        log_file.write_text("".join(f"line {i}\n" for i in range(2500)))
+
+        assert count_log_lines(JOB_ID) == 2500
+        assert (log_dir / f"{JOB_ID}.log.idx").exists()
+        lines, _, _ = read_log_tail(JOB_ID, lines=2, offset=2000)
+        assert lines == ["line 2000", "line 2001"]
+
+    def test_stale_index_is_rebuilt(self, log_dir: Path):
+        self._write(25)
+        (log_dir / f"{JOB_ID}.log").write_text("a\nb\n")
+
+        assert count_log_lines(JOB_ID) == 2
+        assert read_log_tail(JOB_ID)[0] == ["a", "b"]
+
+    def test_compression_removes_index(self, log_dir: Path):
+        import os
+        import time
+
+        from vpo.jobs.logs import compress_old_logs
+
+        self._write(25)
+        log_file = log_dir / f"{JOB_ID}.log"
+        old_time = time.time() - (10 * 86400)
+        os.utime(log_file, (old_time, old_time))
+
+        compress_old_logs(older_than_days=7)
+
+        assert not (log_dir / f"{JOB_ID}.log.idx").exists()
+        assert read_log_tail(JOB_ID, lines=1, offset=24)[1] == 25
+
+
+class TestTailAndFollow:
+    """Tests for tail mode and follow reads."""
+
+    def test_tail_returns_last_lines(self, log_dir: Path):
+        (log_dir / f"{JOB_ID}.log").write_text("1\n2\n3\n4\n5")
+
+        lines, total, has_more = read_log_tail(JOB_ID, lines=2, tail=True)
+
+        assert lines == ["4", "5"]
+        assert total == 5
+        assert has_more is False
+
+    def test_tail_of_compressed_log(self, log_dir: Path):
+        import gzip
+
+        with gzip.open(log_dir / f"{JOB_ID}.log.gz", "wt") as f:
+            f.write("1\n2\n3\n")
+
+        assert read_log_tail(JOB_ID, lines=2, tail=True) == (["2", "3"], 3, False)
+
+    def test_follow_returns_only_complete_appended_lines(self, log_dir: Path):
+        from vpo.jobs.logs import get_log_end_position, read_log_from
+
+        log_file = log_dir / f"{JOB_ID}.log"
+        log_file.write_text("1\n2\n3\n")
+
+        position = get_log_end_position(JOB_ID, lines=1)
+        assert read_log_from(JOB_ID, position) == (["3"], 6)
+
+        with log_file.open("a") as f:
+            f.write("4\n5")
+        lines, position = read_log_from(JOB_ID, 6)
+        assert (lines, position) == (["4"], 8)
+        assert read_log_from(JOB_ID, position) == ([], 8)
+
+    def test_follow_splits_overlong_line(self, log_dir: Path):
+        from vpo.jobs.logs import read_log_from
+
+        (log_dir / f"{JOB_ID}.log").write_text("x" * 10)
+
+        assert read_log_from(JOB_ID, 0, max_bytes=4) == (["xxxx"], 4)
+
+    def test_end_position_without_log(self, log_dir: Path):
+        from vpo.jobs.logs import get_log_end_position
+
+        assert get_log_end_position(JOB_ID) is None
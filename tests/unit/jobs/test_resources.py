@@ -0,0 +1,75 @@
+"""Unit tests for job resource classes (vpo.jobs.resources)."""
+
+import json
+
+import pytest
+
+from vpo.config.models import JobsConfig
+from vpo.db.types import JobType, ResourceClass
+from vpo.jobs.resources import classify_job, resource_slots
+
+
+class TestClassifyJob:
+    """Tests for classify_job."""
+
+    @pytest.mark.parametrize(
+        ("job_type", "expected"),
+        [
+            (JobType.TRANSCODE, ResourceClass.CPU),
+            (JobType.MOVE, ResourceClass.IO),
+            (JobType.SCAN, ResourceClass.IO),
+            (JobType.PRUNE, ResourceClass.METADATA),
+        ],
+    )
+    def test_by_job_type(self, make_job, job_type, expected) -> None:
+        assert classify_job(make_job(job_type=job_type)) == expected
+
+    @pytest.mark.parametrize(
+        ("action_types", "requires_remux", "expected"),
+        [
+            (["set_default", "set_title"], False, ResourceClass.METADATA),
+            (["set_default"], True, ResourceClass.IO),
+            (["reorder"], False, ResourceClass.IO),
+            (["reorder", "transcode"], True, ResourceClass.CPU),
+        ],
+    )
+    def test_apply_job_from_plan_actions(
+        self, make_job, action_types, requires_remux, expected
+    ) -> None:
+        job = make_job(
+            job_type=JobType.APPLY,
+            policy_json=json.dumps([{"action_type": a} for a in action_types]),
+        )
+
+        assert classify_job(job, requires_remux=requires_remux) == expected
+
+    @pytest.mark.parametrize(
+        ("policy", "expected"),
+        [
+            ({"phases": [{"name": "a", "transcode": {}}]}, ResourceClass.CPU),
+            ({"phases": [{"transcription": {}}]}, ResourceClass.TRANSCRIPTION),
+            ({"phases": [{"track_order": []}]}, ResourceClass.IO),
+        ],
+    )
+    def test_process_job_from_policy(self, make_job, policy, expected) -> None:
+        job = make_job(job_type=JobType.PROCESS, policy_json=json.dumps(policy))
+
+        assert classify_job(job) == expected
+
+    def test_process_job_without_embedded_policy(self, make_job) -> None:
+        job = make_job(job_type=JobType.PROCESS, policy_json=None)
+
+        assert classify_job(job) == ResourceClass.CPU
+
+
+def test_resource_slots_from_config() -> None:
+    slots = resource_slots(JobsConfig(cpu_slots=2, metadata_slots=0))
+
+    assert slots[ResourceClass.CPU] == 2
+    assert slots[ResourceClass.METADATA] == 0
+    assert slots[ResourceClass.IO] == 2
+
+
+def test_negative_slots_rejected() -> None:
+    with pytest.raises(ValueError, match="cpu_slots"):
+        JobsConfig(cpu_slots=-1)
@@ -13,7 +13,8 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from vpo.db.queries import get_job, insert_job
-from vpo.db.types import JobStatus, JobType
+from vpo.db.types import JobStatus, JobType, ResourceClass
+from vpo.jobs.estimates import DurationEstimator, JobFeatures
 from vpo.jobs.worker import (
     JobWorker,
 )
@@ -799,6 +800,122 @@ class TestRun:
         assert worker._start_time is not None
         assert before <= worker._start_time <= after
 
+    def test_batch_size_leases_and_processes_all_jobs(
+        self, db_conn: sqlite3.Connection, make_job
+    ) -> None:
+        """Processes every job when leasing several per claim."""
+        worker = JobWorker(conn=db_conn, batch_size=2)
+        for i in range(3):
+            insert_job(db_conn, make_job(id=f"test-job-{i}"))
+
+        mock_result = MagicMock()
+        mock_result.success = True
+        mock_result.error_message = None
+        mock_result.output_path = None
+
+        with patch.object(worker._transcode_service, "process") as mock_process:
+            mock_process.return_value = mock_result
+            count = worker.run()
+
+        assert count == 3
+        for i in range(3):
+            assert get_job(db_conn, f"test-job-{i}").status == JobStatus.COMPLETED
+
+    def test_releases_unstarted_leases_on_shutdown(
+        self, db_conn: sqlite3.Connection, make_job
+    ) -> None:
+        """Leased jobs not started before shutdown go back to the queue."""
+        worker = JobWorker(conn=db_conn, batch_size=3)
+        for i in range(3):
+            insert_job(db_conn, make_job(id=f"test-job-{i}"))
+
+        mock_result = MagicMock()
+        mock_result.success = True
+        mock_result.error_message = None
+        mock_result.output_path = None
+
+        def process(*args, **kwargs):
+            worker._shutdown_requested = True
+            return mock_result
+
+        with patch.object(worker._transcode_service, "process", side_effect=process):
+            count = worker.run()
+
+        assert count == 1
+        leased = db_conn.execute(
+            "SELECT COUNT(*) FROM jobs WHERE lease_owner IS NOT NULL"
+        ).fetchone()[0]
+        assert leased == 0
+
+    @pytest.mark.parametrize("batch_size", [1, 2])
+    def test_waits_for_free_slot(
+        self, db_conn: sqlite3.Connection, make_job, batch_size: int
+    ) -> None:
+        """Jobs whose class has no free slot on this host are waited for."""
+        slots = {ResourceClass.CPU: 1}
+        worker = JobWorker(conn=db_conn, batch_size=batch_size, resource_slots=slots)
+        running = make_job(status=JobStatus.RUNNING, resource_class=ResourceClass.CPU)
+        insert_job(db_conn, running)
+        db_conn.execute(
+            "UPDATE jobs SET lease_owner = ? WHERE id = ?",
+            (worker._lease_owner, running.id),
+        )
+        queued = make_job(resource_class=ResourceClass.CPU)
+        insert_job(db_conn, queued)
+        db_conn.commit()
+
+        def finish_running(seconds):
+            db_conn.execute(
+                "UPDATE jobs SET status = 'completed' WHERE id = ?", (running.id,)
+            )
+            db_conn.commit()
+
+        mock_result = MagicMock()
+        mock_result.success = True
+        mock_result.error_message = None
+        mock_result.output_path = None
+
+        with (
+            patch("vpo.jobs.worker.recover_stale_jobs"),
+            patch("vpo.jobs.worker.time.sleep", side_effect=finish_running) as sleep,
+            patch.object(
+                worker._transcode_service, "process", return_value=mock_result
+            ),
+        ):
+            count = worker.run()
+
+        assert count == 1
+        assert sleep.call_count == 1
+        assert get_job(db_conn, queued.id).status == JobStatus.COMPLETED
+
+    @pytest.mark.parametrize("batch_size", [1, 2])
+    def test_skips_jobs_longer_than_window(
+        self, db_conn: sqlite3.Connection, make_job, batch_size: int
+    ) -> None:
+        """With a time window, jobs expected to overrun it stay queued."""
+        estimator = DurationEstimator()
+        for _ in range(3):
+            estimator.add_sample(JobFeatures(job_type=JobType.TRANSCODE), 7200.0)
+            estimator.add_sample(JobFeatures(job_type=JobType.MOVE), 60.0)
+        worker = JobWorker(conn=db_conn, max_duration=3600, batch_size=batch_size)
+        long_job = make_job(job_type=JobType.TRANSCODE, priority=10)
+        short_job = make_job(job_type=JobType.MOVE, priority=50)
+        insert_job(db_conn, long_job)
+        insert_job(db_conn, short_job)
+        db_conn.commit()
+
+        with (
+            patch(
+                "vpo.jobs.worker.DurationEstimator.from_history",
+                return_value=estimator,
+            ),
+            patch.object(worker, "process_job") as mock_process,
+        ):
+            worker.run()
+
+        assert [c.args[0].id for c in mock_process.call_args_list] == [short_job.id]
+        assert get_job(db_conn, long_job.id).status == JobStatus.QUEUED
+
     def test_recovers_stale_jobs(self, db_conn: sqlite3.Connection) -> None:
         """Recovers stale jobs at startup."""
         worker = JobWorker(conn=db_conn)
@@ -184,6 +184,27 @@ class TestWorkerContextFilter:
 
         assert record.worker_tag == "[W07] "
 
+    def test_filter_keeps_forwarded_context(self) -> None:
+        """Records enriched in a worker process keep their context."""
+        filter_ = WorkerContextFilter()
+        record = logging.LogRecord(
+            name="test",
+            level=logging.INFO,
+            pathname="",
+            lineno=0,
+            msg="test message",
+            args=(),
+            exc_info=None,
+        )
+        with worker_context("03", "F007", "/path/to/video.mkv"):
+            filter_.filter(record)
+
+        # Parent-side handler filter runs with no context set
+        filter_.filter(record)
+
+        assert record.worker_id == "03"
+        assert record.worker_tag == "[W03:F007] "
+
     def test_filter_never_removes_records(self) -> None:
         """Test that filter always returns True (never filters out)."""
         filter_ = WorkerContextFilter()
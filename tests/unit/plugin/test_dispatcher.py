@@ -0,0 +1,306 @@
+"""Tests for the concurrent plugin event dispatcher."""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from vpo.config.models import PluginConfig
+from vpo.plugin import dispatcher as dispatcher_module
+from vpo.plugin.dispatcher import (
+    LatencyHistogram,
+    PluginCallStats,
+    PluginEventDispatcher,
+    breaker_state,
+    flush_plugin_stats,
+    load_plugin_stats,
+    reset_dispatch_state,
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_state():
+    reset_dispatch_state()
+    yield
+    reset_dispatch_state()
+
+
+def _plugin(name: str, handler) -> SimpleNamespace:
+    return SimpleNamespace(name=name, instance=SimpleNamespace(on_file_scanned=handler))
+
+
+def _dispatcher(*plugins, **kwargs) -> PluginEventDispatcher:
+    registry = MagicMock()
+    registry.get_by_event.return_value = list(plugins)
+    return PluginEventDispatcher(registry, **kwargs)
+
+
+def _sleeper(seconds: float, value=None):
+    def handler(event):
+        time.sleep(seconds)
+        return value
+
+    return handler
+
+
+class TestDispatch:
+    """Tests for PluginEventDispatcher.dispatch."""
+
+    def test_runs_handlers_concurrently(self):
+        dispatcher = _dispatcher(
+            _plugin("a", _sleeper(0.3, "a")),
+            _plugin("b", _sleeper(0.3, "b")),
+            _plugin("c", _sleeper(0.3, "c")),
+        )
+
+        start = time.monotonic()
+        results = dispatcher.dispatch("file.scanned", "on_file_scanned", object())
+        elapsed = time.monotonic() - start
+
+        assert [r.value for r in results] == ["a", "b", "c"]
+        assert all(r.ok for r in results)
+        assert elapsed < 0.8
+
+    def test_handler_error_is_reported(self):
+        def boom(event):
+            raise RuntimeError("boom")
+
+        dispatcher = _dispatcher(_plugin("bad", boom))
+
+        [result] = dispatcher.dispatch("file.scanned", "on_file_scanned", None)
+
+        assert not result.ok
+        assert result.error == "boom"
+        assert not result.timed_out
+
+    def test_overrunning_handler_times_out(self):
+        dispatcher = _dispatcher(
+            _plugin("fast", _sleeper(0, "ok")), _plugin("slow", _sleeper(1.0))
+        )
+
+        start = time.monotonic()
+        fast, slow = dispatcher.dispatch(
+            "file.scanned", "on_file_scanned", None, timeout=0.1
+        )
+
+        assert time.monotonic() - start < 0.6
+        assert fast.ok
+        assert slow.timed_out
+        assert "timed out" in slow.error
+
+    def test_budget_starts_when_handler_starts(self, monkeypatch):
+        """Calls queued behind busy handlers still get their full budget."""
+        monkeypatch.setattr(
+            dispatcher_module._state, "pool", ThreadPoolExecutor(max_workers=1)
+        )
+        dispatcher = _dispatcher(
+            _plugin("first", _sleeper(0.3, "first")),
+            _plugin("second", _sleeper(0.3, "second")),
+            breaker_threshold=1,
+        )
+
+        first, second = dispatcher.dispatch(
+            "file.scanned", "on_file_scanned", None, timeout=0.5
+        )
+
+        assert first.ok and second.ok
+        assert breaker_state("second") == "closed"
+
+    def test_unstarted_call_is_not_a_failure(self, monkeypatch):
+        """A call cancelled while still queued does not feed the breaker."""
+        monkeypatch.setattr(
+            dispatcher_module._state, "pool", ThreadPoolExecutor(max_workers=1)
+        )
+        queued = MagicMock(return_value="late")
+        dispatcher = _dispatcher(
+            _plugin("busy", _sleeper(0.5)),
+            _plugin("queued", queued),
+            breaker_threshold=1,
+        )
+
+        busy, result = dispatcher.dispatch(
+            "file.scanned", "on_file_scanned", None, timeout=0.1
+        )
+
+        assert busy.timed_out
+        assert result.not_started and not result.timed_out and not result.ok
+        queued.assert_not_called()
+        assert breaker_state("busy") == "open"
+        assert breaker_state("queued") == "closed"
+        stats = load_plugin_stats(Path("/nonexistent/plugin-stats.json"))["queued"]
+        assert stats.skipped == 1
+        assert stats.timeouts == 0
+
+    def test_plugin_without_handler_is_skipped(self):
+        registry = MagicMock()
+        registry.get_by_event.return_value = [
+            SimpleNamespace(name="none", instance=SimpleNamespace())
+        ]
+
+        dispatcher = PluginEventDispatcher(registry)
+
+        assert dispatcher.dispatch("file.scanned", "on_file_scanned", None) == []
+
+
+class TestDispatchFirst:
+    """Tests for PluginEventDispatcher.dispatch_first."""
+
+    def test_stops_at_first_value(self):
+        second = MagicMock(return_value="never")
+        dispatcher = _dispatcher(
+            _plugin("none", _sleeper(0)),
+            _plugin("answer", _sleeper(0, 42)),
+            _plugin("later", second),
+        )
+
+        results = dispatcher.dispatch_first(
+            "file.scanned", "on_file_scanned", None, timeout=None
+        )
+
+        assert [r.plugin_name for r in results] == ["none", "answer"]
+        assert results[-1].value == 42
+        second.assert_not_called()
+
+    def test_inline_without_timeout(self):
+        threads = []
+        dispatcher = _dispatcher(
+            _plugin("a", lambda event: threads.append(threading.current_thread()))
+        )
+
+        dispatcher.dispatch_first("file.scanned", "on_file_scanned", None, timeout=None)
+
+        assert threads == [threading.current_thread()]
+
+
+class TestCircuitBreaker:
+    """Tests for per-plugin circuit breakers."""
+
+    def test_repeated_overruns_trip_breaker(self):
+        slow = MagicMock(side_effect=_sleeper(0.2))
+        dispatcher = _dispatcher(
+            _plugin("slow", slow), breaker_threshold=2, breaker_reset_seconds=60
+        )
+
+        for _ in range(2):
+            dispatcher.dispatch("file.scanned", "on_file_scanned", None, timeout=0.01)
+        results = dispatcher.dispatch("file.scanned", "on_file_scanned", None)
+
+        assert results == []
+        assert slow.call_count == 2
+        assert breaker_state("slow") == "open"
+        stats = load_plugin_stats(Path("/nonexistent/plugin-stats.json"))["slow"]
+        assert stats.timeouts == 2
+        assert stats.skipped == 1
+        assert stats.breaker_trips == 1
+        assert stats.last_tripped_at is not None
+
+    def test_errors_do_not_trip_breaker(self):
+        def boom(event):
+            raise ValueError("bad")
+
+        dispatcher = _dispatcher(_plugin("bad", boom), breaker_threshold=1)
+
+        for _ in range(3):
+            [result] = dispatcher.dispatch("file.scanned", "on_file_scanned", None)
+
+        assert result.error == "bad"
+
+    def test_half_open_trial_closes_breaker(self):
+        durations = iter([0.2, 0.0])
+        dispatcher = _dispatcher(
+            _plugin("p", lambda event: time.sleep(next(durations))),
+            breaker_threshold=1,
+            breaker_reset_seconds=0.05,
+        )
+
+        dispatcher.dispatch("file.scanned", "on_file_scanned", None, timeout=0.01)
+        assert breaker_state("p") == "open"
+        time.sleep(0.3)
+
+        [trial] = dispatcher.dispatch("file.scanned", "on_file_scanned", None)
+
+        assert trial.ok
+        assert breaker_state("p") == "closed"
+
+    def test_zero_threshold_never_trips(self):
+        dispatcher = _dispatcher(_plugin("slow", _sleeper(0.1)), breaker_threshold=0)
+
+        for _ in range(3):
+            [result] = dispatcher.dispatch(
+                "file.scanned", "on_file_scanned", None, timeout=0.01
+            )
+
+        assert result.timed_out
+        assert breaker_state("slow") == "closed"
+
+
+class TestLatencyHistogram:
+    """Tests for LatencyHistogram."""
+
+    def test_empty_quantile_is_none(self):
+        assert LatencyHistogram().quantile(0.5) is None
+
+    def test_quantiles_use_bucket_bounds(self):
+        histogram = LatencyHistogram()
+        for _ in range(90):
+            histogram.observe(0.004)
+        for _ in range(10):
+            histogram.observe(2.0)
+
+        assert histogram.quantile(0.5) == 0.005
+        assert histogram.quantile(0.95) == 2.0
+        assert histogram.max_seconds == 2.0
+
+    def test_overflow_bucket_reports_max(self):
+        histogram = LatencyHistogram()
+        histogram.observe(120.0)
+
+        assert histogram.quantile(0.95) == 120.0
+
+
+class TestStatsFile:
+    """Tests for flushing and loading the shared stats file."""
+
+    def test_flush_merges_into_existing_file(self, tmp_path: Path):
+        path = tmp_path / "plugin-stats.json"
+        dispatcher = _dispatcher(_plugin("p", _sleeper(0, 1)))
+
+        dispatcher.dispatch("file.scanned", "on_file_scanned", None)
+        flush_plugin_stats(path)
+        dispatcher.dispatch("file.scanned", "on_file_scanned", None)
+        flush_plugin_stats(path)
+
+        stats = load_plugin_stats(path)["p"]
+        assert stats.calls == 2
+        assert stats.latency.count == 2
+        assert stats.summary()["p95_seconds"] is not None
+
+    def test_unreadable_file_is_ignored(self, tmp_path: Path):
+        path = tmp_path / "plugin-stats.json"
+        path.write_text("{not json")
+
+        assert load_plugin_stats(path) == {}
+
+    def test_round_trip(self):
+        stats = PluginCallStats(calls=3, errors=1, timeouts=1, breaker_trips=1)
+        stats.latency.observe(0.3)
+
+        restored = PluginCallStats.from_dict(stats.to_dict())
+
+        assert restored == stats
+
+
+class TestPluginConfigValidation:
+    """Validation of the dispatcher settings."""
+
+    def test_rejects_zero_workers(self):
+        with pytest.raises(ValueError, match="event_workers"):
+            PluginConfig(event_workers=0)
+
+    def test_rejects_negative_timeout(self):
+        with pytest.raises(ValueError, match="event_timeout_seconds"):
+            PluginConfig(event_timeout_seconds=-1)
@@ -6,7 +6,7 @@ from unittest.mock import MagicMock, patch
 import pytest
 
 from vpo.config.models import PluginConnectionConfig
-from vpo.plugin.events import FileScannedEvent
+from vpo.plugin.events import FileScannedEvent, FilesScannedEvent
 from vpo.plugin.interfaces import AnalyzerPlugin
 from vpo.plugins.radarr_metadata.client import (
     RadarrAuthError,
@@ -303,6 +303,36 @@ class TestRadarrMetadataPluginOnFileScanned:
         assert result is None
 
 
+class TestRadarrMetadataPluginOnFilesScanned:
+    """Tests for the batched on_files_scanned hook."""
+
+    def test_resolves_batch_from_one_cache(
+        self,
+        plugin: RadarrMetadataPlugin,
+        mock_client: MagicMock,
+        sample_movie: RadarrMovie,
+        tmp_path: Path,
+    ):
+        matched = tmp_path / "movies" / "Test Movie (2023)" / "Test.mkv"
+        mock_client.build_cache.return_value = RadarrCache(
+            movies={123: sample_movie},
+            files={},
+            path_to_movie={str(matched.resolve()): 123},
+        )
+        event = FilesScannedEvent(
+            files=[
+                FileScannedEvent(file_path=path, file_info=MagicMock(), tracks=[])
+                for path in (matched, tmp_path / "unknown.mkv")
+            ]
+        )
+
+        results = plugin.on_files_scanned(event)
+
+        assert results[0]["external_id"] == 123
+        assert results[1] is None
+        mock_client.build_cache.assert_called_once()
+
+
 class TestRadarrMetadataPluginEnrichment:
     """Tests for enrichment data creation."""
 
@@ -1,5 +1,6 @@
 """Unit tests for FFmpeg synthesis executor."""
 
+from dataclasses import replace
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -148,7 +149,7 @@ class TestFFmpegSynthesisExecutor:
         audio_tracks = (sample_track,)
 
         args = executor._build_ffmpeg_args(
-            input_path, sample_operation, output_path, audio_tracks
+            input_path, [(sample_operation, output_path)], audio_tracks
         )
 
         assert "/usr/bin/ffmpeg" in args
@@ -168,13 +169,15 @@ class TestFFmpegSynthesisExecutor:
         audio_tracks = (sample_track,)
 
         args = executor._build_ffmpeg_args(
-            input_path, sample_operation, output_path, audio_tracks
+            input_path, [(sample_operation, output_path)], audio_tracks
         )
 
-        assert "-af" in args
-        # Should have the filter after -af
-        af_idx = args.index("-af")
-        assert "pan=5.1" in args[af_idx + 1]
+        assert "-filter_complex" in args
+        # Should have the filter applied to the source stream
+        graph = args[args.index("-filter_complex") + 1]
+        assert graph.startswith("[0:a:0]pan=5.1")
+        assert graph.endswith("[out0]")
+        assert args[args.index("-map") + 1] == "[out0]"
 
     def test_build_ffmpeg_args_includes_bitrate(
         self,
@@ -189,12 +192,165 @@ class TestFFmpegSynthesisExecutor:
         audio_tracks = (sample_track,)
 
         args = executor._build_ffmpeg_args(
-            input_path, sample_operation, output_path, audio_tracks
+            input_path, [(sample_operation, output_path)], audio_tracks
         )
 
         assert "-b:a" in args
         assert "640000" in args
 
+    def test_build_ffmpeg_args_without_filter_maps_stream(
+        self,
+        sample_operation: SynthesisOperation,
+        sample_track: TrackInfo,
+        tmp_path: Path,
+    ) -> None:
+        """Test that a single unfiltered output maps the source stream directly."""
+        executor = FFmpegSynthesisExecutor(ffmpeg_path=Path("/usr/bin/ffmpeg"))
+        operation = replace(sample_operation, downmix_filter=None)
+
+        args = executor._build_ffmpeg_args(
+            tmp_path / "input.mkv",
+            [(operation, tmp_path / "output.eac3")],
+            (sample_track,),
+        )
+
+        assert "-filter_complex" not in args
+        assert args[args.index("-map") + 1] == "0:a:0"
+
+    def test_build_ffmpeg_args_splits_shared_source(
+        self,
+        sample_operation: SynthesisOperation,
+        sample_track: TrackInfo,
+        tmp_path: Path,
+    ) -> None:
+        """Test that outputs sharing a source track decode it once."""
+        executor = FFmpegSynthesisExecutor(ffmpeg_path=Path("/usr/bin/ffmpeg"))
+        stereo_aac = replace(
+            sample_operation,
+            definition_name="aac_stereo",
+            target_codec=AudioCodec.AAC,
+            target_channels=2,
+            target_bitrate=192000,
+            downmix_filter="pan=stereo|FL=FL|FR=FR",
+        )
+        opus = replace(
+            sample_operation,
+            definition_name="opus",
+            target_codec=AudioCodec.OPUS,
+            downmix_filter=None,
+        )
+        outputs = [
+            (sample_operation, tmp_path / "a.eac3"),
+            (stereo_aac, tmp_path / "b.aac"),
+            (opus, tmp_path / "c.opus"),
+        ]
+
+        args = executor._build_ffmpeg_args(
+            tmp_path / "input.mkv", outputs, (sample_track,)
+        )
+
+        assert args.count("-i") == 1
+        graph = args[args.index("-filter_complex") + 1]
+        assert graph.split(";") == [
+            "[0:a:0]asplit=3[s0_0][s0_1][s0_2]",
+            f"[s0_0]{sample_operation.downmix_filter}[out0]",
+            "[s0_1]pan=stereo|FL=FL|FR=FR[out1]",
+        ]
+        maps = [args[i + 1] for i, arg in enumerate(args) if arg == "-map"]
+        assert maps == ["[out0]", "[out1]", "[s0_2]"]
+        assert args[-1] == str(tmp_path / "c.opus")
+        assert args[-9:-1] == [
+            "-map",
+            "[s0_2]",
+            "-c:a",
+            "libopus",
+            "-b:a",
+            "640000",
+            "-f",
+            "opus",
+        ]
+
+    def test_build_ffmpeg_args_uses_audio_relative_index(
+        self,
+        sample_operation: SynthesisOperation,
+        sample_track: TrackInfo,
+        tmp_path: Path,
+    ) -> None:
+        """Test that each source track is addressed by its audio stream index."""
+        executor = FFmpegSynthesisExecutor(ffmpeg_path=Path("/usr/bin/ffmpeg"))
+        second_track = replace(sample_track, index=3, channels=6)
+        second_source = replace(
+            sample_operation.source_track, track_index=3, track_info=second_track
+        )
+        from_second = replace(
+            sample_operation,
+            definition_name="from_second",
+            source_track=second_source,
+            downmix_filter=None,
+        )
+
+        args = executor._build_ffmpeg_args(
+            tmp_path / "input.mkv",
+            [(sample_operation, tmp_path / "a.eac3"), (from_second, tmp_path / "b")],
+            (sample_track, second_track),
+        )
+
+        graph = args[args.index("-filter_complex") + 1]
+        assert graph.startswith("[0:a:0]pan=5.1")
+        maps = [args[i + 1] for i, arg in enumerate(args) if arg == "-map"]
+        assert maps == ["[out0]", "0:a:1"]
+
+    def test_execute_runs_ffmpeg_once_for_all_operations(
+        self, sample_plan: SynthesisPlan, sample_operation: SynthesisOperation
+    ) -> None:
+        """Test that all synthesized tracks come from a single FFmpeg run."""
+        stereo = replace(
+            sample_operation,
+            definition_name="aac_stereo",
+            target_codec=AudioCodec.AAC,
+            target_channels=2,
+        )
+        plan = replace(sample_plan, operations=(sample_operation, stereo))
+        executor = FFmpegSynthesisExecutor(
+            ffmpeg_path=Path("/usr/bin/ffmpeg"),
+            mkvmerge_path=Path("/usr/bin/mkvmerge"),
+        )
+
+        def fake_run(args, **kwargs):
+            if args[0] == "/usr/bin/ffmpeg":
+                for arg in args:
+                    if arg.startswith(str(plan.file_path.parent)) and "synth_" in arg:
+                        Path(arg).write_bytes(b"audio")
+            else:
+                Path(args[args.index("-o") + 1]).write_bytes(b"merged")
+            return MagicMock(returncode=0, stdout="", stderr="")
+
+        with patch(
+            "vpo.policy.synthesis.executor.subprocess.run", side_effect=fake_run
+        ) as mock_run:
+            result = executor.execute(plan, keep_backup=False)
+
+        assert result.success is True
+        assert result.tracks_created == 2
+        ffmpeg_calls = [
+            c for c in mock_run.call_args_list if c.args[0][0] == "/usr/bin/ffmpeg"
+        ]
+        assert len(ffmpeg_calls) == 1
+        assert plan.file_path.read_bytes() == b"merged"
+
+    def test_execute_reports_every_operation_on_ffmpeg_failure(
+        self, sample_plan: SynthesisPlan
+    ) -> None:
+        """Test that a failed FFmpeg run fails every operation it produces."""
+        executor = FFmpegSynthesisExecutor(ffmpeg_path=Path("/usr/bin/ffmpeg"))
+
+        with patch("vpo.policy.synthesis.executor.subprocess.run") as mock_run:
+            mock_run.return_value = MagicMock(returncode=1, stdout="", stderr="boom")
+            result = executor.execute(sample_plan)
+
+        assert result.success is False
+        assert result.errors == ["Failed to transcode 'eac3_51'"]
+
     def test_build_mkvmerge_args_includes_original(
         self, sample_operation: SynthesisOperation, tmp_path: Path
     ) -> None:
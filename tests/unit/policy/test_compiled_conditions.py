@@ -0,0 +1,264 @@
+"""Tests for compiled condition evaluation.
+
+Compiled conditions must produce exactly the same (result, reason) pairs
+as the interpreted evaluate_condition() for the same inputs.
+"""
+
+from pathlib import Path
+
+import pytest
+
+from vpo.db import TrackInfo
+from vpo.policy.compiled import (
+    ConditionContext,
+    clear_compiled_caches,
+    compile_condition,
+    compile_track_filters,
+    get_compiled_rules,
+    load_compiled_policy,
+)
+from vpo.policy.conditions import evaluate_condition, matches_track
+from vpo.policy.types import (
+    AndCondition,
+    Comparison,
+    ComparisonOperator,
+    ConditionalRule,
+    ContainerMetadataCondition,
+    CountCondition,
+    ExistsCondition,
+    MatchMode,
+    MetadataComparisonOperator,
+    NotCondition,
+    OrCondition,
+    PluginMetadataCondition,
+    RulesConfig,
+    TitleMatch,
+    TrackFilters,
+)
+
+POLICY_YAML = """\
+schema_version: 13
+config:
+  audio_languages: [eng]
+phases:
+  - name: apply
+    rules:
+      match: first
+      items:
+        - name: has-japanese
+          when:
+            exists:
+              track_type: audio
+              language: jpn
+          then:
+            - warn: "Japanese audio"
+"""
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches():
+    clear_compiled_caches()
+    yield
+    clear_compiled_caches()
+
+
+@pytest.fixture
+def tracks() -> list[TrackInfo]:
+    """A typical movie: video, two audio tracks and a commentary."""
+    return [
+        TrackInfo(
+            index=0,
+            track_type="video",
+            codec="hevc",
+            width=3840,
+            height=2160,
+            is_default=True,
+        ),
+        TrackInfo(
+            index=1,
+            track_type="audio",
+            codec="truehd",
+            language="en",
+            title="English Atmos",
+            channels=8,
+            is_default=True,
+        ),
+        TrackInfo(
+            index=2,
+            track_type="Audio",
+            codec="AAC",
+            language="jpn",
+            title="Japanese",
+            channels=2,
+        ),
+        TrackInfo(
+            index=3,
+            track_type="audio",
+            codec="ac3",
+            language="eng",
+            title="Director's Commentary",
+            channels=2,
+        ),
+        TrackInfo(
+            index=4,
+            track_type="subtitle",
+            codec="subrip",
+            language="ger",
+            is_forced=True,
+        ),
+    ]
+
+
+CONDITIONS = [
+    ExistsCondition(track_type="video"),
+    ExistsCondition(track_type="audio", filters=TrackFilters(language="eng")),
+    ExistsCondition(track_type="audio", filters=TrackFilters(language=("fr", "ja"))),
+    ExistsCondition(track_type="audio", filters=TrackFilters(codec=("aac", "dts"))),
+    ExistsCondition(track_type="subtitle", filters=TrackFilters(language="de")),
+    ExistsCondition(track_type="subtitle", filters=TrackFilters(is_forced=False)),
+    ExistsCondition(
+        track_type="video",
+        filters=TrackFilters(
+            height=Comparison(operator=ComparisonOperator.GTE, value=2160)
+        ),
+    ),
+    ExistsCondition(track_type="video", filters=TrackFilters(width=1920)),
+    ExistsCondition(track_type="audio", filters=TrackFilters(title="atmos")),
+    ExistsCondition(
+        track_type="audio",
+        filters=TrackFilters(title=TitleMatch(regex=r"^director")),
+    ),
+    ExistsCondition(
+        track_type="audio",
+        filters=TrackFilters(title=TitleMatch(contains="JAPAN")),
+    ),
+    CountCondition(
+        track_type="audio",
+        filters=TrackFilters(not_commentary=True),
+        operator=ComparisonOperator.EQ,
+        value=2,
+    ),
+    CountCondition(
+        track_type="audio",
+        filters=TrackFilters(channels=Comparison(ComparisonOperator.LT, 6)),
+        operator=ComparisonOperator.GT,
+        value=1,
+    ),
+    AndCondition(
+        conditions=(
+            ExistsCondition(track_type="video"),
+            ExistsCondition(track_type="audio", filters=TrackFilters(codec="dts")),
+        )
+    ),
+    OrCondition(
+        conditions=(
+            ExistsCondition(track_type="audio", filters=TrackFilters(codec="dts")),
+            ExistsCondition(track_type="audio", filters=TrackFilters(codec="ac3")),
+        )
+    ),
+    NotCondition(inner=ExistsCondition(track_type="attachment")),
+    PluginMetadataCondition(plugin="radarr", field="original_language", value="JPN"),
+    PluginMetadataCondition(plugin="Radarr", field="Year", value=2000),
+    PluginMetadataCondition(
+        plugin="radarr",
+        field="year",
+        value=2000,
+        operator=MetadataComparisonOperator.GT,
+    ),
+    PluginMetadataCondition(plugin="sonarr", field="tvdb_id", value=1),
+    ContainerMetadataCondition(field="encoder", value="libx265"),
+]
+
+
+class TestCompiledEquivalence:
+    """Compiled conditions agree with the interpreter."""
+
+    @pytest.mark.parametrize("condition", CONDITIONS)
+    @pytest.mark.parametrize(
+        "plugin_metadata",
+        [
+            None,
+            {"radarr": {"original_language": "jpn", "year": 2010}},
+            {"Radarr": {"Original_Language": "eng", "YEAR": 1990}},
+        ],
+    )
+    def test_matches_evaluate_condition(
+        self, condition, plugin_metadata, tracks: list[TrackInfo]
+    ) -> None:
+        container_tags = {"encoder": "libx265"}
+        expected = evaluate_condition(
+            condition,
+            tracks,
+            plugin_metadata=plugin_metadata,
+            container_tags=container_tags,
+        )
+        ctx = ConditionContext(
+            tracks, plugin_metadata=plugin_metadata, container_tags=container_tags
+        )
+        assert compile_condition(condition)(ctx) == expected
+
+    @pytest.mark.parametrize(
+        "filters",
+        [
+            TrackFilters(),
+            TrackFilters(language="de"),
+            TrackFilters(codec="SUBRIP", is_forced=True),
+            TrackFilters(not_commentary=True),
+            TrackFilters(channels=2, title="japanese"),
+        ],
+    )
+    def test_track_filters_match_matches_track(
+        self, filters: TrackFilters, tracks: list[TrackInfo]
+    ) -> None:
+        predicate = compile_track_filters(filters)
+        for track in tracks:
+            assert predicate(track) == matches_track(track, filters)
+
+    def test_missing_language_never_matches(self) -> None:
+        track = TrackInfo(index=0, track_type="audio", language=None)
+        predicate = compile_track_filters(TrackFilters(language="und"))
+        assert predicate(track) is False
+
+
+class TestCompiledCaches:
+    """Compiled rules and policies are cached."""
+
+    def test_rules_compiled_once_per_instance(self) -> None:
+        rules = RulesConfig(
+            match=MatchMode.FIRST,
+            items=(
+                ConditionalRule(
+                    name="r", when=ExistsCondition(track_type="video"), then_actions=()
+                ),
+            ),
+        )
+        first = get_compiled_rules(rules)
+        assert get_compiled_rules(rules) is first
+        assert len(first.conditions) == 1
+
+    def test_policy_cached_by_content_hash(self, tmp_path: Path) -> None:
+        policy_path = tmp_path / "policy.yaml"
+        policy_path.write_text(POLICY_YAML)
+
+        first = load_compiled_policy(policy_path)
+        assert load_compiled_policy(policy_path) is first
+        assert "apply" in first.rules_by_phase
+
+        # A copy with identical content shares the compiled policy
+        copy_path = tmp_path / "copy.yaml"
+        copy_path.write_text(POLICY_YAML)
+        assert load_compiled_policy(copy_path) is first
+
+    def test_policy_change_invalidates_cache(self, tmp_path: Path) -> None:
+        policy_path = tmp_path / "policy.yaml"
+        policy_path.write_text(POLICY_YAML)
+        first = load_compiled_policy(policy_path)
+
+        policy_path.write_text(POLICY_YAML.replace("language: jpn", "language: fre"))
+        second = load_compiled_policy(policy_path)
+        assert second is not first
+        assert second.content_hash != first.content_hash
+
+    def test_missing_policy_raises(self, tmp_path: Path) -> None:
+        with pytest.raises(FileNotFoundError):
+            load_compiled_policy(tmp_path / "missing.yaml")
@@ -9,10 +9,14 @@ import pytest
 from vpo.reports.formatters import (
     ReportFormat,
     _atomic_write_text,
+    buffer_chunks,
     calculate_duration_seconds,
     format_duration,
     format_size_change,
     format_timestamp_local,
+    iter_json_array,
+    iter_ndjson,
+    iter_report,
     render_csv,
     render_json,
     render_text_table,
@@ -23,6 +27,10 @@ from vpo.reports.formatters import (
 class TestReportFormat:
     """Tests for ReportFormat enum."""
 
+    def test_ndjson_format(self):
+        """ReportFormat.NDJSON has correct value."""
+        assert ReportFormat.NDJSON.value == "ndjson"
+
     def test_text_format(self):
         """ReportFormat.TEXT has correct value."""
         assert ReportFormat.TEXT.value == "text"
@@ -276,6 +284,66 @@ class TestRenderJson:
         assert "\n" in result
 
 
+class TestStreamingFormatters:
+    """Tests for the incremental formatters."""
+
+    ROWS = [
+        {"name": "Test", "value": 123, "note": "a\nb"},
+        {"name": None, "value": True, "note": "-"},
+    ]
+    COLUMNS = [("NAME", "name", 10), ("VALUE", "value", 8)]
+
+    @pytest.mark.parametrize("rows", [[], ROWS[:1], ROWS])
+    def test_json_array_matches_render_json(self, rows):
+        """Streamed JSON array is identical to render_json output."""
+        assert "".join(iter_json_array(iter(rows))) == render_json(rows)
+
+    def test_csv_matches_render_csv(self):
+        """Streamed CSV is identical to render_csv output."""
+        streamed = "".join(iter_report(iter(self.ROWS), ReportFormat.CSV, self.COLUMNS))
+
+        assert streamed == render_csv(self.ROWS, ["name", "value"])
+
+    def test_text_yields_nothing_for_no_rows(self):
+        """Text rendering of an empty iterable is empty."""
+        assert list(iter_report(iter([]), ReportFormat.TEXT, self.COLUMNS)) == []
+
+    def test_ndjson_one_object_per_line(self):
+        """NDJSON writes one compact, key-sorted object per line."""
+        lines = list(iter_ndjson(iter(self.ROWS)))
+
+        assert lines[0] == '{"name": "Test", "note": "a\\nb", "value": 123}\n'
+        assert [json.loads(line) for line in lines] == self.ROWS
+
+    def test_rows_are_consumed_lazily(self):
+        """Rows are pulled from the iterable only as output is produced."""
+        pulled = []
+
+        def rows():
+            for row in self.ROWS:
+                pulled.append(row)
+                yield row
+
+        pieces = iter_ndjson(rows())
+        next(pieces)
+
+        assert len(pulled) == 1
+
+    def test_buffer_chunks_joins_small_pieces(self):
+        """Small pieces are joined into chunks of at least chunk_size."""
+        chunks = list(buffer_chunks(["ab", "cd", "ef", "g"], chunk_size=4))
+
+        assert chunks == ["abcd", "efg"]
+
+    def test_write_report_streams_chunks(self, tmp_path: Path):
+        """write_report_to_file accepts an iterable of chunks."""
+        path = tmp_path / "report.ndjson"
+
+        write_report_to_file(iter_ndjson(iter(self.ROWS)), path)
+
+        assert path.read_text().count("\n") == 2
+
+
 class TestWriteReportToFile:
     """Tests for write_report_to_file function."""
 
@@ -13,12 +13,15 @@ from vpo.reports.queries import (
     JobReportRow,
     LibraryReportRow,
     extract_scan_summary,
+    get_io_wait_report,
     get_jobs_report,
     get_library_report,
     get_policy_apply_report,
     get_resolution_category,
     get_scans_report,
     get_transcodes_report,
+    iter_jobs_report,
+    iter_scans_report,
 )
 
 
@@ -459,6 +462,59 @@ class TestGetScansReport:
         assert result[0]["files_changed"] == 5
 
 
+class TestStreamingReports:
+    """Tests for the iter_*_report generators."""
+
+    def _insert_scans(self, conn, count: int) -> None:
+        conn.executemany(
+            """
+            INSERT INTO jobs (id, job_type, status, created_at, summary_json)
+            VALUES (?, 'scan', 'completed', ?, '{}')
+            """,
+            [
+                (f"scan-{i:04d}", f"2025-01-15T12:{i % 60:02d}:00Z")
+                for i in range(count)
+            ],
+        )
+
+    def test_matches_list_report(self, test_db):
+        """Streamed rows equal the list-returning report."""
+        self._insert_scans(test_db, 7)
+
+        streamed = list(iter_scans_report(test_db, limit=None, fetch_size=2))
+
+        assert streamed == get_scans_report(test_db, limit=None)
+        assert len(streamed) == 7
+
+    def test_fetches_in_batches(self, test_db):
+        """Rows are fetched from the cursor fetch_size at a time."""
+        self._insert_scans(test_db, 5)
+        fetched = []
+        original = sqlite3.Cursor.fetchmany
+
+        class Cursor(sqlite3.Cursor):
+            def fetchmany(self, size=1):
+                rows = original(self, size)
+                fetched.append(len(rows))
+                return rows
+
+        class Conn:
+            def execute(self, query, params):
+                return test_db.cursor(Cursor).execute(query, params)
+
+        rows = iter_scans_report(Conn(), limit=None, fetch_size=2)
+        next(rows)
+        assert fetched == [2]
+
+        assert len(list(rows)) == 4
+        assert fetched == [2, 2, 1, 0]
+
+    def test_validates_limit_on_call(self, test_db):
+        """Invalid limits are rejected before any row is consumed."""
+        with pytest.raises(ValueError, match="non-negative"):
+            iter_jobs_report(test_db, limit=-1)
+
+
 class TestGetTranscodesReport:
     """Tests for get_transcodes_report function."""
 
@@ -869,3 +925,61 @@ class TestForeignKeysEnabled:
         """Verify foreign keys are enabled in test database."""
         cursor = test_db.execute("PRAGMA foreign_keys")
         assert cursor.fetchone()[0] == 1
+
+
+class TestGetIOWaitReport:
+    """Tests for get_io_wait_report."""
+
+    @pytest.fixture
+    def stats_db(self):
+        from vpo.db.schema import create_schema
+
+        conn = sqlite3.connect(":memory:")
+        create_schema(conn)
+        conn.execute(
+            "INSERT INTO files (id, path, filename, directory, extension, "
+            "size_bytes, modified_at, scanned_at, scan_status) VALUES "
+            "(1, '/m/a.mkv', 'a.mkv', '/m', '.mkv', 1, 'x', 'x', 'ok')"
+        )
+        for stats_id, processed_at, devices in [
+            ("s1", "2024-01-01T00:00:00+00:00", {"8:16": 30.0, "8:32": 1.0}),
+            ("s2", "2024-01-02T00:00:00+00:00", {"8:16": 90.0}),
+            ("s3", "2024-01-03T00:00:00+00:00", None),
+        ]:
+            conn.execute(
+                "INSERT INTO processing_stats (id, file_id, processed_at, "
+                "policy_name, size_before, size_after, size_change, "
+                "duration_seconds, phases_completed, phases_total, "
+                "total_changes, success) "
+                "VALUES (?, 1, ?, 'p', 1, 1, 0, 1.0, 1, 1, 0, 1)",
+                (stats_id, processed_at),
+            )
+            conn.execute(
+                "INSERT INTO performance_metrics (stats_id, phase_name, "
+                "wall_time_seconds, io_wait_seconds, io_wait_devices) "
+                "VALUES (?, 'apply', 1.0, ?, ?)",
+                (
+                    stats_id,
+                    sum(devices.values()) if devices else None,
+                    json.dumps(devices) if devices else None,
+                ),
+            )
+        conn.commit()
+        yield conn
+        conn.close()
+
+    def test_aggregates_per_device(self, stats_db):
+        rows = get_io_wait_report(stats_db)
+
+        assert [r["device"] for r in rows] == ["8:16", "8:32"]
+        assert rows[0]["phases"] == 2
+        assert rows[0]["total_wait"] == "2m 0s"
+        assert rows[0]["max_wait"] == "1m 30s"
+
+    def test_time_filter(self, stats_db):
+        time_filter = TimeFilter(since=datetime(2024, 1, 2, tzinfo=timezone.utc))
+
+        rows = get_io_wait_report(stats_db, time_filter=time_filter)
+
+        assert len(rows) == 1
+        assert rows[0]["total_wait"] == "1m 30s"
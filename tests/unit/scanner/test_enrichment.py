@@ -0,0 +1,221 @@
+"""Tests for the file.scanned enrichment stage."""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from vpo.plugin.dispatcher import (
+    PluginEventDispatcher,
+    breaker_state,
+    reset_dispatch_state,
+)
+from vpo.plugin.events import FileScannedEvent
+from vpo.scanner.enrichment import EnrichmentStage, metadata_key
+from vpo.scanner.orchestrator import ScannerOrchestrator
+
+
+@pytest.fixture(autouse=True)
+def _reset_dispatch_state():
+    reset_dispatch_state()
+    yield
+    reset_dispatch_state()
+
+
+class BatchPlugin:
+    """Plugin implementing the batched hook."""
+
+    name = "batch"
+
+    def __init__(self) -> None:
+        self.batch_sizes: list[int] = []
+        self.on_file_scanned = MagicMock()
+
+    def on_files_scanned(self, event):
+        self.batch_sizes.append(len(event.files))
+        return [{"stem": f.file_path.stem} for f in event.files]
+
+
+class PerFilePlugin:
+    """Plugin implementing only the per-file hook."""
+
+    name = "per-file-metadata"
+
+    def on_file_scanned(self, event):
+        return {"external_source": "perfile", "name": event.file_path.name}
+
+
+def _registry(*instances) -> MagicMock:
+    registry = MagicMock()
+    registry.get_by_event.return_value = [
+        SimpleNamespace(name=instance.name, instance=instance) for instance in instances
+    ]
+    return registry
+
+
+def _stage(*instances, **kwargs) -> EnrichmentStage:
+    return EnrichmentStage(PluginEventDispatcher(_registry(*instances)), **kwargs)
+
+
+def _event(path: str) -> FileScannedEvent:
+    return FileScannedEvent(file_path=Path(path), file_info=MagicMock(), tracks=[])
+
+
+class TestMetadataKey:
+    """Tests for metadata_key."""
+
+    def test_prefers_external_source(self):
+        assert metadata_key("radarr-metadata", {"external_source": "radarr"}) == (
+            "radarr"
+        )
+
+    def test_falls_back_to_plugin_name(self):
+        assert metadata_key("my-plugin", {"field": 1}) == "my-plugin"
+
+
+class TestEnrichmentStage:
+    """Tests for EnrichmentStage."""
+
+    def test_from_registry_without_subscribers(self):
+        assert EnrichmentStage.from_registry(_registry()) is None
+
+    def test_batches_and_falls_back_per_file(self):
+        batch = BatchPlugin()
+        stage = _stage(batch, PerFilePlugin(), batch_size=3, linger_seconds=0.2)
+
+        stage.start()
+        for file_id in range(1, 6):
+            stage.submit(file_id, _event(f"/m/{file_id}.mkv"))
+        enrichments = stage.finish()
+
+        assert batch.batch_sizes == [3, 2]
+        batch.on_file_scanned.assert_not_called()
+        assert enrichments[4] == {
+            "batch": {"stem": "4"},
+            "perfile": {"external_source": "perfile", "name": "4.mkv"},
+        }
+        assert sorted(enrichments) == [1, 2, 3, 4, 5]
+
+    def test_mismatched_batch_result_is_ignored(self):
+        batch = BatchPlugin()
+        batch.on_files_scanned = lambda event: [{"only": "one"}]
+        stage = _stage(batch, linger_seconds=0.1)
+
+        stage.start()
+        stage.submit(1, _event("/m/a.mkv"))
+        stage.submit(2, _event("/m/b.mkv"))
+
+        assert stage.finish() == {}
+
+    def test_batch_budget_scales_with_size(self):
+        batch = BatchPlugin()
+        handler = batch.on_files_scanned
+
+        def slow(event):
+            time.sleep(0.2)
+            return handler(event)
+
+        batch.on_files_scanned = slow
+        dispatcher = PluginEventDispatcher(_registry(batch), timeout_seconds=0.1)
+        stage = EnrichmentStage(dispatcher, batch_size=4, linger_seconds=0.2)
+
+        with patch("vpo.scanner.enrichment.FILES_PER_TIMEOUT", 1):
+            stage.start()
+            for file_id in range(1, 5):
+                stage.submit(file_id, _event(f"/m/{file_id}.mkv"))
+            enrichments = stage.finish()
+
+        assert sorted(enrichments) == [1, 2, 3, 4]
+
+    def test_slow_batches_do_not_trip_breaker(self):
+        batch = BatchPlugin()
+        batch.on_files_scanned = lambda event: time.sleep(0.1)
+        dispatcher = PluginEventDispatcher(
+            _registry(batch), timeout_seconds=0.01, breaker_threshold=1
+        )
+        stage = EnrichmentStage(dispatcher, batch_size=1, linger_seconds=0.05)
+
+        stage.start()
+        stage.submit(1, _event("/m/a.mkv"))
+        stage.submit(2, _event("/m/b.mkv"))
+        stage.finish()
+
+        assert stage.batches == 2
+        assert breaker_state("batch") == "closed"
+
+    def test_cancel_drops_queued_files(self):
+        plugin = PerFilePlugin()
+        stage = _stage(plugin)
+
+        stage.submit(1, _event("/m/a.mkv"))
+        stage.start()
+
+        assert stage.finish(cancel=True) == {}
+
+
+class TestScanAndPersistEnrichment:
+    """Enrichment results are written by scan_and_persist."""
+
+    @patch("vpo.scanner.orchestrator.discover_videos")
+    def test_writes_plugin_metadata(
+        self,
+        mock_discover: MagicMock,
+        db_conn: sqlite3.Connection,
+        mock_introspector,
+        mock_discovered_files,
+        tmp_path: Path,
+    ):
+        mock_discover.return_value = mock_discovered_files(5)
+        stage = _stage(BatchPlugin(), PerFilePlugin(), linger_seconds=0.05)
+
+        _, result = ScannerOrchestrator().scan_and_persist(
+            [tmp_path],
+            db_conn,
+            introspector=mock_introspector,
+            compute_hashes=False,
+            batch_commit_size=2,
+            enrichment=stage,
+        )
+
+        assert result.files_enriched == 5
+        row = db_conn.execute(
+            "SELECT plugin_metadata FROM files WHERE path = ?",
+            ("/media/video3.mkv",),
+        ).fetchone()
+        assert json.loads(row[0]) == {
+            "batch": {"stem": "video3"},
+            "perfile": {"external_source": "perfile", "name": "video3.mkv"},
+        }
+        values = db_conn.execute(
+            "SELECT COUNT(*) FROM plugin_metadata_values WHERE plugin = 'perfile'"
+        ).fetchone()[0]
+        assert values == 10
+
+    @patch("vpo.scanner.orchestrator.discover_videos")
+    def test_failed_introspection_is_not_enriched(
+        self,
+        mock_discover: MagicMock,
+        db_conn: sqlite3.Connection,
+        mock_introspector_error,
+        mock_discovered_files,
+        tmp_path: Path,
+    ):
+        mock_discover.return_value = mock_discovered_files(2)
+        stage = _stage(PerFilePlugin(), linger_seconds=0.05)
+
+        _, result = ScannerOrchestrator().scan_and_persist(
+            [tmp_path],
+            db_conn,
+            introspector=mock_introspector_error,
+            compute_hashes=False,
+            enrichment=stage,
+        )
+
+        assert result.files_enriched == 0
+        assert stage.files_submitted == 0
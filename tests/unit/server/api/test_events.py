@@ -187,3 +187,68 @@ class TestTemplateXSSEscaping:
             r'class="policy-description"[^>]*title="[^"]*\|e[^"]*"', content
         )
         assert match is not None, "policy-description title should use |e filter"
+
+
+class TestJobLogFollow:
+    """Tests for the job log follow stream."""
+
+    @pytest.mark.asyncio
+    async def test_streams_backlog_then_appended_lines(self, tmp_path) -> None:
+        """Sends the requested backlog, then only newly appended lines."""
+        from unittest.mock import patch
+
+        from aiohttp import web
+        from aiohttp.test_utils import TestClient, TestServer
+
+        from vpo.server.api.events import sse_job_logs_handler
+
+        job_id = "12345678-1234-1234-1234-123456789abc"
+        log_file = tmp_path / f"{job_id}.log"
+        log_file.write_text("1\n2\n3\n")
+
+        app = web.Application()
+        app["_sse_connections"] = {"count": 0}
+        app.router.add_get("/events/jobs/{job_id}/logs", sse_job_logs_handler)
+
+        async def next_event(resp) -> tuple[str, str]:
+            event = await resp.content.readline()
+            data = await resp.content.readline()
+            await resp.content.readline()
+            return event.decode().strip(), data.decode().strip()
+
+        with (
+            patch("vpo.jobs.logs.get_log_directory", return_value=tmp_path),
+            patch("vpo.server.api.events.SSE_LOG_POLL_INTERVAL", 0.05),
+        ):
+            async with TestClient(TestServer(app)) as client:
+                resp = await client.get(f"/events/jobs/{job_id}/logs?lines=2")
+                assert resp.status == 200
+
+                event, data = await next_event(resp)
+                assert event == "event: log_lines"
+                assert data == 'data: {"lines": ["2", "3"], "position": 6}'
+
+                with log_file.open("a") as f:
+                    f.write("4\n")
+                event, data = await next_event(resp)
+                assert data == 'data: {"lines": ["4"], "position": 8}'
+                resp.close()
+
+    @pytest.mark.asyncio
+    async def test_rejects_invalid_job_id(self) -> None:
+        """Invalid job IDs are rejected before streaming starts."""
+        from aiohttp import web
+        from aiohttp.test_utils import make_mocked_request
+
+        from vpo.server.api.events import sse_job_logs_handler
+
+        request = make_mocked_request(
+            "GET",
+            "/events/jobs/bad/logs",
+            match_info={"job_id": "bad"},
+            app=web.Application(),
+        )
+
+        response = await sse_job_logs_handler(request)
+
+        assert response.status == 400
@@ -0,0 +1,109 @@
+"""Unit tests for server/api/reports.py."""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+
+from vpo.db.connection import DaemonConnectionPool
+from vpo.db.schema import create_schema
+from vpo.server.api.reports import get_report_routes
+
+
+@pytest.fixture
+def pool(tmp_path: Path):
+    """Connection pool over a database with a few scan jobs."""
+    pool = DaemonConnectionPool(tmp_path / "library.db")
+    with pool.transaction() as conn:
+        create_schema(conn)
+        conn.executemany(
+            """
+            INSERT INTO jobs (id, job_type, status, priority, created_at,
+                              file_path, summary_json)
+            VALUES (?, 'scan', 'completed', 100, ?, '/media', ?)
+            """,
+            [
+                (
+                    f"scan-{i:04d}",
+                    f"2025-01-15T12:{i:02d}:00+00:00",
+                    json.dumps({"files_scanned": i}),
+                )
+                for i in range(30)
+            ],
+        )
+    yield pool
+    pool.close()
+
+
+def _app(pool: DaemonConnectionPool) -> web.Application:
+    app = web.Application()
+    app["connection_pool"] = pool
+    for method, suffix, handler in get_report_routes():
+        app.router.add_route(method, f"/api{suffix}", handler)
+    return app
+
+
+class TestReportDownload:
+    """Tests for GET /api/reports/{name}."""
+
+    @pytest.mark.asyncio
+    async def test_streams_ndjson_attachment(self, pool) -> None:
+        """Default format is chunked NDJSON with one row per line."""
+        async with TestClient(TestServer(_app(pool))) as client:
+            resp = await client.get("/api/reports/scans")
+            body = await resp.text()
+
+        assert resp.status == 200
+        assert resp.headers["Transfer-Encoding"] == "chunked"
+        assert resp.headers["Content-Type"].startswith("application/x-ndjson")
+        assert 'filename="vpo-scans.ndjson"' in resp.headers["Content-Disposition"]
+        rows = [json.loads(line) for line in body.splitlines()]
+        assert len(rows) == 30
+        assert rows[0]["files_scanned"] == 29
+
+    @pytest.mark.asyncio
+    async def test_json_array_with_limit(self, pool) -> None:
+        """format=json streams a valid JSON array honouring limit."""
+        async with TestClient(TestServer(_app(pool))) as client:
+            resp = await client.get("/api/reports/scans?format=json&limit=5")
+            rows = json.loads(await resp.text())
+
+        assert [row["files_scanned"] for row in rows] == [29, 28, 27, 26, 25]
+
+    @pytest.mark.asyncio
+    async def test_csv_with_filters(self, pool) -> None:
+        """Report filters are applied and CSV uses the report columns."""
+        async with TestClient(TestServer(_app(pool))) as client:
+            resp = await client.get(
+                "/api/reports/jobs?format=csv&type=scan&status=failed"
+            )
+            body = await resp.text()
+
+        assert body.splitlines() == [
+            "job_id,type,status,target,started_at,completed_at,duration,error"
+        ]
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        ("path", "status"),
+        [
+            ("/api/reports/unknown", 404),
+            ("/api/reports/scans?format=xml", 400),
+            ("/api/reports/scans?limit=0", 400),
+            ("/api/reports/scans?since=yesterday", 400),
+            ("/api/reports/scans?codec=hevc", 400),
+            ("/api/reports/library?has_subtitles=maybe", 400),
+        ],
+    )
+    async def test_rejects_invalid_requests(self, pool, path, status) -> None:
+        """Invalid reports and parameters fail before streaming starts."""
+        async with TestClient(TestServer(_app(pool))) as client:
+            resp = await client.get(path)
+            payload = await resp.json()
+
+        assert resp.status == status
+        assert "error" in payload
@@ -0,0 +1,176 @@
+"""Unit tests for server/api/broker.py."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+
+from vpo.db import JobStatus, JobType, get_job
+from vpo.db.connection import DaemonConnectionPool
+from vpo.db.queries import insert_job
+from vpo.db.schema import create_schema
+from vpo.jobs.broker import WORKER_HEADER
+from vpo.server.api.broker import get_broker_routes
+
+WORKER = {WORKER_HEADER: "host-b:42"}
+OTHER_WORKER = {WORKER_HEADER: "host-c:7"}
+
+
+@pytest.fixture
+def pool(tmp_path: Path, monkeypatch):
+    """Connection pool over an empty library database."""
+    monkeypatch.setenv("VPO_DATA_DIR", str(tmp_path))
+    pool = DaemonConnectionPool(tmp_path / "library.db")
+    create_schema(pool.get_connection())
+    yield pool
+    pool.close()
+
+
+def _app(pool: DaemonConnectionPool) -> web.Application:
+    app = web.Application()
+    app["connection_pool"] = pool
+    for method, suffix, handler in get_broker_routes():
+        app.router.add_route(method, f"/api{suffix}", handler)
+    return app
+
+
+def _add_job(pool: DaemonConnectionPool, make_job, **kwargs):
+    job = make_job(**kwargs)
+    with pool.transaction() as conn:
+        insert_job(conn, job)
+    return job
+
+
+def _get_job(pool: DaemonConnectionPool, job_id: str):
+    with pool.read() as conn:
+        return get_job(conn, job_id)
+
+
+class TestClaim:
+    """Tests for POST /api/broker/claim."""
+
+    @pytest.mark.asyncio
+    async def test_claims_transcode_job(self, pool, make_job) -> None:
+        _add_job(pool, make_job, job_type=JobType.MOVE, priority=1)
+        job = _add_job(pool, make_job, job_type=JobType.TRANSCODE)
+        async with TestClient(TestServer(_app(pool))) as client:
+            resp = await client.post("/api/broker/claim", json={}, headers=WORKER)
+            data = await resp.json()
+
+        assert resp.status == 200
+        assert data["job"]["id"] == job.id
+        assert data["job"]["status"] == "running"
+        assert data["duration_seconds"] is None
+        with pool.read() as conn:
+            owner = conn.execute(
+                "SELECT lease_owner FROM jobs WHERE id = ?", (job.id,)
+            ).fetchone()[0]
+        assert owner == "host-b:42"
+
+    @pytest.mark.asyncio
+    async def test_empty_queue_returns_null(self, pool) -> None:
+        async with TestClient(TestServer(_app(pool))) as client:
+            resp = await client.post("/api/broker/claim", headers=WORKER)
+
+            assert resp.status == 200
+            assert (await resp.json())["job"] is None
+
+    @pytest.mark.asyncio
+    async def test_rejects_local_only_job_types(self, pool) -> None:
+        async with TestClient(TestServer(_app(pool))) as client:
+            resp = await client.post(
+                "/api/broker/claim", json={"job_types": ["process"]}, headers=WORKER
+            )
+
+            assert resp.status == 400
+
+    @pytest.mark.asyncio
+    async def test_requires_worker_header(self, pool) -> None:
+        async with TestClient(TestServer(_app(pool))) as client:
+            missing = await client.post("/api/broker/claim")
+            invalid = await client.post(
+                "/api/broker/claim", headers={WORKER_HEADER: "bad id/.."}
+            )
+
+            assert missing.status == 400
+            assert invalid.status == 400
+
+
+class TestLeasedJob:
+    """Tests for the per-job endpoints, which require the worker's lease."""
+
+    @pytest.mark.asyncio
+    async def test_progress_log_and_complete(self, pool, make_job, tmp_path) -> None:
+        job = _add_job(pool, make_job)
+        async with TestClient(TestServer(_app(pool))) as client:
+            await client.post("/api/broker/claim", headers=WORKER)
+            base = f"/api/broker/jobs/{job.id}"
+
+            heartbeat = await client.post(f"{base}/heartbeat", headers=WORKER)
+            progress = await client.post(
+                f"{base}/progress", json={"percent": 42.5}, headers=WORKER
+            )
+            running = _get_job(pool, job.id)
+            log = await client.put(f"{base}/log", data=b"line 1\n", headers=WORKER)
+            complete = await client.post(
+                f"{base}/complete",
+                json={"status": "completed", "output_path": "/media/out.mkv"},
+                headers=WORKER,
+            )
+
+        assert [r.status for r in (heartbeat, progress, log, complete)] == [200] * 4
+        assert running.progress_percent == 42.5
+        done = _get_job(pool, job.id)
+        assert done.status == JobStatus.COMPLETED
+        assert done.output_path == "/media/out.mkv"
+        assert done.progress_percent == 100.0
+        assert done.log_path == f"logs/{job.id}.log"
+        assert (tmp_path / "logs" / f"{job.id}.log").read_bytes() == b"line 1\n"
+
+    @pytest.mark.asyncio
+    async def test_other_worker_gets_conflict(self, pool, make_job) -> None:
+        job = _add_job(pool, make_job)
+        async with TestClient(TestServer(_app(pool))) as client:
+            await client.post("/api/broker/claim", headers=WORKER)
+            base = f"/api/broker/jobs/{job.id}"
+
+            responses = [
+                await client.post(f"{base}/heartbeat", headers=OTHER_WORKER),
+                await client.post(
+                    f"{base}/progress", json={"percent": 1}, headers=OTHER_WORKER
+                ),
+                await client.put(f"{base}/log", data=b"x", headers=OTHER_WORKER),
+                await client.post(
+                    f"{base}/complete",
+                    json={"status": "failed"},
+                    headers=OTHER_WORKER,
+                ),
+            ]
+
+        assert [r.status for r in responses] == [409] * 4
+        assert _get_job(pool, job.id).status == JobStatus.RUNNING
+
+    @pytest.mark.asyncio
+    async def test_rejects_invalid_job_id(self, pool) -> None:
+        async with TestClient(TestServer(_app(pool))) as client:
+            resp = await client.post(
+                "/api/broker/jobs/not-a-uuid/heartbeat", headers=WORKER
+            )
+
+            assert resp.status == 400
+
+    @pytest.mark.asyncio
+    async def test_rejects_invalid_status(self, pool, make_job) -> None:
+        job = _add_job(pool, make_job)
+        async with TestClient(TestServer(_app(pool))) as client:
+            await client.post("/api/broker/claim", headers=WORKER)
+            resp = await client.post(
+                f"/api/broker/jobs/{job.id}/complete",
+                json={"status": "queued"},
+                headers=WORKER,
+            )
+
+            assert resp.status == 400
@@ -0,0 +1,101 @@
+"""Unit tests for server/compression.py."""
+
+from __future__ import annotations
+
+import gzip
+from unittest.mock import patch
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+
+from vpo.server import compression
+from vpo.server.compression import (
+    COMPRESSION_MIN_BYTES,
+    compression_middleware,
+    negotiate_encoding,
+)
+
+LARGE = b'{"items": [' + b'{"path": "/media/movie.mkv"},' * 200 + b"{}]}"
+
+
+def _app() -> web.Application:
+    async def large(request: web.Request) -> web.Response:
+        return web.Response(body=LARGE, content_type="application/json")
+
+    async def small(request: web.Request) -> web.Response:
+        return web.json_response({"ok": True})
+
+    async def binary(request: web.Request) -> web.Response:
+        return web.Response(body=LARGE, content_type="application/octet-stream")
+
+    app = web.Application(middlewares=[compression_middleware])
+    app.router.add_get("/large", large)
+    app.router.add_get("/small", small)
+    app.router.add_get("/binary", binary)
+    return app
+
+
+class TestNegotiateEncoding:
+    """Tests for negotiate_encoding."""
+
+    @pytest.mark.parametrize(
+        ("header", "expected"),
+        [
+            ("gzip, deflate", "gzip"),
+            ("deflate", None),
+            ("", None),
+            ("gzip;q=0", None),
+            ("*", "gzip"),
+            ("GZIP;q=0.5, identity", "gzip"),
+        ],
+    )
+    def test_without_brotli(self, header: str, expected: str | None) -> None:
+        with patch.object(compression, "brotli", None):
+            assert negotiate_encoding(header) == expected
+
+    def test_prefers_brotli_when_available(self) -> None:
+        with patch.object(compression, "brotli", object()):
+            assert negotiate_encoding("gzip, br") == "br"
+            assert negotiate_encoding("gzip, br;q=0.5") == "gzip"
+            assert negotiate_encoding("br;q=0, *") == "gzip"
+
+
+class TestCompressionMiddleware:
+    """Tests for compression_middleware."""
+
+    @pytest.mark.asyncio
+    async def test_compresses_large_json_with_gzip(self) -> None:
+        with patch.object(compression, "brotli", None):
+            async with TestClient(TestServer(_app())) as client:
+                resp = await client.get(
+                    "/large", headers={"Accept-Encoding": "gzip"}, auto_decompress=False
+                )
+                body = await resp.read()
+
+        assert resp.headers["Content-Encoding"] == "gzip"
+        assert resp.headers["Vary"] == "Accept-Encoding"
+        assert len(body) < len(LARGE)
+        assert gzip.decompress(body) == LARGE
+
+    @pytest.mark.asyncio
+    async def test_identity_when_not_accepted(self) -> None:
+        async with TestClient(TestServer(_app())) as client:
+            resp = await client.get(
+                "/large", headers={"Accept-Encoding": "identity"}, auto_decompress=False
+            )
+
+            assert "Content-Encoding" not in resp.headers
+            assert resp.headers["Vary"] == "Accept-Encoding"
+            assert await resp.read() == LARGE
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("path", ["/small", "/binary"])
+    async def test_skips_small_and_binary_bodies(self, path: str) -> None:
+        assert len(b'{"ok": true}') < COMPRESSION_MIN_BYTES
+        async with TestClient(TestServer(_app())) as client:
+            resp = await client.get(
+                path, headers={"Accept-Encoding": "gzip"}, auto_decompress=False
+            )
+
+            assert "Content-Encoding" not in resp.headers
@@ -0,0 +1,140 @@
+"""Unit tests for server/response_cache.py."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestClient, TestServer
+
+from vpo.db.connection import DaemonConnectionPool
+from vpo.db.schema import create_schema
+from vpo.server.api.files import get_file_routes
+from vpo.server.response_cache import CachedResponse, ResponseCache
+
+
+@pytest.fixture
+def pool(tmp_path: Path):
+    """Connection pool over an empty library database."""
+    pool = DaemonConnectionPool(tmp_path / "library.db")
+    create_schema(pool.get_connection())
+    yield pool
+    pool.close()
+
+
+def _app(pool: DaemonConnectionPool, cache: ResponseCache | None) -> web.Application:
+    app = web.Application()
+    app["connection_pool"] = pool
+    app["response_cache"] = cache
+    for method, suffix, handler in get_file_routes():
+        app.router.add_route(method, f"/api{suffix}", handler)
+    return app
+
+
+def _add_file(pool: DaemonConnectionPool, path: str) -> None:
+    with pool.transaction() as conn:
+        conn.execute(
+            """
+            INSERT INTO files (path, filename, directory, extension, size_bytes,
+                               modified_at, scanned_at, scan_status)
+            VALUES (?, ?, '/media', '.mkv', 1, '2025-01-15T12:00:00+00:00',
+                    '2025-01-15T12:00:00+00:00', 'ok')
+            """,
+            (path, Path(path).name),
+        )
+
+
+class TestConditionalGet:
+    """Tests for the conditional_get decorator on the library API."""
+
+    @pytest.mark.asyncio
+    async def test_revalidation_returns_304(self, pool) -> None:
+        cache = ResponseCache()
+        async with TestClient(TestServer(_app(pool, cache))) as client:
+            first = await client.get("/api/library")
+            etag = first.headers["ETag"]
+            revalidated = await client.get(
+                "/api/library", headers={"If-None-Match": etag}
+            )
+            repeated = await client.get("/api/library")
+
+            assert first.status == 200
+            assert first.headers["Cache-Control"] == "no-cache"
+            assert etag.startswith('W/"')
+            assert revalidated.status == 304
+            assert revalidated.headers["ETag"] == etag
+            assert repeated.status == 200
+            assert await repeated.json() == await first.json()
+
+        assert (cache.misses, cache.not_modified, cache.hits) == (1, 1, 1)
+
+    @pytest.mark.asyncio
+    async def test_write_changes_etag(self, pool) -> None:
+        cache = ResponseCache()
+        async with TestClient(TestServer(_app(pool, cache))) as client:
+            before = await client.get("/api/library")
+            _add_file(pool, "/media/a.mkv")
+            after = await client.get(
+                "/api/library", headers={"If-None-Match": before.headers["ETag"]}
+            )
+
+            assert after.status == 200
+            assert after.headers["ETag"] != before.headers["ETag"]
+            assert (await after.json())["total"] == 1
+
+    @pytest.mark.asyncio
+    async def test_query_parameters_are_normalized(self, pool) -> None:
+        cache = ResponseCache()
+        async with TestClient(TestServer(_app(pool, cache))) as client:
+            a = await client.get("/api/library?limit=10&offset=0")
+            b = await client.get("/api/library?offset=0&limit=10")
+            c = await client.get("/api/library?limit=20&offset=0")
+
+            assert a.headers["ETag"] == b.headers["ETag"]
+            assert a.headers["ETag"] != c.headers["ETag"]
+
+    @pytest.mark.asyncio
+    async def test_errors_are_not_cached(self, pool) -> None:
+        cache = ResponseCache()
+        async with TestClient(TestServer(_app(pool, cache))) as client:
+            resp = await client.get("/api/library/999")
+
+            assert resp.status == 404
+            assert "ETag" not in resp.headers
+        assert len(cache) == 0
+
+    @pytest.mark.asyncio
+    async def test_passes_through_without_cache(self, pool) -> None:
+        async with TestClient(TestServer(_app(pool, None))) as client:
+            resp = await client.get("/api/library")
+
+            assert resp.status == 200
+            assert "ETag" not in resp.headers
+
+
+class TestResponseCache:
+    """Tests for the ResponseCache LRU."""
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache = ResponseCache(max_entries=2)
+        for key in ("a", "b"):
+            cache.put(key, CachedResponse("e", key.encode(), "application/json"))
+        cache.get("a", "e")
+        cache.put("c", CachedResponse("e", b"c", "application/json"))
+
+        assert cache.get("a", "e") is not None
+        assert cache.get("b", "e") is None
+        assert len(cache) == 2
+
+    def test_stale_etag_misses(self) -> None:
+        cache = ResponseCache()
+        cache.put("a", CachedResponse("old", b"{}", "application/json"))
+
+        assert cache.get("a", "new") is None
+
+    def test_skips_large_bodies(self) -> None:
+        cache = ResponseCache(max_body_bytes=4)
+        cache.put("a", CachedResponse("e", b"12345", "application/json"))
+
+        assert len(cache) == 0
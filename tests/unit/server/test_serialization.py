@@ -0,0 +1,166 @@
+"""Unit tests for server/serialization.py."""
+
+from __future__ import annotations
+
+import datetime
+import enum
+import json
+import uuid
+from dataclasses import dataclass, field
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from vpo.server import serialization
+from vpo.server.serialization import dumps, json_response
+
+
+class Color(enum.Enum):
+    RED = "red"
+
+
+@dataclass
+class Inner:
+    name: str
+    tags: list[str] = field(default_factory=list)
+
+
+@dataclass
+class Outer:
+    id: int
+    inner: Inner
+    items: list[Inner]
+    path: Path
+    color: Color
+    when: datetime.datetime
+    key: uuid.UUID
+
+
+VALUE = Outer(
+    id=1,
+    inner=Inner("a", ["x"]),
+    items=[Inner("b"), Inner("c")],
+    path=Path("/media/movie.mkv"),
+    color=Color.RED,
+    when=datetime.datetime(2025, 1, 15, 10, 30, tzinfo=datetime.UTC),
+    key=uuid.UUID("12345678-1234-5678-1234-567812345678"),
+)
+
+EXPECTED = {
+    "id": 1,
+    "inner": {"name": "a", "tags": ["x"]},
+    "items": [{"name": "b", "tags": []}, {"name": "c", "tags": []}],
+    "path": "/media/movie.mkv",
+    "color": "red",
+    "when": "2025-01-15T10:30:00+00:00",
+    "key": "12345678-1234-5678-1234-567812345678",
+}
+
+
+@pytest.fixture(params=["orjson", "json"])
+def backend(request):
+    """Run a test with each serializer backend."""
+    if request.param == "orjson":
+        if serialization.orjson is None:
+            pytest.skip("orjson not installed")
+        yield
+    else:
+        with patch.object(serialization, "orjson", None):
+            yield
+
+
+class TestDumps:
+    """Tests for dumps with both backends."""
+
+    def test_serializes_dataclasses_directly(self, backend) -> None:
+        assert json.loads(dumps(VALUE)) == EXPECTED
+
+    def test_non_string_keys_and_sets(self, backend) -> None:
+        assert json.loads(dumps({1: {"b"}, "s": "é"})) == {"1": ["b"], "s": "é"}
+
+    def test_output_is_compact_utf8(self, backend) -> None:
+        assert dumps({"a": [1, 2], "s": "é"}) == '{"a":[1,2],"s":"é"}'.encode()
+
+    def test_float_subclass(self, backend) -> None:
+        class ScalarFloat(float):
+            pass
+
+        assert dumps({"x": ScalarFloat(0.5)}) == b'{"x":0.5}'
+
+    def test_unsupported_value_raises_type_error(self, backend) -> None:
+        with pytest.raises(TypeError):
+            dumps({"x": object()})
+
+
+class TestJsonResponse:
+    """Tests for json_response."""
+
+    def test_builds_json_response(self) -> None:
+        response = json_response([Inner("a")], status=201, headers={"X-A": "1"})
+
+        assert response.status == 201
+        assert response.content_type == "application/json"
+        assert response.headers["X-A"] == "1"
+        assert json.loads(response.body) == [{"name": "a", "tags": []}]
+
+
+class TestDirectViewModels:
+    """List responses serialized directly must match their to_dict()."""
+
+    def test_list_responses_match_to_dict(self) -> None:
+        from vpo.server.ui.models import (
+            FileListItem,
+            FileListResponse,
+            JobListItem,
+            JobListResponse,
+            PlanListItem,
+            PlanListResponse,
+        )
+
+        responses = [
+            FileListResponse(
+                files=[
+                    FileListItem(
+                        1, "a.mkv", "/m/a.mkv", None, "1080p", "eng", "t", "ok"
+                    )
+                ],
+                total=1,
+                limit=50,
+                offset=0,
+                has_filters=False,
+            ),
+            JobListResponse(
+                jobs=[JobListItem("j", "scan", "running", "/m", 12.5, "t")],
+                total=1,
+                limit=50,
+                offset=0,
+                has_filters=True,
+            ),
+            PlanListResponse(
+                plans=[
+                    PlanListItem(
+                        "p",
+                        "p",
+                        1,
+                        "/m/a.mkv",
+                        "a.mkv",
+                        False,
+                        "policy",
+                        2,
+                        True,
+                        "pending",
+                        {"class": "c", "label": "l"},
+                        "t",
+                        "t",
+                    )
+                ],
+                total=1,
+                limit=50,
+                offset=0,
+                has_filters=False,
+            ),
+        ]
+
+        for response in responses:
+            assert json.loads(dumps(response)) == response.to_dict()
@@ -4,20 +4,48 @@ from datetime import datetime, timedelta, timezone
 
 from vpo.db import (
     JobStatus,
+    JobType,
+    ResourceClass,
     get_job,
+    get_job_checkpoint,
+    update_job_checkpoint,
 )
 from vpo.jobs.queue import (
     DEFAULT_HEARTBEAT_TIMEOUT,
+    _next_queued_ids,
     cancel_job,
     claim_next_job,
+    enqueue_job,
     get_queue_stats,
+    get_running_by_class,
+    holds_lease,
+    lease_jobs,
+    peek_queued_jobs,
     recover_stale_jobs,
     release_job,
+    release_leases,
     requeue_job,
+    start_leased_job,
     update_heartbeat,
 )
 
 
+def _lease_of(db_conn, job_id):
+    return tuple(
+        db_conn.execute(
+            "SELECT lease_owner, lease_expires_at FROM jobs WHERE id = ?", (job_id,)
+        ).fetchone()
+    )
+
+
+def _run_on(db_conn, job_id, lease_owner):
+    """Mark a running job as leased by a worker."""
+    db_conn.execute(
+        "UPDATE jobs SET lease_owner = ? WHERE id = ?", (lease_owner, job_id)
+    )
+    db_conn.commit()
+
+
 class TestClaimNextJob:
     """Tests for claim_next_job function."""
 
@@ -80,6 +108,110 @@ class TestClaimNextJob:
 
         assert claimed is None
 
+    def test_sets_lease(self, db_conn, insert_test_job):
+        """Claimed job carries the worker's lease."""
+        job = insert_test_job()
+        db_conn.commit()
+
+        claim_next_job(db_conn, lease_owner="host:1")
+
+        owner, expires_at = _lease_of(db_conn, job.id)
+        assert owner == "host:1"
+        assert expires_at > datetime.now(timezone.utc).isoformat()
+
+    def test_filters_by_job_type(self, db_conn, insert_test_job):
+        """Only jobs of the requested types are claimed."""
+        insert_test_job(job_type=JobType.MOVE, priority=10)
+        transcode = insert_test_job(job_type=JobType.TRANSCODE, priority=100)
+        db_conn.commit()
+
+        claimed = claim_next_job(db_conn, job_types=[JobType.TRANSCODE])
+
+        assert claimed.id == transcode.id
+        assert claim_next_job(db_conn, job_types=[JobType.TRANSCODE]) is None
+
+    def test_uses_partial_queue_index(self, db_conn):
+        """Claim order is served by the partial index on queued jobs."""
+        sql, params = _next_queued_ids(
+            datetime.now(timezone.utc).isoformat(), 1, [JobType.TRANSCODE]
+        )
+        plan = db_conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+
+        details = " ".join(row["detail"] for row in plan)
+        assert "idx_jobs_queue" in details
+        assert "TEMP B-TREE" not in details
+
+
+class TestLeaseJobs:
+    """Tests for batch leasing (lease_jobs, start_leased_job, release_leases)."""
+
+    def test_leases_batch_in_priority_order(self, db_conn, insert_test_job):
+        """Leases up to limit jobs, highest priority first, still queued."""
+        low = insert_test_job(priority=50)
+        high = insert_test_job(priority=10)
+        insert_test_job(priority=90)
+        db_conn.commit()
+
+        leased = lease_jobs(db_conn, 2, lease_owner="host:1")
+
+        assert [job.id for job in leased] == [high.id, low.id]
+        assert all(job.status == JobStatus.QUEUED for job in leased)
+
+    def test_other_workers_skip_leased_jobs(self, db_conn, insert_test_job):
+        """Jobs leased by one worker are not claimed by another."""
+        leased_job = insert_test_job(priority=10)
+        free_job = insert_test_job(priority=20)
+        db_conn.commit()
+
+        lease_jobs(db_conn, 1, lease_owner="host:1")
+
+        assert claim_next_job(db_conn, lease_owner="host:2").id == free_job.id
+        assert lease_jobs(db_conn, 5, lease_owner="host:2") == []
+        assert get_job(db_conn, leased_job.id).status == JobStatus.QUEUED
+
+    def test_expired_lease_is_claimable(self, db_conn, insert_test_job):
+        """A lease that has expired no longer reserves the job."""
+        job = insert_test_job()
+        db_conn.commit()
+
+        lease_jobs(db_conn, 1, lease_owner="host:1", lease_seconds=-1)
+        claimed = claim_next_job(db_conn, lease_owner="host:2")
+
+        assert claimed.id == job.id
+        assert start_leased_job(db_conn, job.id, lease_owner="host:1") is None
+
+    def test_start_leased_job(self, db_conn, insert_test_job):
+        """Starting a leased job moves it to running."""
+        job = insert_test_job()
+        db_conn.commit()
+        lease_jobs(db_conn, 1, lease_owner="host:1")
+
+        assert start_leased_job(db_conn, job.id, lease_owner="host:2") is None
+        started = start_leased_job(db_conn, job.id, lease_owner="host:1")
+
+        assert started.status == JobStatus.RUNNING
+        assert started.started_at is not None
+        assert started.worker_pid is not None
+
+    def test_cancelled_leased_job_is_not_started(self, db_conn, insert_test_job):
+        """Leased jobs stay cancellable until started."""
+        job = insert_test_job()
+        db_conn.commit()
+        lease_jobs(db_conn, 1, lease_owner="host:1")
+
+        assert cancel_job(db_conn, job.id) is True
+        assert start_leased_job(db_conn, job.id, lease_owner="host:1") is None
+
+    def test_release_leases(self, db_conn, insert_test_job):
+        """Released leases make jobs claimable again."""
+        job = insert_test_job()
+        db_conn.commit()
+        lease_jobs(db_conn, 1, lease_owner="host:1")
+
+        assert release_leases(db_conn, "host:1") == 1
+        assert _lease_of(db_conn, job.id) == (None, None)
+        assert claim_next_job(db_conn, lease_owner="host:2").id == job.id
+
 
 class TestReleaseJob:
     """Tests for release_job function."""
@@ -136,6 +268,23 @@ class TestReleaseJob:
         updated = get_job(db_conn, job.id)
         assert updated.summary_json == summary
 
+    def test_lease_owner_must_hold_job(self, db_conn, insert_test_job):
+        """With lease_owner, only the owner's running job is released."""
+        job = insert_test_job()
+        db_conn.commit()
+        claim_next_job(db_conn, lease_owner="host:1")
+
+        assert (
+            release_job(db_conn, job.id, JobStatus.FAILED, lease_owner="host:2")
+            is False
+        )
+        assert get_job(db_conn, job.id).status == JobStatus.RUNNING
+        assert (
+            release_job(db_conn, job.id, JobStatus.COMPLETED, lease_owner="host:1")
+            is True
+        )
+        assert get_job(db_conn, job.id).status == JobStatus.COMPLETED
+
     def test_set_progress_100_updates_progress(self, db_conn, insert_test_job):
         """set_progress_100=True sets progress_percent to 100.0."""
         job = insert_test_job(status=JobStatus.RUNNING)
@@ -191,6 +340,34 @@ class TestUpdateHeartbeat:
 
         assert result is False
 
+    def test_renews_leases(self, db_conn, insert_test_job):
+        """Renews the running job's lease and the owner's leased jobs."""
+        running_job = insert_test_job()
+        leased_job = insert_test_job()
+        other_job = insert_test_job()
+        db_conn.commit()
+        claim_next_job(db_conn, lease_owner="host:1", lease_seconds=1)
+        lease_jobs(db_conn, 1, lease_owner="host:1", lease_seconds=1)
+        lease_jobs(db_conn, 1, lease_owner="host:2", lease_seconds=1)
+        _, other_before = _lease_of(db_conn, other_job.id)
+
+        update_heartbeat(db_conn, running_job.id, lease_owner="host:1")
+
+        soon = (datetime.now(timezone.utc) + timedelta(seconds=60)).isoformat()
+        assert _lease_of(db_conn, running_job.id)[1] > soon
+        assert _lease_of(db_conn, leased_job.id)[1] > soon
+        assert _lease_of(db_conn, other_job.id)[1] == other_before
+
+    def test_rejects_other_lease_owner(self, db_conn, insert_test_job):
+        """A worker whose job was taken over cannot renew it."""
+        job = insert_test_job()
+        db_conn.commit()
+        claim_next_job(db_conn, lease_owner="host:1")
+
+        assert update_heartbeat(db_conn, job.id, lease_owner="host:2") is False
+        assert holds_lease(db_conn, job.id, "host:1") is True
+        assert holds_lease(db_conn, job.id, "host:2") is False
+
 
 class TestRecoverStaleJobs:
     """Tests for recover_stale_jobs function."""
@@ -256,6 +433,304 @@ class TestRecoverStaleJobs:
         count = recover_stale_jobs(db_conn, timeout_seconds=5)
         assert count == 1
 
+    def test_recovers_expired_lease(self, db_conn, insert_test_job):
+        """Recovers running jobs whose lease expired despite a fresh heartbeat."""
+        job = insert_test_job()
+        db_conn.commit()
+        claim_next_job(db_conn, lease_owner="host:1", lease_seconds=-1)
+
+        count = recover_stale_jobs(db_conn)
+
+        assert count == 1
+        assert get_job(db_conn, job.id).status == JobStatus.QUEUED
+        assert _lease_of(db_conn, job.id) == (None, None)
+
+    def test_keeps_checkpoint(self, db_conn, insert_test_job):
+        """Recovered jobs keep their checkpoint so they can resume."""
+        job = insert_test_job()
+        update_job_checkpoint(db_conn, job.id, '{"version": 1}')
+        db_conn.commit()
+        claim_next_job(db_conn, lease_seconds=-1)
+
+        recover_stale_jobs(db_conn)
+
+        assert get_job_checkpoint(db_conn, job.id) == '{"version": 1}'
+
+    def test_does_not_recover_live_lease(self, db_conn, insert_test_job):
+        """Running jobs with an unexpired lease and fresh heartbeat are kept."""
+        insert_test_job()
+        db_conn.commit()
+        claim_next_job(db_conn)
+
+        assert recover_stale_jobs(db_conn) == 0
+
+
+class TestEnqueueJob:
+    """Tests for enqueue_job coalescing."""
+
+    def test_inserts_new_job(self, db_conn, make_job):
+        """A job without an equivalent pending job is queued as given."""
+        job = make_job(file_id=None)
+
+        result = enqueue_job(db_conn, job)
+
+        assert (result.job_id, result.coalesced) == (job.id, False)
+        assert get_job(db_conn, job.id).status == JobStatus.QUEUED
+
+    def test_merges_into_queued_job(self, db_conn, make_job, insert_test_file):
+        """A duplicate submission raises priority and updates options."""
+        file_id = insert_test_file(path="/media/a.mkv")
+        first = make_job(file_id=file_id, priority=100, policy_json='{"v": 1}')
+        enqueue_job(db_conn, first)
+
+        result = enqueue_job(
+            db_conn, make_job(file_id=file_id, priority=10, policy_json='{"v": 2}')
+        )
+        enqueue_job(db_conn, make_job(file_id=file_id, priority=50))
+
+        assert (result.job_id, result.coalesced) == (first.id, True)
+        merged = get_job(db_conn, first.id)
+        assert merged.priority == 10
+        assert merged.policy_json == "{}"
+        assert get_queue_stats(db_conn)["queued"] == 1
+        assert get_queue_stats(db_conn)["coalesced"] == 2
+
+    def test_different_policy_is_not_merged(self, db_conn, make_job, insert_test_file):
+        """Jobs for another policy or job type are queued separately."""
+        file_id = insert_test_file(path="/media/a.mkv")
+        enqueue_job(db_conn, make_job(file_id=file_id, policy_name="a"))
+
+        other_policy = enqueue_job(db_conn, make_job(file_id=file_id, policy_name="b"))
+        other_type = enqueue_job(
+            db_conn, make_job(file_id=file_id, policy_name="a", job_type=JobType.MOVE)
+        )
+
+        assert not other_policy.coalesced
+        assert not other_type.coalesced
+        assert get_queue_stats(db_conn)["queued"] == 3
+
+    def test_running_job_with_same_options(self, db_conn, make_job, insert_test_file):
+        """A running job with identical options absorbs the submission."""
+        file_id = insert_test_file(path="/media/a.mkv")
+        running = make_job(file_id=file_id)
+        enqueue_job(db_conn, running)
+        db_conn.commit()
+        claim_next_job(db_conn)
+
+        same = enqueue_job(db_conn, make_job(file_id=file_id))
+        changed = enqueue_job(
+            db_conn, make_job(file_id=file_id, policy_json='{"v": 2}')
+        )
+
+        assert (same.job_id, same.coalesced) == (running.id, True)
+        assert not changed.coalesced
+        assert get_job(db_conn, changed.job_id).status == JobStatus.QUEUED
+
+    def test_requeue_skips_when_equivalent_job_queued(
+        self, db_conn, make_job, insert_test_file
+    ):
+        """A failed job is not requeued next to an equivalent queued job."""
+        file_id = insert_test_file(path="/media/a.mkv")
+        failed = make_job(file_id=file_id, status=JobStatus.FAILED)
+        enqueue_job(db_conn, make_job(file_id=file_id))
+        db_conn.execute(
+            "INSERT INTO jobs (id, file_id, file_path, job_type, status, "
+            "policy_name, policy_json, created_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (
+                failed.id,
+                file_id,
+                failed.file_path,
+                failed.job_type.value,
+                "failed",
+                failed.policy_name,
+                failed.policy_json,
+                failed.created_at,
+            ),
+        )
+        db_conn.commit()
+
+        assert requeue_job(db_conn, failed.id) is False
+        assert get_job(db_conn, failed.id).status == JobStatus.FAILED
+
+    def test_recovery_cancels_superseded_stale_job(
+        self, db_conn, make_job, insert_test_file
+    ):
+        """A stale running job with an equivalent queued job is cancelled."""
+        file_id = insert_test_file(path="/media/a.mkv")
+        stale = make_job(file_id=file_id)
+        enqueue_job(db_conn, stale)
+        db_conn.commit()
+        claim_next_job(db_conn, lease_seconds=-1)
+        newer = enqueue_job(db_conn, make_job(file_id=file_id, policy_json='{"v": 2}'))
+        db_conn.commit()
+
+        assert recover_stale_jobs(db_conn) == 1
+        assert get_job(db_conn, stale.id).status == JobStatus.CANCELLED
+        assert get_job(db_conn, newer.job_id).status == JobStatus.QUEUED
+
+    def test_recovery_requeues_newest_of_running_twins(
+        self, db_conn, make_job, insert_test_file
+    ):
+        """Of two stale equivalent running jobs, only the newest is requeued."""
+        file_id = insert_test_file(path="/media/a.mkv")
+        older = make_job(file_id=file_id, created_at="2025-01-15T10:00:00+00:00")
+        enqueue_job(db_conn, older)
+        db_conn.commit()
+        claim_next_job(db_conn, lease_seconds=-1)
+        newer = make_job(
+            file_id=file_id,
+            policy_json='{"v": 2}',
+            created_at="2025-01-15T11:00:00+00:00",
+        )
+        enqueue_job(db_conn, newer)
+        db_conn.commit()
+        claim_next_job(db_conn, lease_seconds=-1)
+
+        assert recover_stale_jobs(db_conn) == 2
+        assert get_job(db_conn, older.id).status == JobStatus.CANCELLED
+        assert get_job(db_conn, newer.id).status == JobStatus.QUEUED
+
+
+class TestResourceSlots:
+    """Tests for resource-class slot limits."""
+
+    CPU_SLOT = {ResourceClass.CPU: 1, ResourceClass.METADATA: 0}
+
+    def test_enqueue_records_class(self, db_conn, make_job):
+        """enqueue_job classifies jobs that have no resource class."""
+        job = make_job(job_type=JobType.MOVE)
+
+        enqueue_job(db_conn, job)
+
+        assert get_job(db_conn, job.id).resource_class == ResourceClass.IO
+
+    def test_claim_skips_saturated_class(self, db_conn, insert_test_job):
+        """Light jobs are claimed around a class that has no free slot."""
+        running = insert_test_job(
+            status=JobStatus.RUNNING, resource_class=ResourceClass.CPU
+        )
+        _run_on(db_conn, running.id, "host:1")
+        insert_test_job(priority=10, resource_class=ResourceClass.CPU)
+        light = insert_test_job(priority=50, resource_class=ResourceClass.METADATA)
+        db_conn.commit()
+
+        claimed = claim_next_job(db_conn, lease_owner="host:2", slots=self.CPU_SLOT)
+
+        assert claimed.id == light.id
+        assert (
+            claim_next_job(db_conn, lease_owner="host:2", slots=self.CPU_SLOT) is None
+        )
+
+    def test_slots_are_per_host(self, db_conn, insert_test_job):
+        """Jobs running on another host do not use this host's slots."""
+        running = insert_test_job(
+            status=JobStatus.RUNNING, resource_class=ResourceClass.CPU
+        )
+        _run_on(db_conn, running.id, "encoder-1:100")
+        job = insert_test_job(resource_class=ResourceClass.CPU)
+        db_conn.commit()
+
+        same_host = claim_next_job(
+            db_conn, lease_owner="encoder-1:200", slots=self.CPU_SLOT
+        )
+        other_host = claim_next_job(
+            db_conn, lease_owner="encoder-2:100", slots=self.CPU_SLOT
+        )
+
+        assert same_host is None
+        assert other_host.id == job.id
+
+    def test_claims_in_priority_order_with_free_slot(self, db_conn, insert_test_job):
+        """Slots do not change the order while a class has room."""
+        heavy = insert_test_job(priority=10, resource_class=ResourceClass.CPU)
+        insert_test_job(priority=50, resource_class=ResourceClass.METADATA)
+        db_conn.commit()
+
+        assert claim_next_job(db_conn, slots=self.CPU_SLOT).id == heavy.id
+
+    def test_unclassified_jobs_are_not_limited(self, db_conn, insert_test_job):
+        """Jobs without a resource class (older rows) are always claimable."""
+        insert_test_job(status=JobStatus.RUNNING, resource_class=ResourceClass.CPU)
+        job = insert_test_job()
+        db_conn.commit()
+
+        assert claim_next_job(db_conn, slots=self.CPU_SLOT).id == job.id
+
+    def test_lease_and_start_respect_slots(self, db_conn, insert_test_job):
+        """Leasing skips full classes; starting checks the slot again."""
+        first = insert_test_job(priority=10, resource_class=ResourceClass.CPU)
+        second = insert_test_job(priority=20, resource_class=ResourceClass.CPU)
+        db_conn.commit()
+
+        leased = lease_jobs(db_conn, 2, lease_owner="host:1", slots=self.CPU_SLOT)
+        start_leased_job(db_conn, first.id, lease_owner="host:1")
+
+        assert [job.id for job in leased] == [first.id, second.id]
+        assert (
+            start_leased_job(
+                db_conn, second.id, lease_owner="host:1", slots=self.CPU_SLOT
+            )
+            is None
+        )
+        assert lease_jobs(db_conn, 2, lease_owner="host:2", slots=self.CPU_SLOT) == []
+
+    def test_release_single_lease(self, db_conn, insert_test_job):
+        """release_leases can hand back selected jobs only."""
+        kept = insert_test_job(priority=10)
+        released = insert_test_job(priority=20)
+        db_conn.commit()
+        lease_jobs(db_conn, 2, lease_owner="host:1")
+
+        assert release_leases(db_conn, "host:1", job_ids=[released.id]) == 1
+        assert _lease_of(db_conn, released.id) == (None, None)
+        assert _lease_of(db_conn, kept.id)[0] == "host:1"
+
+    def test_running_by_class(self, db_conn, insert_test_job):
+        """Slot usage counts running jobs per class."""
+        insert_test_job(status=JobStatus.RUNNING, resource_class=ResourceClass.IO)
+        insert_test_job(status=JobStatus.RUNNING, resource_class=ResourceClass.IO)
+        insert_test_job(resource_class=ResourceClass.CPU)
+
+        usage = get_running_by_class(db_conn)
+
+        assert usage[ResourceClass.IO] == 2
+        assert usage[ResourceClass.CPU] == 0
+
+
+class TestPlannedClaims:
+    """Tests for claiming from a planned set of jobs."""
+
+    def test_peek_does_not_claim(self, db_conn, insert_test_job):
+        """peek_queued_jobs lists claimable jobs in claim order."""
+        low = insert_test_job(priority=50)
+        high = insert_test_job(priority=10)
+        insert_test_job(status=JobStatus.RUNNING)
+        db_conn.commit()
+
+        peeked = peek_queued_jobs(db_conn, 5)
+
+        assert [job.id for job in peeked] == [high.id, low.id]
+        assert get_job(db_conn, high.id).status == JobStatus.QUEUED
+
+    def test_claim_restricted_to_job_ids(self, db_conn, insert_test_job):
+        """claim_next_job only takes jobs from job_ids."""
+        insert_test_job(priority=10)
+        short = insert_test_job(priority=50)
+        db_conn.commit()
+
+        assert claim_next_job(db_conn, job_ids=[short.id]).id == short.id
+        assert claim_next_job(db_conn, job_ids=[]) is None
+
+    def test_lease_restricted_to_job_ids(self, db_conn, insert_test_job):
+        """lease_jobs only leases jobs from job_ids."""
+        insert_test_job(priority=10)
+        short = insert_test_job(priority=50)
+        db_conn.commit()
+
+        leased = lease_jobs(db_conn, 2, lease_owner="host:1", job_ids=[short.id])
+
+        assert [job.id for job in leased] == [short.id]
+
 
 class TestGetQueueStats:
     """Tests for get_queue_stats function."""
@@ -332,6 +807,15 @@ class TestRequeueJob:
         assert updated.error_message is None
         assert updated.progress_percent == 0.0
 
+    def test_retry_starts_over(self, db_conn, insert_test_job):
+        """A retried job does not resume from its checkpoint."""
+        job = insert_test_job(status=JobStatus.FAILED)
+        update_job_checkpoint(db_conn, job.id, '{"version": 1}')
+
+        requeue_job(db_conn, job.id)
+
+        assert get_job_checkpoint(db_conn, job.id) is None
+
     def test_requeues_cancelled_job(self, db_conn, insert_test_job):
         """Requeues a cancelled job."""
         job = insert_test_job(status=JobStatus.CANCELLED)
@@ -7,6 +7,16 @@ from unittest.mock import patch
 import pytest
 
 
+class TestSchemaVersion:
+    """Tests for the current schema version."""
+
+    def test_schema_version_is_current(self):
+        """Bump together with a new migration and its test_migration_vNN.py."""
+        from vpo.db.schema import SCHEMA_VERSION
+
+        assert SCHEMA_VERSION == 35
+
+
 class TestSchemaCreation:
     """Tests for schema creation and initialization."""
 
@@ -2,6 +2,7 @@
 
 from vpo.tools.ffmpeg_progress import (
     FFmpegProgress,
+    FFmpegProgressParser,
     parse_progress_block,
     parse_progress_line,
     parse_stderr_progress,
@@ -156,6 +157,45 @@ fps=25.0"""
         assert result.fps is None
 
 
+class TestFFmpegProgressParser:
+    """Tests for FFmpegProgressParser."""
+
+    def test_emits_progress_at_block_end(self):
+        """Fields accumulate until the progress= line closes the block."""
+        parser = FFmpegProgressParser()
+
+        assert parser.feed_line("frame=120\n") is None
+        assert parser.feed_line("out_time_us=5000000\n") is None
+        assert parser.feed_line("speed=2.5x\n") is None
+        result = parser.feed_line("progress=continue\n")
+
+        assert result == FFmpegProgress(frame=120, out_time_us=5_000_000, speed="2.5x")
+
+    def test_blocks_are_independent(self):
+        """A new block does not inherit fields from the previous one."""
+        parser = FFmpegProgressParser()
+        parser.feed_line("frame=10")
+        parser.feed_line("progress=continue")
+
+        parser.feed_line("fps=24.0")
+        result = parser.feed_line("progress=end")
+
+        assert result is not None
+        assert result.frame is None
+        assert result.fps == 24.0
+
+    def test_ignores_unknown_and_malformed_lines(self):
+        """Unknown keys, N/A values and lines without '=' are skipped."""
+        parser = FFmpegProgressParser()
+        parser.feed_line("dup_frames=0")
+        parser.feed_line("out_time_us=N/A")
+        parser.feed_line("garbage")
+
+        result = parser.feed_line("progress=continue")
+
+        assert result == FFmpegProgress()
+
+
 class TestParseStderrProgress:
     """Tests for parse_stderr_progress function."""
 
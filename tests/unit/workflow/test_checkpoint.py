@@ -0,0 +1,85 @@
+"""Unit tests for workflow checkpoints (vpo.workflow.checkpoint)."""
+
+from vpo.db.queries import get_job_checkpoint, update_job_checkpoint
+from vpo.policy.types import PhaseOutcome
+from vpo.workflow.checkpoint import (
+    FileFingerprint,
+    PhaseCheckpoint,
+    WorkflowCheckpoint,
+    checkpoint_mismatch,
+    load_checkpoint,
+    resume_path,
+    save_checkpoint,
+)
+
+
+def _checkpoint(path) -> WorkflowCheckpoint:
+    return WorkflowCheckpoint(
+        policy_hash="hash",
+        phase_names=("convert", "clean"),
+        phases=(
+            PhaseCheckpoint(
+                phase_name="convert",
+                outcome=PhaseOutcome.COMPLETED,
+                changes_made=1,
+                file_modified=True,
+            ),
+        ),
+        file=FileFingerprint.of(path),
+    )
+
+
+class TestWorkflowCheckpoint:
+    """Tests for checkpoint storage and verification."""
+
+    def test_round_trip(self, db_conn, insert_test_job, tmp_path) -> None:
+        job = insert_test_job()
+        path = tmp_path / "a.mkv"
+        path.write_bytes(b"data")
+        checkpoint = _checkpoint(path)
+
+        save_checkpoint(db_conn, job.id, checkpoint)
+
+        assert load_checkpoint(db_conn, job.id) == checkpoint
+        assert checkpoint.phases[0].to_result().success is True
+
+    def test_unreadable_checkpoint_is_ignored(self, db_conn, insert_test_job) -> None:
+        job = insert_test_job()
+
+        assert load_checkpoint(db_conn, job.id) is None
+        update_job_checkpoint(db_conn, job.id, '{"version": 999}')
+        assert load_checkpoint(db_conn, job.id) is None
+        update_job_checkpoint(db_conn, job.id, "not json")
+        assert load_checkpoint(db_conn, job.id) is None
+        assert get_job_checkpoint(db_conn, "missing") is None
+
+    def test_mismatch_reasons(self, tmp_path) -> None:
+        path = tmp_path / "a.mkv"
+        path.write_bytes(b"data")
+        checkpoint = _checkpoint(path)
+        phases = ("convert", "clean")
+
+        assert checkpoint_mismatch(checkpoint, "hash", phases, path) is None
+        assert checkpoint_mismatch(checkpoint, "other", phases, path) == (
+            "policy changed"
+        )
+        assert checkpoint_mismatch(checkpoint, "hash", ("clean",), path) == (
+            "phases changed"
+        )
+        path.write_bytes(b"edit")
+        assert checkpoint_mismatch(checkpoint, "hash", phases, path) == (
+            "file changed since the checkpoint"
+        )
+
+    def test_resume_path_follows_renamed_file(
+        self, db_conn, insert_test_job, tmp_path
+    ) -> None:
+        job = insert_test_job()
+        original = tmp_path / "a.avi"
+        converted = tmp_path / "a.mkv"
+        converted.write_bytes(b"data")
+        save_checkpoint(db_conn, job.id, _checkpoint(converted))
+
+        assert resume_path(db_conn, job.id, original) == converted
+        original.write_bytes(b"data")
+        assert resume_path(db_conn, job.id, original) == original
@@ -7,12 +7,14 @@ Tests the WorkflowProcessor class:
 - Re-introspection after file modifications
 """
 
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
 
 from vpo.db.types import FileInfo, TrackInfo
+from vpo.executor.io_admission import IOAdmission
 from vpo.policy.types import (
     GlobalConfig,
     OnErrorMode,
@@ -23,6 +25,7 @@ from vpo.policy.types import (
     PhaseSkipCondition,
     PolicySchema,
     RunIfCondition,
+    TrackType,
 )
 from vpo.workflow.processor import WorkflowProcessor
 
@@ -870,3 +873,214 @@ class TestSelectedPhases:
             )
 
         assert "Unknown phase 'nonexistent'" in str(exc_info.value)
+
+
+# =============================================================================
+# Tests for per-device I/O admission
+# =============================================================================
+
+
+class TestIOAdmission:
+    """Phases that modify files wait for per-device I/O admission."""
+
+    def test_admission_wait_recorded_on_phase_result(
+        self, db_conn, test_file, make_policy, make_phase_result, sample_file_info
+    ):
+        """Wait time per device is attached to the phase result."""
+        policy = make_policy(
+            phases=[PhaseDefinition(name="order", track_order=(TrackType.VIDEO,))]
+        )
+        processor = WorkflowProcessor(
+            conn=db_conn, policy=policy, dry_run=False, use_compliance_memo=False
+        )
+
+        @contextmanager
+        def fake_admit(paths, size_bytes=0):
+            admitted.append((list(paths), size_bytes))
+            yield IOAdmission(wait_seconds={"8:16": 1.5})
+
+        admitted: list = []
+        controller = MagicMock()
+        controller.admit.side_effect = fake_admit
+
+        with (
+            patch.object(
+                processor, "_check_min_free_disk_threshold", return_value=None
+            ),
+            patch.object(processor, "_get_file_info", return_value=sample_file_info),
+            patch.object(
+                processor._executor,
+                "execute_phase",
+                return_value=make_phase_result(phase_name="order"),
+            ),
+            patch("vpo.workflow.processor.get_io_admission", return_value=controller),
+        ):
+            result = processor.process_file(test_file)
+
+        assert result.phase_results[0].io_wait == (("8:16", 1.5),)
+        assert admitted[0][0][0] == test_file
+        assert admitted[0][1] == sample_file_info.size_bytes
+
+    def test_dry_run_skips_admission(
+        self, db_conn, test_file, make_policy, make_phase_result, sample_file_info
+    ):
+        """Dry runs never wait for admission."""
+        policy = make_policy(
+            phases=[PhaseDefinition(name="order", track_order=(TrackType.VIDEO,))]
+        )
+        processor = WorkflowProcessor(conn=db_conn, policy=policy, dry_run=True)
+
+        with (
+            patch.object(processor, "_get_file_info", return_value=sample_file_info),
+            patch.object(
+                processor._executor,
+                "execute_phase",
+                return_value=make_phase_result(phase_name="order"),
+            ),
+            patch("vpo.workflow.processor.get_io_admission") as get_admission,
+        ):
+            result = processor.process_file(test_file)
+
+        get_admission.assert_not_called()
+        assert result.phase_results[0].io_wait == ()
+
+
+# =============================================================================
+# Tests for checkpoint/resume
+# =============================================================================
+
+
+class TestCheckpoints:
+    """Queued jobs checkpoint finished phases and resume after them."""
+
+    PHASES = [
+        PhaseDefinition(name="phase1"),
+        PhaseDefinition(name="phase2"),
+        PhaseDefinition(name="phase3"),
+    ]
+
+    def _run(self, db_conn, job_id, policy, file_path, file_info, execute):
+        processor = WorkflowProcessor(
+            conn=db_conn,
+            policy=policy,
+            job_id=job_id,
+            policy_hash="hash",
+            use_compliance_memo=False,
+            checkpoint=True,
+        )
+        with (
+            patch.object(
+                processor, "_check_min_free_disk_threshold", return_value=None
+            ),
+            patch.object(processor, "_get_file_info", return_value=file_info),
+            patch.object(processor._executor, "execute_phase", side_effect=execute),
+        ):
+            return processor.process_file(file_path)
+
+    def _interrupted_run(
+        self, db_conn, job_id, policy, test_file, sample_file_info, make_phase_result
+    ):
+        """Run phase1 and phase2, then die during phase3."""
+
+        def execute(phase, file_path, file_info):
+            if phase.name == "phase3":
+                raise KeyboardInterrupt
+            return make_phase_result(phase_name=phase.name, changes_made=1)
+
+        with (
+            patch.object(WorkflowProcessor, "_re_introspect"),
+            pytest.raises(KeyboardInterrupt),
+        ):
+            self._run(db_conn, job_id, policy, test_file, sample_file_info, execute)
+
+    def test_resumes_at_first_unfinished_phase(
+        self,
+        db_conn,
+        insert_test_job,
+        test_file,
+        make_policy,
+        make_phase_result,
+        sample_file_info,
+    ):
+        """A rerun skips the phases recorded in the checkpoint."""
+        job = insert_test_job()
+        policy = make_policy(phases=self.PHASES)
+        self._interrupted_run(
+            db_conn, job.id, policy, test_file, sample_file_info, make_phase_result
+        )
+        executed = []
+
+        def execute(phase, file_path, file_info):
+            executed.append(phase.name)
+            return make_phase_result(phase_name=phase.name)
+
+        result = self._run(
+            db_conn, job.id, policy, test_file, sample_file_info, execute
+        )
+
+        assert executed == ["phase3"]
+        assert result.success is True
+        assert result.phases_completed == 3
+        assert result.total_changes == 2
+
+    def test_changed_file_runs_all_phases(
+        self,
+        db_conn,
+        insert_test_job,
+        test_file,
+        make_policy,
+        make_phase_result,
+        sample_file_info,
+    ):
+        """The checkpoint is ignored if the file no longer matches it."""
+        job = insert_test_job()
+        policy = make_policy(phases=self.PHASES)
+        self._interrupted_run(
+            db_conn, job.id, policy, test_file, sample_file_info, make_phase_result
+        )
+        test_file.write_bytes(b"\x01" * 1000)
+        executed = []
+
+        def execute(phase, file_path, file_info):
+            executed.append(phase.name)
+            return make_phase_result(phase_name=phase.name)
+
+        self._run(db_conn, job.id, policy, test_file, sample_file_info, execute)
+
+        assert executed == ["phase1", "phase2", "phase3"]
+
+    def test_changed_policy_runs_all_phases(
+        self,
+        db_conn,
+        insert_test_job,
+        test_file,
+        make_policy,
+        make_phase_result,
+        sample_file_info,
+    ):
+        """The checkpoint is ignored if the phase list changed."""
+        job = insert_test_job()
+        self._interrupted_run(
+            db_conn,
+            job.id,
+            make_policy(phases=self.PHASES),
+            test_file,
+            sample_file_info,
+            make_phase_result,
+        )
+        executed = []
+
+        def execute(phase, file_path, file_info):
+            executed.append(phase.name)
+            return make_phase_result(phase_name=phase.name)
+
+        self._run(
+            db_conn,
+            job.id,
+            make_policy(phases=self.PHASES[1:]),
+            test_file,
+            sample_file_info,
+            execute,
+        )
+
+        assert executed == ["phase2", "phase3"]
@@ -0,0 +1,96 @@
+"""Tests for library-wide policy simulation (workflow.simulation)."""
+
+import pytest
+
+from vpo.policy.loader import load_policy_from_dict
+from vpo.workflow.simulation import simulate_policy
+
+
+@pytest.fixture
+def policy():
+    """Keep English audio only; the second phase also sets timestamps."""
+    return load_policy_from_dict(
+        {
+            "schema_version": 13,
+            "phases": [
+                {"name": "filter", "keep_audio": {"languages": ["eng"]}},
+                {"name": "stamp", "file_timestamp": {}},
+            ],
+        }
+    )
+
+
+@pytest.fixture
+def library(db_conn, insert_test_file, insert_test_track):
+    """Three files: compliant, one foreign audio track, and no tracks."""
+    compliant = insert_test_file(path="/media/movies/compliant.mkv")
+    foreign = insert_test_file(path="/media/movies/foreign.mkv")
+    for file_id in (compliant, foreign):
+        insert_test_track(
+            file_id=file_id, track_index=0, track_type="video", is_default=True
+        )
+        insert_test_track(
+            file_id=file_id,
+            track_index=1,
+            track_type="audio",
+            language="eng",
+            is_default=True,
+        )
+    insert_test_track(
+        file_id=foreign, track_index=2, track_type="audio", language="fre"
+    )
+
+    insert_test_file(path="/media/tv/empty.mkv")
+    return {"compliant": compliant, "foreign": foreign}
+
+
+class TestSimulatePolicy:
+    """Tests for simulate_policy."""
+
+    def test_aggregate_counts(self, db_conn, library, policy):
+        result = simulate_policy(db_conn, policy, batch_size=2)
+
+        assert result.total_files == 3
+        assert result.files_changed == 1
+        assert result.files_compliant == 1
+        assert result.files_errored == 1
+        assert result.tracks_removed == 1
+        assert result.phase_counts == {"filter": 1}
+        assert result.unsimulated_operations == ("file_timestamp",)
+
+    def test_per_file_summaries(self, db_conn, library, policy):
+        result = simulate_policy(db_conn, policy)
+
+        by_path = {f.path: f for f in result.files}
+        foreign = by_path["/media/movies/foreign.mkv"]
+        assert foreign.file_id == library["foreign"]
+        assert foreign.tracks_removed == 1
+        assert foreign.phases_changed == ("filter",)
+        assert by_path["/media/tv/empty.mkv"].error is not None
+        assert "/media/movies/compliant.mkv" not in by_path
+
+    def test_path_prefix(self, db_conn, library, policy):
+        result = simulate_policy(db_conn, policy, path_prefix="/media/movies")
+
+        assert result.total_files == 2
+        assert result.files_errored == 0
+
+    def test_selected_phases(self, db_conn, library, policy):
+        result = simulate_policy(db_conn, policy, selected_phases=["stamp"])
+
+        assert result.files_changed == 0
+        assert result.tracks_removed == 0
+
+    def test_max_files_truncates_listing(self, db_conn, library, policy):
+        result = simulate_policy(db_conn, policy, max_files=1)
+
+        assert len(result.files) == 1
+        assert result.truncated is True
+        assert result.files_changed + result.files_errored == 2
+
+    def test_to_dict(self, db_conn, library, policy):
+        data = simulate_policy(db_conn, policy).to_dict()
+
+        assert data["total_files"] == 3
+        assert data["phase_counts"] == {"filter": 1}
+        assert isinstance(data["files"], list)